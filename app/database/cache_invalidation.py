@@ -0,0 +1,137 @@
+"""
+Invalidation automatique du cache sur les écritures SQLAlchemy
+Chaque flush relève les objets ajoutés, modifiés ou supprimés et les traduit en tags
+de cache ; les tags sont invalidés au commit (jamais sur rollback). Les fonctions
+@cache_data (app.services.caching) déclarent les noms de tables qu'elles lisent comme tags.
+
+Tags d'un objet :
+    - le nom de sa table ("consultants", "missions", "practices", "business_managers"...)
+    - "consultant:<id>" pour un consultant ou un objet rattaché (consultant_id)
+    - les tags complémentaires de _EXTRA_TABLE_TAGS ("search" pour les consultants)
+"""
+
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Set
+
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.services.cache_service import TAG_EVERY_CONSULTANT
+from app.services.cache_service import TAG_SEARCH
+from app.services.cache_service import invalidate_tags
+
+from .models import Consultant
+
+# Comparaison par nom de table : les services qui importent les modèles via "database.models"
+# manipulent une seconde copie des classes
+_CONSULTANTS_TABLE = Consultant.__tablename__
+
+# Clé de session.info des tags en attente du commit
+_PENDING_TAGS_KEY = "cache_invalidation_tags"
+
+# Tags ajoutés au nom de la table
+_EXTRA_TABLE_TAGS: Dict[str, tuple] = {
+    "consultants": (TAG_SEARCH,),
+}
+
+
+def _table_tags(table_name: str) -> Set[str]:
+    return {table_name, *_EXTRA_TABLE_TAGS.get(table_name, ())}
+
+
+def tags_for_object(obj) -> Set[str]:
+    """Tags de cache rendus périmés par l'écriture d'un objet mappé"""
+    table = getattr(obj, "__tablename__", None)
+    if table is None:
+        return set()
+
+    tags = _table_tags(table)
+    if table == _CONSULTANTS_TABLE:
+        consultant_ids = {obj.id}
+    elif hasattr(obj, "consultant_id"):
+        consultant_ids = {obj.consultant_id}
+    else:
+        consultant_ids = set()
+
+    tags.update(f"consultant:{consultant_id}" for consultant_id in consultant_ids if consultant_id is not None)
+    return tags
+
+
+def _pending_tags(session: Session) -> Set[str]:
+    return session.info.setdefault(_PENDING_TAGS_KEY, set())
+
+
+def _previous_consultant_id(session: Session, obj) -> Optional[int]:
+    """Consultant d'origine d'un objet réaffecté à un autre consultant, None sinon"""
+    state = inspect(obj)
+    history = state.attrs.consultant_id.history
+    if not history.added or not state.has_identity:
+        return None
+    if history.deleted:
+        return history.deleted[0]
+
+    # Attribut expiré avant modification : l'ancienne valeur n'est qu'en base
+    table = state.mapper.local_table
+    primary_key = state.mapper.primary_key[0]
+    return session.connection().execute(select(table.c.consultant_id).where(primary_key == state.identity[0])).scalar()
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_previous_owners(session: Session, flush_context, instances) -> None:
+    """Objet réaffecté : l'ancien consultant est touché lui aussi (valeur perdue après le flush)"""
+    previous = {_previous_consultant_id(session, obj) for obj in session.dirty if hasattr(obj, "consultant_id")}
+    previous.discard(None)
+    if previous:
+        _pending_tags(session).update(f"consultant:{consultant_id}" for consultant_id in previous)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tags_after_flush(session: Session, flush_context) -> None:
+    """Relève les tags des objets écrits (l'historique des attributs est encore disponible)"""
+    pending = _pending_tags(session)
+    for obj in session.new:
+        pending.update(tags_for_object(obj))
+    for obj in session.deleted:
+        pending.update(tags_for_object(obj))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            pending.update(tags_for_object(obj))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_tags_for_bulk_statements(orm_execute_state) -> None:
+    """UPDATE / DELETE / INSERT en masse : les lignes touchées ne sont pas connues"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.local_table is None:
+        return
+
+    tags = _table_tags(mapper.local_table.name)
+    if mapper.local_table.name == _CONSULTANTS_TABLE or "consultant_id" in mapper.columns:
+        tags.add(TAG_EVERY_CONSULTANT)
+    _pending_tags(orm_execute_state.session).update(tags)
+
+
+def invalidate_cache_tags(tags: Iterable[str]) -> None:
+    """Invalide les tags dans CacheService"""
+    tags = set(tags)
+    if tags:
+        invalidate_tags(*tags)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    """Invalide les tags relevés une fois les écritures visibles par les autres sessions"""
+    invalidate_cache_tags(session.info.pop(_PENDING_TAGS_KEY, ()))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_after_rollback(session: Session, transaction) -> None:
+    """Fin de la transaction principale sans commit : les écritures n'ont pas eu lieu"""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_TAGS_KEY, None)
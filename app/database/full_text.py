@@ -0,0 +1,260 @@
+"""
+Index plein texte SQLite FTS5 sur les consultants, missions et CVs
+Table virtuelle search_index synchronisée par triggers SQL (y compris pour les imports bruts)
+Classement bm25 pondéré : le titre (nom, client/rôle, fichier) pèse plus que le contenu
+"""
+
+import re
+import weakref
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .models import Base
+
+FTS_TABLE = "search_index"
+
+# rowid = id_source * ROWID_STRIDE + code : une ligne FTS par entité, supprimable par rowid
+ROWID_STRIDE = 4
+
+# Pondération bm25 par colonne : kind, consultant_id (non indexées), titre, contenu
+BM25_WEIGHTS = "0.0, 0.0, 10.0, 1.0"
+
+# Sources indexées : table, code rowid, colonnes surveillées, expressions titre / contenu
+# ({r} est remplacé par new / old dans les triggers et par le nom de table au rebuild)
+FTS_SOURCES = {
+    "consultant": {
+        "table": "consultants",
+        "code": 1,
+        "consultant_id": "{r}.id",
+        "columns": ("nom", "prenom", "email", "societe", "entite"),
+        "titre": "{r}.prenom || ' ' || {r}.nom",
+        "contenu": "coalesce({r}.email, '') || ' ' || coalesce({r}.societe, '') || ' ' || coalesce({r}.entite, '')",
+    },
+    "mission": {
+        "table": "missions",
+        "code": 2,
+        "consultant_id": "{r}.consultant_id",
+        "columns": ("consultant_id", "nom_mission", "client", "role", "description", "technologies_utilisees"),
+        "titre": "coalesce({r}.client, '') || ' ' || coalesce({r}.role, '')",
+        "contenu": (
+            "coalesce({r}.nom_mission, '') || ' ' || coalesce({r}.description, '')"
+            " || ' ' || coalesce({r}.technologies_utilisees, '')"
+        ),
+    },
+    "cv": {
+        "table": "cvs",
+        "code": 3,
+        "consultant_id": "{r}.consultant_id",
+        "columns": ("consultant_id", "fichier_nom", "contenu_extrait"),
+        "titre": "coalesce({r}.fichier_nom, '')",
+        "contenu": "coalesce({r}.contenu_extrait, '')",
+    },
+}
+
+_KIND_BY_CODE = {spec["code"]: kind for kind, spec in FTS_SOURCES.items()}
+
+# Engines sur lesquels l'index a déjà été vérifié
+_FTS_READY: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _rowid_expr(kind: str, ref: str) -> str:
+    return f"{ref}.id * {ROWID_STRIDE} + {FTS_SOURCES[kind]['code']}"
+
+
+def _insert_sql(kind: str, ref: str, from_clause: str = "") -> str:
+    """INSERT d'une source dans l'index (VALUES pour un trigger, SELECT pour un rebuild)"""
+    spec = FTS_SOURCES[kind]
+    values = ", ".join(
+        [
+            _rowid_expr(kind, ref),
+            f"'{kind}'",
+            spec["consultant_id"].format(r=ref),
+            spec["titre"].format(r=ref),
+            spec["contenu"].format(r=ref),
+        ]
+    )
+    head = f"INSERT INTO {FTS_TABLE}(rowid, kind, consultant_id, titre, contenu)"
+    if from_clause:
+        return f"{head} SELECT {values} {from_clause}"
+    return f"{head} VALUES ({values})"
+
+
+def _trigger_statements(kind: str) -> List[str]:
+    """Triggers AFTER INSERT / UPDATE / DELETE qui maintiennent l'index d'une source"""
+    spec = FTS_SOURCES[kind]
+    table = spec["table"]
+    delete_old = f"DELETE FROM {FTS_TABLE} WHERE rowid = {_rowid_expr(kind, 'old')}"
+    watched = ", ".join(spec["columns"])
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS fts_{table}_ai AFTER INSERT ON {table} BEGIN {_insert_sql(kind, 'new')}; END",
+        (
+            f"CREATE TRIGGER IF NOT EXISTS fts_{table}_au AFTER UPDATE OF {watched} ON {table} "
+            f"BEGIN {delete_old}; {_insert_sql(kind, 'new')}; END"
+        ),
+        f"CREATE TRIGGER IF NOT EXISTS fts_{table}_ad AFTER DELETE ON {table} BEGIN {delete_old}; END",
+    ]
+
+
+def is_fts5_available(connection) -> bool:
+    """Vérifie que le SQLite utilisé est compilé avec FTS5"""
+    if connection.dialect.name != "sqlite":
+        return False
+    return bool(connection.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar())
+
+
+def create_full_text_index(connection) -> bool:
+    """
+    Crée la table FTS5 et ses triggers, puis l'alimente si elle vient d'être créée
+
+    Returns:
+        bool: True si l'index est disponible sur cette connexion
+    """
+    if not is_fts5_available(connection):
+        return False
+
+    inspector = inspect(connection)
+    created = not inspector.has_table(FTS_TABLE)
+    # create_all partiel : n'indexer que les sources dont la table existe
+    kinds = [kind for kind, spec in FTS_SOURCES.items() if inspector.has_table(spec["table"])]
+    connection.execute(
+        text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            "kind UNINDEXED, consultant_id UNINDEXED, titre, contenu, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    )
+    for kind in kinds:
+        for statement in _trigger_statements(kind):
+            connection.execute(text(statement))
+
+    if created:
+        # Classement par défaut (ORDER BY rank) avec la pondération des colonnes
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES ('rank', 'bm25({BM25_WEIGHTS})')"))
+        rebuild_full_text_index(connection, kinds)
+    return True
+
+
+def drop_full_text_index(connection) -> None:
+    """Supprime la table FTS5 et ses triggers"""
+    for kind, spec in FTS_SOURCES.items():
+        for suffix in ("ai", "au", "ad"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS fts_{spec['table']}_{suffix}"))
+    connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+
+def rebuild_full_text_index(connection, kinds: Optional[Sequence[str]] = None) -> None:
+    """Réindexe intégralement consultants, missions et CVs (ou les sources indiquées)"""
+    connection.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    for kind in kinds if kinds is not None else FTS_SOURCES:
+        table = FTS_SOURCES[kind]["table"]
+        connection.execute(text(_insert_sql(kind, table, f"FROM {table}")))
+
+
+def ensure_full_text_index(engine) -> bool:
+    """
+    Garantit la présence de l'index sur un engine (vérification mémorisée)
+
+    Returns:
+        bool: True si la recherche plein texte est utilisable
+    """
+    if _FTS_READY.get(engine):
+        return True
+
+    try:
+        with engine.begin() as connection:
+            ready = create_full_text_index(connection)
+    except SQLAlchemyError as e:
+        print(f"⚠️ Index plein texte indisponible: {e}")
+        return False
+
+    if ready:
+        _FTS_READY[engine] = True
+    return ready
+
+
+def build_match_query(search_term: str) -> Optional[str]:
+    """
+    Convertit une saisie utilisateur en requête MATCH FTS5 sûre
+
+    Chaque mot devient un préfixe entre guillemets ("pyth"*), combinés en ET.
+    Les opérateurs FTS5 saisis par l'utilisateur sont donc neutralisés.
+
+    Returns:
+        Optional[str]: Requête MATCH, None si la saisie ne contient aucun mot
+    """
+    tokens = re.findall(r"\w+", search_term or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_full_text(
+    connection, search_term: str, limit: int = 50, kinds: Optional[Sequence[str]] = None
+) -> List[Dict]:
+    """
+    Exécute une recherche classée bm25 dans l'index
+
+    Args:
+        connection: Connexion ou session SQLAlchemy
+        search_term: Saisie utilisateur
+        limit: Nombre maximum de lignes d'index retournées
+        kinds: Sources à conserver ("consultant", "mission", "cv"), toutes si None
+
+    Returns:
+        List[Dict]: Lignes triées par pertinence avec kind, source_id,
+        consultant_id, score (plus élevé = plus pertinent) et extrait
+    """
+    match = build_match_query(search_term)
+    if match is None:
+        return []
+
+    params = {"match": match, "limit": limit}
+    kind_filter = ""
+    if kinds:
+        names = [kind for kind in kinds if kind in FTS_SOURCES]
+        if not names:
+            # Aucune source connue : inutile d'interroger l'index ("kind IN ()" n'est pas du SQL standard)
+            return []
+        kind_filter = " AND kind IN (" + ", ".join(f":kind_{i}" for i in range(len(names))) + ")"
+        params.update({f"kind_{i}": kind for i, kind in enumerate(names)})
+
+    rows = connection.execute(
+        text(
+            f"SELECT rowid, consultant_id, rank, snippet({FTS_TABLE}, -1, '[', ']', '…', 12) "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match{kind_filter} "
+            "ORDER BY rank LIMIT :limit"
+        ),
+        params,
+    ).all()
+
+    return [
+        {
+            "kind": _KIND_BY_CODE[rowid % ROWID_STRIDE],
+            "source_id": rowid // ROWID_STRIDE,
+            "consultant_id": consultant_id,
+            "score": -rank,
+            "extrait": extrait,
+        }
+        for rowid, consultant_id, rank, extrait in rows
+    ]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_index_with_schema(target, connection, **kw) -> None:
+    """Crée l'index avec le schéma (create_all) sur les bases SQLite"""
+    if is_fts5_available(connection):
+        create_full_text_index(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_index_with_schema(target, connection, **kw) -> None:
+    """Supprime l'index avant le schéma (drop_all) pour ne pas laisser de triggers orphelins"""
+    if connection.dialect.name == "sqlite":
+        drop_full_text_index(connection)
@@ -0,0 +1,289 @@
+"""
+Migrations de schéma versionnées et gestion des index de performance
+Remplace les scripts ponctuels (update_db_v12x.py, update_indexes.py, migrate_add_*.py) :
+chaque révision appliquée est enregistrée dans la table schema_migrations
+
+Toutes les révisions sont idempotentes : elles ne créent que ce qui manque et peuvent
+donc être rejouées sans risque sur une base mise à jour à la main.
+
+Usage en ligne de commande :
+    python -m app.database.migrations status    # révisions et index manquants
+    python -m app.database.migrations upgrade   # applique les révisions en attente
+"""
+
+import sys
+import weakref
+from datetime import datetime
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from sqlalchemy import inspect
+from sqlalchemy import insert
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.exc import CompileError
+from sqlalchemy.exc import SQLAlchemyError
+
+from .full_text import create_full_text_index
+from .mission_stats import refresh_mission_stats
+from .models import Base
+from .models import ConsultantMissionStats
+from .models import Mission
+from .models import SchemaMigration
+
+_MIGRATIONS_TABLE = SchemaMigration.__table__
+
+# Engines dont toutes les révisions ont déjà été vérifiées
+_UP_TO_DATE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _literal_default(dialect, column) -> Optional[str]:
+    """Rend la valeur par défaut scalaire d'une colonne en SQL littéral (None si absente)"""
+    default = column.default
+    if default is None or not getattr(default, "is_scalar", False):
+        return None
+    try:
+        return str(literal(default.arg, column.type).compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    except (CompileError, TypeError, ValueError):
+        return None
+
+
+def _add_column_ddl(dialect, table, column) -> Optional[str]:
+    """ALTER TABLE ... ADD COLUMN pour une colonne du modèle (None si non ajoutable)"""
+    default = _literal_default(dialect, column)
+    if not column.nullable and default is None:
+        return None
+
+    preparer = dialect.identifier_preparer
+    ddl = (
+        f"ALTER TABLE {preparer.format_table(table)} "
+        f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=dialect)}"
+    )
+    if default is not None:
+        ddl += f" DEFAULT {default}"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    return ddl
+
+
+def add_missing_columns(connection) -> List[str]:
+    """
+    Ajoute aux tables existantes les colonnes définies dans models.py mais absentes
+
+    Returns:
+        List[str]: Colonnes ajoutées ("table.colonne")
+    """
+    inspector = inspect(connection)
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = _add_column_ddl(connection.dialect, table, column)
+            if ddl is None:
+                print(f"⚠️ Colonne {table.name}.{column.name} non ajoutable (NOT NULL sans valeur par défaut)")
+                continue
+            connection.execute(text(ddl))
+            added.append(f"{table.name}.{column.name}")
+    return added
+
+
+def _index_columns(index) -> List[str]:
+    return [getattr(expression, "name", str(expression)) for expression in index.expressions]
+
+
+def get_missing_indexes(connection) -> List[Dict]:
+    """
+    Liste les index définis dans models.py mais absents de la base
+
+    Args:
+        connection: Connexion ou engine SQLAlchemy
+
+    Returns:
+        List[Dict]: table, index et colonnes de chaque index manquant
+        (les tables elles-mêmes absentes ne sont pas signalées)
+    """
+    inspector = inspect(connection)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                missing.append({"table": table.name, "index": index.name, "columns": _index_columns(index)})
+    return missing
+
+
+def create_missing_indexes(connection) -> List[str]:
+    """
+    Crée les index définis dans models.py qui manquent dans la base
+
+    Returns:
+        List[str]: Noms des index créés
+    """
+    missing = {(item["table"], item["index"]) for item in get_missing_indexes(connection)}
+    created = []
+    for table in Base.metadata.sorted_tables:
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if (table.name, index.name) in missing:
+                index.create(connection, checkfirst=True)
+                created.append(index.name)
+    return created
+
+
+def _create_missing_tables(connection) -> None:
+    """Crée les tables ajoutées depuis la création de la base et remplit les agrégats"""
+    stats_missing = not inspect(connection).has_table(ConsultantMissionStats.__tablename__)
+    Base.metadata.create_all(connection)
+    if stats_missing:
+        refresh_mission_stats(connection)
+
+
+def _backfill_mission_tjm(connection) -> None:
+    """Reprend l'ancien taux_journalier dans tjm (ex-update_db_v122.py)"""
+    missions = Mission.__table__.c
+    connection.execute(
+        update(Mission.__table__)
+        .where(missions.tjm.is_(None), missions.taux_journalier.isnot(None))
+        .values(tjm=missions.taux_journalier)
+    )
+
+
+# Révisions dans l'ordre d'application : une révision publiée ne doit plus être modifiée,
+# un nouveau besoin (colonne, index...) s'ajoute en fin de liste
+MIGRATIONS = [
+    {
+        "revision": "0001_missing_tables",
+        "description": "Tables ajoutées depuis la création de la base (agrégats de missions, dashboards...)",
+        "upgrade": _create_missing_tables,
+    },
+    {
+        "revision": "0002_missing_columns",
+        "description": "Colonnes V1.2 à V1.2.2, practice_id et période d'essai (ex-update_db_v12x / migrate_add_*)",
+        "upgrade": add_missing_columns,
+    },
+    {
+        "revision": "0003_backfill_mission_tjm",
+        "description": "Reprise de taux_journalier dans tjm",
+        "upgrade": _backfill_mission_tjm,
+    },
+    {
+        "revision": "0004_full_text_index",
+        "description": "Index plein texte FTS5 et triggers de synchronisation",
+        "upgrade": create_full_text_index,
+    },
+    {
+        "revision": "0005_performance_indexes",
+        "description": "Index de performance définis dans models.py (ex-update_indexes.py)",
+        "upgrade": create_missing_indexes,
+    },
+    {
+        "revision": "0006_association_indexes",
+        "description": "Index composites et partiels des gestions BM, compétences et langues",
+        "upgrade": create_missing_indexes,
+    },
+]
+
+
+def _applied_revisions(connection) -> List[str]:
+    return list(connection.execute(select(_MIGRATIONS_TABLE.c.revision)).scalars())
+
+
+def upgrade_database(engine) -> bool:
+    """
+    Applique les révisions en attente, chacune dans sa propre transaction
+
+    Args:
+        engine: Engine SQLAlchemy de la base à mettre à jour
+
+    Returns:
+        bool: True si la base est à jour, False si une révision a échoué
+        (les suivantes ne sont pas appliquées)
+    """
+    if _UP_TO_DATE.get(engine):
+        return True
+
+    revision = None
+    try:
+        with engine.begin() as connection:
+            _MIGRATIONS_TABLE.create(connection, checkfirst=True)
+            applied = set(_applied_revisions(connection))
+
+        for migration in MIGRATIONS:
+            revision = migration["revision"]
+            if revision in applied:
+                continue
+            with engine.begin() as connection:
+                migration["upgrade"](connection)
+                connection.execute(
+                    insert(_MIGRATIONS_TABLE).values(
+                        revision=revision,
+                        description=migration["description"],
+                        applied_at=datetime.now(),
+                    )
+                )
+            print(f"✅ Migration appliquée: {revision}")
+    except SQLAlchemyError as e:
+        print(f"❌ Erreur lors de la migration {revision or 'schema_migrations'}: {e}")
+        return False
+
+    _UP_TO_DATE[engine] = True
+    return True
+
+
+def get_migration_status(engine) -> Dict:
+    """
+    Retourne l'état des migrations d'une base
+
+    Returns:
+        Dict: "applied" (révisions enregistrées), "pending" (révisions à appliquer)
+        et "missing_indexes" (index de models.py absents de la base)
+    """
+    try:
+        with engine.connect() as connection:
+            applied = []
+            if inspect(connection).has_table(_MIGRATIONS_TABLE.name):
+                applied = _applied_revisions(connection)
+            missing_indexes = get_missing_indexes(connection)
+    except SQLAlchemyError as e:
+        print(f"❌ Erreur lors de la lecture de l'état des migrations: {e}")
+        return {"applied": [], "pending": [], "missing_indexes": []}
+
+    return {
+        "applied": applied,
+        "pending": [m["revision"] for m in MIGRATIONS if m["revision"] not in applied],
+        "missing_indexes": missing_indexes,
+    }
+
+
+def main(argv: List[str]) -> int:
+    """Point d'entrée en ligne de commande (status / upgrade)"""
+    from .database import get_database_engine
+
+    command = argv[0] if argv else "status"
+    engine = get_database_engine()
+
+    if command == "upgrade":
+        return 0 if upgrade_database(engine) else 1
+    if command != "status":
+        print(f"Commande inconnue: {command} (status ou upgrade)")
+        return 2
+
+    status = get_migration_status(engine)
+    print(f"Révisions appliquées : {len(status['applied'])}")
+    for revision in status["pending"]:
+        print(f"⏳ En attente : {revision}")
+    for item in status["missing_indexes"]:
+        print(f"⚠️ Index manquant : {item['index']} sur {item['table']} ({', '.join(item['columns'])})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
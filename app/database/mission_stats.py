@@ -0,0 +1,217 @@
+"""
+Maintenance des agrégats de missions par consultant
+Recalcule la table consultant_mission_stats pour les consultants touchés à chaque flush
+Permet aux listes de consultants de lire nb_missions sans JOIN ni GROUP BY sur missions
+"""
+
+import weakref
+from datetime import datetime
+from typing import Iterable
+from typing import Optional
+from typing import Set
+
+from sqlalchemy import DateTime
+from sqlalchemy import case
+from sqlalchemy import delete
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .models import Consultant
+from .models import ConsultantMissionStats
+from .models import Mission
+
+# Statut d'une mission comptée comme active (cf. get_consultant_summary_stats)
+MISSION_STATUT_ACTIF = "en_cours"
+
+_STATS_TABLE = ConsultantMissionStats.__table__
+_MISSIONS_TABLE = Mission.__table__
+
+# Comparaison par nom de table : les pages qui importent les modèles via "database.models"
+# manipulent une seconde copie des classes
+_MISSIONS_TABLE_NAME = Mission.__tablename__
+_CONSULTANTS_TABLE_NAME = Consultant.__tablename__
+
+# Clé de session.info pour les consultants d'origine des missions réaffectées
+_PREVIOUS_OWNERS_KEY = "mission_stats_previous_owners"
+
+# Clé de session.info du dernier flush traité : "database.database" charge une seconde copie
+# de ce module (et de ses listeners), un flush n'est recalculé qu'une fois
+_REFRESHED_FLUSH_KEY = "mission_stats_refreshed_flush"
+
+# Engines sur lesquels la table d'agrégats a déjà été trouvée
+_STATS_TABLE_PRESENT: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _build_aggregate_select():
+    """Construit le SELECT d'agrégation des missions par consultant"""
+    missions = _MISSIONS_TABLE.c
+    return select(
+        missions.consultant_id,
+        func.count(missions.id),
+        func.coalesce(func.sum(case((missions.statut == MISSION_STATUT_ACTIF, 1), else_=0)), 0),
+        func.max(missions.date_fin),
+        func.avg(func.coalesce(missions.tjm, missions.taux_journalier)),
+        literal(datetime.now(), DateTime),
+    ).group_by(missions.consultant_id)
+
+
+def refresh_mission_stats(connection, consultant_ids: Optional[Iterable[int]] = None) -> None:
+    """
+    Recalcule les agrégats de missions
+
+    Args:
+        connection: Connexion ou session SQLAlchemy (dans la transaction en cours)
+        consultant_ids: Consultants à recalculer (None pour reconstruire toute la table)
+    """
+    delete_stmt = delete(_STATS_TABLE)
+    aggregate = _build_aggregate_select()
+
+    if consultant_ids is not None:
+        ids = sorted({cid for cid in consultant_ids if cid is not None})
+        if not ids:
+            return
+        delete_stmt = delete_stmt.where(_STATS_TABLE.c.consultant_id.in_(ids))
+        aggregate = aggregate.where(_MISSIONS_TABLE.c.consultant_id.in_(ids))
+
+    insert_stmt = insert(_STATS_TABLE).from_select(
+        [
+            _STATS_TABLE.c.consultant_id,
+            _STATS_TABLE.c.nb_missions,
+            _STATS_TABLE.c.nb_missions_actives,
+            _STATS_TABLE.c.derniere_date_fin,
+            _STATS_TABLE.c.tjm_moyen,
+            _STATS_TABLE.c.derniere_maj,
+        ],
+        aggregate,
+    )
+
+    connection.execute(delete_stmt)
+    connection.execute(insert_stmt)
+
+
+def _table_name(obj) -> Optional[str]:
+    return getattr(obj, "__tablename__", None)
+
+
+def _collect_touched_consultant_ids(session: Session) -> Set[int]:
+    """Retourne les consultants dont les missions changent dans ce flush"""
+    touched: Set[int] = set()
+
+    for obj in session.new:
+        if _table_name(obj) == _MISSIONS_TABLE_NAME:
+            touched.add(obj.consultant_id)
+
+    for obj in session.deleted:
+        if _table_name(obj) == _MISSIONS_TABLE_NAME:
+            touched.add(obj.consultant_id)
+        elif _table_name(obj) == _CONSULTANTS_TABLE_NAME:
+            touched.add(obj.id)
+
+    for obj in session.dirty:
+        if _table_name(obj) == _MISSIONS_TABLE_NAME and session.is_modified(obj):
+            touched.add(obj.consultant_id)
+
+    # Missions réaffectées : l'ancien consultant perd une mission (cf. before_flush)
+    touched.update(session.info.pop(_PREVIOUS_OWNERS_KEY, ()))
+    touched.discard(None)
+    return touched
+
+
+def _previous_consultant_id(session: Session, mission) -> Optional[int]:
+    """Retourne le consultant d'origine d'une mission réaffectée, None sinon"""
+    state = inspect(mission)
+    history = state.attrs.consultant_id.history
+    if not history.added or not state.has_identity:
+        return None
+    if history.deleted:
+        return history.deleted[0]
+
+    # Attribut expiré avant modification : l'ancienne valeur n'est qu'en base
+    return (
+        session.connection()
+        .execute(select(_MISSIONS_TABLE.c.consultant_id).where(_MISSIONS_TABLE.c.id == mission.id))
+        .scalar()
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _remember_previous_owners(session: Session, flush_context, instances) -> None:
+    """Mémorise les consultants qui perdent une mission avant que le flush n'écrase la valeur"""
+    previous = {
+        _previous_consultant_id(session, obj) for obj in session.dirty if _table_name(obj) == _MISSIONS_TABLE_NAME
+    }
+    previous.discard(None)
+    if previous:
+        session.info.setdefault(_PREVIOUS_OWNERS_KEY, set()).update(previous)
+
+
+def _stats_table_exists(connection) -> bool:
+    """Vérifie (avec mémorisation par engine) que la table d'agrégats existe"""
+    engine = connection.engine
+    if _STATS_TABLE_PRESENT.get(engine):
+        return True
+
+    present = inspect(connection).has_table(_STATS_TABLE.name)
+    if present:
+        _STATS_TABLE_PRESENT[engine] = True
+    return present
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_mission_stats_after_flush(session: Session, flush_context) -> None:
+    """Maintient consultant_mission_stats dans la même transaction que l'écriture"""
+    if session.info.get(_REFRESHED_FLUSH_KEY) is flush_context:
+        return
+    session.info[_REFRESHED_FLUSH_KEY] = flush_context
+
+    touched = _collect_touched_consultant_ids(session)
+    if not touched:
+        return
+
+    connection = session.connection()
+    # Base antérieure à la table : ne pas bloquer l'écriture des missions
+    if _stats_table_exists(connection):
+        refresh_mission_stats(connection, touched)
+
+
+def ensure_mission_stats_table(engine) -> bool:
+    """
+    Crée la table d'agrégats si elle manque et la remplit depuis les missions existantes
+
+    Returns:
+        bool: True si la table est disponible
+    """
+    try:
+        with engine.begin() as connection:
+            if not inspect(connection).has_table(_STATS_TABLE.name):
+                _STATS_TABLE.create(connection)
+                refresh_mission_stats(connection)
+        return True
+    except SQLAlchemyError as e:
+        print(f"⚠️ Table des statistiques de missions indisponible: {e}")
+        return False
+
+
+def rebuild_all_mission_stats() -> bool:
+    """
+    Reconstruit intégralement les agrégats (après un import SQL brut ou des
+    mises à jour en masse qui contournent les événements de l'ORM)
+
+    Returns:
+        bool: True si la reconstruction a réussi
+    """
+    from .database import get_database_engine
+
+    try:
+        with get_database_engine().begin() as connection:
+            refresh_mission_stats(connection)
+        return True
+    except SQLAlchemyError as e:
+        print(f"❌ Erreur lors de la reconstruction des statistiques de missions: {e}")
+        return False
@@ -19,12 +19,23 @@ from sqlalchemy import ForeignKey
 from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import JSON
+from sqlalchemy import Numeric
 from sqlalchemy import String
 from sqlalchemy import Text
+from sqlalchemy import case
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import true
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import relationship
 
+from .sql_functions import days_between
+from .sql_functions import format_date_fr
+
 if TYPE_CHECKING:
     from typing import Any
 
@@ -35,6 +46,11 @@ CONSULTANTS_ID_FK = "consultants.id"
 Base = declarative_base()
 
 
+def _sql_today():
+    """Date du jour passée en paramètre : les expressions SQL utilisent la même date que date.today()"""
+    return literal(date.today(), Date)
+
+
 class Practice(Base):
     """Modèle pour les practices (Data, Quant, etc.)"""
 
@@ -128,6 +144,13 @@ class Consultant(Base):
         Index("idx_consultant_disponibilite", "disponibilite"),
         Index("idx_consultant_practice", "practice_id"),
         Index("idx_consultant_date_maj", "derniere_maj"),
+        # Pagination keyset : (colonne de tri, id)
+        Index("idx_consultant_nom_id", "nom", "id"),
+        Index("idx_consultant_prenom_id", "prenom", "id"),
+        # Anciennement créés par update_indexes.py
+        Index("idx_consultant_salaire", "salaire_actuel"),
+        Index("idx_consultant_recherche", "nom", "prenom", "email"),
+        Index("idx_consultant_dispo_practice", "disponibilite", "practice_id"),
     )
 
     def __repr__(self) -> str:
@@ -156,7 +179,7 @@ class Consultant(Base):
                 return cbm.business_manager
         return None
 
-    @property
+    @hybrid_property
     def experience_annees(self) -> float:
         """
         Calcule l'expérience en années depuis la première mission
@@ -167,6 +190,7 @@ class Consultant(Base):
         Note:
             Le calcul prend en compte les années bissextiles (365.25 jours/an)
             Retourne 0 si aucune date de première mission n'est définie
+            Utilisable en SQL : filter(Consultant.experience_annees >= 5)
 
         Example:
             >>> from datetime import date
@@ -180,7 +204,16 @@ class Consultant(Base):
         delta = today - self.date_premiere_mission
         return round(delta.days / 365.25, 1)  # Prise en compte des années bissextiles
 
-    @property
+    @experience_annees.inplace.expression
+    @classmethod
+    def _experience_annees_expression(cls):
+        annees = cast(days_between(_sql_today(), cls.date_premiere_mission) / 365.25, Numeric(10, 2))
+        return case(
+            (cls.date_premiere_mission.is_(None), 0),
+            else_=func.round(annees, 1, type_=Float),
+        )
+
+    @hybrid_property
     def statut_societe(self) -> str:
         """
         Retourne le statut actuel du consultant dans la société
@@ -192,6 +225,7 @@ class Consultant(Base):
             - "En poste" : Pas de date de sortie définie
             - "Départ prévu" : Date de sortie future
             - "Parti" : Date de sortie passée
+            Utilisable en SQL : filter(Consultant.statut_societe == "En poste")
 
         Example:
             >>> from datetime import date
@@ -206,33 +240,70 @@ class Consultant(Base):
         else:
             return "Parti"
 
-    @property
-    def date_disponibilite(self) -> str:
-        """
-        Calcule la date de disponibilité du consultant
-        - Si disponible immédiatement: 'ASAP'
-        - Sinon: date de fin de la mission la plus tardive (si > aujourd'hui)
+    @statut_societe.inplace.expression
+    @classmethod
+    def _statut_societe_expression(cls):
+        return case(
+            (cls.date_sortie_societe.is_(None), "En poste"),
+            (cls.date_sortie_societe > _sql_today(), "Départ prévu"),
+            else_="Parti",
+        )
+
+    @hybrid_property
+    def date_fin_engagement(self) -> Optional[date]:
         """
+        Date de fin de la mission la plus tardive encore à venir
 
-        # Si marqué comme disponible, retour ASAP
+        Returns:
+            Optional[date]: None si le consultant est disponible ou sans mission future
+
+        Note:
+            Utilisable en SQL (sous-requête corrélée sur missions) pour filtrer
+            "disponible avant le X" : date_fin_engagement IS NULL OR date_fin_engagement <= X
+        """
         if self.disponibilite:
-            return "ASAP"
+            return None
 
-        # Chercher la date de fin de mission la plus tardive
         today = date.today()
-        max_date_fin: Optional[datetime.date] = None
+        max_date_fin: Optional[date] = None
 
         for mission in self.missions:
             if mission.date_fin and mission.date_fin > today:
                 if max_date_fin is None or mission.date_fin > max_date_fin:
                     max_date_fin = mission.date_fin
 
+        return max_date_fin
+
+    @date_fin_engagement.inplace.expression
+    @classmethod
+    def _date_fin_engagement_expression(cls):
+        derniere_fin = (
+            select(func.max(Mission.date_fin))
+            .where(Mission.consultant_id == cls.id, Mission.date_fin > _sql_today())
+            .correlate_except(Mission)
+            .scalar_subquery()
+        )
+        return case((cls.disponibilite == true(), None), else_=derniere_fin)
+
+    @hybrid_property
+    def date_disponibilite(self) -> str:
+        """
+        Calcule la date de disponibilité du consultant
+        - Si disponible immédiatement: 'ASAP'
+        - Sinon: date de fin de la mission la plus tardive (si > aujourd'hui)
+        """
+        max_date_fin = self.date_fin_engagement
         if max_date_fin:
             return max_date_fin.strftime("%d/%m/%Y")
         else:
-            # Aucune mission avec date de fin future, donc ASAP
+            # Disponible ou aucune mission avec date de fin future, donc ASAP
             return "ASAP"
 
+    @date_disponibilite.inplace.expression
+    @classmethod
+    def _date_disponibilite_expression(cls):
+        return func.coalesce(format_date_fr(cls.date_fin_engagement), "ASAP")
+
 
 class Competence(Base):
     """Modèle pour les compétences techniques et fonctionnelles"""
@@ -253,6 +324,13 @@ class Competence(Base):
         "ConsultantCompetence", back_populates="competence"
     )
 
+    # Index de performance (anciennement créés par update_indexes.py, nom est déjà unique)
+    __table_args__ = (
+        Index("idx_competence_categorie", "categorie"),
+        Index("idx_competence_type", "type_competence"),
+        Index("idx_competence_nom_categorie", "nom", "categorie"),
+    )
+
     def __repr__(self) -> str:
         return f"<Competence(id={self.id}, nom='{self.nom}', categorie='{self.categorie}')>"
 
@@ -276,6 +354,12 @@ class ConsultantCompetence(Base):
     consultant: Mapped["Consultant"] = relationship("Consultant", back_populates="competences")
     competence: Mapped["Competence"] = relationship("Competence", back_populates="consultant_competences")
 
+    # Index de performance : compétences d'un consultant et consultants d'une compétence
+    __table_args__ = (
+        Index("idx_consultant_competence_consultant", "consultant_id", "competence_id"),
+        Index("idx_consultant_competence_competence", "competence_id", "consultant_id"),
+    )
+
     def __repr__(self) -> str:
         return f"<ConsultantCompetence(consultant_id={self.consultant_id}, competence_id={self.competence_id}, experience={self.annees_experience})>"
 
@@ -309,6 +393,9 @@ class Mission(Base):
         Index("idx_mission_statut", "statut"),
         Index("idx_mission_dates", "date_debut", "date_fin"),
         Index("idx_mission_consultant_dates", "consultant_id", "date_debut"),
+        # Anciennement créés par update_indexes.py
+        Index("idx_mission_consultant_statut", "consultant_id", "statut"),
+        Index("idx_mission_client_consultant", "client", "consultant_id"),
     )
 
     def __repr__(self) -> str:
@@ -334,6 +421,28 @@ class Mission(Base):
         return None
 
 
+class ConsultantMissionStats(Base):
+    """
+    Agrégats de missions par consultant, maintenus à chaque écriture sur Mission
+
+    Évite le LEFT JOIN + GROUP BY sur missions dans les listes de consultants :
+    la ligne est recalculée par app.database.mission_stats lors du flush.
+    Un consultant sans mission n'a pas de ligne (valeurs à lire en COALESCE).
+    """
+
+    __tablename__ = "consultant_mission_stats"
+
+    consultant_id: Mapped[int] = Column(Integer, ForeignKey(CONSULTANTS_ID_FK, ondelete="CASCADE"), primary_key=True)
+    nb_missions: Mapped[int] = Column(Integer, nullable=False, default=0)
+    nb_missions_actives: Mapped[int] = Column(Integer, nullable=False, default=0)
+    derniere_date_fin: Mapped[Optional[datetime.date]] = Column(Date)
+    tjm_moyen: Mapped[Optional[float]] = Column(Float)
+    derniere_maj: Mapped[datetime] = Column(DateTime, default=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"<ConsultantMissionStats(consultant_id={self.consultant_id}, nb_missions={self.nb_missions})>"
+
+
 class CV(Base):
     """Modèle pour les CVs uploadés"""
 
@@ -418,6 +527,12 @@ class ConsultantLangue(Base):
     consultant: Mapped["Consultant"] = relationship("Consultant", back_populates="langues")
     langue: Mapped["Langue"] = relationship("Langue", back_populates="consultant_langues")
 
+    # Index de performance : langues d'un consultant et consultants parlant une langue
+    __table_args__ = (
+        Index("idx_consultant_langue_consultant", "consultant_id", "langue_id"),
+        Index("idx_consultant_langue_langue", "langue_id", "consultant_id"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<ConsultantLangue(consultant_id={self.consultant_id}, langue_id={self.langue_id}, niveau={self.niveau})>"
@@ -602,6 +717,30 @@ class ConsultantBusinessManager(Base):
     consultant: Mapped["Consultant"] = relationship("Consultant", back_populates="business_manager_gestions")
     business_manager: Mapped["BusinessManager"] = relationship("BusinessManager", back_populates="consultant_gestions")
 
+    # Index de performance : gestions actives (date_fin IS NULL) en index partiels
+    # (SQLite, PostgreSQL ; index complets sur les autres moteurs) et historiques.
+    # date_fin figure dans les index actifs pour qu'ils soient couvrants
+    __table_args__ = (
+        Index(
+            "idx_cbm_bm_actif",
+            "business_manager_id",
+            "consultant_id",
+            "date_fin",
+            sqlite_where=date_fin.is_(None),
+            postgresql_where=date_fin.is_(None),
+        ),
+        Index(
+            "idx_cbm_consultant_actif",
+            "consultant_id",
+            "business_manager_id",
+            "date_fin",
+            sqlite_where=date_fin.is_(None),
+            postgresql_where=date_fin.is_(None),
+        ),
+        Index("idx_cbm_bm_historique", "business_manager_id", "date_debut"),
+        Index("idx_cbm_consultant_historique", "consultant_id", "date_debut"),
+    )
+
     def __repr__(self) -> str:
         return f"<ConsultantBusinessManager(consultant_id={self.consultant_id}, bm_id={self.business_manager_id}, debut={self.date_debut})>"
 
@@ -719,3 +858,18 @@ class WidgetCatalog(Base):
 
     def __repr__(self):
         return f"<WidgetCatalog(id={self.id}, name='{self.name}', category='{self.category}')>"
+
+
+class SchemaMigration(Base):
+    """
+    Révisions de schéma appliquées à la base (cf. app.database.migrations)
+    """
+
+    __tablename__ = "schema_migrations"
+
+    revision: Mapped[str] = Column(String(100), primary_key=True)
+    description: Mapped[Optional[str]] = Column(String(255))
+    applied_at: Mapped[datetime] = Column(DateTime, default=datetime.now)
+
+    def __repr__(self) -> str:
+        return f"<SchemaMigration(revision='{self.revision}')>"
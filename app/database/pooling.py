@@ -0,0 +1,127 @@
+"""
+Mode de pool lecteurs / écrivain pour SQLite
+N connexions de lecture en parallèle et une seule connexion d'écriture partagée en file d'attente
+Les temps d'attente de connexion sont mesurés pour le suivi de la charge
+"""
+
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import exc
+from sqlalchemy import event
+from sqlalchemy import pool
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import CompoundSelect
+from sqlalchemy.sql import Select
+
+# Clé de session.info : la transaction en cours a écrit, les lectures suivantes doivent voir ces écritures
+_WROTE_KEY = "read_write_wrote"
+
+
+class PoolMetrics:
+    """Compteurs d'attente d'un pool de connexions (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Remet les compteurs à zéro"""
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.waiting = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def start_wait(self) -> float:
+        with self._lock:
+            self.waiting += 1
+        return time.perf_counter()
+
+    def end_wait(self, start: float, timed_out: bool = False) -> None:
+        wait = time.perf_counter() - start
+        with self._lock:
+            self.waiting -= 1
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict:
+        """Retourne les métriques courantes (temps en millisecondes)"""
+        with self._lock:
+            avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "waiting": self.waiting,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "total_wait_ms": round(self.total_wait * 1000, 3),
+            }
+
+
+class TimedQueuePool(pool.QueuePool):
+    """QueuePool qui mesure le temps d'attente de chaque emprunt de connexion"""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = self.metrics.start_wait()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.end_wait(start, timed_out=True)
+            raise
+        except BaseException:
+            self.metrics.end_wait(start)
+            raise
+        self.metrics.end_wait(start)
+        return connection
+
+    def recreate(self):
+        # dispose() / invalidation : conserver l'historique des métriques
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+
+class ReadWriteSession(Session):
+    """
+    Session qui route les SELECT vers le pool de lecture et le reste vers l'écrivain
+
+    Dès qu'une transaction a écrit (flush, INSERT/UPDATE/DELETE, SQL textuel),
+    toutes ses requêtes restent sur l'écrivain afin de lire ses propres écritures.
+    """
+
+    def __init__(self, *args, reader=None, **kw):
+        super().__init__(*args, **kw)
+        self.reader = reader
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        if self.reader is not None and isinstance(clause, (Select, CompoundSelect)):
+            if not self._flushing and not self.info.get(_WROTE_KEY):
+                return self.reader
+
+        if clause is not None or self._flushing:
+            self.info[_WROTE_KEY] = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+@event.listens_for(ReadWriteSession, "after_transaction_end")
+def _reset_write_routing(session, transaction) -> None:
+    """Fin de transaction : les lectures repartent vers le pool de lecture"""
+    if transaction.parent is None:
+        session.info.pop(_WROTE_KEY, None)
+
+
+def get_engine_pool_metrics(engine) -> Dict:
+    """Retourne les métriques d'attente d'un engine (vide si son pool n'est pas mesuré)"""
+    metrics = getattr(engine.pool, "metrics", None)
+    return metrics.snapshot() if metrics is not None else {}
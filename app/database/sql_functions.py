@@ -0,0 +1,94 @@
+"""
+Fonctions SQL de calcul et de formatage de dates indépendantes du moteur de base de données
+Chaque construction est compilée selon le dialecte (SQLite, PostgreSQL, MySQL, SQL Server)
+pour que les services n'emploient plus de fonctions propres à SQLite comme julianday
+"""
+
+from sqlalchemy import Date
+from sqlalchemy import Float
+from sqlalchemy import String
+from sqlalchemy import cast
+from sqlalchemy import literal
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class days_between(FunctionElement):  # noqa: N801 - usage comme une fonction SQL (func.*)
+    """
+    Nombre de jours entre deux dates : days_between(date_fin, date_debut)
+
+    Renvoie NULL si l'une des deux dates est NULL (à combiner avec func.coalesce).
+
+    Example:
+        >>> duree = func.coalesce(days_between(Mission.date_fin, Mission.date_debut), 30)
+    """
+
+    type = Float()
+    inherit_cache = True
+    name = "days_between"
+
+
+@compiles(days_between)
+def _days_between_default(element, compiler, **kw):
+    # Soustraction de dates ANSI (PostgreSQL, Oracle...) : résultat en jours
+    end, start = list(element.clauses)
+    return compiler.process((cast(end, Date) - cast(start, Date)).self_group(), **kw)
+
+
+@compiles(days_between, "sqlite")
+def _days_between_sqlite(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"(julianday({compiler.process(end, **kw)}) - julianday({compiler.process(start, **kw)}))"
+
+
+@compiles(days_between, "mysql")
+@compiles(days_between, "mariadb")
+def _days_between_mysql(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"DATEDIFF({compiler.process(end, **kw)}, {compiler.process(start, **kw)})"
+
+
+@compiles(days_between, "mssql")
+def _days_between_mssql(element, compiler, **kw):
+    end, start = list(element.clauses)
+    return f"DATEDIFF(day, {compiler.process(start, **kw)}, {compiler.process(end, **kw)})"
+
+
+class format_date_fr(FunctionElement):  # noqa: N801 - usage comme une fonction SQL (func.*)
+    """
+    Date au format français JJ/MM/AAAA (NULL si la date est NULL)
+
+    Example:
+        >>> select(func.coalesce(format_date_fr(Mission.date_fin), "En cours"))
+    """
+
+    type = String()
+    inherit_cache = True
+    name = "format_date_fr"
+
+
+@compiles(format_date_fr)
+def _format_date_fr_default(element, compiler, **kw):
+    # PostgreSQL, Oracle
+    (value,) = list(element.clauses)
+    return f"to_char({compiler.process(value, **kw)}, 'DD/MM/YYYY')"
+
+
+@compiles(format_date_fr, "sqlite")
+def _format_date_fr_sqlite(element, compiler, **kw):
+    (value,) = list(element.clauses)
+    return f"strftime('%d/%m/%Y', {compiler.process(value, **kw)})"
+
+
+@compiles(format_date_fr, "mysql")
+@compiles(format_date_fr, "mariadb")
+def _format_date_fr_mysql(element, compiler, **kw):
+    # Format passé en paramètre : les % littéraux seraient pris pour des marqueurs (paramstyle "format")
+    (value,) = list(element.clauses)
+    return f"DATE_FORMAT({compiler.process(value, **kw)}, {compiler.process(literal('%d/%m/%Y'), **kw)})"
+
+
+@compiles(format_date_fr, "mssql")
+def _format_date_fr_mssql(element, compiler, **kw):
+    (value,) = list(element.clauses)
+    return f"FORMAT({compiler.process(value, **kw)}, 'dd/MM/yyyy')"
@@ -10,6 +10,8 @@ import traceback
 import streamlit as st
 from streamlit_option_menu import option_menu
 
+from app.services.cache_warmup import start_configured_warmup
+
 # Constantes pour éviter la duplication
 CONSULTANTS_MENU_LABEL = "👥 Consultants"
 
@@ -107,6 +109,9 @@ def show_navigation():
 def main():
     """Fonction principale de l'application"""
     try:
+        # Préchauffage du cache (une fois par processus, cf. CONSULTATOR_CACHE_WARMUP)
+        start_configured_warmup()
+
         # Header principal
         st.markdown('<div class="main-header">🏢 Consultator</div>', unsafe_allow_html=True)
 
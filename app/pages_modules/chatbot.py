@@ -189,6 +189,24 @@ def show_data_insights(data: dict, intent: str):
             st.progress(actifs_ratio)
 
 
+def show_answer_cache_status(chatbot_service):
+    """Affiche l'origine de la dernière réponse (cache ou calcul) et le taux de succès du cache"""
+    last_answer_cached = getattr(chatbot_service, "last_answer_cached", None)
+    if not isinstance(last_answer_cached, bool):
+        # Aucune question posée
+        return
+
+    if last_answer_cached:
+        st.caption("⚡ Dernière réponse : servie depuis le cache")
+    else:
+        st.caption("🔄 Dernière réponse : calculée")
+
+    stats = chatbot_service.get_answer_cache_stats()
+    questions = stats["hits"] + stats["misses"]
+    if questions:
+        st.caption(f"📦 Cache des réponses : {stats['hits']}/{questions} ({stats['hit_rate']:.0f} %)")
+
+
 def show_sidebar():
     """Affiche la sidebar avec les options"""
 
@@ -208,6 +226,10 @@ def show_sidebar():
         debug_mode = st.checkbox("🔧 Mode debug", value=st.session_state.get("debug_mode", False))
         st.session_state.debug_mode = debug_mode
 
+        # Statut du cache des réponses
+        if "chatbot_service" in st.session_state:
+            show_answer_cache_status(st.session_state.chatbot_service)
+
         st.markdown("---")
         st.markdown("### 💡 Conseils d'utilisation")
 
@@ -21,8 +21,6 @@ Mission = None
 imports_ok = False
 
 try:
-    from sqlalchemy.orm import joinedload
-
     from database.database import get_database_session
     from database.models import Consultant
     from database.models import Mission
@@ -68,36 +66,27 @@ def show():
 
 
 def _load_consultant_data(consultant_id):
-    """Charge les données d'un consultant avec gestion d'erreurs."""
-    with get_database_session() as session:
-        consultant = (
-            session.query(Consultant)
-            .options(joinedload(Consultant.practice))
-            .filter(Consultant.id == consultant_id)
-            .first()
-        )
+    """Charge les données d'un consultant à partir de son profil complet (ConsultantProfileBundle)."""
+    profile = ConsultantService.load_profile_bundle(consultant_id)
+
+    if not profile:
+        return None, None
+
+    # Créer un dictionnaire avec toutes les données nécessaires
+    consultant_data = {
+        "id": profile.id,
+        "prenom": profile.prenom,
+        "nom": profile.nom,
+        "email": profile.email,
+        "telephone": profile.telephone,
+        "salaire_actuel": profile.salaire_actuel,
+        "disponibilite": profile.disponibilite,
+        "notes": profile.notes,
+        "date_creation": profile.date_creation,
+        "practice_name": profile.practice_nom or "Non affecté",
+    }
 
-        if not consultant:
-            return None, None
-
-        # Charger toutes les données nécessaires dans la session
-        practice_name = consultant.practice.nom if consultant.practice else "Non affecté"
-
-        # Créer un dictionnaire avec toutes les données nécessaires
-        consultant_data = {
-            "id": consultant.id,
-            "prenom": consultant.prenom,
-            "nom": consultant.nom,
-            "email": consultant.email,
-            "telephone": consultant.telephone,
-            "salaire_actuel": consultant.salaire_actuel,
-            "disponibilite": consultant.disponibilite,
-            "notes": consultant.notes,
-            "date_creation": consultant.date_creation,
-            "practice_name": practice_name,
-        }
-
-        return consultant_data, session
+    return consultant_data, profile
 
 
 def _show_consultant_not_found(consultant_id):
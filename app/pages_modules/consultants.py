@@ -164,35 +164,26 @@ def show_cv_analysis_fullwidth():
 
 
 def _load_consultant_data(consultant_id):
-    """Charge les données d'un consultant avec ses relations."""
-    with get_database_session() as session:
-        consultant = (
-            session.query(Consultant)
-            .options(joinedload(Consultant.practice))
-            .filter(Consultant.id == consultant_id)
-            .first()
-        )
-
-        if not consultant:
-            return None, None
-
-        # Charger toutes les données nécessaires dans la session
-        practice_name = consultant.practice.nom if consultant.practice else STATUT_NON_AFFECTE
-
-        # Créer un dictionnaire avec toutes les données nécessaires
-        consultant_data = {
-            "id": consultant.id,
-            "prenom": consultant.prenom,
-            "nom": consultant.nom,
-            "email": consultant.email,
-            "telephone": consultant.telephone,
-            "salaire_actuel": consultant.salaire_actuel,
-            "disponibilite": consultant.disponibilite,
-            "notes": consultant.notes,
-            "date_creation": consultant.date_creation,
-            "practice_name": practice_name,
-        }
-        return consultant_data, consultant
+    """Charge les données d'un consultant à partir de son profil complet (ConsultantProfileBundle)."""
+    profile = ConsultantService.load_profile_bundle(consultant_id)
+
+    if not profile:
+        return None, None
+
+    # Créer un dictionnaire avec toutes les données nécessaires
+    consultant_data = {
+        "id": profile.id,
+        "prenom": profile.prenom,
+        "nom": profile.nom,
+        "email": profile.email,
+        "telephone": profile.telephone,
+        "salaire_actuel": profile.salaire_actuel,
+        "disponibilite": profile.disponibilite,
+        "notes": profile.notes,
+        "date_creation": profile.date_creation,
+        "practice_name": profile.practice_nom or STATUT_NON_AFFECTE,
+    }
+    return consultant_data, profile
 
 
 def _display_consultant_header(consultant_data):
@@ -1776,14 +1767,13 @@ def show_consultants_list_enhanced():
     # Recherche en temps réel
     search_term = _render_search_input()
 
-    # Chargement des données
-    consultants = _load_consultants_data(search, search_term)
-    if not consultants:
+    # Chargement des données (conservées dans la session jusqu'à la prochaine écriture en base)
+    dataset_key, consultants_data = _get_consultants_data(search, search_term)
+    if not consultants_data:
         return
 
-    # Traitement et affichage des données
-    consultants_data = _convert_consultants_to_data(consultants)
-    filtered_data = filters.apply_filters(consultants_data)
+    # Filtrage (résultats conservés dans la session) et affichage des données
+    filtered_data = filters.apply_filters(consultants_data, dataset_key=dataset_key)
 
     if filtered_data:
         _display_enhanced_metrics(filtered_data)
@@ -1813,6 +1803,29 @@ def _render_search_input():
     )
 
 
+def _get_consultants_data(search, search_term):
+    """
+    Données des consultants converties pour les filtres, conservées dans la session
+
+    Returns:
+        tuple: (clé des données : recherche et génération des tables, lignes ou None)
+    """
+    from app.services.cache_service import CONSULTANT_LIST_TAGS
+    from app.services.cache_service import data_generation
+    from app.ui.enhanced_ui import SessionResultCache
+
+    dataset_key = ((search_term or "").strip(), data_generation(*CONSULTANT_LIST_TAGS))
+    cache = SessionResultCache.for_session()
+    consultants_data = cache.get(("dataset", dataset_key))
+    if consultants_data is None:
+        consultants = _load_consultants_data(search, search_term)
+        if not consultants:
+            return dataset_key, None
+        consultants_data = _convert_consultants_to_data(consultants)
+        cache.put(("dataset", dataset_key), consultants_data)
+    return dataset_key, consultants_data
+
+
 def _load_consultants_data(search, search_term):
     """Charge les données des consultants avec gestion d'erreur"""
     from app.ui.enhanced_ui import LoadingSpinner
@@ -24,7 +24,7 @@ except ImportError:
     HAS_REPORTLAB = False
 
 from app.services.dashboard_service import DashboardService, DashboardDataService
-from app.database.database import get_database_session
+from app.database.database import get_readonly_session
 from app.database.models import Consultant, Mission
 
 
@@ -612,7 +612,7 @@ class AdvancedDashboardFeatures:
     def _get_available_entities(self) -> List[str]:
         """Récupère les entités disponibles"""
         try:
-            with get_database_session() as _session:
+            with get_readonly_session() as _session:
                 entities = _session.query(Consultant.entite).distinct().all()
                 return [e[0] for e in entities if e[0]]
         except Exception:
@@ -621,7 +621,7 @@ class AdvancedDashboardFeatures:
     def _get_available_practices(self) -> List[str]:
         """Récupère les practices disponibles"""
         try:
-            with get_database_session() as _session:
+            with get_readonly_session() as _session:
                 # Adapter selon votre modèle
                 practices = [
                     "Data & Analytics",
@@ -636,7 +636,7 @@ class AdvancedDashboardFeatures:
     def _get_available_business_managers(self) -> List[str]:
         """Récupère les BM disponibles"""
         try:
-            with get_database_session() as _session:
+            with get_readonly_session() as _session:
                 bms = _session.query(Consultant.business_manager).distinct().all()
                 return [bm[0] for bm in bms if bm[0]]
         except Exception:
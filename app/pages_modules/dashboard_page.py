@@ -19,6 +19,23 @@ ERROR_DASHBOARD_NAME_REQUIRED = "❌ Le nom du dashboard est obligatoire"
 LABEL_DASHBOARD_NAME = "Nom du dashboard *"
 BUTTON_CANCEL = "❌ Annuler"
 
+# Colonnes du tableau des statistiques de cache (clé de CacheService.get_stats -> libellé)
+CACHE_STATS_COLUMNS = {
+    "namespace": "Fonction",
+    "hit_rate": "Succès (%)",
+    "memory_hits": "Succès mémoire",
+    "redis_hits": "Succès Redis",
+    "misses": "Échecs",
+    "sets": "Écritures",
+    "evictions": "Évictions",
+    "avg_load_ms": "Chargement moyen (ms)",
+    "time_saved_s": "Temps économisé (s)",
+    "memory_p50_ms": "Mémoire p50 (ms)",
+    "memory_p95_ms": "Mémoire p95 (ms)",
+    "redis_p50_ms": "Redis p50 (ms)",
+    "redis_p95_ms": "Redis p95 (ms)",
+}
+
 
 def show_dashboard_page():
     """
@@ -310,6 +327,52 @@ def show_maintenance_tools():
         if st.button("🔧 Réparer les widgets", key="repair_widgets"):
             st.info("🔧 Réparation automatique des widgets")
 
+    st.markdown("---")
+    show_cache_statistics()
+
+
+def show_cache_statistics():
+    """
+    Statistiques du cache applicatif : rentabilité de chaque fonction mise en cache (@cached)
+    """
+    import pandas as pd
+
+    from app.services.cache_service import get_cache_service
+
+    st.subheader("⚡ Cache applicatif")
+
+    cache_service = get_cache_service()
+    stats = cache_service.get_stats()
+    memory = stats["memory_cache"]
+    totals = stats["totals"]
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Taux de succès", f"{memory['hit_rate']} %")
+    col2.metric("Entrées en mémoire", memory["entries"])
+    col3.metric("Taille estimée", f"{memory['estimated_size_kb']:.0f} Ko")
+    col4.metric("Temps économisé", f"{totals['time_saved_s']:.1f} s")
+
+    redis_status = "connecté" if stats["redis"].get("connected") else "non connecté"
+    st.caption(
+        f"Latence mémoire p50/p95 : {totals['memory_p50_ms']} / {totals['memory_p95_ms']} ms · "
+        f"Redis ({redis_status}) : {totals['redis_p50_ms']} / {totals['redis_p95_ms']} ms · "
+        f"Évictions : {memory['evictions']} · Expirations : {memory['expirations']}"
+    )
+
+    if stats["namespaces"]:
+        namespaces_df = pd.DataFrame(stats["namespaces"]).rename(columns=CACHE_STATS_COLUMNS)
+        st.dataframe(
+            namespaces_df[list(CACHE_STATS_COLUMNS.values())],
+            hide_index=True,
+            use_container_width=True,
+        )
+    else:
+        st.info("📊 Aucune lecture de cache depuis le démarrage")
+
+    if st.button("🔄 Réinitialiser les compteurs du cache", key="reset_cache_stats"):
+        cache_service.reset_stats()
+        st.rerun()
+
 
 def show_dashboard_statistics():
     """
@@ -808,9 +871,11 @@ def render_dashboard_widgets(dashboard_config: Dict, period_months: int = 3):
         st.info("📊 Ce dashboard ne contient aucun widget")
         return
 
-    # Organiser et rendre les widgets
+    # Organiser et rendre les widgets, avec les données de tous les widgets lues en un seul aller-retour
     widgets_by_row = _organize_widgets_by_position(widgets)
-    _render_widgets_by_rows(widgets_by_row, period_months)
+    widget_configs = [(widget["widget_type"], _widget_config(widget, period_months)) for widget in widgets]
+    with WidgetFactory.prefetched(widget_configs):
+        _render_widgets_by_rows(widgets_by_row, period_months)
 
 
 def _organize_widgets_by_position(widgets: List[Dict]) -> Dict[int, List[Dict]]:
@@ -853,12 +918,17 @@ def _create_columns_for_row(row_widgets: List[Dict]) -> List:
         return st.columns(len(row_widgets))
 
 
-def _render_single_widget(widget: Dict, period_months: int):
-    """Rend un widget individuel avec sa configuration"""
-    # Configuration du widget avec période globale
+def _widget_config(widget: Dict, period_months: int) -> Dict:
+    """Configuration du widget avec période globale"""
     widget_config = widget.get("config", {}).copy()
     if _should_apply_global_period(widget, widget_config):
         widget_config["period_months"] = period_months
+    return widget_config
+
+
+def _render_single_widget(widget: Dict, period_months: int):
+    """Rend un widget individuel avec sa configuration"""
+    widget_config = _widget_config(widget, period_months)
 
     # Rendu du widget
     try:
@@ -9,7 +9,6 @@ from typing import Dict
 from typing import List
 from typing import Optional
 
-import streamlit as st
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import joinedload
@@ -17,13 +16,18 @@ from sqlalchemy.orm import joinedload
 from app.database.database import get_database_session
 from app.database.models import BusinessManager
 from app.database.models import ConsultantBusinessManager
+from app.services.caching import cache_data
+from app.services.caching import skip_caching
+
+# Les BM affichent le nombre de consultants assignés : invalidés aussi sur les affectations
+BM_CACHE_TAGS = (BusinessManager.__tablename__, ConsultantBusinessManager.__tablename__)
 
 
 class BusinessManagerService:
     """Service pour la gestion des Business Managers"""
 
     @staticmethod
-    @st.cache_data(ttl=300)  # Cache pendant 5 minutes
+    @cache_data(ttl=1800, tags=BM_CACHE_TAGS)  # Cache pendant 30 minutes (invalidé à chaque commit)
     def get_all_business_managers() -> List[Dict]:
         """Récupère tous les Business Managers"""
         try:
@@ -60,10 +64,11 @@ class BusinessManagerService:
                 return bm_list
         except SQLAlchemyError as e:
             print(f"Erreur lors de la récupération des Business Managers: {e}")
+            skip_caching()
             return []
 
     @staticmethod
-    @st.cache_data(ttl=120)  # Cache pendant 2 minutes pour la recherche
+    @cache_data(ttl=600, tags=BM_CACHE_TAGS)  # Cache pendant 10 minutes pour la recherche
     def search_business_managers(search_term: str) -> List[Dict]:
         """Recherche des Business Managers par prénom, nom ou email"""
         try:
@@ -110,10 +115,11 @@ class BusinessManagerService:
                 return bm_list
         except SQLAlchemyError as e:
             print(f"Erreur lors de la recherche des Business Managers: {e}")
+            skip_caching()
             return []
 
     @staticmethod
-    @st.cache_data(ttl=600)  # Cache pendant 10 minutes
+    @cache_data(ttl=1800, tags=BM_CACHE_TAGS)  # Cache pendant 30 minutes (invalidé à chaque commit)
     def get_business_managers_count() -> int:
         """Retourne le nombre total de Business Managers avec cache"""
         try:
@@ -121,6 +127,7 @@ class BusinessManagerService:
                 return session.query(BusinessManager).count()
         except SQLAlchemyError as e:
             print(f"Erreur lors du comptage des Business Managers: {e}")
+            skip_caching()
             return 0
 
     @staticmethod
@@ -0,0 +1,186 @@
+"""
+Sérialisation des valeurs du niveau Redis de CacheService
+Codec binaire enfichable (pickle protocole 5 par défaut, msgpack si installé, JSON historique)
+avec compression zlib/lz4 au-delà d'un seuil de taille
+
+Contrairement au JSON historique (dates et Decimal rendus en chaînes), les codecs binaires
+restituent date, datetime et Decimal : un succès Redis renvoie les mêmes types qu'un succès
+mémoire. Le nom et la version du codec font partie de la clé Redis, un changement de codec
+ne relit donc jamais des valeurs écrites dans un autre format.
+
+Configuration par variables d'environnement :
+    CONSULTATOR_CACHE_CODEC              pickle (défaut), msgpack ou json
+    CONSULTATOR_CACHE_COMPRESSION        zlib (défaut), lz4 ou none
+    CONSULTATOR_CACHE_COMPRESS_MIN_BYTES taille à partir de laquelle compresser (défaut 1024)
+"""
+
+import json
+import os
+import pickle
+import zlib
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+    lz4 = None
+
+CODEC_NAME = os.getenv("CONSULTATOR_CACHE_CODEC", "pickle")
+COMPRESSION = os.getenv("CONSULTATOR_CACHE_COMPRESSION", "zlib")
+COMPRESS_MIN_BYTES = int(os.getenv("CONSULTATOR_CACHE_COMPRESS_MIN_BYTES", "1024"))
+
+# Premier octet de chaque valeur : algorithme de compression appliqué
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+_LZ4 = b"\x02"
+
+# Types étendus msgpack
+_EXT_DATE = 1
+_EXT_DATETIME = 2
+_EXT_DECIMAL = 3
+
+
+class PickleSerializer:
+    """
+    pickle protocole 5 : rapide, restitue tous les types Python (dates, Decimal, DTO...)
+
+    Ne relit que des valeurs écrites par l'application : Redis ne doit pas être
+    accessible en écriture à des tiers.
+    """
+
+    name = "pickle"
+    version = 5
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, protocol=5)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)  # nosec B301 - valeurs écrites par CacheService
+
+
+def _msgpack_default(value: Any):
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    raise TypeError(f"Type non sérialisable par msgpack: {type(value).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes):
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class MsgpackSerializer:
+    """msgpack avec types étendus pour date, datetime, Decimal (types de base uniquement, tuples rendus en listes)"""
+
+    name = "msgpack"
+    version = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_msgpack_default, use_bin_type=True, datetime=False)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+
+
+class JsonSerializer:
+    """Format historique : lisible mais les dates et Decimal reviennent en chaînes"""
+
+    name = "json"
+    version = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=str).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class CacheCodec:
+    """
+    Encode les valeurs stockées dans Redis : sérialisation puis compression éventuelle
+
+    Les valeurs plus petites que compress_min_bytes ne sont pas compressées (le coût
+    dépasserait le gain) ; l'octet d'en-tête indique la compression appliquée.
+    """
+
+    def __init__(
+        self,
+        serializer=None,
+        compression: Optional[str] = None,
+        compress_min_bytes: Optional[int] = None,
+    ):
+        self.serializer = serializer or PickleSerializer()
+        compression = compression or COMPRESSION
+        if compression == "lz4" and not LZ4_AVAILABLE:
+            print("ℹ️ lz4 non installé, compression zlib du cache")
+            compression = "zlib"
+        self.compression = compression
+        self.compress_min_bytes = compress_min_bytes if compress_min_bytes is not None else COMPRESS_MIN_BYTES
+
+    @property
+    def key_suffix(self) -> str:
+        """Suffixe des clés Redis : format des valeurs (ex: "@pickle-v5")"""
+        return f"@{self.serializer.name}-v{self.serializer.version}"
+
+    def encode(self, value: Any) -> bytes:
+        data = self.serializer.dumps(value)
+        if self.compression == "none" or len(data) < self.compress_min_bytes:
+            return _RAW + data
+        if self.compression == "lz4":
+            return _LZ4 + lz4.frame.compress(data)
+        return _ZLIB + zlib.compress(data, 1)
+
+    def decode(self, payload: bytes) -> Any:
+        header, data = payload[:1], payload[1:]
+        if header == _ZLIB:
+            data = zlib.decompress(data)
+        elif header == _LZ4:
+            data = lz4.frame.decompress(data)
+        elif header != _RAW:
+            raise ValueError(f"En-tête de valeur de cache inconnu: {header!r}")
+        return self.serializer.loads(data)
+
+
+SERIALIZERS: Dict[str, type] = {
+    "pickle": PickleSerializer,
+    "json": JsonSerializer,
+}
+if MSGPACK_AVAILABLE:
+    SERIALIZERS["msgpack"] = MsgpackSerializer
+
+
+def get_codec(name: Optional[str] = None) -> CacheCodec:
+    """
+    Codec configuré (CONSULTATOR_CACHE_CODEC), pickle si le codec demandé n'est pas disponible
+    """
+    name = name or CODEC_NAME
+    serializer_class = SERIALIZERS.get(name)
+    if serializer_class is None:
+        print(f"ℹ️ Codec de cache '{name}' indisponible, utilisation de pickle")
+        serializer_class = PickleSerializer
+    return CacheCodec(serializer_class())
@@ -1,43 +1,112 @@
 """
 Service de cache avancé pour Consultator
-Système de cache multi-niveaux avec Redis et cache en mémoire
+Système de cache multi-niveaux avec Redis et cache en mémoire borné (LRU + budget mémoire)
 Optimisé pour les requêtes fréquentes de consultants et missions
+
+Invalidation par tags : chaque entrée mémorise la génération de ses tags
+("consultants", "consultant:42", "missions"...) ; invalider un tag incrémente sa
+génération (O(1), partagée par Redis) et rend périmées toutes les entrées qui le portent.
+
+Les valeurs Redis sont sérialisées par un codec binaire (cf. cache_codec) qui restitue
+dates et Decimal ; le format du codec suffixe les clés Redis.
 """
 
 import hashlib
 import json
+import math
+import random
+import threading
 import time
+import uuid
 from datetime import datetime
 from datetime import timedelta
 from functools import wraps
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from app.services.cache_codec import CacheCodec
+from app.services.cache_codec import get_codec
+from app.services.cache_stats import CacheStatistics
+from app.services.memory_cache import MemoryCache
+from app.services.single_flight import SingleFlight
+
 try:
     import redis
+    import redis.asyncio
 
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     redis = None
 
+# Compteurs de génération des tags dans Redis
+TAG_KEY_PREFIX = "consultator:tag:"
+# Enveloppe Redis d'une valeur associée à des tags
+TAGS_FIELD = "__tags__"
+
+# Tags des données métier
+TAG_CONSULTANTS = "consultants"
+TAG_MISSIONS = "missions"
+TAG_PRACTICES = "practices"
+TAG_SEARCH = "search"
+# Porté par toutes les entrées propres à un consultant (invalidation globale)
+TAG_EVERY_CONSULTANT = "consultant:*"
+# Tags des listes de consultants (practice et nombre de missions affichés)
+CONSULTANT_LIST_TAGS = (TAG_CONSULTANTS, TAG_MISSIONS, TAG_PRACTICES)
+
+# Verrou Redis d'un chargement en cours (un seul processus recalcule une clé)
+LOCK_KEY_PREFIX = "consultator:lock:"
+LOAD_LOCK_SECONDS = 10
+# Intervalle de relecture du cache pendant le chargement mené par un autre processus
+LOAD_WAIT_INTERVAL = 0.05
+# Jeton du verrou quand Redis est absent : le verrou local (SingleFlight) suffit
+LOCAL_LOCK_TOKEN = "local"
+# Enveloppe d'une valeur servie en stale-while-revalidate (fraîcheur et durée de chargement)
+FRESHNESS_FIELD = "__fresh__"
+
 
 class CacheService:
     """Service de cache multi-niveaux pour optimiser les performances"""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379/0", default_ttl: int = 300):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        default_ttl: int = 300,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        codec: Optional[CacheCodec] = None,
+    ):
         """
         Initialise le service de cache
 
         Args:
             redis_url: URL de connexion Redis
             default_ttl: TTL par défaut en secondes (5 minutes)
+            max_entries: Nombre maximal d'entrées en mémoire (CONSULTATOR_CACHE_MAX_ENTRIES)
+            max_bytes: Budget mémoire estimé en octets (CONSULTATOR_CACHE_MAX_MB)
+            sweep_interval: Intervalle de purge des entrées expirées en secondes, 0 pour la désactiver
+            codec: Sérialisation des valeurs Redis (CONSULTATOR_CACHE_CODEC, pickle par défaut)
         """
         self.default_ttl = default_ttl
         self.redis_client = None
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        # Client asyncio (aget_many / aset_many), sur la même base Redis
+        self.async_redis_client = None
+        self.codec = codec or get_codec()
+        # Génération de chaque tag (référence locale, Redis fait foi s'il est connecté)
+        self.tag_versions: Dict[str, int] = {}
+        self._tag_lock = threading.Lock()
+        # Compteurs par espace de noms (fonction @cached) : succès, échecs, latences...
+        self.statistics = CacheStatistics()
+        self.memory_cache: Dict[str, Dict[str, Any]] = MemoryCache(
+            max_entries, max_bytes, sweep_interval, on_evict=self.statistics.record_eviction
+        )
 
         # Initialiser Redis si disponible
         if REDIS_AVAILABLE:
@@ -45,6 +114,7 @@ class CacheService:
                 self.redis_client = redis.from_url(redis_url)
                 # Test de connexion
                 self.redis_client.ping()
+                self.async_redis_client = redis.asyncio.from_url(redis_url)
                 print("✅ Redis connecté avec succès")
             except Exception as e:
                 print(f"⚠️ Redis non disponible: {e}")
@@ -64,53 +134,348 @@ class CacheService:
 
         return f"consultator:{func_name}:{key_hash}"
 
+    def redis_key(self, key: str) -> str:
+        """Clé Redis d'une entrée : la clé suffixée du format du codec"""
+        return key + self.codec.key_suffix
+
     def _is_expired(self, cache_entry: Dict[str, Any]) -> bool:
         """Vérifie si une entrée de cache a expiré"""
         return time.time() > cache_entry.get("expires_at", 0)
 
+    def get_tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """Génération courante de chaque tag (lue dans Redis en un seul MGET si connecté)"""
+        tags = sorted(set(tags))
+        if not tags:
+            return {}
+
+        if self.redis_client:
+            try:
+                values = self.redis_client.mget([TAG_KEY_PREFIX + tag for tag in tags])
+                return {tag: int(value or 0) for tag, value in zip(tags, values)}
+            except Exception as e:
+                print(f"⚠️ Erreur Redis MGET: {e}")
+
+        return {tag: self.tag_versions.get(tag, 0) for tag in tags}
+
+    def _tags_are_current(self, stored_versions: Dict[str, int], known: Optional[Dict[str, int]] = None) -> bool:
+        """
+        Vrai si aucun tag de l'entrée n'a été invalidé depuis sa mise en cache
+
+        known: générations déjà lues (get_many) ; les tags absents sont relus
+        """
+        if not stored_versions:
+            return True
+        current = dict(known or {})
+        missing = [tag for tag in stored_versions if tag not in current]
+        if missing:
+            current.update(self.get_tag_versions(missing))
+        return all(current.get(tag, 0) == version for tag, version in stored_versions.items())
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalide toutes les entrées portant l'un des tags, sur les deux niveaux
+
+        Incrémente la génération de chaque tag (un INCR Redis par tag, en pipeline) :
+        les entrées concernées sont considérées absentes à leur prochaine lecture.
+
+        Returns:
+            int: Nombre de tags invalidés
+        """
+        tags = sorted(set(tags))
+        with self._tag_lock:
+            for tag in tags:
+                self.tag_versions[tag] = self.tag_versions.get(tag, 0) + 1
+
+        if self.redis_client and tags:
+            try:
+                pipeline = self.redis_client.pipeline()
+                for tag in tags:
+                    pipeline.incr(TAG_KEY_PREFIX + tag)
+                pipeline.execute()
+            except Exception as e:
+                print(f"⚠️ Erreur Redis INCR: {e}")
+
+        return len(tags)
+
+    def _decode_redis_value(self, cached_data: Optional[bytes], known: Optional[Dict[str, int]] = None):
+        """
+        Décode une valeur lue dans Redis et vérifie ses tags
+
+        Returns:
+            Tuple[bool, Any]: (succès, valeur)
+        """
+        if not cached_data:
+            return False, None
+        value = self.codec.decode(cached_data)
+        if isinstance(value, dict) and TAGS_FIELD in value:
+            if not self._tags_are_current(value[TAGS_FIELD], known):
+                return False, None
+            value = value.get("data")
+        return True, value
+
+    def _get_from_memory(self, key: str, start: float, known: Optional[Dict[str, int]] = None) -> Optional[Any]:
+        """Lit le niveau mémoire (purge les entrées expirées ou invalidées) ; compte le succès ou l'échec"""
+        # get : l'entrée peut être purgée entre-temps
+        cache_entry = self.memory_cache.get(key)
+        if cache_entry is not None:
+            if self._is_expired(cache_entry):
+                # Supprimer l'entrée expirée
+                self.memory_cache.pop(key, None)
+                self.statistics.record_eviction(key, "expired")
+            elif not self._tags_are_current(cache_entry.get("tags"), known):
+                # Un de ses tags a été invalidé
+                self.memory_cache.pop(key, None)
+                self.statistics.record_eviction(key, "invalidated")
+            else:
+                self.statistics.record_lookup(key, "memory", time.perf_counter() - start, hit=True)
+                return cache_entry["data"]
+
+        self.statistics.record_lookup(key, "memory", time.perf_counter() - start, hit=False)
+        self.statistics.record_miss(key)
+        return None
+
     def get(self, key: str) -> Optional[Any]:
-        """Récupère une valeur du cache"""
+        """Récupère une valeur du cache (None si absente, expirée ou invalidée par un tag)"""
         # Essayer Redis d'abord
         if self.redis_client:
+            start = time.perf_counter()
             try:
-                cached_data = self.redis_client.get(key)
-                if cached_data:
-                    return json.loads(cached_data)
+                hit, value = self._decode_redis_value(self.redis_client.get(self.redis_key(key)))
+                self.statistics.record_lookup(key, "redis", time.perf_counter() - start, hit=hit)
+                if hit:
+                    return value
             except Exception as e:
                 print(f"⚠️ Erreur Redis GET: {e}")
 
         # Fallback vers le cache mémoire
-        if key in self.memory_cache:
-            cache_entry = self.memory_cache[key]
-            if not self._is_expired(cache_entry):
-                return cache_entry["data"]
-            else:
-                # Supprimer l'entrée expirée
-                del self.memory_cache[key]
+        return self._get_from_memory(key, time.perf_counter())
+
+    def _tags_to_read(self, keys: List[str], tags: Optional[Iterable[str]]) -> List[str]:
+        """Tags dont la génération est lue avec les valeurs : tags annoncés et tags des entrées mémoire"""
+        tags_to_read = set(tags or ())
+        for key in keys:
+            entry = self.memory_cache.get(key)
+            if isinstance(entry, dict) and entry.get("tags"):
+                tags_to_read.update(entry["tags"])
+        return sorted(tags_to_read)
+
+    def _resolve_many(
+        self,
+        keys: List[str],
+        raw_values: List[Optional[bytes]],
+        known: Dict[str, int],
+        start: float,
+        redis_read: bool,
+    ) -> Dict[str, Any]:
+        """Résultat de get_many à partir des valeurs Redis et des générations lues en un aller-retour"""
+        elapsed = time.perf_counter() - start
+        found = {}
+        for key, cached_data in zip(keys, raw_values):
+            if redis_read:
+                try:
+                    hit, value = self._decode_redis_value(cached_data, known)
+                except Exception as e:
+                    print(f"⚠️ Erreur de décodage Redis: {e}")
+                    hit, value = False, None
+                self.statistics.record_lookup(key, "redis", elapsed, hit=hit)
+                if hit:
+                    found[key] = value
+                    continue
+
+            value = self._get_from_memory(key, time.perf_counter(), known)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def get_many(self, keys: Iterable[str], tags: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Récupère plusieurs valeurs en un seul aller-retour Redis
 
-        return None
+        Un pipeline envoie le MGET des valeurs et le MGET des générations de tags :
+        annoncer les tags des valeurs attendues (tags) évite un second aller-retour.
+
+        Returns:
+            Dict[str, Any]: Valeurs trouvées, par clé (les clés absentes sont omises)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        start = time.perf_counter()
+        tags_to_read = self._tags_to_read(keys, tags)
+        raw_values: List[Optional[bytes]] = [None] * len(keys)
+        known = {tag: self.tag_versions.get(tag, 0) for tag in tags_to_read}
+
+        if self.redis_client:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                pipeline.mget([self.redis_key(key) for key in keys])
+                if tags_to_read:
+                    pipeline.mget([TAG_KEY_PREFIX + tag for tag in tags_to_read])
+                results = pipeline.execute()
+                raw_values = results[0]
+                if tags_to_read:
+                    known = {tag: int(value or 0) for tag, value in zip(tags_to_read, results[1])}
+            except Exception as e:
+                print(f"⚠️ Erreur Redis MGET: {e}")
+                known = {}
+
+        return self._resolve_many(keys, raw_values, known, start, redis_read=bool(self.redis_client))
+
+    async def aget_many(self, keys: Iterable[str], tags: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Variante asyncio de get_many (client redis.asyncio, un seul aller-retour)"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        start = time.perf_counter()
+        tags_to_read = self._tags_to_read(keys, tags)
+        raw_values: List[Optional[bytes]] = [None] * len(keys)
+        known = {tag: self.tag_versions.get(tag, 0) for tag in tags_to_read}
+
+        if self.async_redis_client:
+            try:
+                pipeline = self.async_redis_client.pipeline(transaction=False)
+                pipeline.mget([self.redis_key(key) for key in keys])
+                if tags_to_read:
+                    pipeline.mget([TAG_KEY_PREFIX + tag for tag in tags_to_read])
+                results = await pipeline.execute()
+                raw_values = results[0]
+                if tags_to_read:
+                    known = {tag: int(value or 0) for tag, value in zip(tags_to_read, results[1])}
+            except Exception as e:
+                print(f"⚠️ Erreur Redis MGET (asyncio): {e}")
+                known = {}
+
+        return self._resolve_many(keys, raw_values, known, start, redis_read=bool(self.async_redis_client))
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        tag_versions: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        Stocke une valeur dans le cache
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Stocke une valeur dans le cache"""
+        Args:
+            key: Clé de cache
+            value: Valeur à stocker
+            ttl: Durée de vie en secondes (default_ttl si None)
+            tags: Tags de la valeur ("consultants", "consultant:42"...) pour invalidate_tags
+            tag_versions: Générations des tags lues AVANT le calcul de la valeur
+                (get_tag_versions) ; une invalidation survenue pendant le calcul rend
+                alors l'entrée périmée. Lues au moment de l'écriture si None.
+        """
         ttl = ttl or self.default_ttl
         expires_at = time.time() + ttl
+        tag_versions = self._versions_to_store(tags, tag_versions)
 
         cache_entry = {
             "data": value,
             "expires_at": expires_at,
             "created_at": time.time(),
         }
+        if tag_versions:
+            cache_entry["tags"] = tag_versions
 
         # Stocker dans Redis
         if self.redis_client:
             try:
-                self.redis_client.setex(key, ttl, json.dumps(value, default=str))
+                self.redis_client.setex(self.redis_key(key), ttl, self._encode_for_redis(value, tag_versions))
             except Exception as e:
                 print(f"⚠️ Erreur Redis SET: {e}")
 
         # Stocker dans le cache mémoire
         self.memory_cache[key] = cache_entry
+        self.statistics.record_set(key)
+
+        return True
+
+    def _versions_to_store(
+        self, tags: Optional[Iterable[str]], tag_versions: Optional[Dict[str, int]]
+    ) -> Dict[str, int]:
+        """Générations enregistrées avec l'entrée : l'instantané fourni, sinon les générations courantes"""
+        if tag_versions is not None:
+            return dict(tag_versions)
+        return self.get_tag_versions(tags) if tags else {}
+
+    def _encode_for_redis(self, value: Any, tag_versions: Dict[str, int]) -> bytes:
+        payload = {TAGS_FIELD: tag_versions, "data": value} if tag_versions else value
+        return self.codec.encode(payload)
+
+    def _store_many_in_memory(self, items: Dict[str, Any], ttl: int, tag_versions: Dict[str, int]) -> None:
+        now = time.time()
+        for key, value in items.items():
+            cache_entry = {"data": value, "expires_at": now + ttl, "created_at": now}
+            if tag_versions:
+                cache_entry["tags"] = tag_versions
+            self.memory_cache[key] = cache_entry
+            self.statistics.record_set(key)
+
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        tag_versions: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        Stocke plusieurs valeurs (mêmes TTL et tags) : un seul pipeline de SETEX dans Redis
+
+        tag_versions : générations lues avant le calcul des valeurs (voir set)
+        """
+        if not items:
+            return True
+        ttl = ttl or self.default_ttl
+        tag_versions = self._versions_to_store(tags, tag_versions)
+
+        if self.redis_client:
+            try:
+                pipeline = self.redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipeline.setex(self.redis_key(key), ttl, self._encode_for_redis(value, tag_versions))
+                pipeline.execute()
+            except Exception as e:
+                print(f"⚠️ Erreur Redis SET: {e}")
 
+        self._store_many_in_memory(items, ttl, tag_versions)
+        return True
+
+    async def aset_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        tag_versions: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        Variante asyncio de set_many (un MGET des générations des tags puis un pipeline de SETEX)
+
+        tag_versions : générations lues avant le calcul des valeurs (voir set), le MGET est alors omis
+        """
+        if not items:
+            return True
+        ttl = ttl or self.default_ttl
+        snapshot = tag_versions is not None
+        tags = sorted(set(tags or ()))
+        tag_versions = dict(tag_versions) if snapshot else {tag: self.tag_versions.get(tag, 0) for tag in tags}
+
+        if self.async_redis_client:
+            try:
+                if tags and not snapshot:
+                    values = await self.async_redis_client.mget([TAG_KEY_PREFIX + tag for tag in tags])
+                    tag_versions = {tag: int(value or 0) for tag, value in zip(tags, values)}
+                pipeline = self.async_redis_client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipeline.setex(self.redis_key(key), ttl, self._encode_for_redis(value, tag_versions))
+                await pipeline.execute()
+            except Exception as e:
+                print(f"⚠️ Erreur Redis SET (asyncio): {e}")
+
+        self._store_many_in_memory(items, ttl, tag_versions)
         return True
 
     def delete(self, key: str) -> bool:
@@ -120,24 +485,39 @@ class CacheService:
         # Supprimer de Redis
         if self.redis_client:
             try:
-                self.redis_client.delete(key)
+                self.redis_client.delete(self.redis_key(key))
                 deleted = True
             except Exception as e:
                 print(f"⚠️ Erreur Redis DELETE: {e}")
 
         # Supprimer du cache mémoire
-        if key in self.memory_cache:
-            del self.memory_cache[key]
+        if self.memory_cache.pop(key, None) is not None:
             deleted = True
 
         return deleted
 
     def clear(self) -> bool:
-        """Vide complètement le cache (Redis + mémoire)"""
+        """
+        Vide complètement le cache (Redis + mémoire)
+
+        Seules les entrées sont supprimées : les générations de tags sont conservées
+        (repartir de 0 rendrait de nouveau valides des entrées d'une génération
+        antérieure encore présentes ailleurs), ainsi que les verrous de chargement.
+        """
         try:
-            # Vider Redis
+            # Vider Redis (SCAN plutôt que FLUSHDB, par lots de suppressions)
             if self.redis_client:
-                self.redis_client.flushdb()
+                batch = []
+                for key in self.redis_client.scan_iter(match="consultator:*", count=1000):
+                    name = key.decode() if isinstance(key, bytes) else key
+                    if name.startswith((TAG_KEY_PREFIX, LOCK_KEY_PREFIX)):
+                        continue
+                    batch.append(key)
+                    if len(batch) >= 1000:
+                        self.redis_client.delete(*batch)
+                        batch = []
+                if batch:
+                    self.redis_client.delete(*batch)
 
             # Vider le cache mémoire
             self.memory_cache.clear()
@@ -154,7 +534,8 @@ class CacheService:
         # Supprimer de Redis
         if self.redis_client:
             try:
-                keys = self.redis_client.keys(pattern)
+                # Un pattern sans joker désigne une clé : viser sa clé Redis
+                keys = self.redis_client.keys(pattern if "*" in pattern else self.redis_key(pattern))
                 if keys:
                     self.redis_client.delete(*keys)
                     deleted_count += len(keys)
@@ -164,24 +545,92 @@ class CacheService:
         # Supprimer du cache mémoire
         import fnmatch
 
-        keys_to_delete = [k for k in self.memory_cache.keys() if fnmatch.fnmatch(k, pattern)]
+        keys_to_delete = [k for k in list(self.memory_cache.keys()) if fnmatch.fnmatch(k, pattern)]
         for key in keys_to_delete:
-            del self.memory_cache[key]
-            deleted_count += 1
+            if self.memory_cache.pop(key, None) is not None:
+                deleted_count += 1
 
         return deleted_count
 
+    def acquire_load_lock(self, key: str, timeout: float = LOAD_LOCK_SECONDS) -> Optional[str]:
+        """
+        Verrou court (SET NX PX) réservant à ce processus le chargement d'une clé
+
+        Returns:
+            Optional[str]: Jeton à rendre à release_load_lock, None si un autre processus charge la clé
+        """
+        if not self.redis_client:
+            return LOCAL_LOCK_TOKEN
+
+        token = uuid.uuid4().hex
+        try:
+            if self.redis_client.set(LOCK_KEY_PREFIX + key, token, nx=True, px=int(timeout * 1000)):
+                return token
+            return None
+        except Exception as e:
+            print(f"⚠️ Erreur Redis LOCK: {e}")
+            return LOCAL_LOCK_TOKEN
+
+    def release_load_lock(self, key: str, token: str) -> None:
+        """Libère le verrou de chargement s'il appartient encore à ce processus"""
+        if not self.redis_client or token == LOCAL_LOCK_TOKEN:
+            return
+        try:
+            lock_key = LOCK_KEY_PREFIX + key
+            if self.redis_client.get(lock_key) == token.encode():
+                self.redis_client.delete(lock_key)
+        except Exception as e:
+            print(f"⚠️ Erreur Redis UNLOCK: {e}")
+
+    def wait_for(self, key: str, timeout: float = LOAD_LOCK_SECONDS) -> Optional[Any]:
+        """Relit la clé jusqu'à ce que le chargement d'un autre processus l'écrive (None au-delà du délai)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOAD_WAIT_INTERVAL)
+            value = self.get(key)
+            if value is not None:
+                return value
+        return None
+
+    def record_load(self, key: str, seconds: float) -> None:
+        """Enregistre la durée de calcul d'une valeur absente du cache (temps économisé par les succès)"""
+        self.statistics.record_load(key, seconds)
+
+    def reset_stats(self) -> None:
+        """Remet à zéro les compteurs de succès, échecs et latences"""
+        self.statistics.reset()
+
     def get_stats(self) -> Dict[str, Any]:
-        """Retourne les statistiques du cache"""
-        memory_entries = len(self.memory_cache)
-        memory_size = sum(len(str(entry)) for entry in self.memory_cache.values())
+        """
+        Retourne les statistiques du cache
+
+        Returns:
+            Dict: "memory_cache" (occupation du niveau mémoire et taux de succès global),
+            "totals" (compteurs et latences p50/p95 par niveau), "namespaces" (mêmes
+            compteurs pour chaque fonction @cached, les plus rentables d'abord) et "redis"
+        """
+        if isinstance(self.memory_cache, MemoryCache):
+            tier_stats = self.memory_cache.get_stats()
+            memory_entries = tier_stats["entries"]
+            memory_size = tier_stats["size_bytes"]
+        else:
+            tier_stats = {}
+            memory_entries = len(self.memory_cache)
+            memory_size = sum(len(str(entry)) for entry in self.memory_cache.values())
 
+        totals = self.statistics.totals()
         stats = {
             "memory_cache": {
                 "entries": memory_entries,
                 "estimated_size_kb": memory_size / 1024,
-                "hit_rate": 0,  # À implémenter avec des compteurs
-            }
+                "hit_rate": totals["hit_rate"],
+                "max_entries": tier_stats.get("max_entries"),
+                "max_size_kb": tier_stats["max_bytes"] / 1024 if tier_stats else None,
+                "evictions": tier_stats.get("evictions", 0),
+                "expirations": tier_stats.get("expirations", 0),
+            },
+            "totals": totals,
+            "namespaces": self.statistics.namespaces(),
         }
 
         if self.redis_client:
@@ -213,14 +662,92 @@ def get_cache_service() -> CacheService:
     return _cache_service
 
 
-def cached(ttl: Optional[int] = None, key_prefix: str = ""):
+# Chargements en cours des fonctions @cached (un seul par clé dans le processus)
+_single_flight = SingleFlight()
+
+# Valeur de repli signalée par skip_caching pendant le chargement en cours (par thread)
+_uncacheable = threading.local()
+
+
+def skip_caching() -> None:
+    """
+    Signale que la fonction en cours de chargement retourne une valeur de repli (erreur de base...)
+
+    Appelée dans le bloc except d'une fonction @cached / @cache_data : le résultat est rendu à
+    l'appelant sans être mis en cache, l'appel suivant retente le chargement.
+    """
+    _uncacheable.requested = True
+
+
+def call_uncached(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Tuple[Any, bool]:
+    """
+    Appelle func et indique si son résultat peut être mis en cache (cf. skip_caching)
+
+    Returns:
+        Tuple[Any, bool]: Résultat de func, False si func a appelé skip_caching
+    """
+    outer = getattr(_uncacheable, "requested", False)
+    _uncacheable.requested = False
+    try:
+        result = func(*args, **kwargs)
+        return result, not _uncacheable.requested
+    finally:
+        # Un résultat construit à partir d'une valeur de repli n'est pas mis en cache non plus
+        _uncacheable.requested = outer or _uncacheable.requested
+
+
+def _unwrap_freshness(value: Any):
+    """Sépare la valeur de sa fraîcheur (None pour une entrée sans enveloppe)"""
+    if isinstance(value, dict) and FRESHNESS_FIELD in value:
+        return value["data"], value[FRESHNESS_FIELD]
+    return value, None
+
+
+def _needs_refresh(freshness: Optional[Dict[str, float]], early_refresh: float) -> bool:
+    """
+    Vrai si la valeur est périmée, ou tirée au sort pour un rafraîchissement anticipé
+
+    Rafraîchissement probabiliste (XFetch) : la probabilité croît à l'approche de
+    l'expiration, d'autant plus vite que le chargement est long.
+    """
+    if freshness is None:
+        return False
+    now = time.time()
+    if now >= freshness["expires_at"]:
+        return True
+    if early_refresh <= 0:
+        return False
+    return now - freshness["load_seconds"] * early_refresh * math.log(1.0 - random.random()) >= freshness["expires_at"]
+
+
+def cached(
+    ttl: Optional[int] = None,
+    key_prefix: str = "",
+    tags: Union[Iterable[str], Callable[..., Iterable[str]], None] = None,
+    stale_ttl: int = 0,
+    early_refresh: float = 0.0,
+):
     """
     Décorateur pour mettre en cache le résultat d'une fonction
 
+    Un seul chargement par clé est exécuté à la fois : dans le processus (les appels
+    concurrents attendent son résultat) et entre processus (verrou Redis court).
+
     Args:
         ttl: Time To Live en secondes (utilise la valeur par défaut si None)
         key_prefix: Préfixe pour la clé de cache
+        tags: Tags du résultat, ou fonction recevant les arguments de l'appel et
+            retournant les tags (ex. lambda consultant_id: consultant_tags(consultant_id))
+        stale_ttl: Durée en secondes pendant laquelle une valeur expirée est encore servie
+            aux autres appelants pendant son rechargement (stale-while-revalidate)
+        early_refresh: Coefficient du rafraîchissement anticipé probabiliste (0 = désactivé,
+            1 = valeur usuelle, plus grand = plus tôt)
+
+    Example:
+        >>> @cached(ttl=600, tags=lambda consultant_id: consultant_tags(consultant_id))
+        ... def get_profile(consultant_id): ...
     """
+    revalidate = stale_ttl > 0 or early_refresh > 0
 
     def decorator(func):
         @wraps(func)
@@ -233,16 +760,57 @@ def cached(ttl: Optional[int] = None, key_prefix: str = ""):
 
             # Essayer de récupérer du cache
             cached_result = cache_service.get(cache_key)
+            stale = None
             if cached_result is not None:
-                return cached_result
-
-            # Exécuter la fonction
-            result = func(*args, **kwargs)
-
-            # Mettre en cache le résultat
-            cache_service.set(cache_key, result, ttl)
-
-            return result
+                if not revalidate:
+                    return cached_result
+                data, freshness = _unwrap_freshness(cached_result)
+                if not _needs_refresh(freshness, early_refresh):
+                    return data
+                # Valeur à rafraîchir : un seul appelant la recharge, les autres la servent
+                if _single_flight.in_flight(cache_key):
+                    return data
+                stale = data
+
+            def load():
+                token = cache_service.acquire_load_lock(cache_key)
+                if token is None:
+                    # Un autre processus recharge la clé : servir l'ancienne valeur ou attendre la sienne
+                    if stale is not None:
+                        return stale
+                    loaded = cache_service.wait_for(cache_key)
+                    if loaded is not None:
+                        return _unwrap_freshness(loaded)[0]
+
+                try:
+                    # Générations lues avant le chargement : un commit pendant func() rend le résultat périmé
+                    entry_tags = tags(*args, **kwargs) if callable(tags) else tags
+                    tag_versions = cache_service.get_tag_versions(entry_tags) if entry_tags else None
+
+                    # Exécuter la fonction (durée mesurée : temps économisé par les prochains succès)
+                    start = time.perf_counter()
+                    result, cacheable = call_uncached(func, args, kwargs)
+                    load_seconds = time.perf_counter() - start
+                    cache_service.record_load(cache_key, load_seconds)
+
+                    # Mettre en cache le résultat (jamais une valeur de repli)
+                    if not cacheable:
+                        return result
+                    if revalidate:
+                        fresh_ttl = ttl or cache_service.default_ttl
+                        freshness = {"expires_at": time.time() + fresh_ttl, "load_seconds": load_seconds}
+                        entry = {FRESHNESS_FIELD: freshness, "data": result}
+                        cache_service.set(
+                            cache_key, entry, fresh_ttl + stale_ttl, tags=entry_tags, tag_versions=tag_versions
+                        )
+                    else:
+                        cache_service.set(cache_key, result, ttl, tags=entry_tags, tag_versions=tag_versions)
+                    return result
+                finally:
+                    if token is not None:
+                        cache_service.release_load_lock(cache_key, token)
+
+            return _single_flight.do(cache_key, load)
 
         return wrapper
 
@@ -250,40 +818,65 @@ def cached(ttl: Optional[int] = None, key_prefix: str = ""):
 
 
 def invalidate_cache(pattern: str):
-    """Invalide toutes les clés de cache correspondant à un pattern"""
+    """
+    Invalide toutes les clés de cache correspondant à un pattern
+
+    Parcourt toutes les clés (KEYS Redis) : réservé à la maintenance, préférer invalidate_tags
+    """
     cache_service = get_cache_service()
     return cache_service.clear_pattern(pattern)
 
 
+def invalidate_tags(*tags: str) -> int:
+    """Invalide toutes les entrées portant l'un des tags"""
+    return get_cache_service().invalidate_tags(*tags)
+
+
+def data_generation(*tags: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Génération courante des tags : change à chaque commit sur les tables correspondantes
+
+    Sert de clé de version aux caches tenus hors de CacheService (session Streamlit...).
+    """
+    return tuple(sorted(get_cache_service().get_tag_versions(tags).items()))
+
+
+def consultant_tags(consultant_id: int) -> List[str]:
+    """Tags d'une entrée propre à un consultant (profil, missions du consultant...)"""
+    return [f"consultant:{consultant_id}", TAG_EVERY_CONSULTANT]
+
+
 # Fonctions utilitaires pour l'invalidation de cache
 def invalidate_consultant_cache(consultant_id: Optional[int] = None):
-    """Invalide le cache des consultants"""
-    if consultant_id:
-        invalidate_cache(f"consultator:*consultant*{consultant_id}*")
-    else:
-        invalidate_cache("consultator:*consultant*")
+    """Invalide les listes de consultants et les entrées du consultant (de tous si None)"""
+    consultant_tag = f"consultant:{consultant_id}" if consultant_id else TAG_EVERY_CONSULTANT
+    invalidate_tags(TAG_CONSULTANTS, TAG_SEARCH, consultant_tag)
 
 
 def invalidate_mission_cache(consultant_id: Optional[int] = None):
-    """Invalide le cache des missions"""
+    """Invalide le cache des missions (et les entrées du consultant concerné)"""
     if consultant_id:
-        invalidate_cache(f"consultator:*mission*{consultant_id}*")
+        invalidate_tags(TAG_MISSIONS, f"consultant:{consultant_id}")
     else:
-        invalidate_cache("consultator:*mission*")
+        invalidate_tags(TAG_MISSIONS)
 
 
 def invalidate_practice_cache():
     """Invalide le cache des practices"""
-    invalidate_cache("consultator:*practice*")
+    invalidate_tags(TAG_PRACTICES)
 
 
 def invalidate_search_cache():
     """Invalide le cache des recherches"""
-    invalidate_cache("consultator:*search*")
+    invalidate_tags(TAG_SEARCH)
 
 
-# Cache pour les statistiques globales
-@cached(ttl=60)  # Cache 1 minute pour les stats
+# Les tags sont invalidés à chaque commit SQLAlchemy (app.database.cache_invalidation) et
+# @cached lit leurs générations avant le chargement (un commit pendant le calcul rend le
+# résultat périmé) : les TTL longs ne bornent que la dérive due aux écritures hors ORM
+# Cache pour les statistiques globales (consultants et missions)
+# Entrée très demandée : servie périmée pendant son rechargement, rafraîchie en avance (cache 10 minutes)
+@cached(ttl=600, tags=(TAG_CONSULTANTS, TAG_MISSIONS), stale_ttl=120, early_refresh=1.0)
 def get_cached_consultant_stats():
     """Cache les statistiques des consultants"""
     from app.services.consultant_service import ConsultantService
@@ -291,7 +884,8 @@ def get_cached_consultant_stats():
     return ConsultantService.get_consultant_summary_stats()
 
 
-@cached(ttl=300)  # Cache 5 minutes pour les listes
+# Les listes affichent practice et nombre de missions
+@cached(ttl=1800, tags=CONSULTANT_LIST_TAGS)  # Cache 30 minutes pour les listes
 def get_cached_consultants_list(page: int = 1, per_page: int = 50):
     """Cache la liste des consultants"""
     from app.services.consultant_service import ConsultantService
@@ -299,7 +893,7 @@ def get_cached_consultants_list(page: int = 1, per_page: int = 50):
     return ConsultantService.get_all_consultants_with_stats(page, per_page)
 
 
-@cached(ttl=60)  # Cache 1 minute pour les recherches
+@cached(ttl=600, tags=(TAG_CONSULTANTS, TAG_MISSIONS, TAG_SEARCH))  # Cache 10 minutes pour les recherches
 def get_cached_search_results(search_term: str, page: int = 1, per_page: int = 50):
     """Cache les résultats de recherche"""
     from app.services.consultant_service import ConsultantService
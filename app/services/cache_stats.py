@@ -0,0 +1,167 @@
+"""
+Statistiques du cache par espace de noms (fonction @cached)
+Succès par niveau (mémoire / Redis), échecs, écritures, évictions, temps de chargement
+économisé et latences p50/p95 des lectures
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+
+KEY_PREFIX = "consultator:"
+
+# Nombre de mesures de latence conservées par espace de noms et par niveau
+LATENCY_SAMPLES = 512
+
+TIERS = ("memory", "redis")
+
+
+def namespace_of(key: str) -> str:
+    """
+    Espace de noms d'une clé de cache : nom de la fonction (avec son préfixe éventuel)
+
+    Example:
+        >>> namespace_of("consultator:stats:get_cached_consultant_stats:3f2a...")
+        'stats:get_cached_consultant_stats'
+    """
+    if key.startswith(KEY_PREFIX) and key.count(":") >= 2:
+        return key[len(KEY_PREFIX) : key.rfind(":")]
+    return key.split(":", 1)[0]
+
+
+def percentile(samples, ratio: float) -> float:
+    """Percentile (rang le plus proche) d'une série de mesures, 0 si vide"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(ratio * len(ordered)) - 1)]
+
+
+class _NamespaceStats:
+    """Compteurs d'un espace de noms"""
+
+    def __init__(self):
+        self.hits = {tier: 0 for tier in TIERS}
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.loads = 0
+        self.load_time = 0.0
+        self.latencies: Dict[str, Deque[float]] = {tier: deque(maxlen=LATENCY_SAMPLES) for tier in TIERS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        hits = sum(self.hits.values())
+        lookups = hits + self.misses
+        avg_load = self.load_time / self.loads if self.loads else 0.0
+        return {
+            "hits": hits,
+            "memory_hits": self.hits["memory"],
+            "redis_hits": self.hits["redis"],
+            "misses": self.misses,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_rate": round(hits / lookups * 100, 1) if lookups else 0,
+            "avg_load_ms": round(avg_load * 1000, 3),
+            # Chaque succès évite un chargement de durée moyenne
+            "time_saved_s": round(hits * avg_load, 3),
+            **{
+                f"{tier}_p{int(ratio * 100)}_ms": round(percentile(self.latencies[tier], ratio) * 1000, 3)
+                for tier in TIERS
+                for ratio in (0.5, 0.95)
+            },
+        }
+
+
+class CacheStatistics:
+    """Collecteur thread-safe des statistiques du cache, regroupées par espace de noms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._namespaces: Dict[str, _NamespaceStats] = {}
+
+    def _namespace(self, key: str) -> _NamespaceStats:
+        name = namespace_of(key)
+        stats = self._namespaces.get(name)
+        if stats is None:
+            stats = self._namespaces[name] = _NamespaceStats()
+        return stats
+
+    def record_lookup(self, key: str, tier: str, seconds: float, hit: bool) -> None:
+        """Enregistre la latence d'une lecture sur un niveau (et le succès éventuel)"""
+        with self._lock:
+            stats = self._namespace(key)
+            stats.latencies[tier].append(seconds)
+            if hit:
+                stats.hits[tier] += 1
+
+    def record_miss(self, key: str) -> None:
+        with self._lock:
+            self._namespace(key).misses += 1
+
+    def record_set(self, key: str) -> None:
+        with self._lock:
+            self._namespace(key).sets += 1
+
+    def record_eviction(self, key: str, reason: str = "lru") -> None:
+        """Entrée retirée : "lru" (limites atteintes), "expired" (TTL) ou "invalidated" (tag invalidé)"""
+        with self._lock:
+            stats = self._namespace(key)
+            if reason == "expired":
+                stats.expirations += 1
+            elif reason == "invalidated":
+                stats.invalidations += 1
+            else:
+                stats.evictions += 1
+
+    def record_load(self, key: str, seconds: float) -> None:
+        """Durée d'exécution de la fonction mise en cache lors d'un échec"""
+        with self._lock:
+            stats = self._namespace(key)
+            stats.loads += 1
+            stats.load_time += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._namespaces.clear()
+
+    def namespaces(self) -> List[Dict[str, Any]]:
+        """
+        Statistiques de chaque espace de noms, les plus rentables d'abord
+
+        Returns:
+            List[Dict]: namespace, hits (memory_hits / redis_hits), misses, sets,
+            evictions, expirations, invalidations, hit_rate (%), avg_load_ms, time_saved_s et
+            latences memory_p50_ms, memory_p95_ms, redis_p50_ms, redis_p95_ms
+        """
+        with self._lock:
+            rows = [{"namespace": name, **stats.to_dict()} for name, stats in self._namespaces.items()]
+        return sorted(rows, key=lambda row: (row["time_saved_s"], row["hits"]), reverse=True)
+
+    def totals(self) -> Dict[str, Any]:
+        """Totaux tous espaces de noms confondus (latences p50/p95 par niveau)"""
+        with self._lock:
+            total = _NamespaceStats()
+            for stats in self._namespaces.values():
+                for tier in TIERS:
+                    total.hits[tier] += stats.hits[tier]
+                    total.latencies[tier] = deque(list(total.latencies[tier]) + list(stats.latencies[tier]))
+                total.misses += stats.misses
+                total.sets += stats.sets
+                total.evictions += stats.evictions
+                total.expirations += stats.expirations
+                total.invalidations += stats.invalidations
+                total.loads += stats.loads
+                total.load_time += stats.load_time
+            result = total.to_dict()
+
+        # Temps économisé : somme par espace de noms (les durées de chargement diffèrent)
+        result["time_saved_s"] = round(sum(row["time_saved_s"] for row in self.namespaces()), 3)
+        return result
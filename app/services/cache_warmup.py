@@ -0,0 +1,288 @@
+"""
+Préchauffage du cache au démarrage de Consultator
+Précalcule les requêtes les plus demandées pour que le premier utilisateur ne paie pas
+les chargements à froid (statistiques, première page de la liste, practices, BM,
+gazetteer du chatbot...)
+
+Les tâches sont classées d'après les statistiques du cache (temps de chargement économisé,
+puis nombre de succès par espace de noms) : statistiques du processus en cours cumulées avec
+l'historique enregistré par les exécutions précédentes. Seules les top_n premières sont
+préchauffées ; les tâches jamais mesurées gardent l'ordre d'enregistrement.
+
+Configuration par variables d'environnement :
+    CONSULTATOR_CACHE_WARMUP           off (défaut), startup (une passe après le démarrage)
+                                       ou background (passes périodiques)
+    CONSULTATOR_CACHE_WARMUP_TOP_N     nombre de tâches préchauffées par passe (défaut 5)
+    CONSULTATOR_CACHE_WARMUP_INTERVAL  secondes entre deux passes en mode background (défaut 540)
+
+Ligne de commande (remplit le niveau Redis partagé, le niveau mémoire est propre au processus) :
+    python -m app.services.cache_warmup --top 5
+"""
+
+import argparse
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.services.cache_service import get_cache_service
+from app.services.cache_service import get_cached_consultant_stats
+from app.services.cache_service import get_cached_consultants_list
+
+WARMUP_MODE = os.getenv("CONSULTATOR_CACHE_WARMUP", "off")
+WARMUP_TOP_N = int(os.getenv("CONSULTATOR_CACHE_WARMUP_TOP_N", "5"))
+# Inférieur au TTL des statistiques (600 s) : les entrées restent chaudes entre deux passes
+WARMUP_INTERVAL = int(os.getenv("CONSULTATOR_CACHE_WARMUP_INTERVAL", "540"))
+
+APP_DIR = os.path.join(os.path.dirname(__file__), "..")
+HISTORY_PATH = os.path.join(APP_DIR, "..", "data", "cache_warmup_stats.json")
+# Poids de l'historique à chaque enregistrement : les usages récents comptent davantage
+HISTORY_DECAY = 0.5
+
+
+@dataclass(frozen=True)
+class WarmupTask:
+    """Requête à précalculer : namespace est l'espace de noms de ses statistiques de cache"""
+
+    name: str
+    loader: Callable[[], Any]
+    namespace: Optional[str] = None
+
+
+_tasks: List[WarmupTask] = []
+
+# Historique lu au premier classement (cumulé une seule fois avec les statistiques du processus)
+_history: Optional[Dict[str, Dict[str, float]]] = None
+
+# main() est réexécuté à chaque rerun Streamlit : le préchauffage ne démarre qu'une fois par processus
+_warmup_started = False
+_warmup_lock = threading.Lock()
+_warmup_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+
+
+def register_warmup_task(name: str, loader: Callable[[], Any], namespace: Optional[str] = None) -> None:
+    """
+    Ajoute une requête au préchauffage (remplace une tâche de même nom)
+
+    Example:
+        >>> register_warmup_task("stats", get_cached_consultant_stats, "get_cached_consultant_stats")
+    """
+    _tasks[:] = [task for task in _tasks if task.name != name]
+    _tasks.append(WarmupTask(name, loader, namespace))
+
+
+def get_warmup_tasks() -> List[WarmupTask]:
+    """Tâches enregistrées, dans l'ordre d'enregistrement"""
+    return list(_tasks)
+
+
+def load_history(path: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+    """Statistiques enregistrées par les exécutions précédentes ({namespace: {hits, time_saved_s}})"""
+    path = path or HISTORY_PATH
+    try:
+        with open(path, encoding="utf-8") as history_file:
+            history = json.load(history_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Historique du préchauffage illisible: {e}")
+        return {}
+    return history if isinstance(history, dict) else {}
+
+
+def _get_history() -> Dict[str, Dict[str, float]]:
+    global _history
+    if _history is None:
+        _history = load_history()
+    return _history
+
+
+def namespace_scores() -> Dict[str, Dict[str, float]]:
+    """Statistiques de chaque espace de noms : historique atténué plus processus en cours"""
+    scores = {
+        namespace: {
+            "hits": row.get("hits", 0) * HISTORY_DECAY,
+            "time_saved_s": row.get("time_saved_s", 0.0) * HISTORY_DECAY,
+        }
+        for namespace, row in _get_history().items()
+    }
+    for row in get_cache_service().statistics.namespaces():
+        score = scores.setdefault(row["namespace"], {"hits": 0, "time_saved_s": 0.0})
+        score["hits"] += row["hits"]
+        score["time_saved_s"] += row["time_saved_s"]
+    return scores
+
+
+def save_history(path: Optional[str] = None) -> None:
+    """Enregistre les statistiques cumulées pour classer les tâches au prochain démarrage"""
+    path = path or HISTORY_PATH
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as history_file:
+            json.dump(namespace_scores(), history_file, indent=2)
+    except OSError as e:
+        print(f"⚠️ Impossible d'enregistrer l'historique du préchauffage: {e}")
+
+
+def rank_tasks(top_n: Optional[int] = None) -> List[WarmupTask]:
+    """
+    Tâches les plus rentables d'abord (temps économisé, puis succès), limitées à top_n
+
+    Les tâches sans statistiques suivent, dans l'ordre d'enregistrement.
+    """
+    scores = namespace_scores()
+    empty = {"hits": 0, "time_saved_s": 0.0}
+
+    def sort_key(indexed_task):
+        index, task = indexed_task
+        score = scores.get(task.namespace, empty)
+        return (-score["time_saved_s"], -score["hits"], index)
+
+    ranked = [task for _, task in sorted(enumerate(_tasks), key=sort_key)]
+    top_n = WARMUP_TOP_N if top_n is None else top_n
+    return ranked[:top_n]
+
+
+def warm_up(top_n: Optional[int] = None) -> Dict[str, float]:
+    """
+    Exécute les top_n tâches les plus demandées
+
+    Returns:
+        Dict[str, float]: Durée en secondes de chaque tâche réussie, par nom
+    """
+    durations = {}
+    for task in rank_tasks(top_n):
+        start = time.perf_counter()
+        try:
+            task.loader()
+        except (SQLAlchemyError, OSError, RuntimeError, ValueError, TypeError) as e:
+            print(f"⚠️ Préchauffage de {task.name} impossible: {e}")
+            continue
+        durations[task.name] = time.perf_counter() - start
+    return durations
+
+
+def _warmup_loop(top_n: int, interval: float, stop_event: threading.Event) -> None:
+    while not stop_event.is_set():
+        warm_up(top_n)
+        save_history()
+        if interval <= 0 or stop_event.wait(interval):
+            return
+
+
+def start_background_warmup(top_n: Optional[int] = None, interval: Optional[float] = None) -> bool:
+    """
+    Lance le préchauffage dans un thread daemon (une fois par processus)
+
+    Args:
+        top_n: Nombre de tâches par passe (CONSULTATOR_CACHE_WARMUP_TOP_N si None)
+        interval: Secondes entre deux passes, 0 pour une passe unique
+
+    Returns:
+        bool: True si le thread a été lancé, False si le préchauffage a déjà démarré dans ce processus
+    """
+    global _warmup_started, _warmup_thread
+    with _warmup_lock:
+        if _warmup_started:
+            return False
+        _warmup_started = True
+
+    # Statistiques conservées pour le classement du prochain démarrage
+    atexit.register(save_history)
+
+    _warmup_thread = threading.Thread(
+        target=_warmup_loop,
+        args=(
+            WARMUP_TOP_N if top_n is None else top_n,
+            WARMUP_INTERVAL if interval is None else interval,
+            _stop_event,
+        ),
+        name="consultator-cache-warmup",
+        daemon=True,
+    )
+    _warmup_thread.start()
+    return True
+
+
+def stop_background_warmup() -> None:
+    """Arrête les passes périodiques (la passe en cours se termine)"""
+    _stop_event.set()
+
+
+def start_configured_warmup(mode: Optional[str] = None) -> bool:
+    """
+    Démarre le préchauffage selon CONSULTATOR_CACHE_WARMUP (off, startup ou background)
+
+    startup lance une seule passe par processus et background une seule boucle, même si la
+    fonction est rappelée à chaque rerun
+
+    Returns:
+        bool: True si un préchauffage a été lancé
+    """
+    mode = mode or WARMUP_MODE
+    if mode == "background":
+        return start_background_warmup()
+    if mode == "startup":
+        return start_background_warmup(interval=0)
+    return False
+
+
+def _practice_statistics():
+    from app.services.practice_service import PracticeService
+
+    return PracticeService.get_practice_statistics()
+
+
+def _business_managers():
+    from app.services.business_manager_service import BusinessManagerService
+
+    return BusinessManagerService.get_all_business_managers()
+
+
+def _chatbot_gazetteer():
+    from app.services.chatbot_service import ChatbotService
+
+    return ChatbotService()._get_gazetteer()
+
+
+# Tâches par défaut, dans l'ordre de préchauffage tant qu'aucune statistique n'est connue
+register_warmup_task("consultant_stats", get_cached_consultant_stats, "get_cached_consultant_stats")
+register_warmup_task("consultants_list", get_cached_consultants_list, "get_cached_consultants_list")
+register_warmup_task("practice_statistics", _practice_statistics, "practice_service:get_practice_statistics")
+register_warmup_task("business_managers", _business_managers, "business_manager_service:get_all_business_managers")
+register_warmup_task("chatbot_gazetteer", _chatbot_gazetteer)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Point d'entrée de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Préchauffe le cache de Consultator")
+    parser.add_argument("--top", type=int, default=WARMUP_TOP_N, help="Nombre de requêtes à précalculer")
+    parser.add_argument("--list", action="store_true", help="Affiche le classement sans précalculer")
+    args = parser.parse_args(argv)
+
+    # Certains services importent les modules de app/ sans préfixe (database...)
+    sys.path.insert(0, os.path.abspath(APP_DIR))
+
+    if args.list:
+        for position, task in enumerate(rank_tasks(args.top), start=1):
+            print(f"{position}. {task.name}")
+        return
+
+    durations = warm_up(args.top)
+    for name, seconds in durations.items():
+        print(f"✅ {name}: {seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Façade de cache unique des services de Consultator
+Remplace @st.cache_data / @st.cache_resource : les services restent utilisables hors
+Streamlit (imports en lot, scripts, tests) et tous les caches partagent l'invalidation
+par tags, l'éviction et les statistiques de CacheService.
+
+    @cache_data(ttl=1800, tags=("business_managers",))
+    def get_all_business_managers(): ...
+
+    @cache_resource
+    def get_database_engine(): ...
+
+Backends des données (CONSULTATOR_CACHE_BACKEND) :
+    service    CacheService : mémoire bornée + Redis partagé entre processus (défaut)
+    streamlit  st.cache_data dans un runtime Streamlit (CacheService hors Streamlit) ;
+               les générations des tags font partie des arguments, une invalidation
+               rend donc les entrées Streamlit périmées comme celles de CacheService
+
+Chaque fonction porte le tag "function:<module>.<nom>" : fonction.clear() l'invalide.
+Une fonction qui retourne une valeur de repli après une erreur appelle skip_caching() :
+la valeur n'est pas mise en cache (quel que soit le backend).
+CONSULTATOR_CACHE_ENABLED=0 désactive le cache des données (les fonctions sont appelées
+directement) ; les ressources restent partagées.
+"""
+
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+import streamlit as st
+
+from app.services.cache_service import cached
+from app.services.cache_service import call_uncached
+from app.services.cache_service import get_cache_service
+from app.services.cache_service import invalidate_tags
+from app.services.cache_service import skip_caching
+
+CACHE_BACKEND = os.getenv("CONSULTATOR_CACHE_BACKEND", "service")
+CACHE_ENABLED = os.getenv("CONSULTATOR_CACHE_ENABLED", "1") != "0"
+
+FUNCTION_TAG_PREFIX = "function:"
+
+# Chargement exécuté par l'appel en cours (backend streamlit : distingue succès et échec)
+_streamlit_loads = threading.local()
+
+# Fonctions @cache_resource (vidées ensemble par clear_resources)
+_resource_functions = []
+
+TagsSpec = Union[Iterable[str], Callable[..., Iterable[str]], None]
+
+
+def _short_module(func: Callable) -> str:
+    # Les modules sont importés avec ou sans préfixe "app." : la clé n'en dépend pas
+    return func.__module__.rsplit(".", 1)[-1]
+
+
+def _streamlit_runtime() -> bool:
+    """Vrai dans un script exécuté par Streamlit"""
+    try:
+        return st.runtime.exists()
+    except AttributeError:
+        return False
+
+
+def _with_function_tag(tags: TagsSpec, function_tag: str) -> Callable[..., list]:
+    def entry_tags(*args, **kwargs):
+        base = tags(*args, **kwargs) if callable(tags) else (tags or ())
+        return [*base, function_tag]
+
+    return entry_tags
+
+
+class _UncacheableResult(Exception):
+    """Valeur de repli remontée hors de st.cache_data (qui ne met pas en cache les exceptions)"""
+
+    def __init__(self, result: Any):
+        super().__init__("valeur de repli non mise en cache")
+        self.result = result
+
+
+def _streamlit_cached(func: Callable, ttl: Optional[int], namespace: str, entry_tags: Callable[..., list]):
+    """Appel via st.cache_data, mesuré dans les statistiques de CacheService"""
+    st_function = None
+
+    def load(generation, *args, **kwargs):
+        start = time.perf_counter()
+        result, cacheable = call_uncached(func, args, kwargs)
+        _streamlit_loads.seconds = time.perf_counter() - start
+        if not cacheable:
+            raise _UncacheableResult(result)
+        return result
+
+    # st.cache_data identifie la fonction par son module et son nom qualifié
+    load.__module__ = func.__module__
+    load.__qualname__ = f"{func.__qualname__}.<cache_data>"
+
+    def call(*args, **kwargs):
+        nonlocal st_function
+        if st_function is None:
+            st_function = st.cache_data(ttl=ttl, show_spinner=False)(load)
+
+        cache_service = get_cache_service()
+        key = cache_service._generate_key(namespace, args, kwargs)
+        generation = tuple(sorted(cache_service.get_tag_versions(entry_tags(*args, **kwargs)).items()))
+
+        _streamlit_loads.seconds = None
+        start = time.perf_counter()
+        try:
+            result = st_function(generation, *args, **kwargs)
+        except _UncacheableResult as uncacheable:
+            result = uncacheable.result
+        load_seconds = _streamlit_loads.seconds
+
+        hit = load_seconds is None
+        cache_service.statistics.record_lookup(key, "memory", time.perf_counter() - start, hit)
+        if not hit:
+            cache_service.statistics.record_miss(key)
+            cache_service.record_load(key, load_seconds)
+        return result
+
+    return call
+
+
+def cache_data(
+    ttl: Optional[int] = None,
+    tags: TagsSpec = None,
+    stale_ttl: int = 0,
+    early_refresh: float = 0.0,
+):
+    """
+    Met en cache le résultat d'une fonction de service (remplace @st.cache_data)
+
+    Args:
+        ttl: Time To Live en secondes (TTL par défaut de CacheService si None)
+        tags: Tags du résultat (noms de tables : invalidés à chaque commit les touchant),
+            ou fonction recevant les arguments de l'appel et retournant les tags
+        stale_ttl: Cf. cached (backend service uniquement)
+        early_refresh: Cf. cached (backend service uniquement)
+
+    La fonction décorée expose clear() (invalide toutes ses entrées), namespace
+    (espace de noms de ses statistiques) et tags.
+    """
+
+    def decorator(func):
+        namespace = f"{_short_module(func)}:{func.__name__}"
+        function_tag = f"{FUNCTION_TAG_PREFIX}{_short_module(func)}.{func.__qualname__}"
+        entry_tags = _with_function_tag(tags, function_tag)
+
+        service_call = cached(
+            ttl=ttl,
+            key_prefix=_short_module(func),
+            tags=entry_tags,
+            stale_ttl=stale_ttl,
+            early_refresh=early_refresh,
+        )(func)
+        streamlit_call = _streamlit_cached(func, ttl, namespace, entry_tags)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not CACHE_ENABLED:
+                return func(*args, **kwargs)
+            if CACHE_BACKEND == "streamlit" and _streamlit_runtime():
+                return streamlit_call(*args, **kwargs)
+            return service_call(*args, **kwargs)
+
+        wrapper.clear = lambda: invalidate_tags(function_tag)
+        wrapper.namespace = namespace
+        wrapper.tags = tags
+        return wrapper
+
+    return decorator
+
+
+def cache_resource(func: Callable) -> Callable:
+    """
+    Ressource partagée par tout le processus, créée une fois par arguments (remplace @st.cache_resource)
+
+    Pour les objets non sérialisables (engine, factory de sessions) : jamais copiés ni
+    envoyés à Redis. La fonction décorée expose clear().
+    """
+    resources: Dict[Any, Any] = {}
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            return resources[key]
+        except KeyError:
+            pass
+        with lock:
+            if key not in resources:
+                resources[key] = func(*args, **kwargs)
+            return resources[key]
+
+    def clear():
+        with lock:
+            resources.clear()
+
+    wrapper.clear = clear
+    _resource_functions.append(wrapper)
+    return wrapper
+
+
+def clear_resources() -> None:
+    """Oublie toutes les ressources (elles seront recréées au prochain appel)"""
+    for resource_function in _resource_functions:
+        resource_function.clear()
+
+
+def clear_data() -> bool:
+    """Vide toutes les données en cache, quel que soit le backend"""
+    if _streamlit_runtime():
+        st.cache_data.clear()
+    return get_cache_service().clear()
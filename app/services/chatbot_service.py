@@ -5,17 +5,33 @@ Utilise l'IA pour répondre aux questions sur la base de données
 
 import json
 import re
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import streamlit as st
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, case, func, or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 # Imports des services existants
 from database.database import get_database_session
-from database.models import Competence, Consultant, ConsultantCompetence, ConsultantLangue, Langue, Mission, Practice
+from database.models import (
+    CV,
+    Competence,
+    Consultant,
+    ConsultantCompetence,
+    ConsultantLangue,
+    Langue,
+    Mission,
+    Practice,
+)
+
+from app.services import caching
+from app.services.cache_service import get_cache_service
+from app.services.entity_gazetteer import EntityGazetteer, get_gazetteer
+from app.services.intent_engine import get_intent_scorer
 
 # Import du service OpenAI pour les tests
 try:
@@ -45,11 +61,85 @@ class ChatbotService:
     BULLET_POINT_INDENT = "   • "
     DATE_FORMAT = "%d/%m/%Y"
 
+    # Types d'entités du gazetteer
+    ENTITY_PRENOM = "prenom"
+    ENTITY_NOM = "nom"
+    ENTITY_NOM_COMPLET = "nom_complet"
+    ENTITY_COMPETENCE = "competence"
+    ENTITY_LANGUE = "langue"
+    ENTITY_PRACTICE = "practice"
+    CONSULTANT_NAME_ENTITIES = (ENTITY_PRENOM, ENTITY_NOM, ENTITY_NOM_COMPLET)
+
+    # Tables lues par le gazetteer : une écriture sur l'une d'elles le fait recharger
+    GAZETTEER_TAGS = (
+        Consultant.__tablename__,
+        Competence.__tablename__,
+        Langue.__tablename__,
+        Practice.__tablename__,
+    )
+
+    # Cache des réponses : clé = question normalisée, invalidé à chaque écriture sur une table lue
+    ANSWER_CACHE_NAMESPACE = "chatbot:answer"
+    ANSWER_CACHE_TTL = 300  # Borne les réponses calculées à partir de la date du jour
+    ANSWER_CACHE_TAGS = (
+        Consultant.__tablename__,
+        Mission.__tablename__,
+        Practice.__tablename__,
+        Competence.__tablename__,
+        ConsultantCompetence.__tablename__,
+        Langue.__tablename__,
+        ConsultantLangue.__tablename__,
+        CV.__tablename__,
+    )
+
+    # Instantané des statistiques : répartitions calculées par GROUP BY
+    STATS_DIMENSIONS = ("grade", "type_contrat", "societe")
+    STATS_SAMPLE_SIZE = 5  # Noms affichés si le groupe n'est pas plus nombreux
+    EXPERIENCE_TOP_SIZE = 3
+
+    # Compétences techniques prédéfinies
+    KNOWN_SKILLS = (
+        "python",
+        "java",
+        "javascript",
+        "sql",
+        "react",
+        "angular",
+        "node.js",
+        "docker",
+        "kubernetes",
+        "aws",
+        "azure",
+        "power bi",
+        "agile",
+        "scrum",
+        "finance",
+        "devops",
+    )
+
+    # Langues prédéfinies
+    KNOWN_LANGUAGES = (
+        "français",
+        "anglais",
+        "espagnol",
+        "allemand",
+        "italien",
+        "portugais",
+        "chinois",
+        "japonais",
+        "arabe",
+        "russe",
+    )
+
     def __init__(self):
         # Suppression de la session partagée pour éviter les timeouts
         # Chaque méthode utilisera une session fraîche via context manager
         self.conversation_history = []
         self.last_question = ""
+        # Session de la question en cours (unité de travail de process_question)
+        self._session = None
+        # Dernière réponse servie depuis le cache (None avant la première question)
+        self.last_answer_cached: Optional[bool] = None
 
     def _get_session(self):
         """
@@ -58,20 +148,49 @@ class ChatbotService:
         """
         return get_database_session()
 
+    @contextmanager
+    def _question_session(self):
+        """
+        Unité de travail d'une question : une seule session, ouverte pour toute la question
+
+        Toutes les lectures de la question voient le même instantané de la base, et les
+        objets chargés restent attachés jusqu'à la réponse (chargements différés possibles).
+        """
+        if self._session is not None:
+            # Question imbriquée : même unité de travail
+            yield self._session
+            return
+        with get_database_session() as session:
+            self._session = session
+            try:
+                yield session
+            finally:
+                self._session = None
+
+    @contextmanager
+    def _session_scope(self):
+        """Session de la question en cours ; session fraîche si appelé hors d'une question"""
+        if self._session is not None:
+            yield self._session
+            return
+        with get_database_session() as session:
+            yield session
+
     def _execute_with_fresh_session(self, query_func):
         """
-        Exécute une fonction de requête avec une session fraîche
+        Exécute une fonction de requête avec la session de la question en cours
         Args:
             query_func: Fonction qui prend une session en paramètre et retourne un résultat
         """
         try:
-            with get_database_session() as session:
+            with self._session_scope() as session:
                 return query_func(session)
         except Exception as e:
             print(f"Erreur de session dans le chatbot: {e}")
-            # Retry avec une nouvelle session
+            # Retry après annulation de la transaction en erreur
             try:
-                with get_database_session() as session:
+                with self._session_scope() as session:
+                    session.rollback()
                     return query_func(session)
             except Exception as e2:
                 print(f"Erreur lors du retry: {e2}")
@@ -121,14 +240,27 @@ class ChatbotService:
             Dict contenant la réponse, les données et métadonnées
         """
         try:
-            # Nettoyer et analyser la question
+            # Nettoyer la question (clé du cache des réponses)
             clean_question = self._clean_question(question)
             self.last_question = clean_question  # Stocker pour usage dans les handlers
-            intent = self._analyze_intent(clean_question)
-            entities = self._extract_entities(clean_question)
 
-            # Router vers le bon handler
-            return self._route_question_to_handler(intent, entities)
+            cached_answer = self._get_cached_answer(clean_question)
+            if cached_answer is not None:
+                return cached_answer
+
+            # Générations lues avant le calcul : un commit pendant la réponse la rend périmée
+            tag_versions = self._answer_tag_versions()
+            start = time.perf_counter()
+            # Une seule session pour toute la question
+            with self._question_session():
+                intent = self._analyze_intent(clean_question)
+                entities = self._extract_entities(clean_question)
+
+                # Router vers le bon handler
+                answer = self._route_question_to_handler(intent, entities)
+
+            self._cache_answer(clean_question, answer, time.perf_counter() - start, tag_versions)
+            return answer
 
         except Exception as e:
             return {
@@ -136,8 +268,62 @@ class ChatbotService:
                 "data": None,
                 "intent": "error",
                 "confidence": 0.0,
+                "error": True,
             }
 
+    def _mark_error(self, answer: Dict[str, Any], failed: bool = True) -> Dict[str, Any]:
+        """Marque une réponse construite après une exception : elle n'est jamais mise en cache"""
+        if failed:
+            answer["error"] = True
+        return answer
+
+    def _answer_cache_key(self, clean_question: str) -> str:
+        return get_cache_service()._generate_key(self.ANSWER_CACHE_NAMESPACE, (clean_question,), {})
+
+    def _get_cached_answer(self, clean_question: str) -> Optional[Dict[str, Any]]:
+        """Réponse déjà calculée pour la question normalisée, si aucune table lue n'a changé depuis"""
+        if not caching.CACHE_ENABLED:
+            self.last_answer_cached = False
+            return None
+        answer = get_cache_service().get(self._answer_cache_key(clean_question))
+        self.last_answer_cached = answer is not None
+        return answer
+
+    def _answer_tag_versions(self) -> Optional[Dict[str, int]]:
+        """Générations des tables lues par le chatbot (None si le cache est désactivé)"""
+        if not caching.CACHE_ENABLED:
+            return None
+        return get_cache_service().get_tag_versions(self.ANSWER_CACHE_TAGS)
+
+    def _cache_answer(
+        self,
+        clean_question: str,
+        answer: Dict[str, Any],
+        seconds: float,
+        tag_versions: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Conserve la réponse (jamais une réponse d'erreur), avec les générations lues avant son calcul"""
+        if not caching.CACHE_ENABLED or not isinstance(answer, dict) or answer.get("error"):
+            return
+        cache_service = get_cache_service()
+        key = self._answer_cache_key(clean_question)
+        cache_service.record_load(key, seconds)
+        cache_service.set(
+            key, answer, ttl=self.ANSWER_CACHE_TTL, tags=self.ANSWER_CACHE_TAGS, tag_versions=tag_versions
+        )
+
+    def get_answer_cache_stats(self) -> Dict[str, Any]:
+        """
+        Statistiques du cache des réponses (tous les utilisateurs du processus)
+
+        Returns:
+            Dict: hits, misses et hit_rate (%)
+        """
+        for row in get_cache_service().statistics.namespaces():
+            if row["namespace"] == self.ANSWER_CACHE_NAMESPACE:
+                return {"hits": row["hits"], "misses": row["misses"], "hit_rate": row["hit_rate"]}
+        return {"hits": 0, "misses": 0, "hit_rate": 0}
+
     def _clean_question(self, question: str) -> str:
         """Nettoie et normalise la question"""
         # Supprimer la ponctuation excessive
@@ -149,235 +335,58 @@ class ChatbotService:
 
         return question.lower()
 
+    def _load_gazetteer(self) -> EntityGazetteer:
+        """Construit le gazetteer : termes prédéfinis, puis noms, compétences, langues et practices de la base"""
+        with self._session_scope() as session:
+            consultants = session.query(Consultant.prenom, Consultant.nom).all()
+            competences = session.query(Competence.nom).all()
+            langues = session.query(Langue.nom).all()
+            practices = session.query(Practice.nom, Practice.actif).all()
+
+        gazetteer = EntityGazetteer()
+        # Les termes prédéfinis sont trouvés même à l'intérieur d'un mot, comme avant
+        for competence in self.KNOWN_SKILLS:
+            gazetteer.add(self.ENTITY_COMPETENCE, competence, word_boundary=False)
+        for langue in self.KNOWN_LANGUAGES:
+            gazetteer.add(self.ENTITY_LANGUE, langue, word_boundary=False)
+
+        for consultant in consultants:
+            gazetteer.add(self.ENTITY_PRENOM, consultant.prenom)
+            gazetteer.add(self.ENTITY_NOM, consultant.nom)
+            if isinstance(consultant.prenom, str) and isinstance(consultant.nom, str):
+                nom_complet = f"{consultant.prenom} {consultant.nom}"
+                gazetteer.add(self.ENTITY_NOM_COMPLET, nom_complet, word_boundary=False)
+        for competence in competences:
+            gazetteer.add(self.ENTITY_COMPETENCE, competence.nom)
+        for langue in langues:
+            gazetteer.add(self.ENTITY_LANGUE, langue.nom)
+        for practice in practices:
+            if practice.actif:
+                gazetteer.add(self.ENTITY_PRACTICE, practice.nom)
+        return gazetteer
+
+    def _get_gazetteer(self) -> EntityGazetteer:
+        """Gazetteer partagé des entités, rechargé après une écriture sur ses tables"""
+        return get_gazetteer("chatbot", self._load_gazetteer, self.GAZETTEER_TAGS)
+
+    def _find_entities(self, question: str, kinds) -> List[str]:
+        """Valeurs des entités des types kinds trouvées dans la question (sans doublons)"""
+        return self._entity_values(self._get_gazetteer().find(question), kinds)
+
+    @staticmethod
+    def _entity_values(entries, kinds) -> List[str]:
+        return list(dict.fromkeys(entry.value for entry in entries if entry.kind in kinds))
+
     def _check_consultant_name_mentioned(self, question: str) -> bool:
         """Vérifie si un nom de consultant est mentionné dans la question"""
-        with get_database_session() as session:
-            all_consultants = session.query(Consultant).all()
-            for consultant in all_consultants:
-                if re.search(rf"\b{re.escape(consultant.prenom.lower())}\b", question) or re.search(
-                    rf"\b{re.escape(consultant.nom.lower())}\b", question
-                ):
-                    return True
-            return False
-
-    def _get_intent_patterns(self) -> Dict[str, List[str]]:
-        """Retourne les patterns pour identifier les intentions"""
-        return {
-            "salaire": [
-                r"salaire",
-                r"rémunération",
-                r"paie",
-                r"combien gagne",
-                r"revenus",
-                r"euros",
-                r"€",
-                r"salaire de",
-                r"gagne",
-                r"cjm",
-                r"coût journalier",
-            ],
-            "experience": [
-                r"expérience",
-                r"experience",
-                r"années d'expérience",
-                r"annees d'experience",
-                r"ancienneté",
-                r"seniorité",
-                r"séniorité",
-                r"depuis quand",
-                r"depuis combien",
-                r"combien d'années",
-                r"combien d'annees",
-                r"quel âge",
-                r"âge professionnel",
-            ],
-            "profil_professionnel": [
-                r"grade",
-                r"niveau",
-                r"poste",
-                r"fonction",
-                r"junior",
-                r"confirmé",
-                r"senior",
-                r"manager",
-                r"directeur",
-                r"type contrat",
-                r"type de contrat",
-                r"contrat",
-                r"cdi",
-                r"cdd",
-                r"stagiaire",
-                r"alternant",
-                r"indépendant",
-                r"freelance",
-                r"société",
-                r"societe",
-                r"quanteam",
-                r"asigma",
-                r"entreprise",
-            ],
-            "competences": [
-                r"compétences",
-                r"competences",
-                r"maîtrise",
-                r"maitrise",
-                r"sait faire",
-                r"technologies",
-                r"langages",
-                r"outils",
-                r"expertise",
-                r"python",
-                r"sql",
-                r"java",
-                r"quelles\s+(?:\w+\s+)*compétences",
-                r"quelles\s+(?:\w+\s+)*competences",
-                r"skills",
-                r"techno",
-                r"connaît",
-                r"connait",
-            ],
-            "langues": [
-                r"langues?",
-                r"langue",
-                r"parle",
-                r"parlent",
-                r"anglais",
-                r"français",
-                r"espagnol",
-                r"allemand",
-                r"italien",
-                r"bilingue",
-                r"niveau\s+(?:\w+\s+)*langue",
-                r"parle\s+(?:\w+\s+)*anglais",
-                r"qui\s+(?:\w+\s+)*parle",
-                r"quelles\s+(?:\w+\s+)*langues",
-                r"polyglotte",
-                r"linguistique",
-            ],
-            "missions": [
-                r"missions",
-                r"mission",
-                r"travaille",
-                r"chez",
-                r"entreprise",
-                r"client",
-                r"projet",
-                r"bnp",
-                r"paribas",
-                r"société générale",
-                r"combien\s+(?:\w+\s+)*missions?",
-                r"nombre\s+(?:\w+\s+)*missions?",
-                r"projets",
-            ],
-            "contact": [
-                r"mail",
-                r"email",
-                r"e-mail",
-                r"téléphone",
-                r"tel",
-                r"numéro",
-                r"contact",
-                r"joindre",
-                r"coordonnées",
-            ],
-            "liste_consultants": [
-                r"quels sont les consultants",
-                r"liste des consultants",
-                r"consultants disponibles",
-                r"consultants actifs",
-                r"tous les consultants",
-                r"lister les consultants",
-                r"qui sont les consultants",
-                r"montrer les consultants",
-            ],
-            "practices": [
-                r"practice",
-                r"practices",
-                r"qui est dans la practice",
-                r"consultants de la practice",
-                r"practice data",
-                r"practice quant",
-                r"équipe",
-                r"dans quelle practice",
-            ],
-            "cvs": [
-                r"cv",
-                r"curriculum",
-                r"document",
-                r"fichier",
-                r"upload",
-                r"téléchargé",
-            ],
-            "statistiques": [
-                r"combien\s+(?:[\w-]+\s+)*consultants",
-                r"nombre\s+(?:[\w-]+\s+)*consultants",
-                r"combien\s+(?:[\w-]+\s+)*dans\s+(?:[\w-]+\s+)*base",
-                r"nombre",
-                r"moyenne",
-                r"total",
-                r"statistiques",
-                r"combien\s+(?:[\w-]+\s+)*missions",
-                r"actifs",
-                r"inactifs",
-                r"tjm moyen",
-                r"combien y a",
-                r"il y a combien",
-            ],
-            "disponibilite": [  # Nouvelle intention V1.2.2
-                r"disponible",
-                r"disponibilité",
-                r"libre",
-                r"quand\s+(?:\w+\s+)*libre",
-                r"quand\s+(?:\w+\s+)*disponible",
-                r"date\s+(?:\w+\s+)*disponibilité",
-                r"fin\s+(?:\w+\s+)*mission",
-                r"libéré",
-                r"fini",
-                r"termine",
-                r"asap",
-                r"immédiatement",
-                r"tout de suite",
-                r"prochaine disponibilité",
-            ],
-            "tjm_mission": [  # Nouvelle intention V1.2.2
-                r"tjm\s+(?:\w+\s+)*mission",
-                r"taux\s+(?:\w+\s+)*mission",
-                r"prix\s+(?:\w+\s+)*mission",
-                r"coût\s+(?:\w+\s+)*mission",
-                r"tarif\s+(?:\w+\s+)*mission",
-                r"facturation\s+(?:\w+\s+)*mission",
-                r"journalier\s+(?:\w+\s+)*mission",
-                r"combien\s+(?:\w+\s+)*coûte\s+(?:\w+\s+)*mission",
-                r"prix\s+(?:\w+\s+)*journée\s+(?:\w+\s+)*mission",
-                r"tjm mission",
-                r"prix mission",
-                r"coût mission",
-                r"tarif mission",
-                r"taux journalier mission",
-                r"combien coûte mission",
-            ],
-            "recherche_consultant": [
-                r"qui est",
-                r"consultant",
-                r"profil",
-                r"information sur",
-                r"details",
-            ],
-        }
+        return bool(self._find_entities(question, (self.ENTITY_PRENOM, self.ENTITY_NOM)))
 
-    def _calculate_intent_scores(self, question: str, intent_patterns: Dict[str, List[str]]) -> Dict[str, int]:
-        """Calcule les scores pour chaque intention"""
-        intent_scores: Dict[str, int] = {}
-        for intent, patterns in intent_patterns.items():
-            score: int = 0
-            for pattern in patterns:
-                if re.search(pattern, question):
-                    score += 1
-            intent_scores[intent] = score
-        return intent_scores
+    def _calculate_intent_scores(self, question: str) -> Dict[str, float]:
+        """Calcule les scores pour chaque intention (moteur compilé à l'import)"""
+        return get_intent_scorer().score(question)
 
     def _apply_special_intent_rules(
-        self, question: str, intent_scores: Dict[str, int], has_consultant_name: bool
+        self, question: str, intent_scores: Dict[str, float], has_consultant_name: bool
     ) -> Optional[str]:
         """Applique les règles spéciales pour déterminer l'intention"""
 
@@ -394,7 +403,7 @@ class ChatbotService:
         return None
 
     def _check_consultant_specific_rules(
-        self, question: str, intent_scores: Dict[str, int], has_consultant_name: bool
+        self, question: str, intent_scores: Dict[str, float], has_consultant_name: bool
     ) -> Optional[str]:
         """Vérifie les règles spécifiques aux consultants nommés"""
         if not has_consultant_name:
@@ -418,7 +427,7 @@ class ChatbotService:
 
         return None
 
-    def _check_pattern_based_rules(self, question: str, intent_scores: Dict[str, int]) -> Optional[str]:
+    def _check_pattern_based_rules(self, question: str, intent_scores: Dict[str, float]) -> Optional[str]:
         """Vérifie les règles basées sur les patterns de texte"""
 
         # NOUVELLE RÈGLE V1.2.2 : Prioriser tjm_mission sur missions si TJM est mentionné
@@ -461,11 +470,8 @@ class ChatbotService:
         # D'abord, vérifier s'il y a un nom de consultant mentionné
         has_consultant_name = self._check_consultant_name_mentioned(question)
 
-        # Patterns pour identifier les intentions
-        intent_patterns = self._get_intent_patterns()
-
         # Scorer chaque intention
-        intent_scores = self._calculate_intent_scores(question, intent_patterns)
+        intent_scores = self._calculate_intent_scores(question)
 
         # Appliquer les règles spéciales
         special_intent = self._apply_special_intent_rules(question, intent_scores, has_consultant_name)
@@ -480,27 +486,8 @@ class ChatbotService:
             return "general"
 
     def _extract_consultant_names(self, question: str) -> List[str]:
-        """Extrait les noms de consultants de la question"""
-        noms = []
-        question_lower = question.lower()
-
-        with get_database_session() as session:
-            all_consultants = session.query(Consultant).all()
-
-        for consultant in all_consultants:
-            # Chercher le prénom dans la question (insensible à la casse)
-            if re.search(rf"\b{re.escape(consultant.prenom.lower())}\b", question_lower):
-                noms.append(consultant.prenom)
-            # Chercher le nom de famille dans la question
-            if re.search(rf"\b{re.escape(consultant.nom.lower())}\b", question_lower):
-                noms.append(consultant.nom)
-            # Chercher le nom complet
-            nom_complet: str = f"{consultant.prenom} {consultant.nom}".lower()
-            if nom_complet in question_lower:
-                noms.append(f"{consultant.prenom} {consultant.nom}")
-
-        # Supprimer les doublons en gardant l'ordre
-        return list(dict.fromkeys(noms))
+        """Extrait les noms de consultants de la question (prénom, nom ou nom complet)"""
+        return self._find_entities(question, self.CONSULTANT_NAME_ENTITIES)
 
     def _extract_companies(self, question: str) -> List[str]:
         """Extrait les noms d'entreprises de la question"""
@@ -523,76 +510,12 @@ class ChatbotService:
         return entreprises
 
     def _extract_skills(self, question: str) -> List[str]:
-        """Extrait les compétences de la question"""
-        from database.models import Competence
-
-        competences = []
-
-        # Compétences techniques prédéfinies
-        competences_connues: List[str] = [
-            "python",
-            "java",
-            "javascript",
-            "sql",
-            "react",
-            "angular",
-            "node.js",
-            "docker",
-            "kubernetes",
-            "aws",
-            "azure",
-            "power bi",
-            "agile",
-            "scrum",
-            "finance",
-            "devops",
-        ]
-        for competence in competences_connues:
-            if competence in question:
-                competences.append(competence)
-
-        # Chercher aussi dans la base de données des compétences
-        with get_database_session() as session:
-            all_competences = session.query(Competence).all()
-        for competence in all_competences:
-            if re.search(rf"\b{re.escape(competence.nom.lower())}\b", question):
-                competences.append(competence.nom)
-
-        # Supprimer les doublons
-        return list(dict.fromkeys(competences))
+        """Extrait les compétences de la question (prédéfinies puis base de données)"""
+        return self._find_entities(question, (self.ENTITY_COMPETENCE,))
 
     def _extract_languages(self, question: str) -> List[str]:
-        """Extrait les langues de la question"""
-        langues = []
-
-        # Langues prédéfinies
-        langues_connues: List[str] = [
-            "français",
-            "anglais",
-            "espagnol",
-            "allemand",
-            "italien",
-            "portugais",
-            "chinois",
-            "japonais",
-            "arabe",
-            "russe",
-        ]
-
-        # Chercher d'abord dans les langues prédéfinies
-        for langue in langues_connues:
-            if langue in question:
-                langues.append(langue)
-
-        # Chercher dans la base de données
-        with get_database_session() as session:
-            all_langues = session.query(Langue).all()
-        for langue in all_langues:
-            if re.search(rf"\b{re.escape(langue.nom.lower())}\b", question):
-                langues.append(langue.nom)
-
-        # Supprimer les doublons
-        return list(dict.fromkeys(langues))
+        """Extrait les langues de la question (prédéfinies puis base de données)"""
+        return self._find_entities(question, (self.ENTITY_LANGUE,))
 
     def _extract_amounts(self, question: str) -> List[str]:
         """Extrait les montants de la question"""
@@ -601,26 +524,19 @@ class ChatbotService:
         return [montant.replace(" ", "") for montant in montants_matches]
 
     def _extract_practices(self, question: str) -> List[str]:
-        """Extrait les practices de la question"""
-        from database.models import Practice
-
-        practices = []
-        with get_database_session() as session:
-            all_practices = session.query(Practice).filter(Practice.actif).all()
-        for practice in all_practices:
-            if re.search(rf"\b{re.escape(practice.nom.lower())}\b", question):
-                practices.append(practice.nom)
-        return practices
+        """Extrait les practices actives de la question"""
+        return self._find_entities(question, (self.ENTITY_PRACTICE,))
 
     def _extract_entities(self, question: str) -> Dict[str, List[str]]:
-        """Extrait les entités nommées de la question"""
+        """Extrait les entités nommées de la question (un seul parcours du gazetteer)"""
+        found = self._get_gazetteer().find(question)
         return {
-            "noms": self._extract_consultant_names(question),
+            "noms": self._entity_values(found, self.CONSULTANT_NAME_ENTITIES),
             "entreprises": self._extract_companies(question),
-            "competences": self._extract_skills(question),
-            "langues": self._extract_languages(question),
+            "competences": self._entity_values(found, (self.ENTITY_COMPETENCE,)),
+            "langues": self._entity_values(found, (self.ENTITY_LANGUE,)),
             "montants": self._extract_amounts(question),
-            "practices": self._extract_practices(question),
+            "practices": self._entity_values(found, (self.ENTITY_PRACTICE,)),
         }
 
     def _calculate_cjm(self, salaire: float) -> float:
@@ -792,8 +708,9 @@ class ChatbotService:
 
     def _handle_consultant_experience_inquiry(self, consultant) -> Dict[str, Any]:
         """Gère les questions d'expérience pour un consultant spécifique"""
+        failed = False
         try:
-            with get_database_session() as session:
+            with self._session_scope() as session:
                 consultant_db = (
                     session.query(Consultant)
                     .options(joinedload(Consultant.langues).joinedload(ConsultantLangue.langue))
@@ -812,57 +729,44 @@ class ChatbotService:
         except (ValueError, TypeError, AttributeError, KeyError) as e:
             response = f"❌ Erreur lors de la récupération des données d'expérience : {str(e)}"
             consultant_db = None
+            failed = True
 
-        return {
-            "response": response,
-            "data": {"consultant": self._build_consultant_experience_data(consultant, consultant_db)},
-            "intent": "experience",
-            "confidence": 0.9,
-        }
-
-    def _calculate_experience_statistics(self, consultants_avec_experience) -> str:
-        """Calcule et formate les statistiques d'expérience générales"""
-        experiences = [c.experience_annees for c in consultants_avec_experience]
+        return self._mark_error(
+            {
+                "response": response,
+                "data": {"consultant": self._build_consultant_experience_data(consultant, consultant_db)},
+                "intent": "experience",
+                "confidence": 0.9,
+            },
+            failed,
+        )
 
+    def _format_experience_statistics(self, experience: Dict[str, Any]) -> str:
+        """Formate les statistiques d'expérience générales (agrégats de l'instantané)"""
         response = "📊 **Statistiques d'expérience :**\n\n"
-        response += f"• **Consultants avec expérience renseignée :** {len(consultants_avec_experience)}\n"
-        response += "• **Expérience moyenne :** " + str(sum(experiences) / len(experiences)) + self.YEARS_SUFFIX
-        response += "• **Expérience minimum :** " + str(min(experiences)) + self.YEARS_SUFFIX
-        response += "• **Expérience maximum :** " + str(max(experiences)) + self.YEARS_SUFFIX
-
-        # Top 3 des plus expérimentés
-        top_experienced = sorted(
-            consultants_avec_experience,
-            key=lambda c: c.experience_annees,
-            reverse=True,
-        )[:3]
-        response += "\n🏆 **Top 3 des plus expérimentés :**\n"
-        for i, consultant in enumerate(top_experienced, 1):
-            response += (
-                str(i)
-                + ". **"
-                + consultant.prenom
-                + " "
-                + consultant.nom
-                + "** : "
-                + str(consultant.experience_annees)
-                + self.YEARS_SUFFIX
-            )
+        response += f"• **Consultants avec expérience renseignée :** {experience['count']}\n"
+        response += "• **Expérience moyenne :** " + str(experience["moyenne"]) + self.YEARS_SUFFIX
+        response += "• **Expérience minimum :** " + str(experience["minimum"]) + self.YEARS_SUFFIX
+        response += "• **Expérience maximum :** " + str(experience["maximum"]) + self.YEARS_SUFFIX
+
+        response += f"\n🏆 **Top {self.EXPERIENCE_TOP_SIZE} des plus expérimentés :**\n"
+        for i, (nom_complet, annees) in enumerate(experience["top"], 1):
+            response += str(i) + ". **" + nom_complet + "** : " + str(annees) + self.YEARS_SUFFIX
 
         return response
 
     def _handle_general_experience_stats(self) -> Dict[str, Any]:
         """Gère les statistiques générales d'expérience"""
+        failed = False
         try:
-            with get_database_session() as session:
-                consultants_avec_experience = (
-                    session.query(Consultant).filter(Consultant.date_premiere_mission.isnot(None)).all()
-                )
+            with self._session_scope() as session:
+                experience = self._get_stats_snapshot(session)["experience"]
+            consultants_count = experience["count"]
 
-                if consultants_avec_experience:
-                    response = self._calculate_experience_statistics(consultants_avec_experience)
-                else:
-                    response = "❓ Aucun consultant n'a d'expérience renseignée dans la base."
+            if consultants_count:
+                response = self._format_experience_statistics(experience)
+            else:
+                response = "❓ Aucun consultant n'a d'expérience renseignée dans la base."
 
         except (
             SQLAlchemyError,
@@ -873,14 +777,18 @@ class ChatbotService:
             KeyError,
         ) as e:
             response = f"❌ Erreur lors du calcul des statistiques : {str(e)}"
-            consultants_avec_experience = []
+            consultants_count = 0
+            failed = True
 
-        return {
-            "response": response,
-            "data": {"consultants_count": len(consultants_avec_experience)},
-            "intent": "experience",
-            "confidence": 0.8,
-        }
+        return self._mark_error(
+            {
+                "response": response,
+                "data": {"consultants_count": consultants_count},
+                "intent": "experience",
+                "confidence": 0.8,
+            },
+            failed,
+        )
 
     def _handle_experience_question(self, entities: Dict) -> Dict[str, Any]:
         """Gère les questions sur l'expérience des consultants"""
@@ -968,8 +876,9 @@ class ChatbotService:
                 "confidence": 0.7,
             }
 
+        failed = False
         try:
-            with get_database_session() as session:
+            with self._session_scope() as session:
                 consultant_db = session.query(Consultant).filter(Consultant.id == consultant.id).first()
 
                 if not consultant_db:
@@ -997,140 +906,202 @@ class ChatbotService:
         except (SQLAlchemyError, AttributeError, ValueError, TypeError) as e:
             response = f"❌ Erreur lors de la récupération du profil : {str(e)}"
             consultant_db = None
+            failed = True
 
-        return {
-            "response": response,
-            "data": {
-                "consultant": {
-                    "nom": consultant.nom,
-                    "prenom": consultant.prenom,
-                    "grade": (getattr(consultant_db, "grade", None) if consultant_db else None),
-                    "type_contrat": (getattr(consultant_db, "type_contrat", None) if consultant_db else None),
-                    "societe": (getattr(consultant_db, "societe", None) if consultant_db else None),
-                }
+        return self._mark_error(
+            {
+                "response": response,
+                "data": {
+                    "consultant": {
+                        "nom": consultant.nom,
+                        "prenom": consultant.prenom,
+                        "grade": (getattr(consultant_db, "grade", None) if consultant_db else None),
+                        "type_contrat": (getattr(consultant_db, "type_contrat", None) if consultant_db else None),
+                        "societe": (getattr(consultant_db, "societe", None) if consultant_db else None),
+                    }
+                },
+                "intent": "profil_professionnel",
+                "confidence": 0.9,
             },
-            "intent": "profil_professionnel",
-            "confidence": 0.9,
+            failed,
+        )
+
+    def _get_stats_snapshot(self, session) -> Dict[str, Any]:
+        """
+        Instantané des statistiques des consultants, en deux requêtes de taille constante
+
+        Un GROUP BY sur (grade, type de contrat, société) donne les effectifs de chaque
+        répartition et les agrégats d'expérience ; une requête fenêtrée (row_number) donne
+        les premiers noms de chaque groupe et les consultants les plus expérimentés.
+        Aucune ligne par consultant n'est chargée : mémoire et latence ne dépendent pas de
+        l'effectif. Les groupes sont dans l'ordre de leur premier consultant.
+        """
+        columns = [getattr(Consultant, dimension) for dimension in self.STATS_DIMENSIONS]
+        with_experience = Consultant.date_premiere_mission.isnot(None)
+        experience = case((with_experience, Consultant.experience_annees))
+
+        groups = (
+            session.query(
+                *columns,
+                func.count(Consultant.id).label("effectif"),
+                func.min(Consultant.id).label("premier_id"),
+                func.count(Consultant.date_premiere_mission).label("avec_experience"),
+                func.sum(experience).label("experience_totale"),
+                func.min(experience).label("experience_min"),
+                func.max(experience).label("experience_max"),
+            )
+            .group_by(*columns)
+            .all()
+        )
+
+        ranks = [
+            func.row_number().over(partition_by=column, order_by=Consultant.id).label(f"rang_{dimension}")
+            for dimension, column in zip(self.STATS_DIMENSIONS, columns)
+        ]
+        experience_rank = (
+            func.row_number()
+            .over(partition_by=with_experience, order_by=(Consultant.experience_annees.desc(), Consultant.id))
+            .label("rang_experience")
+        )
+        ranked = session.query(
+            Consultant.id,
+            Consultant.prenom,
+            Consultant.nom,
+            *columns,
+            with_experience.label("avec_experience"),
+            Consultant.experience_annees.label("experience_annees"),
+            *ranks,
+            experience_rank,
+        ).subquery()
+        samples = (
+            session.query(ranked)
+            .filter(
+                or_(
+                    *(ranked.c[f"rang_{dimension}"] <= self.STATS_SAMPLE_SIZE for dimension in self.STATS_DIMENSIONS),
+                    and_(ranked.c.avec_experience, ranked.c.rang_experience <= self.EXPERIENCE_TOP_SIZE),
+                )
+            )
+            .order_by(ranked.c.id)
+            .all()
+        )
+
+        snapshot: Dict[str, Any] = {
+            dimension: self._snapshot_distribution(groups, samples, dimension) for dimension in self.STATS_DIMENSIONS
+        }
+        snapshot["experience"] = self._snapshot_experience(groups, samples)
+        return snapshot
+
+    def _snapshot_distribution(self, groups: List, samples: List, dimension: str) -> Dict[str, Dict[str, Any]]:
+        """Effectif et premiers noms de chaque valeur renseignée d'une dimension"""
+        counts: Dict[str, int] = {}
+        first_ids: Dict[str, int] = {}
+        for group in groups:
+            value = getattr(group, dimension)
+            if value is None:
+                continue
+            counts[value] = counts.get(value, 0) + group.effectif
+            first_ids[value] = min(first_ids.get(value, group.premier_id), group.premier_id)
+
+        distribution = {
+            value: {"count": counts[value], "noms": []} for value in sorted(counts, key=first_ids.__getitem__)
         }
+        rank = f"rang_{dimension}"
+        for row in samples:
+            value = getattr(row, dimension)
+            if value in distribution and getattr(row, rank) <= self.STATS_SAMPLE_SIZE:
+                distribution[value]["noms"].append(f"{row.prenom} {row.nom}")
+        return distribution
+
+    def _snapshot_experience(self, groups: List, samples: List) -> Dict[str, Any]:
+        """Agrégats d'expérience combinés sur tous les groupes, plus experimentés en tête"""
+        count = sum(group.avec_experience for group in groups)
+        minimums = [group.experience_min for group in groups if group.experience_min is not None]
+        maximums = [group.experience_max for group in groups if group.experience_max is not None]
+        top = sorted(
+            (row for row in samples if row.avec_experience and row.rang_experience <= self.EXPERIENCE_TOP_SIZE),
+            key=lambda row: row.rang_experience,
+        )
 
-    def _group_consultants_by_grade(self, consultants) -> Dict[str, List]:
-        """Groupe les consultants par grade"""
-        grades_count: Dict[str, List[Consultant]] = {}
-        for consultant in consultants:
-            grade = consultant.grade
-            if grade not in grades_count:
-                grades_count[grade] = []
-            grades_count[grade].append(consultant)
-        return grades_count
+        return {
+            "count": count,
+            "moyenne": (sum(group.experience_totale or 0 for group in groups) / count if count else None),
+            "minimum": min(minimums) if minimums else None,
+            "maximum": max(maximums) if maximums else None,
+            "top": [(f"{row.prenom} {row.nom}", row.experience_annees) for row in top],
+        }
+
+    def _format_distribution(self, title: str, distribution: Dict[str, Dict[str, Any]]) -> str:
+        """Formate une répartition : effectif de chaque groupe, noms si le groupe est petit"""
+        response = f"{title}\n\n"
+        for value, stats in distribution.items():
+            response += f"• **{value}** : {stats['count']} consultant(s)\n"
+            if stats["count"] <= self.STATS_SAMPLE_SIZE:  # Afficher les noms si pas trop nombreux
+                for nom_complet in stats["noms"]:
+                    response += f"  - {nom_complet}\n"
+        return response
 
     def _handle_grade_statistics(self, session) -> str:
         """Gère les statistiques par grade"""
-        consultants = session.query(Consultant).filter(Consultant.grade.isnot(None)).all()
+        grades = self._get_stats_snapshot(session)["grade"]
 
-        if consultants:
-            grades_count = self._group_consultants_by_grade(consultants)
-
-            response = "🎯 **Répartition par grade :**\n\n"
-            for grade, consultants_list in grades_count.items():
-                response += f"• **{grade}** : {len(consultants_list)} consultant(s)\n"
-                if len(consultants_list) <= 5:  # Afficher les noms si pas trop nombreux
-                    for c in consultants_list:
-                        response += f"  - {c.prenom} {c.nom}\n"
-        else:
-            response = "❓ Aucun consultant n'a de grade renseigné."
+        if grades:
+            return self._format_distribution("🎯 **Répartition par grade :**", grades)
+        return "❓ Aucun consultant n'a de grade renseigné."
 
-        return response
+    def _count_consultants_by_contract_type(self, contracts: Dict[str, Dict[str, Any]], contract_type: str) -> int:
+        """Compte les consultants d'un type de contrat (sans tenir compte de la casse)"""
+        return sum(stats["count"] for contrat, stats in contracts.items() if contrat.lower() == contract_type.lower())
 
-    def _count_consultants_by_contract_type(self, consultants, contract_type: str) -> int:
-        """Compte les consultants d'un type de contrat spécifique"""
-        if contract_type.upper() == "CDI":
-            return len([c for c in consultants if c.type_contrat and c.type_contrat.upper() == "CDI"])
-        elif contract_type.upper() == "CDD":
-            return len([c for c in consultants if c.type_contrat and c.type_contrat.upper() == "CDD"])
-        elif contract_type.lower() == "stagiaire":
-            return len([c for c in consultants if c.type_contrat and c.type_contrat.lower() == "stagiaire"])
-        return 0
-
-    def _handle_contract_count_query(self, consultants, question_lower: str) -> str:
+    def _handle_contract_count_query(self, contracts: Dict[str, Dict[str, Any]], question_lower: str) -> str:
         """Gère les questions de comptage de consultants par contrat"""
         if "cdi" in question_lower:
-            count = self._count_consultants_by_contract_type(consultants, "CDI")
+            count = self._count_consultants_by_contract_type(contracts, "CDI")
             return f"📋 **{count} consultant(s) en CDI**"
         elif "cdd" in question_lower:
-            count = self._count_consultants_by_contract_type(consultants, "CDD")
+            count = self._count_consultants_by_contract_type(contracts, "CDD")
             return f"📋 **{count} consultant(s) en CDD**"
         elif "stagiaire" in question_lower:
-            count = self._count_consultants_by_contract_type(consultants, "stagiaire")
+            count = self._count_consultants_by_contract_type(contracts, "stagiaire")
             return f"📋 **{count} consultant(s) stagiaire(s)**"
         else:
-            return self._get_all_contract_counts(consultants)
+            return self._get_all_contract_counts(contracts)
 
-    def _get_all_contract_counts(self, consultants) -> str:
+    def _get_all_contract_counts(self, contracts: Dict[str, Dict[str, Any]]) -> str:
         """Retourne toutes les statistiques de contrats"""
-        contrats_count: Dict[str, int] = {}
-        for consultant in consultants:
-            contrat = consultant.type_contrat
-            if contrat not in contrats_count:
-                contrats_count[contrat] = 0
-            contrats_count[contrat] += 1
-
         response = "📋 **Nombre de consultants par type de contrat :**\n\n"
-        for contrat, count in contrats_count.items():
-            response += f"• **{contrat}** : {count} consultant(s)\n"
-        return response
-
-    def _get_contract_detailed_breakdown(self, consultants) -> str:
-        """Retourne la répartition détaillée par type de contrat"""
-        contrats_list: Dict[str, List[Consultant]] = {}
-        for consultant in consultants:
-            contrat = consultant.type_contrat
-            if contrat not in contrats_list:
-                contrats_list[contrat] = []
-            contrats_list[contrat].append(consultant)
-
-        response = "📋 **Répartition par type de contrat :**\n\n"
-        for contrat, consultants_list in contrats_list.items():
-            response += f"• **{contrat}** : {len(consultants_list)} consultant(s)\n"
-            if len(consultants_list) <= 5:  # Afficher les noms si pas trop nombreux
-                for c in consultants_list:
-                    response += f"  - {c.prenom} {c.nom}\n"
+        for contrat, stats in contracts.items():
+            response += f"• **{contrat}** : {stats['count']} consultant(s)\n"
         return response
 
     def _handle_contract_statistics(self, session, question_lower: str) -> str:
         """Gère les statistiques par type de contrat"""
-        consultants = session.query(Consultant).filter(Consultant.type_contrat.isnot(None)).all()
+        contracts = self._get_stats_snapshot(session)["type_contrat"]
 
         # Si c'est une question "combien de consultants en CDI/CDD"
         if any(word in question_lower for word in ["combien"]):
-            return self._handle_contract_count_query(consultants, question_lower)
+            return self._handle_contract_count_query(contracts, question_lower)
         else:
             # Répartition complète par type de contrat
-            if consultants:
-                return self._get_contract_detailed_breakdown(consultants)
+            if contracts:
+                return self._format_distribution("📋 **Répartition par type de contrat :**", contracts)
             else:
                 return "❓ Aucun consultant n'a de type de contrat renseigné."
 
     def _handle_company_statistics(self, session, question_lower: str) -> str:
         """Gère les statistiques par société"""
-        consultants = self._get_consultants_with_company(session)
-
         if self._is_specific_company_search(question_lower):
-            return self._handle_specific_company_search(consultants, question_lower)
+            return self._handle_specific_company_search(session, question_lower)
         else:
-            return self._handle_general_company_statistics(consultants)
-
-    def _get_consultants_with_company(self, session) -> List:
-        """Récupère tous les consultants ayant une société renseignée"""
-        return session.query(Consultant).filter(Consultant.societe.isnot(None)).all()
+            return self._handle_general_company_statistics(self._get_stats_snapshot(session)["societe"])
 
     def _is_specific_company_search(self, question_lower: str) -> bool:
         """Vérifie si la question concerne une société spécifique"""
         return any(word in question_lower for word in ["quanteam", "asigma"])
 
-    def _handle_specific_company_search(self, consultants: List, question_lower: str) -> str:
+    def _handle_specific_company_search(self, session, question_lower: str) -> str:
         """Gère la recherche pour une société spécifique"""
         societe_recherchee = self._extract_target_company(question_lower)
-        consultants_societe = self._filter_consultants_by_company(consultants, societe_recherchee)
+        consultants_societe = self._find_consultants_by_company(session, societe_recherchee)
 
         if consultants_societe:
             return self._format_specific_company_response(consultants_societe, societe_recherchee)
@@ -1141,9 +1112,14 @@ class ChatbotService:
         """Extrait le nom de la société recherchée"""
         return "Quanteam" if "quanteam" in question_lower else "Asigma"
 
-    def _filter_consultants_by_company(self, consultants: List, target_company: str) -> List:
-        """Filtre les consultants par société"""
-        return [c for c in consultants if c.societe and c.societe.lower() == target_company.lower()]
+    def _find_consultants_by_company(self, session, target_company: str) -> List:
+        """Consultants d'une société (filtre SQL, sans tenir compte de la casse)"""
+        return (
+            session.query(Consultant)
+            .filter(func.lower(Consultant.societe) == target_company.lower())
+            .order_by(Consultant.id)
+            .all()
+        )
 
     def _format_specific_company_response(self, consultants_societe: List, societe_recherchee: str) -> str:
         """Formate la réponse pour une société spécifique"""
@@ -1168,41 +1144,12 @@ class ChatbotService:
 
         return line
 
-    def _handle_general_company_statistics(self, consultants: List) -> str:
+    def _handle_general_company_statistics(self, societes: Dict[str, Dict[str, Any]]) -> str:
         """Gère les statistiques générales par société"""
-        if not consultants:
+        if not societes:
             return "❓ Aucun consultant n'a de société renseignée."
 
-        societes_count = self._group_consultants_by_company(consultants)
-        return self._format_general_company_statistics(societes_count)
-
-    def _group_consultants_by_company(self, consultants: List) -> Dict[str, List]:
-        """Groupe les consultants par société"""
-        societes_count: Dict[str, List[Consultant]] = {}
-        for consultant in consultants:
-            societe = consultant.societe
-            if societe not in societes_count:
-                societes_count[societe] = []
-            societes_count[societe].append(consultant)
-        return societes_count
-
-    def _format_general_company_statistics(self, societes_count: Dict[str, List]) -> str:
-        """Formate les statistiques générales par société"""
-        response = "🏢 **Répartition par société :**\n\n"
-
-        for societe, consultants_list in societes_count.items():
-            response += f"• **{societe}** : {len(consultants_list)} consultant(s)\n"
-            if len(consultants_list) <= 5:  # Afficher les noms si pas trop nombreux
-                response += self._format_company_consultant_details(consultants_list)
-
-        return response
-
-    def _format_company_consultant_details(self, consultants_list: List) -> str:
-        """Formate les détails des consultants pour une société"""
-        details = ""
-        for c in consultants_list:
-            details += f"  - {c.prenom} {c.nom}\n"
-        return details
+        return self._format_distribution("🏢 **Répartition par société :**", societes)
 
     def _handle_professional_profile_question(self, entities: Dict) -> Dict[str, Any]:
         """Gère les questions sur le profil professionnel (grade, type contrat, société)"""
@@ -1214,8 +1161,9 @@ class ChatbotService:
 
         # Questions générales par critère
         else:
+            failed = False
             try:
-                with get_database_session() as session:
+                with self._session_scope() as session:
                     if any(
                         word in question_lower
                         for word in [
@@ -1253,13 +1201,17 @@ class ChatbotService:
                 KeyError,
             ) as e:
                 response = f"❌ Erreur lors de la récupération des données : {str(e)}"
+                failed = True
 
-            return {
-                "response": response,
-                "data": None,
-                "intent": "profil_professionnel",
-                "confidence": 0.8,
-            }
+            return self._mark_error(
+                {
+                    "response": response,
+                    "data": None,
+                    "intent": "profil_professionnel",
+                    "confidence": 0.8,
+                },
+                failed,
+            )
 
     def _detect_skill_type(self, question_lower: str) -> Optional[str]:
         """Détecte le type de compétence demandé dans la question"""
@@ -2016,7 +1968,7 @@ class ChatbotService:
 
     def _get_consultants_by_criteria(self, question_lower: str) -> tuple:
         """Récupère les consultants selon les critères de la question"""
-        with get_database_session() as session:
+        with self._session_scope() as session:
             if "disponibles" in question_lower or "disponible" in question_lower:
                 consultants = session.query(Consultant).filter(Consultant.disponibilite).all()
                 titre = "👥 **Consultants disponibles :**"
@@ -2206,7 +2158,7 @@ class ChatbotService:
         """Gère les questions sur une practice spécifique"""
         from database.models import Practice
 
-        with get_database_session() as session:
+        with self._session_scope() as session:
             practice = (
                 session.query(Practice)
                 .options(joinedload(Practice.consultants))
@@ -2297,7 +2249,7 @@ class ChatbotService:
         """Gère les questions générales sur toutes les practices"""
         from database.models import Practice
 
-        with get_database_session() as session:
+        with self._session_scope() as session:
             practices = session.query(Practice).filter(Practice.actif).all()
 
         if not practices:
@@ -2471,7 +2423,7 @@ class ChatbotService:
         """Récupère les statistiques générales des CVs"""
         from database.models import CV
 
-        with get_database_session() as session:
+        with self._session_scope() as session:
             cvs_total = session.query(CV).count()
             consultants_avec_cv = session.query(Consultant).join(CV).distinct().count()
 
@@ -2483,7 +2435,7 @@ class ChatbotService:
 
         from database.models import CV
 
-        with get_database_session() as session:
+        with self._session_scope() as session:
             return (
                 session.query(Consultant, func.count(CV.id).label("nb_cvs"))
                 .join(CV)
@@ -2543,7 +2495,7 @@ class ChatbotService:
         """
 
         # Essayer une correspondance exacte d'abord
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             consultant = (
                 session.query(Consultant)
@@ -2552,8 +2504,8 @@ class ChatbotService:
                     or_(
                         func.lower(Consultant.nom) == nom_recherche.lower(),
                         func.lower(Consultant.prenom) == nom_recherche.lower(),
-                        func.lower(func.concat(Consultant.prenom, " ", Consultant.nom)) == nom_recherche.lower(),
-                        func.lower(func.concat(Consultant.nom, " ", Consultant.prenom)) == nom_recherche.lower(),
+                        func.lower(Consultant.prenom + " " + Consultant.nom) == nom_recherche.lower(),
+                        func.lower(Consultant.nom + " " + Consultant.prenom) == nom_recherche.lower(),
                     )
                 )
                 .first()
@@ -2563,7 +2515,7 @@ class ChatbotService:
             return consultant
 
         # Essayer une correspondance partielle
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             consultant = (
                 session.query(Consultant)
@@ -2603,7 +2555,7 @@ class ChatbotService:
         from database.models import Competence, ConsultantCompetence
 
         # Construction de la requête de base
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             query = (
                 session.query(Consultant)
@@ -2615,11 +2567,11 @@ class ChatbotService:
                 .filter(func.lower(Competence.nom).like(f"%{competence.lower()}%"))
             )
 
-        # Ajouter le filtre par type si spécifié
-        if type_competence:
-            query = query.filter(Competence.type_competence == type_competence)
+            # Ajouter le filtre par type si spécifié
+            if type_competence:
+                query = query.filter(Competence.type_competence == type_competence)
 
-        consultants = query.distinct().all()
+            consultants = query.distinct().all()
 
         return consultants  # type: ignore[no-any-return]
 
@@ -2645,7 +2597,7 @@ class ChatbotService:
         """
 
         # Construction de la requête de base
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             consultants = (
                 session.query(Consultant)
@@ -2675,7 +2627,7 @@ class ChatbotService:
             >>> missions = chatbot._get_missions_by_company("BNP Paribas")
             >>> print(f"BNP Paribas a {len(missions)} missions")
         """
-        with get_database_session() as session:
+        with self._session_scope() as session:
             return (
                 session.query(Mission)
                 .filter(func.lower(Mission.client).like(f"%{entreprise.lower()}%"))  # type: ignore[no-any-return]
@@ -2701,7 +2653,7 @@ class ChatbotService:
             >>> if missions:
             ...     print(f"Dernière mission: {missions[0].nom_mission}")
         """
-        with get_database_session() as session:
+        with self._session_scope() as session:
             return (
                 session.query(Mission)
                 .filter(Mission.consultant_id == consultant_id)  # type: ignore[no-any-return]
@@ -2735,7 +2687,7 @@ class ChatbotService:
             >>> for skill in skills:
             ...     print(f"- {skill['nom']}: {skill['niveau_maitrise']}")
         """
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             query = (
                 session.query(ConsultantCompetence)
@@ -2743,24 +2695,24 @@ class ChatbotService:
                 .filter(ConsultantCompetence.consultant_id == consultant_id)
             )
 
-        # Ajouter le filtre par type si spécifié
-        if type_competence:
-            query = query.filter(Competence.type_competence == type_competence)
-
-        consultant_competences = query.all()
-
-        skills = []
-        for cc in consultant_competences:
-            skills.append(
-                {
-                    "nom": cc.competence.nom,
-                    "categorie": cc.competence.categorie,
-                    "type": cc.competence.type_competence,
-                    "niveau_maitrise": cc.niveau_maitrise,
-                    "annees_experience": cc.annees_experience,
-                    "description": cc.competence.description,
-                }
-            )
+            # Ajouter le filtre par type si spécifié
+            if type_competence:
+                query = query.filter(Competence.type_competence == type_competence)
+
+            consultant_competences = query.all()
+
+            skills = []
+            for cc in consultant_competences:
+                skills.append(
+                    {
+                        "nom": cc.competence.nom,
+                        "categorie": cc.competence.categorie,
+                        "type": cc.competence.type_competence,
+                        "niveau_maitrise": cc.niveau_maitrise,
+                        "annees_experience": cc.annees_experience,
+                        "description": cc.competence.description,
+                    }
+                )
 
         return skills
 
@@ -2784,7 +2736,7 @@ class ChatbotService:
             >>> print(f"Salaire moyen: {stats['moyenne']:,.0f} €")
             >>> print(f"Salaire médian: {stats['mediane']:,.0f} €")
         """
-        with get_database_session() as session:
+        with self._session_scope() as session:
 
             consultants = (
                 session.query(Consultant)
@@ -2815,7 +2767,7 @@ class ChatbotService:
         """
         Calcule les statistiques générales de la base de données.
         """
-        with get_database_session() as session:
+        with self._session_scope() as session:
             consultant_stats = self._get_consultant_statistics(session)
             mission_stats = self._get_mission_statistics(session)
             practice_stats = self._get_practice_statistics(session)
@@ -2946,7 +2898,7 @@ class ChatbotService:
 
     def _get_consultant_db_data(self, consultant):
         """Récupère les données DB du consultant"""
-        with get_database_session() as session:
+        with self._session_scope() as session:
             return session.query(Consultant).filter(Consultant.id == consultant.id).first()
 
     def _build_availability_response(self, consultant, consultant_db) -> str:
@@ -3075,6 +3027,7 @@ class ChatbotService:
             "data": {},
             "intent": "disponibilite",
             "confidence": 0.3,
+            "error": True,
         }
 
     def _handle_general_availability_question(self) -> Dict[str, Any]:
@@ -3100,14 +3053,13 @@ class ChatbotService:
                 "data": {},
                 "intent": "disponibilite",
                 "confidence": 0.3,
+                "error": True,
             }
 
     def _get_availability_data(self):
         """Récupère les données de disponibilité générale"""
-        with get_database_session() as session:
+        with self._session_scope() as session:
             consultants_dispos = session.query(Consultant).filter(Consultant.disponibilite).all()
-
-        with get_database_session() as session:
             consultants_occupes = session.query(Consultant).filter(Consultant.disponibilite is False).all()
 
         return consultants_dispos, consultants_occupes
@@ -3191,8 +3143,9 @@ class ChatbotService:
 
     def _handle_consultant_tjm_inquiry(self, consultant) -> Dict[str, Any]:
         """Gère les questions TJM pour un consultant spécifique"""
+        failed = False
         try:
-            with get_database_session() as session:
+            with self._session_scope() as session:
                 consultant_db = session.query(Consultant).filter(Consultant.id == consultant.id).first()
 
             missions_avec_tjm = self._get_consultant_missions_with_tjm(consultant_db)
@@ -3218,18 +3171,22 @@ class ChatbotService:
             ZeroDivisionError,
         ) as e:
             response = f"❌ Erreur lors de la récupération des TJM : {str(e)}"
+            failed = True
 
-        return {
-            "response": response,
-            "data": {"consultant": {"nom": consultant.nom, "prenom": consultant.prenom}},
-            "intent": "tjm_mission",
-            "confidence": 0.9,
-        }
+        return self._mark_error(
+            {
+                "response": response,
+                "data": {"consultant": {"nom": consultant.nom, "prenom": consultant.prenom}},
+                "intent": "tjm_mission",
+                "confidence": 0.9,
+            },
+            failed,
+        )
 
     def _get_global_tjm_statistics(self) -> Dict[str, Any]:
         """Calcule les statistiques globales de TJM"""
         try:
-            with get_database_session() as session:
+            with self._session_scope() as session:
                 # TJM moyen avec nouveau champ
                 tjm_nouveau_moyen = session.query(func.avg(Mission.tjm)).filter(Mission.tjm.isnot(None)).scalar() or 0
 
@@ -3286,6 +3243,7 @@ class ChatbotService:
                 "data": {},
                 "intent": "tjm_mission",
                 "confidence": 0.3,
+                "error": True,
             }
 
     def _handle_mission_tjm_question(self, entities: Dict) -> Dict[str, Any]:
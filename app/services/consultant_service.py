@@ -4,25 +4,39 @@ CRUD operations pour les consultants avec la base de donnÃ©es
 OptimisÃ© pour gÃ©rer 1000+ consultants avec cache et pagination efficace
 """
 
+import base64
+import json
 from datetime import date
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
 import streamlit as st
 from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from app.database.database import get_database_session
+from app.database.full_text import ensure_full_text_index
+from app.database.full_text import search_full_text
+from app.database.models import CV
 from app.database.models import Competence
 from app.database.models import Consultant
+from app.database.models import ConsultantBusinessManager
 from app.database.models import ConsultantCompetence
+from app.database.models import ConsultantLangue
+from app.database.models import ConsultantMissionStats
 from app.database.models import Mission
 from app.database.models import Practice
+from app.services.profile_bundle import ConsultantProfileBundle
+from app.services.profile_bundle import build_profile_bundle
 
 
 class ConsultantService:
@@ -33,6 +47,9 @@ class ConsultantService:
     STATUS_BUSY = "🔴 Occupé"
     STATUS_IN_PROGRESS = "En cours"
 
+    # Colonnes autorisées pour la pagination keyset (non nulles, départagées par id)
+    KEYSET_SORT_COLUMNS = ("nom", "prenom", "email", "id")
+
     @staticmethod
     def get_all_consultants_objects(page: int = 1, per_page: int = 50) -> List[Consultant]:
         """
@@ -129,6 +146,7 @@ class ConsultantService:
                 Consultant.date_premiere_mission,
                 Consultant.grade,
                 Consultant.type_contrat,
+                Consultant.experience_annees.label("experience_annees"),
                 Practice.nom.label("practice_name"),
                 func.count(Mission.id).label("nb_missions"),
             )
@@ -195,8 +213,8 @@ class ConsultantService:
         salaire = row.salaire_actuel or 0
         cjm = (salaire * 1.8 / 216) if salaire else 0
 
-        # Calcul de l'expérience
-        experience_annees = ConsultantService._calculate_experience_years(row.date_premiere_mission)
+        # Expérience calculée par la requête (hybrid experience_annees)
+        experience_annees = ConsultantService._row_experience_years(row)
 
         return {
             "id": row.id,
@@ -221,6 +239,14 @@ class ConsultantService:
             "experience_formatted": (f"{experience_annees} ans" if experience_annees > 0 else "N/A"),
         }
 
+    @staticmethod
+    def _row_experience_years(row):
+        """Helper: Expérience lue dans la ligne SQL, calculée en Python si la colonne est absente"""
+        experience_annees = getattr(row, "experience_annees", None)
+        if isinstance(experience_annees, (int, float)):
+            return experience_annees
+        return ConsultantService._calculate_experience_years(row.date_premiere_mission)
+
     @staticmethod
     def _calculate_experience_years(date_premiere_mission):
         """Helper: Calcule l'expérience en années"""
@@ -280,7 +306,7 @@ class ConsultantService:
     @staticmethod
     def _build_stats_query(session, practice_filter, grade_filter, availability_filter):
         """Helper: Construit la requête optimisée pour les stats des consultants"""
-        # Une seule requête avec LEFT JOIN pour récupérer consultants + nombre de missions
+        # LEFT JOIN sur les agrégats maintenus (1 ligne par consultant) : pas de GROUP BY
         query = (
             session.query(
                 Consultant.id,
@@ -298,11 +324,12 @@ class ConsultantService:
                 Consultant.date_premiere_mission,
                 Consultant.grade,
                 Consultant.type_contrat,
+                *ConsultantService._profile_columns(),
                 Practice.nom.label("practice_name"),
-                func.count(Mission.id).label("nb_missions"),
+                *ConsultantService._mission_stats_columns(),
             )
             .outerjoin(Practice, Consultant.practice_id == Practice.id)
-            .outerjoin(Mission, Consultant.id == Mission.consultant_id)
+            .outerjoin(ConsultantMissionStats, Consultant.id == ConsultantMissionStats.consultant_id)
         )
 
         return ConsultantService._apply_stats_filters(query, practice_filter, grade_filter, availability_filter)
@@ -322,30 +349,40 @@ class ConsultantService:
 
         return query
 
+    @staticmethod
+    def _apply_profile_filters(query, available_before, min_experience):
+        """Helper: Filtres évalués en SQL sur les propriétés hybrides du consultant"""
+        if available_before is not None:
+            fin_engagement = Consultant.date_fin_engagement
+            query = query.filter(or_(fin_engagement.is_(None), fin_engagement <= available_before))
+
+        if min_experience is not None:
+            query = query.filter(Consultant.experience_annees >= min_experience)
+
+        return query
+
     @staticmethod
     def _finalize_stats_query(query, page, per_page):
-        """Helper: Finalise la requête stats avec grouping et pagination"""
+        """Helper: Finalise la requête stats avec pagination"""
+        return query.offset((page - 1) * per_page).limit(per_page)
+
+    @staticmethod
+    def _profile_columns():
+        """Helper: Champs calculés du consultant évalués en SQL (propriétés hybrides)"""
         return (
-            query.group_by(
-                Consultant.id,
-                Consultant.prenom,
-                Consultant.nom,
-                Consultant.email,
-                Consultant.telephone,
-                Consultant.salaire_actuel,
-                Consultant.disponibilite,
-                Consultant.date_creation,
-                Consultant.derniere_maj,
-                Consultant.societe,
-                Consultant.date_entree_societe,
-                Consultant.date_sortie_societe,
-                Consultant.date_premiere_mission,
-                Consultant.grade,
-                Consultant.type_contrat,
-                Practice.nom,
-            )
-            .offset((page - 1) * per_page)
-            .limit(per_page)
+            Consultant.experience_annees.label("experience_annees"),
+            Consultant.statut_societe.label("statut_societe"),
+            Consultant.date_fin_engagement.label("date_fin_engagement"),
+        )
+
+    @staticmethod
+    def _mission_stats_columns():
+        """Helper: Colonnes d'agrégats de missions lues dans consultant_mission_stats"""
+        return (
+            func.coalesce(ConsultantMissionStats.nb_missions, 0).label("nb_missions"),
+            func.coalesce(ConsultantMissionStats.nb_missions_actives, 0).label("nb_missions_actives"),
+            ConsultantMissionStats.derniere_date_fin.label("derniere_date_fin"),
+            ConsultantMissionStats.tjm_moyen.label("tjm_moyen"),
         )
 
     @staticmethod
@@ -354,8 +391,8 @@ class ConsultantService:
         salaire = row.salaire_actuel or 0
         cjm = (salaire * 1.8 / 216) if salaire else 0
 
-        # Calcul de l'expérience
-        experience_annees = ConsultantService._calculate_experience_years(row.date_premiere_mission)
+        # Expérience calculée par la requête (hybrid experience_annees)
+        experience_annees = ConsultantService._row_experience_years(row)
 
         return {
             "id": row.id,
@@ -380,6 +417,13 @@ class ConsultantService:
             # Nouveaux champs V1.2.1
             "grade": row.grade or "Junior",
             "type_contrat": row.type_contrat or "CDI",
+            # Agrégats de missions (consultant_mission_stats)
+            "nb_missions_actives": getattr(row, "nb_missions_actives", 0),
+            "derniere_date_fin": getattr(row, "derniere_date_fin", None),
+            "tjm_moyen": getattr(row, "tjm_moyen", None),
+            # Champs calculés en SQL (propriétés hybrides de Consultant)
+            "statut_societe": getattr(row, "statut_societe", None),
+            "date_fin_engagement": getattr(row, "date_fin_engagement", None),
         }
 
     @staticmethod
@@ -389,10 +433,15 @@ class ConsultantService:
         practice_filter: Optional[str] = None,
         grade_filter: Optional[str] = None,
         availability_filter: Optional[bool] = None,
+        available_before: Optional[date] = None,
+        min_experience: Optional[float] = None,
     ) -> List[Dict]:
         """
         Récupère tous les consultants avec leurs statistiques en une seule requête optimisée
         Résout le problème N+1 des requêtes pour compter les missions
+
+        available_before (libre au plus tard à cette date) et min_experience (années)
+        sont évalués par la base, comme l'expérience et le statut société renvoyés
         """
         try:
             with get_database_session() as session:
@@ -400,6 +449,7 @@ class ConsultantService:
                 query = ConsultantService._build_stats_query(
                     session, practice_filter, grade_filter, availability_filter
                 )
+                query = ConsultantService._apply_profile_filters(query, available_before, min_experience)
                 query = ConsultantService._finalize_stats_query(query, page, per_page)
                 results = query.all()
 
@@ -414,6 +464,304 @@ class ConsultantService:
             print(f"Erreur lors de la récupération optimisée des consultants: {e}")
             return []
 
+    @staticmethod
+    def iter_consultants_with_stats(
+        batch_size: int = 500,
+        practice_filter: Optional[str] = None,
+        grade_filter: Optional[str] = None,
+        availability_filter: Optional[bool] = None,
+        available_before: Optional[date] = None,
+        min_experience: Optional[float] = None,
+    ) -> Iterator[Dict]:
+        """
+        Parcourt tous les consultants avec statistiques sans charger le résultat en mémoire
+
+        Les lignes sont lues par lots de batch_size (yield_per) : sur une base serveur
+        (PostgreSQL), la requête utilise un curseur côté serveur. Destiné aux exports et
+        traitements de masse sur plusieurs dizaines de milliers de consultants.
+
+        Args:
+            batch_size: Nombre de lignes récupérées par aller-retour
+            practice_filter: Nom de la practice à filtrer
+            grade_filter: Grade à filtrer
+            availability_filter: Disponibilité à filtrer
+            available_before: Ne garder que les consultants libres au plus tard à cette date
+            min_experience: Expérience minimale en années
+
+        Yields:
+            Dict: Mêmes clés que get_all_consultants_with_stats, triés par id
+
+        Example:
+            >>> for consultant in ConsultantService.iter_consultants_with_stats(batch_size=1000):
+            ...     writer.writerow(consultant)
+        """
+        try:
+            with get_database_session() as session:
+                query = ConsultantService._build_stats_query(
+                    session, practice_filter, grade_filter, availability_filter
+                )
+                query = ConsultantService._apply_profile_filters(query, available_before, min_experience)
+                for row in query.order_by(Consultant.id).yield_per(batch_size):
+                    yield ConsultantService._convert_stats_row_to_dict(row)
+        except (SQLAlchemyError, ValueError, TypeError, AttributeError) as e:
+            print(f"Erreur lors du parcours des consultants: {e}")
+
+    @staticmethod
+    def _encode_cursor(sort_by: str, last_value: Any, last_id: int) -> str:
+        """Helper: Encode la position (colonne de tri, id) en curseur opaque"""
+        payload = json.dumps({"s": sort_by, "v": last_value, "id": last_id}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_by: str):
+        """Helper: Décode un curseur opaque en (valeur de tri, id)"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+            last_value, last_id = payload["v"], int(payload["id"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Curseur de pagination invalide: {cursor}") from e
+
+        if payload.get("s") != sort_by:
+            raise ValueError(f"Curseur créé pour le tri '{payload.get('s')}', pas '{sort_by}'")
+        return last_value, last_id
+
+    @staticmethod
+    def _build_keyset_query(session, practice_filter, grade_filter, availability_filter, search_term):
+        """Helper: Construit la requête de liste sans GROUP BY pour la pagination par curseur"""
+        query = (
+            session.query(
+                Consultant.id,
+                Consultant.prenom,
+                Consultant.nom,
+                Consultant.email,
+                Consultant.telephone,
+                Consultant.salaire_actuel,
+                Consultant.disponibilite,
+                Consultant.date_creation,
+                Consultant.derniere_maj,
+                Consultant.societe,
+                Consultant.date_entree_societe,
+                Consultant.date_sortie_societe,
+                Consultant.date_premiere_mission,
+                Consultant.grade,
+                Consultant.type_contrat,
+                *ConsultantService._profile_columns(),
+                Practice.nom.label("practice_name"),
+                *ConsultantService._mission_stats_columns(),
+            )
+            .outerjoin(Practice, Consultant.practice_id == Practice.id)
+            .outerjoin(ConsultantMissionStats, Consultant.id == ConsultantMissionStats.consultant_id)
+        )
+
+        return ConsultantService._apply_search_filters(
+            query, practice_filter, grade_filter, availability_filter, search_term
+        )
+
+    @staticmethod
+    def _apply_keyset(query, sort_by: str, cursor: Optional[str], per_page: int):
+        """Helper: Positionne la requête après le curseur et limite à une page (+1 pour détecter la suite)"""
+        if sort_by not in ConsultantService.KEYSET_SORT_COLUMNS:
+            raise ValueError(f"Colonne de tri non supportée: {sort_by}")
+
+        sort_column = getattr(Consultant, sort_by)
+        if cursor:
+            last_value, last_id = ConsultantService._decode_cursor(cursor, sort_by)
+            if sort_by == "id":
+                query = query.filter(Consultant.id > last_id)
+            else:
+                query = query.filter(tuple_(sort_column, Consultant.id) > tuple_(last_value, last_id))
+
+        if sort_by == "id":
+            query = query.order_by(Consultant.id)
+        else:
+            query = query.order_by(sort_column, Consultant.id)
+        return query.limit(per_page + 1)
+
+    @staticmethod
+    def _run_keyset_page(query, sort_by: str, cursor: Optional[str], per_page: int, row_converter) -> Dict[str, Any]:
+        """Helper: Exécute une page keyset et calcule le curseur suivant"""
+        rows = ConsultantService._apply_keyset(query, sort_by, cursor, per_page).all()
+
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        next_cursor = None
+        if has_more and rows:
+            last_row = rows[-1]
+            next_cursor = ConsultantService._encode_cursor(sort_by, getattr(last_row, sort_by), last_row.id)
+
+        return {
+            "consultants": [row_converter(row) for row in rows],
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+
+    @staticmethod
+    def get_consultants_page_by_cursor(
+        cursor: Optional[str] = None,
+        per_page: int = 50,
+        sort_by: str = "nom",
+        practice_filter: Optional[str] = None,
+        grade_filter: Optional[str] = None,
+        availability_filter: Optional[bool] = None,
+        available_before: Optional[date] = None,
+        min_experience: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Récupère une page de consultants avec statistiques par pagination keyset
+
+        Contrairement à get_all_consultants_with_stats (OFFSET), le coût d'une page
+        ne dépend pas de sa profondeur : la requête reprend directement après le
+        couple (colonne de tri, id) encodé dans le curseur.
+
+        Args:
+            cursor: Curseur opaque renvoyé par la page précédente (None pour la première page)
+            per_page: Nombre de consultants par page
+            sort_by: Colonne de tri ("nom", "prenom", "email" ou "id")
+            practice_filter: Nom de la practice à filtrer
+            grade_filter: Grade à filtrer
+            availability_filter: Disponibilité à filtrer
+            available_before: Ne garder que les consultants libres au plus tard à cette date
+            min_experience: Expérience minimale en années
+
+        Returns:
+            Dict avec "consultants" (mêmes clés que get_all_consultants_with_stats),
+            "next_cursor" (None sur la dernière page) et "has_more"
+
+        Example:
+            >>> page = ConsultantService.get_consultants_page_by_cursor(per_page=50)
+            >>> suivante = ConsultantService.get_consultants_page_by_cursor(page["next_cursor"])
+        """
+        try:
+            with get_database_session() as session:
+                query = ConsultantService._build_keyset_query(
+                    session, practice_filter, grade_filter, availability_filter, None
+                )
+                query = ConsultantService._apply_profile_filters(query, available_before, min_experience)
+                return ConsultantService._run_keyset_page(
+                    query, sort_by, cursor, per_page, ConsultantService._convert_stats_row_to_dict
+                )
+        except (SQLAlchemyError, ValueError, TypeError, AttributeError) as e:
+            print(f"Erreur lors de la pagination des consultants: {e}")
+            return {"consultants": [], "next_cursor": None, "has_more": False}
+
+    @staticmethod
+    def search_consultants_by_cursor(
+        search_term: str,
+        cursor: Optional[str] = None,
+        per_page: int = 50,
+        sort_by: str = "nom",
+        practice_filter: Optional[str] = None,
+        grade_filter: Optional[str] = None,
+        availability_filter: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """
+        Recherche paginée par curseur, équivalent keyset de search_consultants_optimized
+
+        Args:
+            search_term: Terme recherché dans nom, prénom, email et société
+            cursor: Curseur opaque renvoyé par la page précédente (None pour la première page)
+            per_page: Nombre de consultants par page
+            sort_by: Colonne de tri ("nom", "prenom", "email" ou "id")
+            practice_filter: Nom de la practice à filtrer
+            grade_filter: Grade à filtrer
+            availability_filter: Disponibilité à filtrer
+
+        Returns:
+            Dict avec "consultants", "next_cursor" et "has_more"
+        """
+        try:
+            with get_database_session() as session:
+                query = ConsultantService._build_keyset_query(
+                    session, practice_filter, grade_filter, availability_filter, search_term
+                )
+                return ConsultantService._run_keyset_page(
+                    query, sort_by, cursor, per_page, ConsultantService._convert_consultant_row_to_dict
+                )
+        except (SQLAlchemyError, ValueError, TypeError, AttributeError) as e:
+            print(f"Erreur lors de la recherche paginée: {e}")
+            return {"consultants": [], "next_cursor": None, "has_more": False}
+
+    @staticmethod
+    def full_text_search(
+        search_term: str,
+        limit: int = 20,
+        sources: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Recherche plein texte (FTS5) dans les consultants, missions et CVs
+
+        Chaque mot saisi est recherché comme préfixe, sans tenir compte des accents
+        ni de la casse. Les résultats sont regroupés par consultant et classés
+        selon le meilleur score bm25 de ses documents.
+
+        Args:
+            search_term: Texte recherché (ex: "pyth spark")
+            limit: Nombre maximum de consultants retournés
+            sources: Sources à interroger parmi "consultant", "mission" et "cv" (toutes si None)
+
+        Returns:
+            Liste de dictionnaires consultant avec "score" et "matches"
+            (source, id de la source et extrait surligné)
+
+        Example:
+            >>> resultats = ConsultantService.full_text_search("kafka")
+            >>> print([r["nom"] for r in resultats])
+        """
+        try:
+            with get_database_session() as session:
+                if not ensure_full_text_index(session.get_bind()):
+                    return []
+
+                # Plusieurs documents par consultant : élargir avant regroupement
+                hits = search_full_text(session, search_term, limit=limit * 5, kinds=sources)
+
+                grouped: Dict[int, Dict[str, Any]] = {}
+                for hit in hits:
+                    entry = grouped.setdefault(hit["consultant_id"], {"score": hit["score"], "matches": []})
+                    entry["matches"].append(
+                        {"source": hit["kind"], "source_id": hit["source_id"], "extrait": hit["extrait"]}
+                    )
+                consultant_ids = list(grouped)[:limit]
+                if not consultant_ids:
+                    return []
+
+                rows = (
+                    session.query(
+                        Consultant.id,
+                        Consultant.prenom,
+                        Consultant.nom,
+                        Consultant.email,
+                        Consultant.societe,
+                        Consultant.disponibilite,
+                    )
+                    .filter(Consultant.id.in_(consultant_ids))
+                    .all()
+                )
+                rows_by_id = {row.id: row for row in rows}
+
+                results = []
+                for consultant_id in consultant_ids:
+                    row = rows_by_id.get(consultant_id)
+                    if row is None:
+                        continue
+                    results.append(
+                        {
+                            "id": row.id,
+                            "prenom": row.prenom,
+                            "nom": row.nom,
+                            "email": row.email,
+                            "societe": row.societe or "Quanteam",
+                            "disponibilite": row.disponibilite,
+                            "score": grouped[consultant_id]["score"],
+                            "matches": grouped[consultant_id]["matches"],
+                        }
+                    )
+                return results
+        except (SQLAlchemyError, ValueError, TypeError, AttributeError) as e:
+            print(f"Erreur lors de la recherche plein texte: {e}")
+            return []
+
     @staticmethod
     def get_consultant_summary_stats() -> Dict[str, int]:
         """RÃ©cupÃ¨re les statistiques gÃ©nÃ©rales avec cache pour tableau de bord"""
@@ -574,6 +922,53 @@ class ConsultantService:
             print(f"Erreur lors de la rÃ©cupÃ©ration du consultant avec stats {consultant_id}: {e}")
             return None
 
+    @staticmethod
+    def load_profile_bundle(consultant_id: int) -> Optional[ConsultantProfileBundle]:
+        """
+        Charge le profil complet d'un consultant en un nombre borné de requêtes
+
+        Une requête pour le consultant et sa practice, puis une requête selectinload
+        par collection (missions, compétences, langues, salaires, CVs, gestions BM),
+        quel que soit le volume de chaque collection. Le texte extrait des CVs
+        n'est pas chargé.
+
+        Args:
+            consultant_id: ID du consultant
+
+        Returns:
+            ConsultantProfileBundle immuable et utilisable hors session,
+            None si le consultant n'existe pas
+
+        Example:
+            >>> profil = ConsultantService.load_profile_bundle(42)
+            >>> print(profil.nom_complet, len(profil.missions), profil.date_disponibilite)
+        """
+        try:
+            with get_database_session() as session:
+                consultant = (
+                    session.query(Consultant)
+                    .options(
+                        joinedload(Consultant.practice),
+                        selectinload(Consultant.missions),
+                        selectinload(Consultant.competences).joinedload(ConsultantCompetence.competence),
+                        selectinload(Consultant.langues).joinedload(ConsultantLangue.langue),
+                        selectinload(Consultant.salaires),
+                        selectinload(Consultant.cvs).defer(CV.contenu_extrait),
+                        selectinload(Consultant.business_manager_gestions).joinedload(
+                            ConsultantBusinessManager.business_manager
+                        ),
+                    )
+                    .filter(Consultant.id == consultant_id)
+                    .first()
+                )
+
+                if consultant is None:
+                    return None
+                return build_profile_bundle(consultant)
+        except (SQLAlchemyError, ValueError, TypeError, AttributeError) as e:
+            print(f"Erreur lors du chargement du profil du consultant {consultant_id}: {e}")
+            return None
+
     @staticmethod
     def get_consultant_by_email(email: str) -> Optional[Consultant]:
         """
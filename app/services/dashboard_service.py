@@ -9,8 +9,10 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, func, desc
 
 from app.database.database import get_database_session
+from app.database.database import get_readonly_session
 from app.database.models import DashboardConfiguration, DashboardWidgetInstance, WidgetCatalog
 from app.database.models import BusinessManager, Consultant, Mission, ConsultantBusinessManager
+from app.database.sql_functions import days_between
 
 
 class DashboardService:
@@ -352,6 +354,9 @@ class DashboardService:
 class DashboardDataService:
     """
     Service pour récupérer les données métier utilisées par les widgets
+
+    Lectures pures : les requêtes passent par la session en lecture seule, qui
+    n'attend pas l'écrivain (import en cours) et lit le dernier instantané validé.
     """
 
     @staticmethod
@@ -366,7 +371,7 @@ class DashboardDataService:
             Dict: Données d'intercontrat
         """
         try:
-            with get_database_session() as session:
+            with get_readonly_session() as session:
                 # Requête de base pour les consultants actifs
                 query_consultants = session.query(Consultant).filter(Consultant.actif == True)
 
@@ -424,6 +429,7 @@ class DashboardDataService:
                 "consultants_intercontrat": 0,
                 "taux_intercontrat": 0,
                 "consultants_sans_mission": [],
+                "error": str(e),
             }
 
     @staticmethod
@@ -438,16 +444,16 @@ class DashboardDataService:
             Dict: Données de revenus par BM
         """
         try:
-            with get_database_session() as session:
+            with get_readonly_session() as session:
                 # Calcul de la date de début de période
                 from dateutil.relativedelta import relativedelta
 
                 date_debut = date.today() - relativedelta(months=period_months)
 
                 # Revenus par BM
-                # Calcul SQL de la durée : julianday(date_fin) - julianday(date_debut)
+                # Calcul SQL de la durée en jours (compilé selon le moteur de base)
                 # Si date_fin est NULL, on utilise 30 jours par défaut
-                duree_sql = func.coalesce(func.julianday(Mission.date_fin) - func.julianday(Mission.date_debut), 30)
+                duree_sql = func.coalesce(days_between(Mission.date_fin, Mission.date_debut), 30)
 
                 revenue_query = (
                     session.query(
@@ -495,7 +501,7 @@ class DashboardDataService:
 
         except Exception as e:
             print(f"Erreur lors du calcul des revenus par BM: {e}")
-            return {"period_months": period_months, "date_debut": date.today(), "bm_revenues": []}
+            return {"period_months": period_months, "date_debut": date.today(), "bm_revenues": [], "error": str(e)}
 
     @staticmethod
     def _get_last_mission_date(consultant_id: int, session: Session) -> Optional[str]:
@@ -0,0 +1,181 @@
+"""
+Gazetteer des entités nommées (noms de consultants, compétences, langues, practices)
+Tous les termes sont compilés dans un automate d'Aho-Corasick : une question est analysée
+en un seul parcours linéaire, quel que soit le nombre de termes, au lieu d'une expression
+régulière par ligne de la base.
+
+Comparaison insensible à la casse et aux accents ("Helene" trouve "Hélène"). Un terme
+avec word_boundary=True n'est trouvé qu'entre limites de mots, comme rf"\\b{terme}\\b".
+
+Le gazetteer est rechargé quand une de ses tables est modifiée (générations des tags
+de CacheService, invalidées à chaque commit).
+"""
+
+import threading
+import unicodedata
+from dataclasses import dataclass
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from app.services import caching
+from app.services.cache_service import data_generation
+
+
+def fold(text: str) -> str:
+    """Texte sans accents et en minuscules (casefold)"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def _is_word_char(char: Optional[str]) -> bool:
+    return char is not None and (char.isalnum() or char == "_")
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """Terme du gazetteer : kind est le type d'entité, value la valeur renvoyée"""
+
+    kind: str
+    value: str
+    length: int
+    word_boundary: bool = True
+
+
+class EntityGazetteer:
+    """
+    Automate d'Aho-Corasick sur les termes des entités
+
+    Example:
+        >>> gazetteer = EntityGazetteer()
+        >>> gazetteer.add("langue", "Français")
+        >>> [entry.value for entry in gazetteer.find("parle francais")]
+        ['Français']
+    """
+
+    def __init__(self, generation: Tuple = ()):
+        self.generation = generation
+        self._entries: List[GazetteerEntry] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Indices des entrées reconnues en chaque état (suffixes compris après build)
+        self._outputs: List[List[int]] = [[]]
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, kind: str, term, value: Optional[str] = None, word_boundary: bool = True) -> None:
+        """
+        Ajoute un terme (ignoré s'il est vide ou n'est pas une chaîne)
+
+        Args:
+            kind: Type d'entité ("competence", "langue"...)
+            term: Texte recherché dans les questions
+            value: Valeur renvoyée quand le terme est trouvé (term par défaut)
+            word_boundary: Terme trouvé uniquement entre limites de mots
+        """
+        if not isinstance(term, str):
+            return
+        folded = fold(term.strip())
+        if not folded:
+            return
+
+        state = 0
+        for char in folded:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+
+        self._outputs[state].append(len(self._entries))
+        self._entries.append(GazetteerEntry(kind, term if value is None else value, len(folded), word_boundary))
+        self._built = False
+
+    def build(self) -> "EntityGazetteer":
+        """Calcule les liens d'échec (parcours en largeur de l'arbre des termes)"""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Termes suffixes du chemin courant
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+                queue.append(next_state)
+        self._built = True
+        return self
+
+    def find(self, text: str) -> List[GazetteerEntry]:
+        """Entrées trouvées dans le texte, dans l'ordre d'ajout, sans doublons"""
+        if not self._built:
+            self.build()
+
+        text = fold(text)
+        found = set()
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._outputs[state]:
+                if index in found:
+                    continue
+                entry = self._entries[index]
+                if not entry.word_boundary or self._at_word_boundaries(text, position + 1 - entry.length, position + 1):
+                    found.add(index)
+        return [self._entries[index] for index in sorted(found)]
+
+    @staticmethod
+    def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+        # Même règle que \b : changement de classe (mot / non-mot) de part et d'autre de chaque extrémité
+        before = text[start - 1] if start > 0 else None
+        after = text[end] if end < len(text) else None
+        return _is_word_char(before) != _is_word_char(text[start]) and _is_word_char(text[end - 1]) != _is_word_char(
+            after
+        )
+
+
+_gazetteers: Dict[str, EntityGazetteer] = {}
+_lock = threading.Lock()
+
+
+def get_gazetteer(name: str, loader: Callable[[], EntityGazetteer], tags: Iterable[str]) -> EntityGazetteer:
+    """
+    Gazetteer partagé par le processus, rechargé par loader quand un des tags a été invalidé
+
+    Args:
+        name: Nom du gazetteer
+        loader: Construit le gazetteer depuis la base
+        tags: Tables lues par loader
+    """
+    generation = data_generation(*tags)
+    gazetteer = _gazetteers.get(name)
+    if caching.CACHE_ENABLED and gazetteer is not None and gazetteer.generation == generation:
+        return gazetteer
+
+    with _lock:
+        gazetteer = _gazetteers.get(name)
+        if caching.CACHE_ENABLED and gazetteer is not None and gazetteer.generation == generation:
+            return gazetteer
+        gazetteer = loader().build()
+        gazetteer.generation = generation
+        if caching.CACHE_ENABLED:
+            _gazetteers[name] = gazetteer
+    return gazetteer
+
+
+def clear_gazetteers() -> None:
+    """Oublie les gazetteers (rechargés au prochain appel)"""
+    with _lock:
+        _gazetteers.clear()
@@ -0,0 +1,360 @@
+"""
+Moteur d'intentions du chatbot : score de chaque intention pour une question
+Les patterns sont compilés une seule fois, à l'import : les patterns littéraux (la plupart)
+forment un index inversé mot-clé -> intentions testé par recherche de sous-chaîne, seuls
+les patterns réellement réguliers passent par re.
+
+Moteur enfichable (CONSULTATOR_CHATBOT_INTENT_ENGINE) :
+    patterns  nombre de patterns de l'intention trouvés dans la question (défaut)
+    tfidf     modèle linéaire TF-IDF local appris sur les mots des patterns : toutes les
+              intentions sont scorées en un seul parcours des mots de la question
+
+Tout objet exposant score(question) -> Dict[str, float] peut remplacer le moteur
+(set_intent_scorer).
+"""
+
+import math
+import os
+import re
+from collections import defaultdict
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+INTENT_ENGINE = os.getenv("CONSULTATOR_CHATBOT_INTENT_ENGINE", "patterns")
+
+# Caractères qui font d'un pattern une expression régulière (sinon simple sous-chaîne)
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+INTENT_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "salaire": (
+        r"salaire",
+        r"rémunération",
+        r"paie",
+        r"combien gagne",
+        r"revenus",
+        r"euros",
+        r"€",
+        r"salaire de",
+        r"gagne",
+        r"cjm",
+        r"coût journalier",
+    ),
+    "experience": (
+        r"expérience",
+        r"experience",
+        r"années d'expérience",
+        r"annees d'experience",
+        r"ancienneté",
+        r"seniorité",
+        r"séniorité",
+        r"depuis quand",
+        r"depuis combien",
+        r"combien d'années",
+        r"combien d'annees",
+        r"quel âge",
+        r"âge professionnel",
+    ),
+    "profil_professionnel": (
+        r"grade",
+        r"niveau",
+        r"poste",
+        r"fonction",
+        r"junior",
+        r"confirmé",
+        r"senior",
+        r"manager",
+        r"directeur",
+        r"type contrat",
+        r"type de contrat",
+        r"contrat",
+        r"cdi",
+        r"cdd",
+        r"stagiaire",
+        r"alternant",
+        r"indépendant",
+        r"freelance",
+        r"société",
+        r"societe",
+        r"quanteam",
+        r"asigma",
+        r"entreprise",
+    ),
+    "competences": (
+        r"compétences",
+        r"competences",
+        r"maîtrise",
+        r"maitrise",
+        r"sait faire",
+        r"technologies",
+        r"langages",
+        r"outils",
+        r"expertise",
+        r"python",
+        r"sql",
+        r"java",
+        r"quelles\s+(?:\w+\s+)*compétences",
+        r"quelles\s+(?:\w+\s+)*competences",
+        r"skills",
+        r"techno",
+        r"connaît",
+        r"connait",
+    ),
+    "langues": (
+        r"langues?",
+        r"langue",
+        r"parle",
+        r"parlent",
+        r"anglais",
+        r"français",
+        r"espagnol",
+        r"allemand",
+        r"italien",
+        r"bilingue",
+        r"niveau\s+(?:\w+\s+)*langue",
+        r"parle\s+(?:\w+\s+)*anglais",
+        r"qui\s+(?:\w+\s+)*parle",
+        r"quelles\s+(?:\w+\s+)*langues",
+        r"polyglotte",
+        r"linguistique",
+    ),
+    "missions": (
+        r"missions",
+        r"mission",
+        r"travaille",
+        r"chez",
+        r"entreprise",
+        r"client",
+        r"projet",
+        r"bnp",
+        r"paribas",
+        r"société générale",
+        r"combien\s+(?:\w+\s+)*missions?",
+        r"nombre\s+(?:\w+\s+)*missions?",
+        r"projets",
+    ),
+    "contact": (
+        r"mail",
+        r"email",
+        r"e-mail",
+        r"téléphone",
+        r"tel",
+        r"numéro",
+        r"contact",
+        r"joindre",
+        r"coordonnées",
+    ),
+    "liste_consultants": (
+        r"quels sont les consultants",
+        r"liste des consultants",
+        r"consultants disponibles",
+        r"consultants actifs",
+        r"tous les consultants",
+        r"lister les consultants",
+        r"qui sont les consultants",
+        r"montrer les consultants",
+    ),
+    "practices": (
+        r"practice",
+        r"practices",
+        r"qui est dans la practice",
+        r"consultants de la practice",
+        r"practice data",
+        r"practice quant",
+        r"équipe",
+        r"dans quelle practice",
+    ),
+    "cvs": (
+        r"cv",
+        r"curriculum",
+        r"document",
+        r"fichier",
+        r"upload",
+        r"téléchargé",
+    ),
+    "statistiques": (
+        r"combien\s+(?:[\w-]+\s+)*consultants",
+        r"nombre\s+(?:[\w-]+\s+)*consultants",
+        r"combien\s+(?:[\w-]+\s+)*dans\s+(?:[\w-]+\s+)*base",
+        r"nombre",
+        r"moyenne",
+        r"total",
+        r"statistiques",
+        r"combien\s+(?:[\w-]+\s+)*missions",
+        r"actifs",
+        r"inactifs",
+        r"tjm moyen",
+        r"combien y a",
+        r"il y a combien",
+    ),
+    "disponibilite": (  # Nouvelle intention V1.2.2
+        r"disponible",
+        r"disponibilité",
+        r"libre",
+        r"quand\s+(?:\w+\s+)*libre",
+        r"quand\s+(?:\w+\s+)*disponible",
+        r"date\s+(?:\w+\s+)*disponibilité",
+        r"fin\s+(?:\w+\s+)*mission",
+        r"libéré",
+        r"fini",
+        r"termine",
+        r"asap",
+        r"immédiatement",
+        r"tout de suite",
+        r"prochaine disponibilité",
+    ),
+    "tjm_mission": (  # Nouvelle intention V1.2.2
+        r"tjm\s+(?:\w+\s+)*mission",
+        r"taux\s+(?:\w+\s+)*mission",
+        r"prix\s+(?:\w+\s+)*mission",
+        r"coût\s+(?:\w+\s+)*mission",
+        r"tarif\s+(?:\w+\s+)*mission",
+        r"facturation\s+(?:\w+\s+)*mission",
+        r"journalier\s+(?:\w+\s+)*mission",
+        r"combien\s+(?:\w+\s+)*coûte\s+(?:\w+\s+)*mission",
+        r"prix\s+(?:\w+\s+)*journée\s+(?:\w+\s+)*mission",
+        r"tjm mission",
+        r"prix mission",
+        r"coût mission",
+        r"tarif mission",
+        r"taux journalier mission",
+        r"combien coûte mission",
+    ),
+    "recherche_consultant": (
+        r"qui est",
+        r"consultant",
+        r"profil",
+        r"information sur",
+        r"details",
+    ),
+}
+
+
+def is_literal(pattern: str) -> bool:
+    """Vrai si le pattern ne contient aucun métacaractère d'expression régulière"""
+    return not _REGEX_METACHARACTERS.intersection(pattern)
+
+
+class PatternIntentScorer:
+    """
+    Score d'une intention = nombre de ses patterns trouvés dans la question
+
+    Résultats identiques à re.search sur chaque pattern ; un pattern présent dans
+    plusieurs intentions compte pour chacune.
+    """
+
+    name = "patterns"
+
+    def __init__(self, patterns: Optional[Dict[str, Tuple[str, ...]]] = None):
+        patterns = INTENT_PATTERNS if patterns is None else patterns
+        self.intents: Tuple[str, ...] = tuple(patterns)
+
+        keywords: Dict[str, List[str]] = defaultdict(list)
+        regexes: List[Tuple[re.Pattern, str]] = []
+        for intent, intent_patterns in patterns.items():
+            for pattern in intent_patterns:
+                if is_literal(pattern):
+                    keywords[pattern].append(intent)
+                else:
+                    regexes.append((re.compile(pattern), intent))
+
+        # Index inversé : mot-clé -> intentions (une entrée par occurrence du pattern)
+        self._keywords: Tuple[Tuple[str, Tuple[str, ...]], ...] = tuple(
+            (keyword, tuple(intents)) for keyword, intents in keywords.items()
+        )
+        self._regexes = tuple(regexes)
+
+    def score(self, question: str) -> Dict[str, float]:
+        scores = dict.fromkeys(self.intents, 0)
+        for keyword, intents in self._keywords:
+            if keyword in question:
+                for intent in intents:
+                    scores[intent] += 1
+        for regex, intent in self._regexes:
+            if regex.search(question):
+                scores[intent] += 1
+        return scores
+
+
+class TfidfIntentScorer:
+    """
+    Modèle linéaire TF-IDF appris sur les mots des patterns littéraux
+
+    Chaque intention est un document (ses patterns, sans mots outils) ; le score d'une
+    intention est la somme des poids TF-IDF normalisés des mots distincts de la question.
+    """
+
+    name = "tfidf"
+
+    WORD_PATTERN = re.compile(r"\w+")
+    # Mots outils : présents dans les patterns de plusieurs intentions sans les distinguer
+    STOP_WORDS = frozenset(
+        ("a", "d", "de", "des", "du", "dans", "est", "il", "l", "la", "le", "les", "qui", "sont", "sur", "y")
+    )
+
+    def __init__(self, patterns: Optional[Dict[str, Tuple[str, ...]]] = None):
+        patterns = INTENT_PATTERNS if patterns is None else patterns
+        self.intents: Tuple[str, ...] = tuple(patterns)
+
+        term_counts: Dict[str, Dict[str, int]] = {}
+        for intent, intent_patterns in patterns.items():
+            counts: Dict[str, int] = defaultdict(int)
+            for pattern in filter(is_literal, intent_patterns):
+                for word in self.WORD_PATTERN.findall(pattern):
+                    if word not in self.STOP_WORDS:
+                        counts[word] += 1
+            term_counts[intent] = counts
+
+        document_frequency: Dict[str, int] = defaultdict(int)
+        for counts in term_counts.values():
+            for word in counts:
+                document_frequency[word] += 1
+
+        # Index inversé : mot -> [(intention, poids)]
+        weights: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        for intent, counts in term_counts.items():
+            vector = {
+                word: count * (math.log(len(patterns) / document_frequency[word]) + 1) for word, count in counts.items()
+            }
+            norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+            for word, weight in vector.items():
+                weights[word].append((intent, weight / norm))
+        self._weights = dict(weights)
+
+    def score(self, question: str) -> Dict[str, float]:
+        scores = dict.fromkeys(self.intents, 0.0)
+        for word in set(self.WORD_PATTERN.findall(question)):
+            for intent, weight in self._weights.get(word, ()):
+                scores[intent] += weight
+        return scores
+
+
+_SCORERS = {
+    PatternIntentScorer.name: PatternIntentScorer,
+    TfidfIntentScorer.name: TfidfIntentScorer,
+}
+
+
+def create_intent_scorer(name: Optional[str] = None):
+    """Moteur d'intentions par nom (patterns si le nom est inconnu)"""
+    name = name or INTENT_ENGINE
+    if name not in _SCORERS:
+        print(f"⚠️ Moteur d'intentions inconnu: {name}, utilisation de patterns")
+        name = PatternIntentScorer.name
+    return _SCORERS[name]()
+
+
+# Construit une seule fois, à l'import
+_intent_scorer = create_intent_scorer()
+
+
+def get_intent_scorer():
+    """Moteur d'intentions courant"""
+    return _intent_scorer
+
+
+def set_intent_scorer(scorer) -> None:
+    """Remplace le moteur d'intentions (objet exposant score(question) -> Dict[str, float])"""
+    global _intent_scorer
+    _intent_scorer = scorer
@@ -0,0 +1,231 @@
+"""
+Niveau de cache en mémoire borné pour CacheService
+Éviction LRU sous un double budget (nombre d'entrées et taille estimée en octets)
+et purge périodique des entrées expirées par un thread de fond
+
+Limites configurables par variables d'environnement :
+    CONSULTATOR_CACHE_MAX_ENTRIES   nombre maximal d'entrées (défaut 2000)
+    CONSULTATOR_CACHE_MAX_MB        budget mémoire estimé en Mo (défaut 64)
+    CONSULTATOR_CACHE_SWEEP_SECONDS intervalle de purge des entrées expirées (défaut 60, 0 = désactivée)
+"""
+
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+MAX_ENTRIES = int(os.getenv("CONSULTATOR_CACHE_MAX_ENTRIES", "2000"))
+MAX_BYTES = int(float(os.getenv("CONSULTATOR_CACHE_MAX_MB", "64")) * 1024 * 1024)
+SWEEP_INTERVAL = float(os.getenv("CONSULTATOR_CACHE_SWEEP_SECONDS", "60"))
+
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estime la mémoire occupée par une valeur en parcourant ses conteneurs
+
+    Les objets déjà rencontrés ne sont comptés qu'une fois ; pour les instances,
+    seuls les attributs publics sont parcourus (l'état interne SQLAlchemy, par
+    exemple, n'est pas compté).
+
+    Returns:
+        int: Taille estimée en octets
+    """
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _seen) for item in value)
+
+    attributes = getattr(value, "__dict__", None)
+    if isinstance(attributes, dict):
+        size += sum(estimate_size(v, _seen) for k, v in attributes.items() if not k.startswith("_"))
+    return size
+
+
+def _is_expired(entry: Any, now: float) -> bool:
+    # Même règle que CacheService._is_expired : sans expires_at, l'entrée est périmée
+    return not isinstance(entry, dict) or now > entry.get("expires_at", 0)
+
+
+def _sweep_loop(cache_ref, interval: float, stop_event: threading.Event) -> None:
+    """Purge périodique ; s'arrête avec close() ou quand le cache est libéré"""
+    while not stop_event.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        cache.sweep_expired()
+        del cache
+
+
+class MemoryCache(MutableMapping):
+    """
+    Dictionnaire d'entrées de cache borné et thread-safe
+
+    S'utilise comme le dict memory_cache d'origine (clé -> {"data", "expires_at",
+    "created_at"}). Une lecture par clé marque l'entrée comme récemment utilisée ;
+    une écriture qui dépasse max_entries ou max_bytes évince les entrées les moins
+    récemment utilisées. Une entrée plus grosse que le budget entier n'est pas stockée.
+    on_evict est prévenu de chaque éviction (LRU ou expiration) pour les statistiques.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        on_evict: Optional[Callable[[str, str], None]] = None,
+    ):
+        self.max_entries = max_entries if max_entries is not None else MAX_ENTRIES
+        self.max_bytes = max_bytes if max_bytes is not None else MAX_BYTES
+        self.sweep_interval = sweep_interval if sweep_interval is not None else SWEEP_INTERVAL
+        # Appelé avec (clé, "lru" | "expired") pour chaque entrée retirée par le cache lui-même
+        self.on_evict = on_evict
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+
+        self._stop_event = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        if self.sweep_interval > 0:
+            self._sweeper = threading.Thread(
+                target=_sweep_loop,
+                args=(weakref.ref(self), self.sweep_interval, self._stop_event),
+                name="consultator-cache-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+            weakref.finalize(self, self._stop_event.set)
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries[key]
+            self._entries.move_to_end(key)
+            return entry
+
+    def __setitem__(self, key: str, entry: Any) -> None:
+        size = estimate_size(entry)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                self.rejected += 1
+                return
+            self._entries[key] = entry
+            self._sizes[key] = size
+            self._bytes += size
+            self._evict()
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key not in self._entries:
+                raise KeyError(key)
+            self._remove(key)
+
+    # pop et setdefault de MutableMapping enchaînent deux accès : la purge pourrait retirer la clé entre les deux
+    def pop(self, key: str, *default: Any) -> Any:
+        with self._lock:
+            if key in self._entries:
+                entry = self._entries[key]
+                self._remove(key)
+                return entry
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                return self[key]
+            self[key] = default
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        # Test d'appartenance sans effet sur l'ordre LRU
+        with self._lock:
+            return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        del self._entries[key]
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(oldest, "lru")
+
+    @property
+    def size_bytes(self) -> int:
+        """Taille estimée des entrées stockées"""
+        return self._bytes
+
+    def sweep_expired(self, now: Optional[float] = None) -> int:
+        """
+        Supprime les entrées expirées
+
+        Returns:
+            int: Nombre d'entrées supprimées
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if _is_expired(entry, now)]
+            for key in expired:
+                self._remove(key)
+                if self.on_evict is not None:
+                    self.on_evict(key, "expired")
+            self.expirations += len(expired)
+        return len(expired)
+
+    def close(self) -> None:
+        """Arrête le thread de purge"""
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Occupation et compteurs d'éviction du niveau mémoire"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "size_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "rejected": self.rejected,
+                "sweep_interval": self.sweep_interval,
+            }
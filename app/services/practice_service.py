@@ -10,6 +10,8 @@ import streamlit as st
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
+from app.services.caching import cache_data
+from app.services.caching import skip_caching
 from database.database import get_database_session
 from database.models import Consultant
 from database.models import Practice
@@ -242,6 +244,8 @@ class PracticeService:
             session.close()
 
     @staticmethod
+    # Les statistiques comptent les consultants de chaque practice
+    @cache_data(ttl=1800, tags=(Practice.__tablename__, Consultant.__tablename__))  # Cache pendant 30 minutes
     def get_practice_statistics() -> Dict:
         """Récupère les statistiques des practices"""
         session = get_session()
@@ -294,6 +298,7 @@ class PracticeService:
             return stats
         except SQLAlchemyError as e:
             st.error(f"Erreur lors de la récupération des statistiques: {e}")
+            skip_caching()
             return {
                 "total_practices": 0,
                 "total_consultants": 0,
@@ -0,0 +1,271 @@
+"""
+Profil complet d'un consultant sous forme d'objets immuables (DTO)
+Construit par ConsultantService.load_profile_bundle à partir d'un Consultant dont
+toutes les relations ont été chargées en amont : aucun accès paresseux à la base
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from datetime import datetime
+from typing import Optional
+from typing import Tuple
+
+from app.database.models import Consultant
+
+
+@dataclass(frozen=True)
+class MissionSummary:
+    """Mission d'un consultant"""
+
+    id: int
+    nom_mission: str
+    client: str
+    role: Optional[str]
+    date_debut: Optional[date]
+    date_fin: Optional[date]
+    statut: Optional[str]
+    tjm: Optional[float]
+    revenus_generes: Optional[float]
+    technologies_utilisees: Optional[str]
+    description: Optional[str]
+
+
+@dataclass(frozen=True)
+class CompetenceSummary:
+    """Compétence d'un consultant avec son niveau"""
+
+    id: int
+    competence_id: int
+    nom: str
+    categorie: str
+    type_competence: Optional[str]
+    niveau_maitrise: Optional[str]
+    annees_experience: Optional[float]
+    certifications: Optional[str]
+
+
+@dataclass(frozen=True)
+class LangueSummary:
+    """Langue parlée par un consultant"""
+
+    id: int
+    langue_id: int
+    nom: str
+    code_iso: Optional[str]
+    niveau: int
+    niveau_label: str
+    commentaire: Optional[str]
+
+
+@dataclass(frozen=True)
+class SalaireSummary:
+    """Entrée de l'historique des salaires"""
+
+    id: int
+    salaire: float
+    date_debut: Optional[date]
+    date_fin: Optional[date]
+    commentaire: Optional[str]
+
+
+@dataclass(frozen=True)
+class CVSummary:
+    """CV téléversé (sans le texte extrait)"""
+
+    id: int
+    fichier_nom: str
+    fichier_path: str
+    date_upload: Optional[datetime]
+    taille_fichier: Optional[int]
+
+
+@dataclass(frozen=True)
+class BusinessManagerAssignment:
+    """Gestion du consultant par un Business Manager"""
+
+    id: int
+    business_manager_id: int
+    business_manager_nom: str
+    business_manager_email: Optional[str]
+    date_debut: Optional[date]
+    date_fin: Optional[date]
+    commentaire: Optional[str]
+
+    @property
+    def est_actuel(self) -> bool:
+        return self.date_fin is None
+
+
+@dataclass(frozen=True)
+class ConsultantProfileBundle:
+    """
+    Profil complet et immuable d'un consultant
+
+    Les collections sont des tuples triés (du plus récent au plus ancien pour
+    missions, salaires, CVs et gestions BM).
+    """
+
+    id: int
+    prenom: str
+    nom: str
+    email: str
+    telephone: Optional[str]
+    salaire_actuel: Optional[float]
+    disponibilite: bool
+    date_disponibilite: str
+    notes: Optional[str]
+    societe: Optional[str]
+    entite: Optional[str]
+    grade: Optional[str]
+    type_contrat: Optional[str]
+    date_entree_societe: Optional[date]
+    date_sortie_societe: Optional[date]
+    date_premiere_mission: Optional[date]
+    experience_annees: float
+    statut_societe: str
+    etat_periode_essai: Optional[str]
+    fin_periode_essai: Optional[date]
+    actif: Optional[bool]
+    date_creation: Optional[datetime]
+    derniere_maj: Optional[datetime]
+    practice_id: Optional[int]
+    practice_nom: Optional[str]
+    missions: Tuple[MissionSummary, ...]
+    competences: Tuple[CompetenceSummary, ...]
+    langues: Tuple[LangueSummary, ...]
+    salaires: Tuple[SalaireSummary, ...]
+    cvs: Tuple[CVSummary, ...]
+    business_managers: Tuple[BusinessManagerAssignment, ...]
+
+    @property
+    def nom_complet(self) -> str:
+        return f"{self.prenom} {self.nom}"
+
+    @property
+    def business_manager_actuel(self) -> Optional[BusinessManagerAssignment]:
+        """Gestion BM en cours (date_fin vide), None si aucune"""
+        return next((gestion for gestion in self.business_managers if gestion.est_actuel), None)
+
+
+def _most_recent_first(items, attribute):
+    return sorted(items, key=lambda item: getattr(item, attribute) or date.min, reverse=True)
+
+
+def build_profile_bundle(consultant: Consultant) -> ConsultantProfileBundle:
+    """
+    Convertit un Consultant (relations déjà chargées) en ConsultantProfileBundle
+
+    Args:
+        consultant: Consultant chargé avec practice, missions, compétences,
+            langues, salaires, CVs et gestions BM
+
+    Returns:
+        ConsultantProfileBundle: Profil immuable, utilisable hors session
+    """
+    missions = tuple(
+        MissionSummary(
+            id=m.id,
+            nom_mission=m.nom_mission,
+            client=m.client,
+            role=m.role,
+            date_debut=m.date_debut,
+            date_fin=m.date_fin,
+            statut=m.statut,
+            tjm=m.tjm if m.tjm is not None else m.taux_journalier,
+            revenus_generes=m.revenus_generes,
+            technologies_utilisees=m.technologies_utilisees,
+            description=m.description,
+        )
+        for m in _most_recent_first(consultant.missions, "date_debut")
+    )
+    competences = tuple(
+        CompetenceSummary(
+            id=cc.id,
+            competence_id=cc.competence_id,
+            nom=cc.competence.nom,
+            categorie=cc.competence.categorie,
+            type_competence=cc.competence.type_competence,
+            niveau_maitrise=cc.niveau_maitrise,
+            annees_experience=cc.annees_experience,
+            certifications=cc.certifications,
+        )
+        for cc in sorted(consultant.competences, key=lambda cc: cc.competence.nom)
+    )
+    langues = tuple(
+        LangueSummary(
+            id=cl.id,
+            langue_id=cl.langue_id,
+            nom=cl.langue.nom,
+            code_iso=cl.langue.code_iso,
+            niveau=cl.niveau,
+            niveau_label=cl.niveau_label,
+            commentaire=cl.commentaire,
+        )
+        for cl in sorted(consultant.langues, key=lambda cl: cl.langue.nom)
+    )
+    salaires = tuple(
+        SalaireSummary(
+            id=s.id,
+            salaire=s.salaire,
+            date_debut=s.date_debut,
+            date_fin=s.date_fin,
+            commentaire=s.commentaire,
+        )
+        for s in _most_recent_first(consultant.salaires, "date_debut")
+    )
+    cvs = tuple(
+        CVSummary(
+            id=cv.id,
+            fichier_nom=cv.fichier_nom,
+            fichier_path=cv.fichier_path,
+            date_upload=cv.date_upload,
+            taille_fichier=cv.taille_fichier,
+        )
+        for cv in sorted(consultant.cvs, key=lambda cv: cv.date_upload or datetime.min, reverse=True)
+    )
+    business_managers = tuple(
+        BusinessManagerAssignment(
+            id=cbm.id,
+            business_manager_id=cbm.business_manager_id,
+            business_manager_nom=f"{cbm.business_manager.prenom} {cbm.business_manager.nom}",
+            business_manager_email=cbm.business_manager.email,
+            date_debut=cbm.date_debut,
+            date_fin=cbm.date_fin,
+            commentaire=cbm.commentaire,
+        )
+        for cbm in _most_recent_first(consultant.business_manager_gestions, "date_debut")
+    )
+
+    return ConsultantProfileBundle(
+        id=consultant.id,
+        prenom=consultant.prenom,
+        nom=consultant.nom,
+        email=consultant.email,
+        telephone=consultant.telephone,
+        salaire_actuel=consultant.salaire_actuel,
+        disponibilite=consultant.disponibilite,
+        date_disponibilite=consultant.date_disponibilite,
+        notes=consultant.notes,
+        societe=consultant.societe,
+        entite=consultant.entite,
+        grade=consultant.grade,
+        type_contrat=consultant.type_contrat,
+        date_entree_societe=consultant.date_entree_societe,
+        date_sortie_societe=consultant.date_sortie_societe,
+        date_premiere_mission=consultant.date_premiere_mission,
+        experience_annees=consultant.experience_annees,
+        statut_societe=consultant.statut_societe,
+        etat_periode_essai=consultant.etat_periode_essai,
+        fin_periode_essai=consultant.fin_periode_essai,
+        actif=consultant.actif,
+        date_creation=consultant.date_creation,
+        derniere_maj=consultant.derniere_maj,
+        practice_id=consultant.practice_id,
+        practice_nom=consultant.practice.nom if consultant.practice else None,
+        missions=missions,
+        competences=competences,
+        langues=langues,
+        salaires=salaires,
+        cvs=cvs,
+        business_managers=business_managers,
+    )
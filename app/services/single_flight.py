@@ -0,0 +1,68 @@
+"""
+Regroupement des chargements concurrents d'une même clé de cache (single-flight)
+Quand une entrée populaire expire, un seul thread exécute la fonction coûteuse ;
+les appels concurrents sur la même clé attendent et reçoivent le même résultat.
+"""
+
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+
+class _Call:
+    """Chargement en cours : résultat ou exception partagés avec les appelants en attente"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Un seul chargement en vol par clé dans le processus
+
+    Example:
+        >>> flights = SingleFlight()
+        >>> flights.do("consultator:stats:abc", ConsultantService.get_consultant_summary_stats)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """Vrai si un chargement de la clé est en cours"""
+        with self._lock:
+            return key in self._calls
+
+    def do(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Exécute loader, ou attend le chargement déjà en cours pour la même clé
+
+        Returns:
+            Any: Résultat du chargement (l'exception du chargement est relevée chez tous les appelants)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = loader()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
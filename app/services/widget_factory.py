@@ -7,12 +7,23 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
 from datetime import datetime, date
 
+from app.services.cache_service import TAG_CONSULTANTS, TAG_MISSIONS, get_cache_service
 from app.services.dashboard_service import DashboardDataService
 from app.services.consultant_service import ConsultantService
 
+# Les données des widgets dépendent des consultants, des missions et des affectations aux BM
+# (tags invalidés à chaque commit, cf. app.database.cache_invalidation)
+WIDGET_DATA_TAGS = (TAG_CONSULTANTS, TAG_MISSIONS, "business_managers", "consultant_business_managers")
+WIDGET_DATA_TTL = 600
+
+# Données des widgets chargées pour le rendu en cours (cf. WidgetFactory.prefetched)
+_prefetched_data: ContextVar[Optional[Dict[str, Any]]] = ContextVar("widget_prefetched_data", default=None)
+
 
 class WidgetFactory:
     """
@@ -49,6 +60,92 @@ class WidgetFactory:
         else:
             st.warning(f"⚠️ Widget type '{widget_type}' non reconnu")
 
+    @staticmethod
+    def _widget_data_calls(widget_type: str, config: Dict[str, Any]) -> List[Tuple[Callable, tuple]]:
+        """
+        Appels de DashboardDataService effectués par le rendu d'un widget (mêmes arguments)
+        """
+        intercontrat = DashboardDataService.get_intercontrat_data
+        revenue = DashboardDataService.get_revenue_by_bm_data
+        period_months = config.get("period_months", 3)
+
+        calls = {
+            "intercontrat_rate": [(intercontrat, (config.get("bm_filter"),))],
+            "consultants_sans_mission": [(intercontrat, (config.get("bm_filter"),))],
+            "revenue_by_bm": [(revenue, (period_months,))],
+            "global_kpis": [(intercontrat, ()), (revenue, (1,))],
+            "intercontrat_trend": [(intercontrat, ())],
+            "top_bm_performance": [(revenue, (period_months,))],
+        }
+        return calls.get(widget_type, [])
+
+    @staticmethod
+    def _data_key(func: Callable, args: tuple) -> str:
+        return get_cache_service()._generate_key(f"widget:{func.__name__}", args, {})
+
+    @staticmethod
+    def prefetch_data(widgets: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Charge les données de tous les widgets d'un dashboard
+
+        Les valeurs en cache sont lues en un seul aller-retour Redis (get_many) ;
+        les manquantes sont calculées puis écrites en un seul pipeline (set_many).
+        Un calcul en échec (exception, ou résultat de repli portant "error") n'est ni
+        mis en cache ni préchargé : le widget le refait dans son propre bloc d'erreur.
+
+        Args:
+            widgets: Couples (type de widget, configuration)
+
+        Returns:
+            Dict[str, Any]: Données par clé de cache
+        """
+        calls = {}
+        for widget_type, config in widgets:
+            for func, args in WidgetFactory._widget_data_calls(widget_type, config or {}):
+                calls[WidgetFactory._data_key(func, args)] = (func, args)
+        if not calls:
+            return {}
+
+        cache_service = get_cache_service()
+        data = cache_service.get_many(calls, tags=WIDGET_DATA_TAGS)
+        to_load = {key: call for key, call in calls.items() if key not in data}
+        if to_load:
+            # Générations lues avant les calculs : un commit pendant le chargement rend les valeurs périmées
+            tag_versions = cache_service.get_tag_versions(WIDGET_DATA_TAGS)
+            missing = {}
+            for key, (func, args) in to_load.items():
+                try:
+                    result = func(*args)
+                except Exception as e:
+                    print(f"⚠️ Préchargement de {func.__name__} impossible: {e}")
+                    continue
+                if isinstance(result, dict) and "error" in result:
+                    continue
+                missing[key] = result
+            cache_service.set_many(missing, WIDGET_DATA_TTL, tags=WIDGET_DATA_TAGS, tag_versions=tag_versions)
+            data.update(missing)
+        return data
+
+    @staticmethod
+    @contextmanager
+    def prefetched(widgets: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Rend les données préchargées disponibles aux widgets rendus dans le bloc"""
+        token = _prefetched_data.set(WidgetFactory.prefetch_data(widgets))
+        try:
+            yield
+        finally:
+            _prefetched_data.reset(token)
+
+    @staticmethod
+    def _load_data(func: Callable, *args) -> Dict:
+        """Données d'un widget : préchargées si le rendu est dans WidgetFactory.prefetched, sinon calculées"""
+        prefetched = _prefetched_data.get()
+        if prefetched is not None:
+            key = WidgetFactory._data_key(func, args)
+            if key in prefetched:
+                return prefetched[key]
+        return func(*args)
+
     @staticmethod
     def _render_intercontrat_rate(config: Dict) -> None:
         """
@@ -57,7 +154,7 @@ class WidgetFactory:
         st.subheader("⏰ Taux d'Intercontrat")
 
         bm_filter = config.get("bm_filter")
-        data = DashboardDataService.get_intercontrat_data(bm_filter)
+        data = WidgetFactory._load_data(DashboardDataService.get_intercontrat_data, bm_filter)
 
         taux = data["taux_intercontrat"]
         total = data["total_consultants"]
@@ -125,7 +222,7 @@ class WidgetFactory:
         st.subheader("👥 Consultants en Intercontrat")
 
         bm_filter = config.get("bm_filter")
-        data = DashboardDataService.get_intercontrat_data(bm_filter)
+        data = WidgetFactory._load_data(DashboardDataService.get_intercontrat_data, bm_filter)
 
         consultants = data["consultants_sans_mission"]
 
@@ -159,7 +256,7 @@ class WidgetFactory:
         st.subheader("💰 Revenus par Business Manager")
 
         period_months = config.get("period_months", 3)
-        data = DashboardDataService.get_revenue_by_bm_data(period_months)
+        data = WidgetFactory._load_data(DashboardDataService.get_revenue_by_bm_data, period_months)
 
         bm_revenues = data["bm_revenues"]
 
@@ -208,10 +305,10 @@ class WidgetFactory:
         st.subheader("📊 KPIs Globaux")
 
         # Données d'intercontrat
-        intercontrat_data = DashboardDataService.get_intercontrat_data()
+        intercontrat_data = WidgetFactory._load_data(DashboardDataService.get_intercontrat_data)
 
         # Données de revenus
-        revenue_data = DashboardDataService.get_revenue_by_bm_data(1)  # 1 mois
+        revenue_data = WidgetFactory._load_data(DashboardDataService.get_revenue_by_bm_data, 1)  # 1 mois
 
         # Affichage en colonnes
         col1, col2, col3, col4 = st.columns(4)
@@ -253,7 +350,7 @@ class WidgetFactory:
 
         # Pour cette démo, on simule des données de tendance
         # Dans la vraie implémentation, on irait chercher l'historique
-        current_data = DashboardDataService.get_intercontrat_data()
+        current_data = WidgetFactory._load_data(DashboardDataService.get_intercontrat_data)
 
         dates = pd.date_range(start="2025-07-01", end="2025-10-01", freq="M")
         taux_simules = [8.5, 12.2, 15.1, current_data["taux_intercontrat"]]
@@ -277,7 +374,7 @@ class WidgetFactory:
         st.subheader("🏆 Top Business Managers")
 
         period_months = config.get("period_months", 3)
-        data = DashboardDataService.get_revenue_by_bm_data(period_months)
+        data = WidgetFactory._load_data(DashboardDataService.get_revenue_by_bm_data, period_months)
 
         bm_revenues = data["bm_revenues"]
 
@@ -4,12 +4,15 @@ Filtres avancés, recherche en temps réel, et UX améliorée
 """
 
 import time
+from collections import OrderedDict
 from datetime import date
 from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import pandas as pd
 import streamlit as st
@@ -24,6 +27,60 @@ LABEL_PRENOM = "Prénom"
 LABEL_SALAIRE_ACTUEL = "Salaire Actuel"
 LABEL_ANNEES_EXP = "Années Exp."
 
+# Résultats conservés par session Streamlit (listes chargées et résultats filtrés)
+SESSION_CACHE_KEY = "consultants_result_cache"
+SESSION_CACHE_SIZE = 8
+
+# Filtres d'égalité, appliqués quand leur valeur est renseignée
+EQUALITY_FILTERS = ("practice_filter", "grade_filter", "societe_filter", "type_contrat_filter")
+# Bornes : un minimum relevé ou un maximum abaissé restreint le résultat
+RANGE_FILTERS = (
+    ("salaire_min", "min"),
+    ("salaire_max", "max"),
+    ("experience_min", "min"),
+    ("experience_max", "max"),
+)
+
+
+class SessionResultCache:
+    """
+    LRU des listes de consultants d'une session : données chargées et résultats filtrés
+
+    Les résultats filtrés référencent les dictionnaires des données chargées (pas de copie).
+    """
+
+    def __init__(self, max_entries: int = SESSION_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, List[Dict]]" = OrderedDict()
+        self.hits = 0
+        self.refinements = 0
+        self.misses = 0
+
+    @classmethod
+    def for_session(cls) -> "SessionResultCache":
+        """Cache de la session Streamlit courante (créé au premier appel)"""
+        cache = st.session_state.get(SESSION_CACHE_KEY)
+        if not isinstance(cache, cls):
+            cache = cls()
+            st.session_state[SESSION_CACHE_KEY] = cache
+        return cache
+
+    def get(self, key: Hashable) -> Optional[List[Dict]]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: List[Dict]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def entries(self) -> List[Tuple[Hashable, List[Dict]]]:
+        """Entrées, de la plus ancienne à la plus récente"""
+        return list(self._entries.items())
+
 
 class AdvancedUIFilters:
     """Classe pour gérer les filtres avancés de l'interface utilisateur"""
@@ -203,8 +260,82 @@ class AdvancedUIFilters:
             elif key == "experience_max":
                 self.filters[key] = 50.0
 
-    def apply_filters(self, data: List[Dict]) -> List[Dict]:
-        """Applique les filtres aux données"""
+    def _filters_key(self) -> Tuple:
+        return tuple(sorted(self.filters.items()))
+
+    def refines(self, previous: Dict[str, Any]) -> bool:
+        """
+        Vrai si les filtres courants ne font que restreindre les filtres previous
+
+        Le résultat courant est alors inclus dans celui de previous : il peut être
+        calculé à partir de ce résultat plutôt que de la liste complète.
+        """
+        old_term = (previous.get("search_term") or "").lower()
+        if old_term not in (self.filters["search_term"] or "").lower():
+            return False
+
+        for name in EQUALITY_FILTERS:
+            if previous.get(name) and previous.get(name) != self.filters[name]:
+                return False
+        if previous.get("availability_filter") is not None:
+            if previous.get("availability_filter") != self.filters["availability_filter"]:
+                return False
+
+        for name, direction in RANGE_FILTERS:
+            old_bound, new_bound = previous.get(name), self.filters[name]
+            if old_bound is None:
+                continue
+            if new_bound is None:
+                return False
+            if (new_bound < old_bound) if direction == "min" else (new_bound > old_bound):
+                return False
+
+        # Non appliqués par le filtrage : ils doivent seulement être identiques
+        return all(previous.get(name) == self.filters[name] for name in ("date_entree_min", "date_entree_max"))
+
+    def apply_filters(
+        self,
+        data: List[Dict],
+        dataset_key: Optional[Hashable] = None,
+        cache: Optional[SessionResultCache] = None,
+    ) -> List[Dict]:
+        """
+        Applique les filtres aux données
+
+        Args:
+            data: Lignes à filtrer
+            dataset_key: Identifie les données (recherche, génération des tables) : le résultat
+                est alors conservé dans la session, et un filtre seulement restreint (ex: salaire
+                minimum relevé) repart du plus petit résultat plus large déjà calculé
+            cache: Cache des résultats (celui de la session Streamlit par défaut)
+        """
+        if not data or dataset_key is None:
+            return self._filter(data)
+
+        cache = cache if cache is not None else SessionResultCache.for_session()
+        key = ("filters", dataset_key, self._filters_key())
+        result = cache.get(key)
+        if result is not None:
+            cache.hits += 1
+            return result
+
+        base = data
+        for cached_key, cached_result in cache.entries():
+            if cached_key[:2] != key[:2] or len(cached_result) >= len(base):
+                continue
+            if self.refines(dict(cached_key[2])):
+                base = cached_result
+        if base is data:
+            cache.misses += 1
+        else:
+            cache.refinements += 1
+
+        result = self._filter(base)
+        cache.put(key, result)
+        return result
+
+    def _filter(self, data: List[Dict]) -> List[Dict]:
+        """Filtre les lignes (parcours complet)"""
         if not data:
             return data
 
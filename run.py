@@ -3,6 +3,7 @@ Script de lancement de Consultator
 Démarre l'application Streamlit
 """
 
+import argparse
 import os
 import socket
 import subprocess
@@ -27,8 +28,13 @@ def find_available_port(start_port=8501, max_attempts=10):
     return None
 
 
-def run_consultator():
-    """Lance l'application Consultator"""
+def run_consultator(warmup=None):
+    """
+    Lance l'application Consultator
+
+    Args:
+        warmup: Préchauffage du cache (off, startup ou background), CONSULTATOR_CACHE_WARMUP si None
+    """
 
     # Changer vers le répertoire de l'application
     app_dir = os.path.join(os.path.dirname(__file__), "app")
@@ -57,9 +63,14 @@ def run_consultator():
         "--browser.gatherUsageStats=false",
     ]
 
+    env = os.environ.copy()
+    if warmup:
+        env["CONSULTATOR_CACHE_WARMUP"] = warmup
+        print(f"🔥 Préchauffage du cache: {warmup}")
+
     try:
         # Utiliser Popen pour un meilleur contrôle
-        process = subprocess.Popen(cmd)
+        process = subprocess.Popen(cmd, env=env)
         process.wait()
     except KeyboardInterrupt:
         print("\n👋 Arrêt de Consultator...")
@@ -68,4 +79,10 @@ def run_consultator():
 
 
 if __name__ == "__main__":
-    run_consultator()
+    parser = argparse.ArgumentParser(description="Lance Consultator")
+    parser.add_argument(
+        "--warmup",
+        choices=["off", "startup", "background"],
+        help="Préchauffage du cache au démarrage (défaut: CONSULTATOR_CACHE_WARMUP ou off)",
+    )
+    run_consultator(parser.parse_args().warmup)
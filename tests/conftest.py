@@ -81,6 +81,46 @@ def db_session(test_db):
             pass  # Ignorer les erreurs de fermeture
 
 
+@pytest.fixture
+def memory_engine():
+    """Engine SQLite en mémoire avec le schéma complet (connexion unique partagée entre threads)"""
+    from sqlalchemy import create_engine
+    from sqlalchemy import pool
+
+    from app.database.models import Base
+
+    engine = create_engine("sqlite://", poolclass=pool.StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def memory_session_factory(memory_engine):
+    """Factory de sessions sur la base en mémoire de memory_engine"""
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(bind=memory_engine)
+
+
+@pytest.fixture
+def isolated_cache(monkeypatch):
+    """Service de cache isolé (mémoire seule, sans balayage) installé comme service global"""
+    from app.services.cache_service import CacheService
+
+    service = CacheService(sweep_interval=0)
+    service.redis_client = None
+    monkeypatch.setattr("app.services.cache_service._cache_service", service)
+    return service
+
+
+@pytest.fixture
+def enabled_cache(isolated_cache, monkeypatch):
+    """Cache isolé avec la façade de cache activée (désactivée par défaut pendant les tests)"""
+    monkeypatch.setattr("app.services.caching.CACHE_ENABLED", True)
+    return isolated_cache
+
+
 @pytest.fixture
 def sample_consultant_data():
     """Données de test pour un consultant avec email unique"""
@@ -927,6 +967,8 @@ def disable_streamlit_cache():
     try:
         patches.append(patch("streamlit.cache_data", mock_cache_data))
         patches.append(patch("streamlit.cache_resource", mock_cache_resource))
+        # Façade de cache des services : appels directs, comme les caches Streamlit
+        patches.append(patch("app.services.caching.CACHE_ENABLED", False))
 
         # Démarrer les patches
         for p in patches:
@@ -80,17 +80,12 @@ class TestConsultantProfile(BaseUITest):
         show()
         # mock_show_profile.assert_called_once() # Corrected: mock expectation
 
-    @patch("app.pages_modules.consultant_profile.get_database_session")
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
     @patch("app.pages_modules.consultant_profile.st.session_state")
-    def test_show_consultant_profile_not_found(self, mock_session_state, mock_session):
+    def test_show_consultant_profile_not_found(self, mock_session_state, mock_load_profile):
         """Test d'affichage du profil quand consultant non trouvé"""
         mock_session_state.view_consultant_profile = 1
-
-        mock_session_instance = Mock()
-        mock_session_instance.query.return_value.options.return_value.filter.return_value.first.return_value = None
-        mock_session_instance.query.return_value.all.return_value = []
-        mock_session.return_value.__enter__.return_value = mock_session_instance
-        mock_session.return_value.__exit__.return_value = None
+        mock_load_profile.return_value = None
 
         with patch("app.pages_modules.consultant_profile.st.error"), patch(
             "app.pages_modules.consultant_profile.st.warning"
@@ -105,8 +100,9 @@ class TestConsultantProfile(BaseUITest):
             assert 1 == 1  # Test basique Test passes if no exception
 
     @patch("app.pages_modules.consultant_profile.get_database_session")
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
     @patch("app.pages_modules.consultant_profile.st.session_state")
-    def test_show_consultant_profile_success(self, mock_session_state, mock_session):
+    def test_show_consultant_profile_success(self, mock_session_state, mock_load_profile, mock_session):
         """Test d'affichage réussi du profil consultant"""
         mock_session_state.view_consultant_profile = 1
 
@@ -121,17 +117,11 @@ class TestConsultantProfile(BaseUITest):
         mock_consultant.disponibilite = True
         mock_consultant.notes = "Test notes"
         mock_consultant.date_creation = datetime.now()
-        mock_consultant.practice.nom = "Test Practice"
-
-        # Mock practice
-        mock_practice = Mock()
-        mock_practice.nom = "Test Practice"
-        mock_consultant.practice = mock_practice
+        mock_consultant.practice_nom = "Test Practice"
+        mock_load_profile.return_value = mock_consultant
 
         mock_session_instance = Mock()
-        mock_session_instance.query.return_value.options.return_value.filter.return_value.first.return_value = (
-            mock_consultant
-        )
+        mock_session_instance.query.return_value.filter.return_value.first.return_value = mock_consultant
         mock_session.return_value.__enter__.return_value = mock_session_instance
         mock_session.return_value.__exit__.return_value = None
 
@@ -160,12 +150,12 @@ class TestConsultantProfile(BaseUITest):
 
             assert 1 == 1  # Test basique Test passes if no exception
 
-    @patch("app.pages_modules.consultant_profile.get_database_session")
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
     @patch("app.pages_modules.consultant_profile.st.session_state")
-    def test_show_consultant_profile_database_error(self, mock_session_state, mock_session):
+    def test_show_consultant_profile_database_error(self, mock_session_state, mock_load_profile):
         """Test gestion d'erreur de base de données"""
         mock_session_state.view_consultant_profile = 1
-        mock_session.side_effect = Exception("Database error")
+        mock_load_profile.side_effect = Exception("Database error")
 
         with patch("app.pages_modules.consultant_profile.st.error"), patch(
             "app.pages_modules.consultant_profile.st.code"
@@ -488,13 +478,10 @@ class TestConsultantProfile(BaseUITest):
         mock_button.return_value = True
 
         with patch("app.pages_modules.consultant_profile.st.rerun"), patch(
-            "app.pages_modules.consultant_profile.get_database_session"
-        ) as mock_session:
+            "app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle"
+        ) as mock_load_profile:
 
-            mock_session_instance = Mock()
-            mock_session_instance.query.return_value.options.return_value.filter.return_value.first.return_value = None
-            mock_session.return_value.__enter__.return_value = mock_session_instance
-            mock_session.return_value.__exit__.return_value = None
+            mock_load_profile.return_value = None
 
             show_consultant_profile()
 
@@ -0,0 +1,180 @@
+"""
+Tests de l'invalidation automatique du cache au commit SQLAlchemy
+Les écritures sur une vraie base SQLite en mémoire doivent invalider les bons tags
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import update
+
+from app.database.cache_invalidation import tags_for_object
+from app.database.models import BusinessManager
+from app.database.models import Consultant
+from app.database.models import ConsultantBusinessManager
+from app.database.models import Mission
+from app.services.cache_service import cached
+from app.services.caching import cache_data
+
+
+@pytest.fixture
+def session(isolated_cache, memory_session_factory):
+    """Session sur une base en mémoire avec deux consultants (commit initial déjà invalidé)"""
+    session = memory_session_factory()
+    session.add_all(
+        [
+            Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com"),
+            Consultant(id=2, nom="Martin", prenom="Marie", email="marie@test.com"),
+        ]
+    )
+    session.commit()
+    isolated_cache.tag_versions.clear()
+    yield session
+    session.close()
+
+
+def _mission(consultant_id):
+    return Mission(
+        consultant_id=consultant_id,
+        nom_mission="Mission",
+        client="Client",
+        date_debut=date(2024, 1, 1),
+        statut="en_cours",
+    )
+
+
+class TestTagsForObject:
+    """Tags calculés pour un objet mappé"""
+
+    def test_consultant(self):
+        """Un consultant touche les listes, les recherches et ses propres entrées"""
+        assert tags_for_object(Consultant(id=7)) == {"consultants", "search", "consultant:7"}
+
+    def test_child_object(self):
+        """Un objet rattaché touche sa table et son consultant"""
+        assert tags_for_object(_mission(3)) == {"missions", "consultant:3"}
+
+
+class TestInvalidationOnCommit:
+    """Listeners after_flush / after_commit"""
+
+    def test_update_consultant_invalidates_cached_entries(self, isolated_cache, session):
+        """Modifier un consultant rend périmées les entrées qui portent ses tags"""
+        calls = []
+
+        @cached(ttl=3600, tags=("consultants",))
+        def liste():
+            calls.append(1)
+            return len(calls)
+
+        assert liste() == 1
+        assert liste() == 1
+
+        session.get(Consultant, 1).nom = "Durand"
+        session.commit()
+
+        assert liste() == 2
+        assert isolated_cache.tag_versions == {"consultants": 1, "search": 1, "consultant:1": 1}
+
+    def test_mission_reassigned_touches_both_consultants(self, isolated_cache, session):
+        """Une mission réaffectée invalide l'ancien et le nouveau consultant"""
+        mission = _mission(1)
+        session.add(mission)
+        session.commit()
+        isolated_cache.tag_versions.clear()
+
+        mission.consultant_id = 2
+        session.commit()
+
+        assert set(isolated_cache.tag_versions) == {"missions", "consultant:1", "consultant:2"}
+
+    def test_flush_without_commit_waits_for_commit(self, isolated_cache, session):
+        """Rien n'est invalidé avant le commit, ni après un rollback"""
+        session.add(_mission(1))
+        session.flush()
+        assert isolated_cache.tag_versions == {}
+
+        session.rollback()
+        session.commit()
+        assert isolated_cache.tag_versions == {}
+
+    def test_bulk_update_invalidates_every_consultant(self, isolated_cache, session):
+        """Un UPDATE en masse invalide la table et toutes les entrées par consultant"""
+        session.execute(update(Consultant).values(disponibilite=False))
+        session.commit()
+
+        assert set(isolated_cache.tag_versions) == {"consultants", "search", "consultant:*"}
+
+    def test_cache_data_function_invalidated(self, enabled_cache, session):
+        """Une fonction @cache_data est rechargée après un commit sur l'une de ses tables"""
+        calls = []
+
+        @cache_data(ttl=3600, tags=("business_managers", "consultant_business_managers"))
+        def business_managers():
+            calls.append(1)
+            return len(calls)
+
+        business_managers()
+        bm = BusinessManager(nom="Boss", prenom="Anne", email="anne@test.com")
+        session.add(bm)
+        session.commit()
+        business_managers()
+        session.add(ConsultantBusinessManager(consultant_id=1, business_manager_id=bm.id))
+        session.commit()
+        business_managers()
+        session.get(Consultant, 2).prenom = "Marion"
+        session.commit()
+
+        assert business_managers() == 3
+
+    def test_consultant_stats_reloaded_after_mission(
+        self, isolated_cache, session, memory_session_factory, monkeypatch
+    ):
+        """Les statistiques globales comptent les missions : un commit de mission les recharge"""
+        from app.services.cache_service import get_cached_consultant_stats
+
+        monkeypatch.setattr("app.services.consultant_service.get_database_session", memory_session_factory)
+
+        assert get_cached_consultant_stats()["total_missions"] == 0
+        session.add(_mission(1))
+        session.commit()
+
+        stats = get_cached_consultant_stats()
+        assert stats["total_missions"] == 1
+        assert stats["active_missions"] == 1
+
+
+class TestCommitDuringLoad:
+    """TTL longs : un commit pendant le chargement ne doit pas figer l'ancienne valeur"""
+
+    def test_cached_list_reloaded(self, isolated_cache, session, monkeypatch):
+        """Liste en cache 30 minutes : rechargée si un consultant est modifié pendant son calcul"""
+        from app.services.cache_service import get_cached_consultants_list
+        from app.services.consultant_service import ConsultantService
+
+        def get_all_consultants_with_stats(page, per_page):
+            nom = session.get(Consultant, 1).nom
+            if nom == "Dupont":
+                session.get(Consultant, 1).nom = "Durand"
+                session.commit()
+            return [nom]
+
+        monkeypatch.setattr(ConsultantService, "get_all_consultants_with_stats", get_all_consultants_with_stats)
+
+        assert get_cached_consultants_list() == ["Dupont"]
+        assert get_cached_consultants_list() == ["Durand"]
+        assert get_cached_consultants_list() == ["Durand"]
+
+    def test_cache_data_function_reloaded(self, enabled_cache, session):
+        """Fonction @cache_data (TTL 1 heure) : rechargée après un commit survenu pendant son calcul"""
+
+        @cache_data(ttl=3600, tags=("business_managers",))
+        def business_managers():
+            count = session.query(BusinessManager).count()
+            if count == 0:
+                session.add(BusinessManager(nom="Boss", prenom="Anne", email="anne@test.com"))
+                session.commit()
+            return count
+
+        assert business_managers() == 0
+        assert business_managers() == 1
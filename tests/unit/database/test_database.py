@@ -20,9 +20,9 @@ if parent_dir not in sys.path:
 class TestDatabaseModule:
     """Tests pour les fonctions de base de données"""
 
-    @patch("app.database.database.st")
+    @patch("app.database.database.event")
     @patch("app.database.database.create_engine")
-    def test_get_database_engine(self, mock_create_engine, mock_st):
+    def test_get_database_engine(self, mock_create_engine, mock_event):
         """Test de la création de l'engine de base de données"""
         from app.database.database import get_database_engine
 
@@ -48,12 +48,15 @@ class TestDatabaseModule:
         assert "pool_pre_ping" in call_args[1]
         assert "pool_recycle" in call_args[1]
 
+        # Les PRAGMA du profil sont appliqués à chaque connexion
+        mock_event.listen.assert_called_once()
+        assert mock_event.listen.call_args[0][:2] == (mock_engine, "connect")
+
         assert result == mock_engine
 
-    @patch("app.database.database.st")
     @patch("app.database.database.get_database_engine")
     @patch("app.database.database.sessionmaker")
-    def test_get_session_factory(self, mock_sessionmaker, mock_get_engine, mock_st):
+    def test_get_session_factory(self, mock_sessionmaker, mock_get_engine):
         """Test de la création de la factory de sessions"""
         from app.database.database import get_session_factory
 
@@ -139,11 +142,10 @@ class TestDatabaseModule:
         assert "missions" not in result
         assert "practices" not in result
 
-    @patch("app.database.database.st")
     @patch("app.database.database.get_database_engine")
     @patch("app.database.database.Base")
     @patch("app.database.database.is_database_initialized")
-    def test_init_database_success(self, mock_is_initialized, mock_base, mock_get_engine, mock_st):
+    def test_init_database_success(self, mock_is_initialized, mock_base, mock_get_engine):
         """Test de l'initialisation réussie de la base de données"""
         from app.database.database import init_database
 
@@ -167,11 +169,10 @@ class TestDatabaseModule:
         assert result is True
         mock_base.metadata.create_all.assert_called_once_with(bind=mock_engine)
 
-    @patch("app.database.database.st")
     @patch("app.database.database.get_database_engine")
     @patch("app.database.database.Base")
     @patch("app.database.database.is_database_initialized")
-    def test_init_database_error(self, mock_is_initialized, mock_base, mock_get_engine, mock_st):
+    def test_init_database_error(self, mock_is_initialized, mock_base, mock_get_engine):
         """Test de l'initialisation avec erreur"""
         from app.database.database import init_database
 
@@ -194,10 +195,9 @@ class TestDatabaseModule:
 
         assert result is False
 
-    @patch("app.database.database.st")
     @patch("app.database.database.get_database_engine")
     @patch("app.database.database.Base")
-    def test_reset_database(self, mock_base, mock_get_engine, mock_st):
+    def test_reset_database(self, mock_base, mock_get_engine):
         """Test de la remise à zéro de la base de données"""
         from app.database.database import reset_database
 
@@ -212,10 +212,9 @@ class TestDatabaseModule:
         mock_base.metadata.drop_all.assert_called_once_with(bind=mock_engine)
         mock_base.metadata.create_all.assert_called_once_with(bind=mock_engine)
 
-    @patch("app.database.database.st")
     @patch("app.database.database.get_database_engine")
     @patch("app.database.database.Base")
-    def test_reset_database_not_exists(self, mock_base, mock_get_engine, mock_st):
+    def test_reset_database_not_exists(self, mock_base, mock_get_engine):
         """Test de reset quand la DB n'existe pas"""
         from app.database.database import reset_database
 
@@ -0,0 +1,129 @@
+"""
+Tests du système de migrations versionnées (app.database.migrations)
+Simule une base de production ancienne : colonnes, tables et index manquants
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+from sqlalchemy import pool
+from sqlalchemy import select
+from sqlalchemy import text
+
+from app.database import migrations
+from app.database.migrations import MIGRATIONS
+from app.database.migrations import get_migration_status
+from app.database.migrations import get_missing_indexes
+from app.database.migrations import upgrade_database
+from app.database.models import Base
+from app.database.models import SchemaMigration
+
+LEGACY_DROPPED_INDEXES = ("idx_consultant_recherche", "idx_mission_consultant_statut", "idx_competence_type")
+
+
+def _make_engine():
+    return create_engine("sqlite://", poolclass=pool.StaticPool, connect_args={"check_same_thread": False})
+
+
+@pytest.fixture
+def legacy_engine():
+    """Base sans schema_migrations, sans la colonne grade et sans plusieurs index"""
+    engine = _make_engine()
+    tables = [t for t in Base.metadata.sorted_tables if t.name not in ("schema_migrations", "consultant_mission_stats")]
+    Base.metadata.create_all(engine, tables=tables)
+    with engine.begin() as connection:
+        for name in LEGACY_DROPPED_INDEXES:
+            connection.execute(text(f"DROP INDEX {name}"))
+        connection.execute(text("ALTER TABLE consultants DROP COLUMN grade"))
+        connection.execute(
+            text(
+                "INSERT INTO consultants (nom, prenom, email, disponibilite) VALUES ('Dupont', 'Jean', 'j@test.com', 1)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO missions (consultant_id, nom_mission, client, date_debut, taux_journalier) "
+                "VALUES (1, 'Mission', 'Client', '2024-01-01', 650)"
+            )
+        )
+    yield engine
+    engine.dispose()
+
+
+class TestMissingIndexes:
+    """Tests du rapport d'index manquants"""
+
+    def test_reports_indexes_absent_from_live_database(self, legacy_engine):
+        """Les index définis dans models.py et absents de la base sont signalés"""
+        missing = get_missing_indexes(legacy_engine)
+
+        assert {item["index"] for item in missing} == set(LEGACY_DROPPED_INDEXES)
+        recherche = next(item for item in missing if item["index"] == "idx_consultant_recherche")
+        assert recherche == {
+            "table": "consultants",
+            "index": "idx_consultant_recherche",
+            "columns": ["nom", "prenom", "email"],
+        }
+
+    def test_fresh_database_has_every_index(self):
+        """create_all produit tous les index : rien n'est signalé"""
+        engine = _make_engine()
+        Base.metadata.create_all(engine)
+
+        assert get_missing_indexes(engine) == []
+        engine.dispose()
+
+
+class TestUpgradeDatabase:
+    """Tests de l'application des révisions"""
+
+    def test_upgrade_brings_legacy_database_up_to_date(self, legacy_engine):
+        """Tables, colonnes, données et index manquants sont rattrapés et les révisions enregistrées"""
+        status = get_migration_status(legacy_engine)
+        assert status["applied"] == []
+        assert status["pending"] == [m["revision"] for m in MIGRATIONS]
+
+        assert upgrade_database(legacy_engine) is True
+
+        status = get_migration_status(legacy_engine)
+        assert status == {"applied": [m["revision"] for m in MIGRATIONS], "pending": [], "missing_indexes": []}
+        inspector = inspect(legacy_engine)
+        assert inspector.has_table("consultant_mission_stats")
+        assert "grade" in {c["name"] for c in inspector.get_columns("consultants")}
+        with legacy_engine.connect() as connection:
+            assert connection.execute(text("SELECT grade FROM consultants")).scalar() == "Junior"
+            assert connection.execute(text("SELECT tjm FROM missions")).scalar() == 650
+            assert connection.execute(text("SELECT nb_missions FROM consultant_mission_stats")).scalar() == 1
+
+    def test_revisions_are_idempotent(self):
+        """Sur une base déjà à jour, les révisions ne font que s'enregistrer"""
+        engine = _make_engine()
+        Base.metadata.create_all(engine)
+
+        assert upgrade_database(engine) is True
+        migrations._UP_TO_DATE.pop(engine)
+        assert upgrade_database(engine) is True
+
+        with engine.connect() as connection:
+            revisions = connection.execute(select(SchemaMigration.revision)).scalars().all()
+        assert sorted(revisions) == sorted(m["revision"] for m in MIGRATIONS)
+        engine.dispose()
+
+    def test_failed_revision_stops_the_upgrade(self, monkeypatch):
+        """Une révision en échec n'est pas enregistrée et bloque les suivantes"""
+        engine = _make_engine()
+        Base.metadata.create_all(engine)
+        failing = [
+            {"revision": "a", "description": "ok", "upgrade": lambda connection: None},
+            {
+                "revision": "b",
+                "description": "ko",
+                "upgrade": lambda connection: connection.execute(text("SELECT * FROM absente")),
+            },
+            {"revision": "c", "description": "ok", "upgrade": lambda connection: None},
+        ]
+        monkeypatch.setattr(migrations, "MIGRATIONS", failing)
+
+        assert upgrade_database(engine) is False
+        assert get_migration_status(engine)["pending"] == ["b", "c"]
+        engine.dispose()
@@ -0,0 +1,195 @@
+"""
+Tests pour la maintenance des agrégats de missions (consultant_mission_stats)
+Vérifie le recalcul automatique au flush sur une vraie base SQLite en mémoire
+"""
+
+import importlib
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy import pool
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+from app.database import mission_stats
+from app.database.mission_stats import ensure_mission_stats_table
+from app.database.models import Base
+from app.database.models import Consultant
+from app.database.models import ConsultantMissionStats
+from app.database.models import Mission
+
+
+def _make_engine():
+    return create_engine("sqlite://", poolclass=pool.StaticPool, connect_args={"check_same_thread": False})
+
+
+@pytest.fixture
+def stats_session(memory_session_factory):
+    """Session sur une base en mémoire avec deux consultants"""
+    session = memory_session_factory()
+    session.add_all(
+        [
+            Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com"),
+            Consultant(id=2, nom="Martin", prenom="Marie", email="marie@test.com"),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _mission(consultant_id, statut="en_cours", date_fin=None, tjm=None, taux_journalier=None):
+    return Mission(
+        consultant_id=consultant_id,
+        nom_mission="Mission",
+        client="Client",
+        date_debut=date(2024, 1, 1),
+        date_fin=date_fin,
+        statut=statut,
+        tjm=tjm,
+        taux_journalier=taux_journalier,
+    )
+
+
+def _stats(session, consultant_id):
+    session.expire_all()
+    return session.get(ConsultantMissionStats, consultant_id)
+
+
+class TestMissionStatsMaintenance:
+    """Tests du recalcul des agrégats lors des écritures sur Mission"""
+
+    def test_insert_updates_aggregates(self, stats_session):
+        """L'ajout de missions alimente compteurs, dernière date de fin et TJM moyen"""
+        stats_session.add_all(
+            [
+                _mission(1, tjm=500),
+                _mission(1, statut="terminee", date_fin=date(2024, 6, 30), taux_journalier=700),
+                _mission(1, statut="terminee", date_fin=date(2023, 12, 31)),
+            ]
+        )
+        stats_session.commit()
+
+        stats = _stats(stats_session, 1)
+        assert stats.nb_missions == 3
+        assert stats.nb_missions_actives == 1
+        assert stats.derniere_date_fin == date(2024, 6, 30)
+        assert stats.tjm_moyen == pytest.approx(600)
+        assert _stats(stats_session, 2) is None
+
+    def test_update_and_reassignment(self, stats_session):
+        """Un changement de statut ou de consultant recalcule les deux consultants"""
+        mission = _mission(1)
+        stats_session.add(mission)
+        stats_session.commit()
+
+        mission.statut = "terminee"
+        stats_session.commit()
+        assert _stats(stats_session, 1).nb_missions_actives == 0
+
+        mission.consultant_id = 2
+        stats_session.commit()
+        assert _stats(stats_session, 1) is None
+        assert _stats(stats_session, 2).nb_missions == 1
+
+    def test_delete_mission_and_consultant(self, stats_session):
+        """La suppression d'une mission ou du consultant retire les agrégats"""
+        first, second = _mission(1), _mission(2)
+        stats_session.add_all([first, second])
+        stats_session.commit()
+
+        stats_session.delete(first)
+        stats_session.commit()
+        assert _stats(stats_session, 1) is None
+
+        stats_session.delete(stats_session.get(Consultant, 2))
+        stats_session.commit()
+        assert stats_session.query(ConsultantMissionStats).count() == 0
+
+    def test_rollback_discards_aggregates(self, stats_session):
+        """Les agrégats suivent la transaction de l'écriture"""
+        stats_session.add(_mission(1))
+        stats_session.flush()
+        assert _stats(stats_session, 1).nb_missions == 1
+
+        stats_session.rollback()
+        assert _stats(stats_session, 1) is None
+
+
+class TestEnsureMissionStatsTable:
+    """Tests de la mise à niveau des bases créées avant la table d'agrégats"""
+
+    def test_legacy_database_is_backfilled(self):
+        """Une base sans la table continue d'accepter des missions puis est remplie"""
+        engine = _make_engine()
+        tables = [t for t in Base.metadata.sorted_tables if t.name != "consultant_mission_stats"]
+        Base.metadata.create_all(engine, tables=tables)
+        session = sessionmaker(bind=engine)()
+        session.add(Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com"))
+        session.add_all([_mission(1), _mission(1)])
+        session.commit()
+
+        assert ensure_mission_stats_table(engine) is True
+
+        assert inspect(engine).has_table("consultant_mission_stats")
+        assert _stats(session, 1).nb_missions == 2
+        session.close()
+        engine.dispose()
+
+
+class TestSecondModelsCopy:
+    """Modèles importés via "database.models" (seconde copie des classes, cf. pages_modules)"""
+
+    @pytest.fixture
+    def legacy_models(self, stats_session):
+        """Classes de database.models, sans les listeners de la seconde copie du module"""
+        legacy_stats = sys.modules.get("database.mission_stats")
+        listeners = [
+            ("before_flush", "_remember_previous_owners"),
+            ("after_flush", "_refresh_mission_stats_after_flush"),
+        ]
+        if legacy_stats is not None:
+            for name, function in listeners:
+                event.remove(Session, name, getattr(legacy_stats, function))
+        yield importlib.import_module("database.models")
+        if legacy_stats is not None:
+            for name, function in listeners:
+                event.listen(Session, name, getattr(legacy_stats, function))
+
+    def test_missions_of_second_copy(self, stats_session, legacy_models):
+        """Les missions créées avec la seconde copie des classes mettent à jour les agrégats"""
+        mission = legacy_models.Mission(
+            consultant_id=1, nom_mission="Mission", client="Client", date_debut=date(2024, 1, 1), statut="en_cours"
+        )
+        stats_session.add(mission)
+        stats_session.commit()
+        assert _stats(stats_session, 1).nb_missions == 1
+
+        mission.consultant_id = 2
+        stats_session.commit()
+        assert _stats(stats_session, 1) is None
+        assert _stats(stats_session, 2).nb_missions == 1
+
+        stats_session.delete(mission)
+        stats_session.commit()
+        assert stats_session.query(ConsultantMissionStats).count() == 0
+
+    def test_flush_refreshed_once(self, stats_session, monkeypatch):
+        """Avec les deux copies du module chargées, un flush n'est recalculé qu'une fois"""
+        importlib.import_module("database.mission_stats")
+        refreshed = []
+        monkeypatch.setattr(mission_stats, "refresh_mission_stats", lambda connection, ids: refreshed.append(ids))
+        monkeypatch.setattr(
+            sys.modules["database.mission_stats"],
+            "refresh_mission_stats",
+            lambda connection, ids: refreshed.append(ids),
+        )
+
+        stats_session.add(_mission(1))
+        stats_session.commit()
+
+        assert refreshed == [{1}]
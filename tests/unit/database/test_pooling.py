@@ -0,0 +1,174 @@
+"""
+Tests du mode de pool lecteurs / écrivain (CONSULTATOR_DB_POOL_MODE=read_write)
+Vérifie le routage des requêtes, la concurrence des lecteurs et la file de l'écrivain
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import select
+
+from app.database import database
+from app.database.models import Base
+from app.database.models import Consultant
+from app.services.dashboard_service import DashboardDataService
+
+_CACHED = (
+    "get_database_engine",
+    "get_readonly_database_engine",
+    "get_session_factory",
+    "get_readonly_session_factory",
+)
+
+
+def _clear_caches():
+    for name in _CACHED:
+        getattr(database, name).clear()
+
+
+def _session(module):
+    # get_database_session est remplacée par un mock global (conftest) : passer par la factory
+    return module.get_session_factory()()
+
+
+def _serve_file_db(tmp_path, monkeypatch, pool_mode):
+    """Base fichier temporaire avec un consultant, servie dans le mode de pool demandé"""
+    path = str(tmp_path / "pool.db")
+    monkeypatch.setattr(database, "POOL_MODE", pool_mode)
+    monkeypatch.setattr(database, "READ_POOL_SIZE", 3)
+    monkeypatch.setattr(database, "DATABASE_PATH", path)
+    monkeypatch.setattr(database, "DATABASE_URL", f"sqlite:///{path}")
+    _clear_caches()
+
+    Base.metadata.create_all(bind=database.get_database_engine())
+    with _session(database) as session:
+        session.add(Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com"))
+        session.commit()
+
+    yield database
+
+    database.get_database_engine().dispose()
+    database.get_readonly_database_engine().dispose()
+    monkeypatch.undo()
+    _clear_caches()
+
+
+@pytest.fixture
+def read_write_db(tmp_path, monkeypatch):
+    """Base fichier temporaire servie en mode read_write avec 3 lecteurs"""
+    yield from _serve_file_db(tmp_path, monkeypatch, "read_write")
+
+
+@pytest.fixture
+def static_db(tmp_path, monkeypatch):
+    """Base fichier temporaire servie en mode static (connexion d'écriture unique)"""
+    yield from _serve_file_db(tmp_path, monkeypatch, "static")
+
+
+class TestReadWriteRouting:
+    """Tests du routage des requêtes d'une session"""
+
+    def test_selects_use_reader_until_write(self, read_write_db):
+        """Les SELECT vont aux lecteurs, puis à l'écrivain après une écriture"""
+        writer = read_write_db.get_database_engine()
+        reader = read_write_db.get_readonly_database_engine()
+        query = select(Consultant)
+
+        with _session(read_write_db) as session:
+            assert session.get_bind(clause=query) is reader
+            assert session.get(Consultant, 1).nom == "Dupont"
+
+            session.add(Consultant(id=2, nom="Martin", prenom="Marie", email="marie@test.com"))
+            session.flush()
+            assert session.get_bind(clause=query) is writer
+            assert session.scalar(select(Consultant.nom).where(Consultant.id == 2)) == "Martin"
+
+            session.commit()
+            assert session.get_bind(clause=query) is reader
+
+    def test_pool_metrics(self, read_write_db):
+        """Les métriques exposent les emprunts des deux pools"""
+        with _session(read_write_db) as session:
+            session.get(Consultant, 1)
+
+        metrics = read_write_db.get_pool_metrics()
+
+        assert metrics["mode"] == "read_write"
+        assert metrics["reader"]["checkouts"] >= 1
+        assert metrics["writer"]["checkouts"] >= 1
+        assert set(metrics["reader"]) >= {"avg_wait_ms", "max_wait_ms", "waiting", "timeouts"}
+
+    def test_static_mode_metrics(self, monkeypatch):
+        """En mode static, aucune métrique de pool n'est exposée"""
+        monkeypatch.setattr(database, "POOL_MODE", "static")
+
+        assert database.get_pool_metrics() == {"mode": "static"}
+
+
+class TestReadWriteConcurrency:
+    """Tests de la concurrence entre sessions de threads différents"""
+
+    def test_readers_run_in_parallel(self, read_write_db):
+        """Trois lecteurs tiennent chacun une connexion en même temps"""
+        barrier = threading.Barrier(3, timeout=5)
+        errors = []
+
+        def read():
+            try:
+                with _session(read_write_db) as session:
+                    session.get(Consultant, 1)
+                    barrier.wait()
+            except Exception as e:  # pragma: no cover - remonté par l'assertion
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_writers_are_queued(self, read_write_db):
+        """Un second écrivain attend la fin de la transaction du premier"""
+        first_flushed = threading.Event()
+
+        def first_writer():
+            with _session(read_write_db) as session:
+                session.add(Consultant(id=10, nom="A", prenom="A", email="a@test.com"))
+                session.flush()
+                first_flushed.set()
+                time.sleep(0.2)
+                session.commit()
+
+        thread = threading.Thread(target=first_writer)
+        thread.start()
+        first_flushed.wait(timeout=5)
+
+        with _session(read_write_db) as session:
+            # Lecture non bloquée pendant l'écriture en cours
+            assert session.get(Consultant, 10) is None
+            session.add(Consultant(id=11, nom="B", prenom="B", email="b@test.com"))
+            session.commit()
+        thread.join()
+
+        with _session(read_write_db) as session:
+            assert session.scalar(select(Consultant.id).where(Consultant.id == 10)) == 10
+        assert read_write_db.get_pool_metrics()["writer"]["max_wait_ms"] >= 100
+
+
+class TestReportingReads:
+    """Tests des chargements de reporting sur l'engine en lecture seule"""
+
+    def test_dashboard_data_during_write(self, static_db):
+        """Les données des widgets ne voient que l'état validé, sans attendre l'écriture en cours"""
+        with _session(static_db) as session:
+            session.add(Consultant(id=2, nom="Martin", prenom="Marie", email="marie@test.com"))
+            session.flush()
+            data = DashboardDataService.get_intercontrat_data()
+            session.commit()
+
+        assert "error" not in data
+        assert data["total_consultants"] == 1
+        assert DashboardDataService.get_intercontrat_data()["total_consultants"] == 2
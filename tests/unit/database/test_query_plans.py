@@ -0,0 +1,120 @@
+"""
+Tests de non-régression des plans de requête SQLite (EXPLAIN QUERY PLAN)
+Vérifie que les filtres fréquents sur les tables de liaison utilisent leurs index
+"""
+
+import pytest
+from sqlalchemy import and_
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import text
+
+from app.database.models import Base
+from app.database.models import BusinessManager
+from app.database.models import Consultant
+from app.database.models import ConsultantBusinessManager
+from app.database.models import ConsultantCompetence
+from app.database.models import ConsultantLangue
+from app.database.models import Langue
+
+
+@pytest.fixture(scope="module")
+def plan_connection():
+    """Connexion sur un schéma vide créé par create_all"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        yield connection
+    engine.dispose()
+
+
+def _plan(connection, statement) -> str:
+    sql = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+class TestAssociationIndexesQueryPlans:
+    """Les requêtes des services utilisent les index des tables de liaison"""
+
+    def test_active_consultants_of_a_bm(self, plan_connection):
+        """Consultants actifs d'un BM (BusinessManagerService, get_intercontrat_data)"""
+        statement = select(ConsultantBusinessManager.consultant_id).where(
+            ConsultantBusinessManager.business_manager_id == 1,
+            ConsultantBusinessManager.date_fin.is_(None),
+        )
+
+        assert "USING COVERING INDEX idx_cbm_bm_actif" in _plan(plan_connection, statement)
+
+    def test_active_bm_of_a_consultant(self, plan_connection):
+        """BM actuel d'un consultant"""
+        statement = select(ConsultantBusinessManager.business_manager_id).where(
+            ConsultantBusinessManager.consultant_id == 1,
+            ConsultantBusinessManager.date_fin.is_(None),
+        )
+
+        assert "USING COVERING INDEX idx_cbm_consultant_actif" in _plan(plan_connection, statement)
+
+    def test_count_per_bm_join(self, plan_connection):
+        """Comptage des consultants actifs par BM : la liaison est lue par l'index partiel"""
+        statement = (
+            select(BusinessManager.id, func.count(ConsultantBusinessManager.id))
+            .outerjoin(
+                ConsultantBusinessManager,
+                and_(
+                    BusinessManager.id == ConsultantBusinessManager.business_manager_id,
+                    ConsultantBusinessManager.date_fin.is_(None),
+                ),
+            )
+            .group_by(BusinessManager.id)
+        )
+
+        assert "consultant_business_managers USING COVERING INDEX idx_cbm_bm_actif" in _plan(plan_connection, statement)
+
+    def test_bm_history(self, plan_connection):
+        """Historique complet d'un BM, trié par date de début"""
+        statement = (
+            select(ConsultantBusinessManager.id)
+            .where(ConsultantBusinessManager.business_manager_id == 1)
+            .order_by(ConsultantBusinessManager.date_debut)
+        )
+        plan = _plan(plan_connection, statement)
+
+        assert "idx_cbm_bm_historique" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_consultants_with_a_competence(self, plan_connection):
+        """Recherche des consultants possédant une compétence"""
+        statement = (
+            select(Consultant.id)
+            .join(ConsultantCompetence, Consultant.id == ConsultantCompetence.consultant_id)
+            .where(ConsultantCompetence.competence_id == 1)
+        )
+
+        assert "USING COVERING INDEX idx_consultant_competence_competence" in _plan(plan_connection, statement)
+
+    def test_competence_pair_lookup(self, plan_connection):
+        """Vérification d'existence d'un couple consultant / compétence"""
+        statement = select(ConsultantCompetence.id).where(
+            ConsultantCompetence.consultant_id == 1, ConsultantCompetence.competence_id == 2
+        )
+
+        assert "idx_consultant_competence_" in _plan(plan_connection, statement)
+
+    def test_consultants_speaking_a_language(self, plan_connection):
+        """Recherche des consultants parlant une langue"""
+        statement = (
+            select(Consultant.id)
+            .join(ConsultantLangue, Consultant.id == ConsultantLangue.consultant_id)
+            .join(Langue, ConsultantLangue.langue_id == Langue.id)
+            .where(Langue.nom == "Anglais")
+        )
+
+        assert "USING COVERING INDEX idx_consultant_langue_langue" in _plan(plan_connection, statement)
+
+    def test_languages_of_a_consultant(self, plan_connection):
+        """Langues d'un consultant"""
+        statement = select(ConsultantLangue.langue_id).where(ConsultantLangue.consultant_id == 1)
+
+        assert "USING COVERING INDEX idx_consultant_langue_consultant" in _plan(plan_connection, statement)
@@ -0,0 +1,132 @@
+"""
+Tests des fonctions SQL de dates indépendantes du moteur et de la configuration d'URL
+Vérifie la compilation par dialecte et l'exécution réelle sur SQLite
+"""
+
+from datetime import date
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy.dialects import mssql
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from app.database import database
+from app.database.models import BusinessManager
+from app.database.models import Consultant
+from app.database.models import ConsultantBusinessManager
+from app.database.models import Mission
+from app.database.sql_functions import days_between
+from app.database.sql_functions import format_date_fr
+from app.services.dashboard_service import DashboardDataService
+
+
+def _compile(expression, dialect):
+    return str(expression.compile(dialect=dialect))
+
+
+class TestDaysBetween:
+    """Tests de la fonction days_between"""
+
+    def test_compiles_per_dialect(self):
+        """Chaque moteur reçoit sa propre arithmétique de dates"""
+        expression = Mission.tjm * days_between(Mission.date_fin, Mission.date_debut)
+
+        assert "julianday(missions.date_fin) - julianday(missions.date_debut)" in _compile(expression, sqlite.dialect())
+        assert "(CAST(missions.date_fin AS DATE) - CAST(missions.date_debut AS DATE))" in _compile(
+            expression, postgresql.dialect()
+        )
+        assert "DATEDIFF(missions.date_fin, missions.date_debut)" in _compile(expression, mysql.dialect())
+        assert "DATEDIFF(day, missions.date_debut, missions.date_fin)" in _compile(expression, mssql.dialect())
+        assert "julianday" not in _compile(expression, postgresql.dialect())
+
+    def test_executes_on_sqlite(self):
+        """Le nombre de jours est exact et NULL se propage"""
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            days = connection.scalar(select(days_between(literal(date(2024, 3, 1)), literal(date(2024, 2, 1)))))
+            missing = connection.scalar(select(func.coalesce(days_between(literal(None), literal(date.today())), 30)))
+        engine.dispose()
+
+        assert days == 29
+        assert missing == 30
+
+    def test_revenue_by_bm_uses_portable_duration(self, memory_session_factory):
+        """Le CA estimé par BM est calculé avec la durée réelle des missions"""
+        debut = date.today() - timedelta(days=20)
+        with memory_session_factory() as session:
+            session.add(BusinessManager(id=1, nom="Bm", prenom="Anne", email="bm@test.com", actif=True))
+            session.add(Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com"))
+            session.add(ConsultantBusinessManager(consultant_id=1, business_manager_id=1, date_debut=debut))
+            session.add_all(
+                [
+                    Mission(
+                        consultant_id=1,
+                        nom_mission="M1",
+                        client="C",
+                        date_debut=debut,
+                        date_fin=debut + timedelta(days=10),
+                        statut="termine",
+                        tjm=500,
+                    ),
+                    Mission(
+                        consultant_id=1, nom_mission="M2", client="C", date_debut=debut, statut="en_cours", tjm=400
+                    ),
+                ]
+            )
+            session.commit()
+
+        with patch("app.services.dashboard_service.get_readonly_session", side_effect=memory_session_factory):
+            data = DashboardDataService.get_revenue_by_bm_data(period_months=3)
+
+        assert data["bm_revenues"][0]["missions_count"] == 2
+        assert data["bm_revenues"][0]["ca_estime"] == pytest.approx(500 * 10 + 400 * 30)
+
+
+class TestDatabaseUrl:
+    """Tests de la sélection du moteur à partir de l'URL"""
+
+    def test_sqlite_is_default(self):
+        """Sans variable d'environnement, la base est le fichier SQLite local"""
+        assert database.is_sqlite_url()
+        assert database.get_database_location() == database.DATABASE_PATH
+
+    def test_server_url_hides_password(self, monkeypatch):
+        """Une URL serveur est reconnue et affichée sans mot de passe"""
+        monkeypatch.setattr(database, "DATABASE_URL", "postgresql+psycopg2://app:secret@db:5432/consultator")
+        monkeypatch.setattr(database, "POOL_MODE", "read_write")
+
+        assert not database.is_sqlite_url()
+        assert not database.is_read_write_mode()
+        assert "secret" not in database.get_database_location()
+        assert database.get_database_location().startswith("postgresql+psycopg2://app:")
+
+
+class TestFormatDateFr:
+    """Tests de la fonction format_date_fr"""
+
+    def test_compiles_per_dialect(self):
+        """Le format JJ/MM/AAAA est rendu avec la fonction native de chaque moteur"""
+        expression = format_date_fr(Mission.date_fin)
+
+        assert "strftime('%d/%m/%Y', missions.date_fin)" in _compile(expression, sqlite.dialect())
+        assert "to_char(missions.date_fin, 'DD/MM/YYYY')" in _compile(expression, postgresql.dialect())
+        assert "DATE_FORMAT(missions.date_fin, %s)" in _compile(expression, mysql.dialect())
+        assert "FORMAT(missions.date_fin, 'dd/MM/yyyy')" in _compile(expression, mssql.dialect())
+
+    def test_executes_on_sqlite(self):
+        """La date est formatée et NULL se propage"""
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            formatted = connection.scalar(select(format_date_fr(literal(date(2024, 3, 1)))))
+            missing = connection.scalar(select(func.coalesce(format_date_fr(literal(None)), "ASAP")))
+        engine.dispose()
+
+        assert formatted == "01/03/2024"
+        assert missing == "ASAP"
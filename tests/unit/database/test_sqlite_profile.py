@@ -0,0 +1,91 @@
+"""
+Tests du profil de performance SQLite (PRAGMA à la connexion) et du mode lecture seule
+Vérifie sur un vrai fichier SQLite que les lecteurs ne sont pas bloqués par un écrivain
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.database.database import _install_sqlite_pragmas
+from app.database.database import get_sqlite_pragmas
+
+
+def _engine(url, readonly=False, profile="performance"):
+    engine = create_engine(url, connect_args={"check_same_thread": False, "timeout": 1})
+    return _install_sqlite_pragmas(engine, get_sqlite_pragmas(profile, readonly=readonly))
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    """Fichier SQLite avec une table remplie, ouvert avec le profil performance"""
+    path = tmp_path / "profil.db"
+    engine = _engine(f"sqlite:///{path}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)"))
+        connection.execute(text("INSERT INTO t (v) VALUES ('a'), ('b')"))
+    yield path, engine
+    engine.dispose()
+
+
+class TestSqlitePragmas:
+    """Tests de la sélection et de l'application des PRAGMA"""
+
+    def test_performance_profile_is_applied(self, db_file):
+        """WAL, synchronous NORMAL, cache, mmap, temp_store et busy_timeout"""
+        _, engine = db_file
+        with engine.connect() as connection:
+            pragma = lambda name: connection.execute(text(f"PRAGMA {name}")).scalar()  # noqa: E731
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("cache_size") == -64000
+            assert pragma("temp_store") == 2  # MEMORY
+            assert pragma("busy_timeout") == 30000
+            assert pragma("mmap_size") > 0
+
+    def test_readonly_pragmas(self):
+        """Le mode lecture seule retire journal_mode et ajoute query_only"""
+        pragmas = get_sqlite_pragmas("performance", readonly=True)
+
+        assert "journal_mode" not in pragmas
+        assert pragmas["query_only"] == "ON"
+        assert pragmas["synchronous"] == "NORMAL"
+
+    def test_unknown_profile_falls_back(self):
+        """Un profil inconnu retombe sur le profil performance"""
+        assert get_sqlite_pragmas("inexistant") == get_sqlite_pragmas("performance")
+        assert get_sqlite_pragmas("safe")["journal_mode"] == "DELETE"
+
+
+class TestReadonlyConnections:
+    """Tests des connexions de reporting en lecture seule"""
+
+    def test_readonly_rejects_writes(self, db_file):
+        """Une connexion de reporting ne peut pas écrire"""
+        path, _ = db_file
+        reader = _engine(f"sqlite:///file:{path}?mode=ro&uri=true", readonly=True)
+
+        with reader.connect() as connection:
+            assert connection.execute(text("SELECT count(*) FROM t")).scalar() == 2
+            with pytest.raises(OperationalError):
+                connection.execute(text("INSERT INTO t (v) VALUES ('c')"))
+        reader.dispose()
+
+    def test_readers_not_blocked_by_writer(self, db_file):
+        """Un lecteur lit le dernier instantané validé pendant une écriture en cours"""
+        path, writer_engine = db_file
+        reader = _engine(f"sqlite:///file:{path}?mode=ro&uri=true", readonly=True)
+
+        with writer_engine.connect() as writer:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO t (v) VALUES ('c')"))
+
+            with reader.connect() as connection:
+                assert connection.execute(text("SELECT count(*) FROM t")).scalar() == 2
+
+            writer.execute(text("COMMIT"))
+
+        with reader.connect() as connection:
+            assert connection.execute(text("SELECT count(*) FROM t")).scalar() == 3
+        reader.dispose()
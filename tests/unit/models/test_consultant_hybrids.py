@@ -0,0 +1,168 @@
+"""
+Tests des propriétés hybrides de Consultant (experience_annees, statut_societe, date_disponibilite)
+Vérifie que l'expression SQL donne le même résultat que le calcul Python et son usage par ConsultantService
+"""
+
+from datetime import date
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import pool
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base
+from app.database.models import Consultant
+from app.database.models import Mission
+from app.services.consultant_service import ConsultantService
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def hybrid_db():
+    """Base en mémoire couvrant chaque cas de disponibilité, d'expérience et de statut"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=pool.StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as session:
+        session.add_all(
+            [
+                # En mission jusqu'à J+40 (et J+10), 8 ans d'expérience, départ prévu
+                Consultant(
+                    id=1,
+                    nom="Occupe",
+                    prenom="Long",
+                    email="long@test.com",
+                    disponibilite=False,
+                    date_premiere_mission=TODAY - timedelta(days=8 * 365),
+                    date_sortie_societe=TODAY + timedelta(days=90),
+                ),
+                # Disponible malgré une mission future, 2 ans d'expérience, parti
+                Consultant(
+                    id=2,
+                    nom="Dispo",
+                    prenom="Flag",
+                    email="flag@test.com",
+                    disponibilite=True,
+                    date_premiere_mission=TODAY - timedelta(days=2 * 365),
+                    date_sortie_societe=TODAY - timedelta(days=1),
+                ),
+                # Occupé mais missions terminées, sans expérience renseignée, en poste
+                Consultant(id=3, nom="Libre", prenom="Fin", email="fin@test.com", disponibilite=False),
+                # En mission jusqu'à J+5, 5 ans d'expérience
+                Consultant(
+                    id=4,
+                    nom="Occupe",
+                    prenom="Court",
+                    email="court@test.com",
+                    disponibilite=False,
+                    date_premiere_mission=TODAY - timedelta(days=5 * 365),
+                ),
+            ]
+        )
+        session.flush()
+        for consultant_id, fin in ((1, 40), (1, 10), (2, 30), (3, -10), (4, 5)):
+            session.add(
+                Mission(
+                    consultant_id=consultant_id,
+                    nom_mission=f"Mission {consultant_id}",
+                    client="Client",
+                    date_debut=TODAY - timedelta(days=100),
+                    date_fin=TODAY + timedelta(days=fin),
+                )
+            )
+        session.commit()
+
+    yield session_factory
+    engine.dispose()
+
+
+class TestConsultantHybridExpressions:
+    """Les expressions SQL reproduisent les propriétés Python"""
+
+    def test_sql_matches_python(self, hybrid_db):
+        """Chaque champ calculé a la même valeur en SQL et en Python"""
+        query = select(
+            Consultant.id,
+            Consultant.experience_annees,
+            Consultant.statut_societe,
+            Consultant.date_fin_engagement,
+            Consultant.date_disponibilite.label("date_disponibilite"),
+        ).order_by(Consultant.id)
+
+        with hybrid_db() as session:
+            rows = session.execute(query).all()
+            consultants = session.scalars(select(Consultant).order_by(Consultant.id)).all()
+            expected = [
+                (c.id, c.experience_annees, c.statut_societe, c.date_fin_engagement, c.date_disponibilite)
+                for c in consultants
+            ]
+
+        assert [tuple(row) for row in rows] == expected
+        assert expected[0][2:] == (
+            "Départ prévu",
+            TODAY + timedelta(days=40),
+            (TODAY + timedelta(days=40)).strftime("%d/%m/%Y"),
+        )
+        assert expected[1][2:] == ("Parti", None, "ASAP")
+        assert expected[2][1:] == (0, "En poste", None, "ASAP")
+
+    def test_filter_and_sort_in_sql(self, hybrid_db):
+        """Filtre sur l'expérience et tri sur la fin d'engagement directement en base"""
+        with hybrid_db() as session:
+            experimentes = session.scalars(
+                select(Consultant.id).where(Consultant.experience_annees >= 4).order_by(Consultant.id)
+            ).all()
+            par_fin = session.scalars(
+                select(Consultant.id)
+                .where(Consultant.date_fin_engagement.isnot(None))
+                .order_by(Consultant.date_fin_engagement)
+            ).all()
+            en_poste = session.scalars(select(Consultant.id).where(Consultant.statut_societe == "En poste")).all()
+
+        assert experimentes == [1, 4]
+        assert par_fin == [4, 1]
+        assert sorted(en_poste) == [3, 4]
+
+
+class TestConsultantServiceProfileFilters:
+    """Filtres available_before / min_experience de ConsultantService"""
+
+    def test_available_before_and_min_experience(self, hybrid_db):
+        """Les filtres sont appliqués par la base sur les listes paginées"""
+        with patch("app.services.consultant_service.get_database_session", side_effect=hybrid_db):
+            dispo_j7 = ConsultantService.get_all_consultants_with_stats(available_before=TODAY + timedelta(days=7))
+            seniors = ConsultantService.get_consultants_page_by_cursor(sort_by="id", min_experience=4)
+            streamed = list(
+                ConsultantService.iter_consultants_with_stats(
+                    available_before=TODAY + timedelta(days=7), min_experience=1
+                )
+            )
+
+        assert sorted(c["id"] for c in dispo_j7) == [2, 3, 4]
+        assert [c["id"] for c in seniors["consultants"]] == [1, 4]
+        assert [c["id"] for c in streamed] == [2, 4]
+
+    def test_experience_comes_from_query(self, hybrid_db):
+        """L'expérience n'est plus recalculée en Python ligne par ligne"""
+        with patch("app.services.consultant_service.get_database_session", side_effect=hybrid_db), patch.object(
+            ConsultantService, "_calculate_experience_years"
+        ) as calculate:
+            consultants = ConsultantService.get_all_consultants_with_stats()
+            results = ConsultantService.search_consultants_optimized("Occupe")
+
+        calculate.assert_not_called()
+        by_id = {c["id"]: c for c in consultants}
+        assert by_id[1]["experience_annees"] == pytest.approx(8 * 365 / 365.25, abs=0.1)
+        assert by_id[1]["statut_societe"] == "Départ prévu"
+        assert by_id[1]["date_fin_engagement"] == TODAY + timedelta(days=40)
+        assert by_id[3]["experience_formatted"] == "N/A"
+        assert {c["id"] for c in results} == {1, 4}
@@ -64,15 +64,14 @@ class TestConsultantProfile:
         # Mock du session state
         mock_st.session_state.view_consultant_profile = 999
 
-        # Mock de la session et de la query qui retourne None
+        # Mock du profil complet introuvable et de la liste des consultants existants
         mock_session = MagicMock()
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.options.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
+        mock_session.query.return_value.all.return_value = []
 
-        with patch("app.pages_modules.consultant_profile.get_database_session") as mock_get_session:
+        with patch(
+            "app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle"
+        ) as mock_load_profile, patch("app.pages_modules.consultant_profile.get_database_session") as mock_get_session:
+            mock_load_profile.return_value = None
             mock_get_session.return_value.__enter__.return_value = mock_session
             mock_get_session.return_value.__exit__.return_value = None
 
@@ -92,8 +91,8 @@ class TestConsultantProfile:
         mock_st.session_state.view_consultant_profile = 1
 
         # Mock de la session qui l�ve une exception
-        with patch("app.pages_modules.consultant_profile.get_database_session") as mock_get_session:
-            mock_get_session.return_value.__enter__.side_effect = Exception("Erreur DB")
+        with patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle") as mock_load_profile:
+            mock_load_profile.side_effect = Exception("Erreur DB")
 
             from app.pages_modules.consultant_profile import (
                 show_consultant_profile,
@@ -365,15 +365,12 @@ class TestShowCVTabs(unittest.TestCase):
 class TestLoadConsultantData(unittest.TestCase):
     """Tests pour _load_consultant_data"""
 
-    @patch("app.pages_modules.consultant_profile.get_database_session")
-    def test_load_consultant_data_found(self, mock_session):
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
+    def test_load_consultant_data_found(self, mock_load_profile):
         """Test chargement consultant trouvé"""
         from app.pages_modules.consultant_profile import _load_consultant_data
 
-        mock_db = MagicMock()
-        mock_session.return_value.__enter__.return_value = mock_db
-
-        mock_consultant = Mock(
+        mock_profile = Mock(
             id=1,
             prenom="Jean",
             nom="Dupont",
@@ -383,41 +380,35 @@ class TestLoadConsultantData(unittest.TestCase):
             disponibilite=True,
             notes="Notes",
             date_creation="2020-01-01",
-            practice=Mock(nom="Data"),
+            practice_nom="Data",
         )
+        mock_load_profile.return_value = mock_profile
 
-        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_consultant
+        consultant_data, profile = _load_consultant_data(1)
 
-        consultant_data, _ = _load_consultant_data(1)
-
-        self.assertIsNotNone(consultant_data)
+        mock_load_profile.assert_called_once_with(1)
+        self.assertIs(profile, mock_profile)
         self.assertEqual(consultant_data["id"], 1)
         self.assertEqual(consultant_data["nom"], "Dupont")
         self.assertEqual(consultant_data["practice_name"], "Data")
 
-    @patch("app.pages_modules.consultant_profile.get_database_session")
-    def test_load_consultant_data_not_found(self, mock_session):
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
+    def test_load_consultant_data_not_found(self, mock_load_profile):
         """Test chargement consultant non trouvé"""
         from app.pages_modules.consultant_profile import _load_consultant_data
 
-        mock_db = MagicMock()
-        mock_session.return_value.__enter__.return_value = mock_db
-
-        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
+        mock_load_profile.return_value = None
 
         consultant_data, _ = _load_consultant_data(999)
 
         self.assertIsNone(consultant_data)
 
-    @patch("app.pages_modules.consultant_profile.get_database_session")
-    def test_load_consultant_data_no_practice(self, mock_session):
+    @patch("app.pages_modules.consultant_profile.ConsultantService.load_profile_bundle")
+    def test_load_consultant_data_no_practice(self, mock_load_profile):
         """Test chargement consultant sans practice"""
         from app.pages_modules.consultant_profile import _load_consultant_data
 
-        mock_db = MagicMock()
-        mock_session.return_value.__enter__.return_value = mock_db
-
-        mock_consultant = Mock(
+        mock_load_profile.return_value = Mock(
             id=2,
             prenom="Marie",
             nom="Martin",
@@ -427,11 +418,9 @@ class TestLoadConsultantData(unittest.TestCase):
             disponibilite=False,
             notes="",
             date_creation="2021-01-01",
-            practice=None,
+            practice_nom=None,
         )
 
-        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_consultant
-
         consultant_data, _ = _load_consultant_data(2)
 
         self.assertIsNotNone(consultant_data)
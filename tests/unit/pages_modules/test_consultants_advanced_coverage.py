@@ -66,43 +66,37 @@ class TestConsultantsModuleAdvancedCoverage(unittest.TestCase):
         self.mock_col.__enter__ = MagicMock(return_value=self.mock_col)
         self.mock_col.__exit__ = MagicMock(return_value=None)
 
-    @patch("app.pages_modules.consultants.get_database_session")
-    def test_load_consultant_data_success(self, mock_get_session):
+    @patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle")
+    def test_load_consultant_data_success(self, mock_load_profile):
         """Test _load_consultant_data avec succès"""
         consultant_id = 1
 
-        # Setup mock session et query
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__.return_value = mock_session
-        mock_query = mock_session.query.return_value
-        mock_query.options.return_value.filter.return_value.first.return_value = self.mock_consultant
+        # Setup mock du profil complet
+        mock_load_profile.return_value = self.mock_consultant
 
         from app.pages_modules.consultants import _load_consultant_data
 
         result = _load_consultant_data(consultant_id)
 
         # Vérifications
-        mock_session.query.assert_called_once()
+        mock_load_profile.assert_called_once_with(consultant_id)
         self.assertIsInstance(result, tuple)
         self.assertEqual(len(result), 2)
 
-    @patch("app.pages_modules.consultants.get_database_session")
-    def test_load_consultant_data_not_found(self, mock_get_session):
+    @patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle")
+    def test_load_consultant_data_not_found(self, mock_load_profile):
         """Test _load_consultant_data consultant non trouvé"""
         consultant_id = 999
 
-        # Setup mock session et query
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__.return_value = mock_session
-        mock_query = mock_session.query.return_value
-        mock_query.options.return_value.filter.return_value.first.return_value = None
+        # Setup mock du profil complet
+        mock_load_profile.return_value = None
 
         from app.pages_modules.consultants import _load_consultant_data
 
         result = _load_consultant_data(consultant_id)
 
         # Vérifications
-        mock_session.query.assert_called_once()
+        mock_load_profile.assert_called_once_with(consultant_id)
         self.assertIsInstance(result, tuple)
         self.assertEqual(result, (None, None))
 
@@ -76,16 +76,10 @@ class TestConsultantsFixedCoverage(unittest.TestCase):
     def test_load_consultant_data_success(self):
         """Test _load_consultant_data avec succès"""
         consultant_id = 1
-        mock_practice = MagicMock()
-        mock_practice.nom = "Practice Test"
-        self.mock_consultant.practice = mock_practice
+        self.mock_consultant.practice_nom = "Practice Test"
 
-        with patch("app.pages_modules.consultants.get_database_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.query.return_value.options.return_value.filter.return_value.first.return_value = (
-                self.mock_consultant
-            )
-            mock_get_session.return_value.__enter__.return_value = mock_session
+        with patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle") as mock_load_profile:
+            mock_load_profile.return_value = self.mock_consultant
 
             from app.pages_modules.consultants import _load_consultant_data
 
@@ -102,10 +96,8 @@ class TestConsultantsFixedCoverage(unittest.TestCase):
         """Test _load_consultant_data consultant non trouvé"""
         consultant_id = 999
 
-        with patch("app.pages_modules.consultants.get_database_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
-            mock_get_session.return_value.__enter__.return_value = mock_session
+        with patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle") as mock_load_profile:
+            mock_load_profile.return_value = None
 
             from app.pages_modules.consultants import _load_consultant_data
 
@@ -54,8 +54,7 @@ class TestConsultantsSimpleCoverage:
         """Test _load_consultant_data() succès - couvre lignes 141-158"""
         from app.pages_modules.consultants import _load_consultant_data
 
-        with patch("app.pages_modules.consultants.get_database_session") as mock_get_session:
-            mock_session = MagicMock()
+        with patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle") as mock_load_profile:
             mock_consultant = MagicMock()
             mock_consultant.id = 123
             mock_consultant.prenom = "Jean"
@@ -66,15 +65,9 @@ class TestConsultantsSimpleCoverage:
             mock_consultant.disponibilite = True
             mock_consultant.notes = "Test notes"
             mock_consultant.date_creation = MagicMock()
+            mock_consultant.practice_nom = "Test Practice"
 
-            mock_practice = MagicMock()
-            mock_practice.nom = "Test Practice"
-            mock_consultant.practice = mock_practice
-
-            mock_session.query.return_value.options.return_value.filter.return_value.first.return_value = (
-                mock_consultant
-            )
-            mock_get_session.return_value.__enter__.return_value = mock_session
+            mock_load_profile.return_value = mock_consultant
 
             result_data, result_consultant = _load_consultant_data(123)
 
@@ -89,10 +82,8 @@ class TestConsultantsSimpleCoverage:
         """Test _load_consultant_data() consultant non trouvé - couvre lignes 141-158"""
         from app.pages_modules.consultants import _load_consultant_data
 
-        with patch("app.pages_modules.consultants.get_database_session") as mock_get_session:
-            mock_session = MagicMock()
-            mock_session.query.return_value.options.return_value.filter.return_value.first.return_value = None
-            mock_get_session.return_value.__enter__.return_value = mock_session
+        with patch("app.pages_modules.consultants.ConsultantService.load_profile_bundle") as mock_load_profile:
+            mock_load_profile.return_value = None
 
             result_data, result_consultant = _load_consultant_data(999)
 
@@ -86,8 +86,9 @@ class TestShowConsultantDocuments:
 
     @patch("app.pages_modules.documents_functions.st")
     @patch("app.pages_modules.documents_functions.show_existing_documents")
-    def test_show_consultant_documents_large_file(self, mock_show_existing, mock_st):
-        """Test avec un gros fichier"""
+    def test_show_consultant_documents_large_file(self, mock_show_existing, mock_st, tmp_path, monkeypatch):
+        """Test avec un gros fichier (sauvegardé dans un répertoire temporaire)"""
+        monkeypatch.setattr("app.pages_modules.documents_functions.DocumentService.UPLOAD_DIR", tmp_path)
         mock_consultant = MagicMock()
         mock_consultant.id = 1
         mock_consultant.prenom = "Jean"
@@ -114,6 +115,8 @@ class TestShowConsultantDocuments:
         mock_st.metric.assert_called()
         # Check that metrics were called for name, size, and type selection
         assert mock_st.metric.call_count >= 2
+        # Le document est écrit dans le répertoire temporaire, pas dans data/uploads
+        assert len(list(tmp_path.glob("Jean_Dupont_*.pdf"))) == 1
 
 
 class TestSaveConsultantDocument:
@@ -64,13 +64,9 @@ class TestBusinessManagerService(BaseServiceTest):
         assert result[1]["prenom"] == "Marie"
         assert result[1]["nom"] == "Martin"
 
-    @patch("app.services.business_manager_service.st")
     @patch("app.services.business_manager_service.get_database_session")
-    def test_get_all_business_managers_database_error(self, mock_session, mock_st):
+    def test_get_all_business_managers_database_error(self, mock_session):
         """Test récupération Business Managers - erreur base de données"""
-        # Mock streamlit cache - return the function itself for decorator behavior
-        mock_st.cache_data = MagicMock(return_value=lambda func: func)
-
         # Mock session qui lève une exception SQLAlchemyError
         from sqlalchemy.exc import SQLAlchemyError
 
@@ -0,0 +1,88 @@
+"""
+Tests des codecs du niveau Redis (sérialisation binaire, compression, clé versionnée)
+"""
+
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.services.cache_codec import CacheCodec
+from app.services.cache_codec import JsonSerializer
+from app.services.cache_codec import get_codec
+from app.services.cache_service import CacheService
+
+ROWS = [
+    {
+        "id": i,
+        "nom": f"Consultant {i}",
+        "date_entree_societe": date(2020, 1, 1 + i % 28),
+        "derniere_maj": datetime(2024, 5, 1, 12, 30),
+        "salaire_actuel": Decimal("55000.50"),
+    }
+    for i in range(200)
+]
+
+
+class TestCacheCodec:
+    """Tests de CacheCodec"""
+
+    def test_binary_default_round_trips_types(self):
+        """Le codec par défaut restitue date, datetime et Decimal"""
+        codec = get_codec("pickle")
+        assert codec.decode(codec.encode(ROWS)) == ROWS
+
+    def test_json_is_lossy(self):
+        """Le format JSON historique rend les dates en chaînes"""
+        codec = CacheCodec(JsonSerializer())
+        assert codec.decode(codec.encode(ROWS))[0]["date_entree_societe"] == "2020-01-01"
+
+    def test_compression_above_threshold(self):
+        """Seules les valeurs au-delà du seuil sont compressées"""
+        codec = CacheCodec(compression="zlib", compress_min_bytes=1024)
+        small = codec.encode({"total": 3})
+        large = codec.encode(ROWS)
+
+        assert small[:1] == b"\x00"
+        assert large[:1] == b"\x01"
+        assert len(large) < len(CacheCodec(compression="none").encode(ROWS)) / 2
+        assert codec.decode(large) == ROWS
+
+    def test_unknown_codec_falls_back_to_pickle(self):
+        """Un codec indisponible est remplacé par pickle"""
+        assert get_codec("inconnu").key_suffix == "@pickle-v5"
+
+    def test_msgpack_round_trips_types(self):
+        """msgpack (optionnel) restitue les types étendus"""
+        pytest.importorskip("msgpack")
+        codec = get_codec("msgpack")
+        assert codec.decode(codec.encode(ROWS)) == ROWS
+
+
+class TestRedisTier:
+    """Intégration dans CacheService"""
+
+    def test_redis_hit_returns_same_types_as_memory(self):
+        """Un succès Redis renvoie les mêmes types qu'un succès mémoire"""
+        store = {}
+
+        class FakeRedis:
+            def setex(self, key, ttl, value):
+                store[key] = value
+
+            def get(self, key):
+                return store.get(key)
+
+        service = CacheService(sweep_interval=0)
+        service.redis_client = FakeRedis()
+        service.set("consultator:liste:a", ROWS)
+        service.memory_cache.clear()
+
+        assert service.get("consultator:liste:a") == ROWS
+        assert list(store) == ["consultator:liste:a@pickle-v5"]
+
+    def test_key_depends_on_codec(self):
+        """Changer de codec change la clé Redis : pas de relecture d'un autre format"""
+        service = CacheService(sweep_interval=0, codec=CacheCodec(JsonSerializer()))
+        assert service.redis_key("consultator:liste:a") == "consultator:liste:a@json-v1"
@@ -0,0 +1,236 @@
+"""
+Tests des lectures et écritures groupées du cache (get_many / set_many, variantes asyncio)
+Un faux client Redis en mémoire compte les allers-retours réseau
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.cache_service import TAG_CONSULTANTS
+from app.services.cache_service import CacheService
+from app.services.dashboard_service import DashboardDataService
+from app.services.widget_factory import WidgetFactory
+
+
+class FakePipeline:
+    """Pipeline : les commandes sont envoyées en un seul aller-retour à execute()"""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def mget(self, keys):
+        self.commands.append(("mget", keys))
+
+    def setex(self, key, ttl, value):
+        self.commands.append(("setex", key, ttl, value))
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def execute(self):
+        self.redis_client.round_trips += 1
+        return [getattr(self.redis_client, "_" + name)(*args) for name, *args in self.commands]
+
+
+class FakeRedis:
+    """Sous-ensemble de redis.Redis utilisé par CacheService"""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    def _mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def _setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def _incr(self, key):
+        self.store[key] = str(int(self.store.get(key) or 0) + 1).encode()
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return self._mget(keys)
+
+    def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self._setex(key, ttl, value)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return super().execute()
+
+
+class FakeAsyncRedis(FakeRedis):
+    """Sous-ensemble de redis.asyncio.Redis"""
+
+    async def mget(self, keys):
+        return super().mget(keys)
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self)
+
+
+def _service(redis_client=None):
+    service = CacheService(sweep_interval=0)
+    service.redis_client = redis_client
+    return service
+
+
+class TestGetSetMany:
+    """Tests de get_many / set_many"""
+
+    def test_memory_only(self):
+        """Sans Redis, les valeurs viennent du niveau mémoire ; les absentes sont omises"""
+        service = _service()
+        service.set_many({"consultator:a:1": 1, "consultator:a:2": 2}, ttl=60)
+
+        assert service.get_many(["consultator:a:1", "consultator:a:2", "consultator:a:3"]) == {
+            "consultator:a:1": 1,
+            "consultator:a:2": 2,
+        }
+
+    def test_single_round_trip_with_tags(self):
+        """Valeurs et générations des tags sont lues dans un seul pipeline"""
+        redis_client = FakeRedis()
+        writer = _service(redis_client)
+        writer.set_many({f"consultator:w:{i}": i for i in range(6)}, ttl=60, tags=[TAG_CONSULTANTS])
+        reader = _service(redis_client)
+
+        redis_client.round_trips = 0
+        values = reader.get_many([f"consultator:w:{i}" for i in range(6)], tags=[TAG_CONSULTANTS])
+
+        assert values == {f"consultator:w:{i}": i for i in range(6)}
+        assert redis_client.round_trips == 1
+
+    def test_invalidated_values_are_missing(self):
+        """Une valeur dont un tag a été invalidé n'est pas renvoyée"""
+        redis_client = FakeRedis()
+        service = _service(redis_client)
+        service.set("consultator:w:0", "ancienne", ttl=60, tags=[TAG_CONSULTANTS])
+        service.invalidate_tags(TAG_CONSULTANTS)
+
+        assert service.get_many(["consultator:w:0"], tags=[TAG_CONSULTANTS]) == {}
+        assert "consultator:w:0" not in service.memory_cache
+
+    def test_async_variants(self):
+        """aget_many / aset_many utilisent le client asyncio"""
+        redis_client = FakeAsyncRedis()
+        service = _service()
+        service.async_redis_client = redis_client
+
+        async def scenario():
+            await service.aset_many({"consultator:w:0": {"total": 3}}, ttl=60, tags=[TAG_CONSULTANTS])
+            service.memory_cache.clear()
+            redis_client.round_trips = 0
+            return await service.aget_many(["consultator:w:0"], tags=[TAG_CONSULTANTS])
+
+        assert asyncio.run(scenario()) == {"consultator:w:0": {"total": 3}}
+        assert redis_client.round_trips == 1
+
+
+class TestDashboardPrefetch:
+    """Données d'un dashboard de 6 widgets"""
+
+    WIDGETS = [
+        ("intercontrat_rate", {}),
+        ("consultants_sans_mission", {"bm_filter": 4}),
+        ("revenue_by_bm", {"period_months": 3}),
+        ("global_kpis", {}),
+        ("intercontrat_trend", {}),
+        ("top_bm_performance", {"period_months": 6}),
+    ]
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        """Remplace les calculs de DashboardDataService en comptant les appels"""
+        calls = []
+
+        def get_intercontrat_data(bm_filter=None):
+            calls.append(("intercontrat", bm_filter))
+            return {"taux_intercontrat": 10, "bm_filter": bm_filter}
+
+        def get_revenue_by_bm_data(period_months=3):
+            calls.append(("revenue", period_months))
+            return {"bm_revenues": [], "period_months": period_months}
+
+        monkeypatch.setattr(DashboardDataService, "get_intercontrat_data", staticmethod(get_intercontrat_data))
+        monkeypatch.setattr(DashboardDataService, "get_revenue_by_bm_data", staticmethod(get_revenue_by_bm_data))
+        return calls
+
+    def test_cached_dashboard_in_one_round_trip(self, loads, monkeypatch):
+        """Dashboard en cache : un seul aller-retour Redis et aucun calcul"""
+        redis_client = FakeRedis()
+        monkeypatch.setattr("app.services.cache_service._cache_service", _service(redis_client))
+
+        WidgetFactory.prefetch_data(self.WIDGETS)
+        assert len(loads) == 6  # 7 appels, dont intercontrat() partagé par global_kpis et intercontrat_trend
+        loads.clear()
+
+        monkeypatch.setattr("app.services.cache_service._cache_service", _service(redis_client))
+        redis_client.round_trips = 0
+        WidgetFactory.prefetch_data(self.WIDGETS)
+
+        assert loads == []
+        assert redis_client.round_trips == 1
+
+    def test_widgets_read_prefetched_data(self, loads, isolated_cache):
+        """Dans le bloc prefetched, les widgets lisent les données préchargées"""
+        with WidgetFactory.prefetched(self.WIDGETS):
+            loads.clear()
+            data = WidgetFactory._load_data(DashboardDataService.get_intercontrat_data, 4)
+
+        assert data == {"taux_intercontrat": 10, "bm_filter": 4}
+        assert loads == []
+        assert WidgetFactory._load_data(DashboardDataService.get_intercontrat_data, 4)["bm_filter"] == 4
+        assert loads == [("intercontrat", 4)]
+
+    def test_invalidation_during_prefetch(self, loads, isolated_cache, monkeypatch):
+        """Un commit pendant le calcul des données rend les valeurs préchargées périmées"""
+
+        def get_intercontrat_data(bm_filter=None):
+            loads.append(("intercontrat", bm_filter))
+            isolated_cache.invalidate_tags(TAG_CONSULTANTS)
+            return {"taux_intercontrat": 10}
+
+        monkeypatch.setattr(DashboardDataService, "get_intercontrat_data", staticmethod(get_intercontrat_data))
+        widgets = [("intercontrat_trend", {})]
+
+        WidgetFactory.prefetch_data(widgets)
+        WidgetFactory.prefetch_data(widgets)
+
+        assert loads == [("intercontrat", None), ("intercontrat", None)]
+
+    def test_failed_calls_left_to_widgets(self, loads, isolated_cache, monkeypatch):
+        """Un calcul en échec n'est ni préchargé ni mis en cache, les autres widgets le sont"""
+
+        def get_intercontrat_data(bm_filter=None):
+            loads.append(("intercontrat", bm_filter))
+            if bm_filter == 4:
+                raise RuntimeError("base indisponible")
+            return {"taux_intercontrat": 0, "error": "base indisponible"}
+
+        monkeypatch.setattr(DashboardDataService, "get_intercontrat_data", staticmethod(get_intercontrat_data))
+
+        data = WidgetFactory.prefetch_data(self.WIDGETS)
+
+        assert list(data.values()) == [
+            {"bm_revenues": [], "period_months": 3},
+            {"bm_revenues": [], "period_months": 1},
+            {"bm_revenues": [], "period_months": 6},
+        ]
+        loads.clear()
+        with WidgetFactory.prefetched(self.WIDGETS):
+            assert loads == [("intercontrat", None), ("intercontrat", 4), ("intercontrat", None)]
+            with pytest.raises(RuntimeError):
+                WidgetFactory._load_data(DashboardDataService.get_intercontrat_data, 4)
@@ -3,7 +3,6 @@ Tests unitaires pour le service de cache
 Couvre toutes les fonctionnalités du CacheService
 """
 
-import json
 import time
 import unittest.mock
 from unittest.mock import MagicMock
@@ -12,7 +11,12 @@ from unittest.mock import patch
 import pytest
 
 from app.services.cache_service import CacheService
+from app.services.cache_service import TAG_CONSULTANTS
+from app.services.cache_service import TAG_MISSIONS
+from app.services.cache_service import TAG_PRACTICES
+from app.services.cache_service import TAG_SEARCH
 from app.services.cache_service import cached
+from app.services.cache_service import consultant_tags
 from app.services.cache_service import get_cache_service
 from app.services.cache_service import get_cached_consultant_stats
 from app.services.cache_service import get_cached_consultants_list
@@ -22,6 +26,7 @@ from app.services.cache_service import invalidate_consultant_cache
 from app.services.cache_service import invalidate_mission_cache
 from app.services.cache_service import invalidate_practice_cache
 from app.services.cache_service import invalidate_search_cache
+from app.services.memory_cache import MemoryCache
 
 
 class TestCacheService:
@@ -37,7 +42,7 @@ class TestCacheService:
             cache = CacheService()
             assert cache.redis_client is None
             assert cache.default_ttl == 300
-            assert isinstance(cache.memory_cache, dict)
+            assert isinstance(cache.memory_cache, MemoryCache)
 
     def test_init_with_redis_success(self):
         """Test d'initialisation avec Redis disponible"""
@@ -127,11 +132,11 @@ class TestCacheService:
         """Test de récupération depuis Redis"""
         mock_redis = MagicMock()
         self.cache_service.redis_client = mock_redis
-        mock_redis.get.return_value = json.dumps({"data": "redis_value"})
+        mock_redis.get.return_value = self.cache_service.codec.encode({"data": "redis_value"})
 
         result = self.cache_service.get("test_key")
         assert result == {"data": "redis_value"}
-        mock_redis.get.assert_called_once_with("test_key")
+        mock_redis.get.assert_called_once_with(self.cache_service.redis_key("test_key"))
 
     def test_get_from_redis_with_error(self):
         """Test de récupération depuis Redis avec erreur"""
@@ -170,7 +175,9 @@ class TestCacheService:
         assert result is True
 
         # Vérifier l'appel Redis
-        mock_redis.setex.assert_called_once_with(key, 120, json.dumps(value, default=str))
+        mock_redis.setex.assert_called_once_with(
+            self.cache_service.redis_key(key), 120, self.cache_service.codec.encode(value)
+        )
 
     def test_set_in_redis_with_error(self):
         """Test de stockage dans Redis avec erreur"""
@@ -202,7 +209,7 @@ class TestCacheService:
 
         result = self.cache_service.delete("test_key")
         assert result is True
-        mock_redis.delete.assert_called_once_with("test_key")
+        mock_redis.delete.assert_called_once_with(self.cache_service.redis_key("test_key"))
 
     def test_delete_from_both_caches(self):
         """Test de suppression des deux caches"""
@@ -219,7 +226,7 @@ class TestCacheService:
         result = self.cache_service.delete(key)
         assert result is True
         assert key not in self.cache_service.memory_cache
-        mock_redis.delete.assert_called_once_with(key)
+        mock_redis.delete.assert_called_once_with(self.cache_service.redis_key(key))
 
     def test_clear_pattern_memory_only(self):
         """Test de suppression par pattern (mémoire uniquement)"""
@@ -376,92 +383,92 @@ class TestGlobalCacheFunctions:
         assert "consultator:post:1" in cache_service.memory_cache
 
     def test_invalidate_consultant_cache_all(self):
-        """Test d'invalidation du cache consultant (tous)"""
+        """Test d'invalidation de tout le cache consultant (listes et entrées par consultant)"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
-        cache_service = get_cache_service()
-        cache_service.memory_cache = {
-            "consultator:get_consultants:abc": {"data": "consultants"},
-            "consultator:get_user:123": {"data": "user"},
-        }
+        service = get_cache_service()
+        service.redis_client = None
+        service.set("consultator:get_consultants:abc", "consultants", tags=[TAG_CONSULTANTS])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_mission:1", "mission1", tags=[TAG_MISSIONS])
 
         invalidate_consultant_cache()
 
-        # Vérifier que seules les clés consultant ont été supprimées
-        assert len(cache_service.memory_cache) == 1
-        assert "consultator:get_user:123" in cache_service.memory_cache
+        assert service.get("consultator:get_consultants:abc") is None
+        assert service.get("consultator:get_consultant:1") is None
+        assert service.get("consultator:get_mission:1") == "mission1"  # Ne devrait pas être invalidé
 
     def test_invalidate_consultant_cache_specific(self):
-        """Test d'invalidation du cache consultant (spécifique)"""
+        """Test d'invalidation du cache pour un consultant spécifique"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
-        cache_service = get_cache_service()
-        cache_service.memory_cache = {
-            "consultator:get_consultant_123:abc": {"data": "consultant123"},
-            "consultator:get_consultant_456:def": {"data": "consultant456"},
-            "consultator:get_user:123": {"data": "user"},
-        }
+        service = get_cache_service()
+        service.redis_client = None
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_consultant:2", "consultant2", tags=consultant_tags(2))
+        service.set("consultator:get_consultants:abc", "consultants", tags=[TAG_CONSULTANTS])
+        service.set("consultator:get_mission:1", "mission1", tags=[TAG_MISSIONS])
 
-        invalidate_consultant_cache(123)
+        invalidate_consultant_cache(consultant_id=1)
 
-        assert "consultator:get_consultant_123:abc" not in cache_service.memory_cache
-        assert "consultator:get_consultant_456:def" in cache_service.memory_cache
-        assert "consultator:get_user:123" in cache_service.memory_cache
+        assert service.get("consultator:get_consultant:1") is None
+        assert service.get("consultator:get_consultants:abc") is None  # La liste contient le consultant 1
+        assert service.get("consultator:get_consultant:2") == "consultant2"
+        assert service.get("consultator:get_mission:1") == "mission1"
 
     def test_invalidate_mission_cache(self):
-        """Test d'invalidation du cache mission"""
+        """Test d'invalidation du cache des missions"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
-        cache_service = get_cache_service()
-        cache_service.memory_cache = {
-            "consultator:get_missions_123:abc": {"data": "missions123"},
-            "consultator:get_other:def": {"data": "other"},
-        }
+        service = get_cache_service()
+        service.redis_client = None
+        service.set("consultator:get_missions:abc", "missions", tags=[TAG_MISSIONS])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_consultant:2", "consultant2", tags=consultant_tags(2))
 
-        invalidate_mission_cache(123)
+        invalidate_mission_cache(1)
 
-        assert "consultator:get_missions_123:abc" not in cache_service.memory_cache
-        assert "consultator:get_other:def" in cache_service.memory_cache
+        assert service.get("consultator:get_missions:abc") is None
+        assert service.get("consultator:get_consultant:1") is None  # Le profil contient ses missions
+        assert service.get("consultator:get_consultant:2") == "consultant2"
 
     def test_invalidate_practice_cache(self):
-        """Test d'invalidation du cache practice"""
+        """Test d'invalidation du cache des practices"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
-        cache_service = get_cache_service()
-        cache_service.memory_cache = {
-            "consultator:get_practices:abc": {"data": "practices"},
-            "consultator:get_other:def": {"data": "other"},
-        }
+        service = get_cache_service()
+        service.redis_client = None
+        service.set("consultator:get_practices:abc", "practices", tags=[TAG_PRACTICES])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
 
         invalidate_practice_cache()
 
-        assert "consultator:get_practices:abc" not in cache_service.memory_cache
-        assert "consultator:get_other:def" in cache_service.memory_cache
+        assert service.get("consultator:get_practices:abc") is None
+        assert service.get("consultator:get_consultant:1") == "consultant1"
 
     def test_invalidate_search_cache(self):
-        """Test d'invalidation du cache recherche"""
+        """Test d'invalidation du cache de recherche"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
-        cache_service = get_cache_service()
-        cache_service.memory_cache = {
-            "consultator:search_consultants:abc": {"data": "search_results"},
-            "consultator:get_other:def": {"data": "other"},
-        }
+        service = get_cache_service()
+        service.redis_client = None
+        service.set("consultator:search_consultants:abc", "search1", tags=[TAG_SEARCH])
+        service.set("consultator:get_other:def", "other")
 
         invalidate_search_cache()
 
-        assert "consultator:search_consultants:abc" not in cache_service.memory_cache
-        assert "consultator:get_other:def" in cache_service.memory_cache
+        assert service.get("consultator:search_consultants:abc") is None
+        assert service.get("consultator:get_other:def") == "other"
 
 
 class TestCachedFunctions:
@@ -0,0 +1,134 @@
+"""
+Tests des statistiques du cache par espace de noms (succès, échecs, évictions, latences)
+"""
+
+import time
+from unittest.mock import MagicMock
+
+from app.services.cache_service import CacheService
+from app.services.cache_service import cached
+from app.services.cache_stats import CacheStatistics
+from app.services.cache_stats import namespace_of
+from app.services.cache_stats import percentile
+
+
+def _service(**kwargs):
+    service = CacheService(sweep_interval=0, **kwargs)
+    service.redis_client = None
+    return service
+
+
+class TestCacheStatistics:
+    """Tests du collecteur CacheStatistics"""
+
+    def test_namespace_of(self):
+        """L'espace de noms est le nom de la fonction (préfixe compris) sans le hash"""
+        assert namespace_of("consultator:get_cached_consultant_stats:abc123") == "get_cached_consultant_stats"
+        assert namespace_of("consultator:stats:get_total:abc123") == "stats:get_total"
+        assert namespace_of("autre_cle") == "autre_cle"
+
+    def test_percentile(self):
+        """Percentile au rang le plus proche"""
+        samples = list(range(1, 101))
+        assert percentile(samples, 0.5) == 50
+        assert percentile(samples, 0.95) == 95
+        assert percentile([], 0.5) == 0.0
+
+    def test_time_saved_and_ranking(self):
+        """Le temps économisé vaut succès × durée moyenne de chargement ; tri par rentabilité"""
+        statistics = CacheStatistics()
+        for _ in range(4):
+            statistics.record_lookup("consultator:lent:h", "memory", 0.001, hit=True)
+        statistics.record_miss("consultator:lent:h")
+        statistics.record_load("consultator:lent:h", 0.5)
+        statistics.record_miss("consultator:rapide:h")
+        statistics.record_load("consultator:rapide:h", 0.01)
+
+        rows = statistics.namespaces()
+
+        assert [row["namespace"] for row in rows] == ["lent", "rapide"]
+        assert rows[0]["hits"] == 4 and rows[0]["misses"] == 1
+        assert rows[0]["hit_rate"] == 80.0
+        assert rows[0]["time_saved_s"] == 2.0
+        assert rows[0]["memory_p50_ms"] == 1.0
+        assert rows[1]["time_saved_s"] == 0
+
+
+class TestCacheServiceStats:
+    """Les opérations de CacheService alimentent les statistiques"""
+
+    def test_memory_hits_misses_and_evictions(self):
+        """Succès, échecs, écritures et évictions LRU sont comptés par espace de noms"""
+        service = _service(max_entries=2)
+        for name in ("a", "b", "c"):
+            service.set(f"consultator:liste:{name}", [name])
+        service.get("consultator:liste:c")
+        service.get("consultator:liste:a")  # évincée
+        service.get("consultator:recherche:x")
+
+        by_namespace = {row["namespace"]: row for row in service.get_stats()["namespaces"]}
+        assert by_namespace["liste"]["sets"] == 3
+        assert by_namespace["liste"]["evictions"] == 1
+        assert by_namespace["liste"]["memory_hits"] == 1
+        assert by_namespace["liste"]["misses"] == 1
+        assert by_namespace["recherche"]["misses"] == 1
+        assert service.get_stats()["memory_cache"]["hit_rate"] == round(100 / 3, 1)
+
+    def test_redis_hits_are_separated(self):
+        """Un succès Redis est compté sur le niveau Redis avec sa latence"""
+        service = _service()
+        service.redis_client = MagicMock()
+        service.redis_client.get.return_value = service.codec.encode({"total": 3})
+
+        assert service.get("consultator:stats:h") == {"total": 3}
+
+        totals = service.get_stats()["totals"]
+        assert totals["redis_hits"] == 1 and totals["memory_hits"] == 0
+        assert totals["redis_p95_ms"] >= 0
+
+    def test_cached_decorator_records_load_time(self, monkeypatch):
+        """Le décorateur mesure le chargement : les succès suivants économisent ce temps"""
+        service = _service()
+        monkeypatch.setattr("app.services.cache_service._cache_service", service)
+
+        @cached(ttl=60, key_prefix="test")
+        def chargement_lent():
+            time.sleep(0.02)
+            return 42
+
+        for _ in range(3):
+            assert chargement_lent() == 42
+
+        row = service.get_stats()["namespaces"][0]
+        assert row["namespace"] == "test:chargement_lent"
+        assert (row["hits"], row["misses"]) == (2, 1)
+        assert row["avg_load_ms"] >= 20
+        assert row["time_saved_s"] >= 0.04
+
+        service.reset_stats()
+        assert service.get_stats()["namespaces"] == []
+
+
+class TestCacheStatisticsPanel:
+    """Panneau d'administration des outils de maintenance"""
+
+    def test_panel_lists_namespaces(self, monkeypatch):
+        """Le panneau affiche un tableau par fonction et remet les compteurs à zéro"""
+        from app.pages_modules import dashboard_page
+
+        service = _service()
+        service.set("consultator:stats:h", {"total": 1})
+        service.get("consultator:stats:h")
+        monkeypatch.setattr("app.services.cache_service._cache_service", service)
+        mock_st = MagicMock()
+        mock_st.columns.return_value = [MagicMock() for _ in range(4)]
+        mock_st.button.return_value = True
+        monkeypatch.setattr(dashboard_page, "st", mock_st)
+
+        dashboard_page.show_cache_statistics()
+
+        table = mock_st.dataframe.call_args[0][0]
+        assert list(table["Fonction"]) == ["stats"]
+        assert list(table["Succès mémoire"]) == [1]
+        mock_st.rerun.assert_called_once()
+        assert service.get_stats()["namespaces"] == []
@@ -0,0 +1,175 @@
+"""
+Tests de l'invalidation du cache par tags (générations)
+Un faux client Redis en mémoire simule le partage des générations entre processus
+"""
+
+from app.services.cache_service import TAG_CONSULTANTS
+from app.services.cache_service import CacheService
+from app.services.cache_service import cached
+from app.services.cache_service import consultant_tags
+
+
+class FakeRedis:
+    """Sous-ensemble de redis.Redis utilisé par CacheService"""
+
+    def __init__(self):
+        self.store = {}
+        self.commands = []
+
+    def get(self, key):
+        self.commands.append("GET")
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.commands.append("SETEX")
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+    def mget(self, keys):
+        self.commands.append("MGET")
+        return [self.store.get(key) for key in keys]
+
+    def incr(self, key):
+        self.commands.append("INCR")
+        self.store[key] = str(int(self.store.get(key) or 0) + 1).encode()
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS ne doit pas être utilisé pour invalider")
+
+    def scan_iter(self, match=None, count=None):
+        prefix = (match or "*").rstrip("*")
+        return [key for key in list(self.store) if key.startswith(prefix)]
+
+    def delete(self, *keys):
+        self.commands.append("DEL")
+        for key in keys:
+            self.store.pop(key, None)
+
+    def flushdb(self):
+        raise AssertionError("FLUSHDB effacerait les générations de tags")
+
+
+def _service(redis_client=None):
+    service = CacheService(sweep_interval=0)
+    service.redis_client = redis_client
+    return service
+
+
+class TestTagInvalidation:
+    """Tests de CacheService.invalidate_tags"""
+
+    def test_memory_only(self):
+        """Sans Redis, invalider un tag rend périmées les seules entrées qui le portent"""
+        service = _service()
+        service.set("consultator:liste:a", [1, 2], tags=[TAG_CONSULTANTS])
+        service.set("consultator:profil:42", {"id": 42}, tags=consultant_tags(42))
+        service.set("consultator:profil:7", {"id": 7}, tags=consultant_tags(7))
+
+        assert service.invalidate_tags("consultant:42") == 1
+
+        assert service.get("consultator:profil:42") is None
+        assert service.get("consultator:profil:7") == {"id": 7}
+        assert service.get("consultator:liste:a") == [1, 2]
+        assert "consultator:profil:42" not in service.memory_cache
+
+    def test_new_value_after_invalidation_is_served(self):
+        """Une valeur écrite après l'invalidation porte la nouvelle génération"""
+        service = _service()
+        service.set("consultator:liste:a", "v1", tags=[TAG_CONSULTANTS])
+        service.invalidate_tags(TAG_CONSULTANTS)
+        service.set("consultator:liste:a", "v2", tags=[TAG_CONSULTANTS])
+
+        assert service.get("consultator:liste:a") == "v2"
+
+    def test_generations_shared_through_redis(self):
+        """Une invalidation dans un processus est vue par les autres, sans KEYS"""
+        redis_client = FakeRedis()
+        writer = _service(redis_client)
+        reader = _service(redis_client)
+        writer.set("consultator:liste:a", [1, 2], tags=[TAG_CONSULTANTS])
+        assert reader.get("consultator:liste:a") == [1, 2]
+
+        reader.invalidate_tags(TAG_CONSULTANTS)
+
+        assert writer.get("consultator:liste:a") is None
+        assert redis_client.store["consultator:tag:consultants"] == b"1"
+        assert writer.get_stats()["totals"]["invalidations"] == 1
+
+    def test_clear_keeps_generations(self):
+        """Vider le cache ne remet pas les générations à 0 : une entrée périmée le reste"""
+        redis_client = FakeRedis()
+        writer = _service(redis_client)
+        other = _service(redis_client)
+        writer.set("consultator:liste:a", "v1", tags=[TAG_CONSULTANTS])
+        other.invalidate_tags(TAG_CONSULTANTS)
+
+        assert other.clear() is True
+
+        assert redis_client.store["consultator:tag:consultants"] == b"1"
+        assert writer.redis_key("consultator:liste:a") not in redis_client.store
+        # L'entrée du cache mémoire de l'autre processus porte la génération 0
+        assert writer.get("consultator:liste:a") is None
+
+    def test_untagged_redis_values_unchanged(self):
+        """Les valeurs sans tags sont stockées dans Redis sans enveloppe"""
+        redis_client = FakeRedis()
+        service = _service(redis_client)
+        service.set("consultator:simple:a", {"total": 3})
+
+        stored = redis_client.store[service.redis_key("consultator:simple:a")]
+        assert service.codec.decode(stored) == {"total": 3}
+        assert "MGET" not in redis_client.commands
+        assert service.get("consultator:simple:a") == {"total": 3}
+
+
+class TestCachedTags:
+    """Tags du décorateur @cached"""
+
+    def test_tags_from_arguments(self, isolated_cache):
+        """Les tags peuvent dépendre des arguments de l'appel"""
+        calls = []
+
+        @cached(ttl=600, tags=lambda consultant_id: consultant_tags(consultant_id))
+        def get_profile(consultant_id):
+            calls.append(consultant_id)
+            return {"id": consultant_id}
+
+        get_profile(1)
+        get_profile(2)
+        isolated_cache.invalidate_tags("consultant:1")
+        get_profile(1)
+        get_profile(2)
+
+        assert calls == [1, 2, 1]
+
+    def test_invalidation_during_load(self, isolated_cache):
+        """Un commit pendant le chargement rend le résultat périmé dès l'appel suivant"""
+        database = {"value": "old"}
+
+        @cached(ttl=600, tags=(TAG_CONSULTANTS,))
+        def load_value():
+            value = database["value"]
+            # Écriture commitée pendant le chargement, après la lecture
+            database["value"] = "new"
+            isolated_cache.invalidate_tags(TAG_CONSULTANTS)
+            return value
+
+        assert load_value() == "old"
+        assert load_value() == "new"
+
+    def test_snapshot_stored_by_set_many(self):
+        """set/set_many enregistrent les générations lues avant le calcul"""
+        service = _service(FakeRedis())
+        tag_versions = service.get_tag_versions([TAG_CONSULTANTS])
+        service.invalidate_tags(TAG_CONSULTANTS)
+
+        service.set("consultator:a", 1, tags=[TAG_CONSULTANTS], tag_versions=tag_versions)
+        service.set_many({"consultator:b": 2}, tags=[TAG_CONSULTANTS], tag_versions=tag_versions)
+        service.memory_cache.clear()
+
+        assert service.get_many(["consultator:a", "consultator:b"]) == {}
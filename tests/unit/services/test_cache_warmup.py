@@ -0,0 +1,121 @@
+"""
+Tests du préchauffage du cache au démarrage
+Classement des tâches par les statistiques du cache, historique enregistré, thread de fond
+"""
+
+import pytest
+
+from app.services import cache_warmup
+
+
+@pytest.fixture
+def service(isolated_cache, monkeypatch, tmp_path):
+    """Cache isolé, tâches et historique vides (fichier d'historique temporaire)"""
+    monkeypatch.setattr(cache_warmup, "_tasks", [])
+    monkeypatch.setattr(cache_warmup, "_history", {})
+    monkeypatch.setattr(cache_warmup, "HISTORY_PATH", str(tmp_path / "cache_warmup_stats.json"))
+    return isolated_cache
+
+
+def _record_hits(cache_service, namespace, hits, load_seconds):
+    key = f"consultator:{namespace}:abc"
+    cache_service.statistics.record_load(key, load_seconds)
+    for _ in range(hits):
+        cache_service.statistics.record_lookup(key, "memory", 0.0001, hit=True)
+
+
+def _names(tasks):
+    return [task.name for task in tasks]
+
+
+class TestRanking:
+    """Classement des tâches"""
+
+    def test_default_order_without_statistics(self, service):
+        """Sans statistiques, l'ordre d'enregistrement est conservé"""
+        for name in ("a", "b", "c"):
+            cache_warmup.register_warmup_task(name, lambda: None, f"ns_{name}")
+
+        assert _names(cache_warmup.rank_tasks(5)) == ["a", "b", "c"]
+        assert _names(cache_warmup.rank_tasks(2)) == ["a", "b"]
+
+    def test_most_time_saved_first(self, service):
+        """Les espaces de noms qui économisent le plus de temps passent devant"""
+        for name in ("a", "b", "c"):
+            cache_warmup.register_warmup_task(name, lambda: None, f"ns_{name}")
+        cache_warmup.register_warmup_task("sans_stats", lambda: None)
+        _record_hits(service, "ns_b", hits=10, load_seconds=0.5)
+        _record_hits(service, "ns_c", hits=50, load_seconds=0.01)
+
+        assert _names(cache_warmup.rank_tasks(5)) == ["b", "c", "a", "sans_stats"]
+
+    def test_history_of_previous_runs(self, service, monkeypatch):
+        """L'historique classe les tâches dès le démarrage, atténué face aux statistiques récentes"""
+        monkeypatch.setattr(cache_warmup, "_history", {"ns_b": {"hits": 100, "time_saved_s": 8.0}})
+        for name in ("a", "b"):
+            cache_warmup.register_warmup_task(name, lambda: None, f"ns_{name}")
+        assert _names(cache_warmup.rank_tasks(1)) == ["b"]
+
+        _record_hits(service, "ns_a", hits=10, load_seconds=0.5)
+        assert _names(cache_warmup.rank_tasks(1)) == ["a"]
+
+    def test_register_replaces_same_name(self, service):
+        """Réenregistrer une tâche remplace la précédente"""
+        cache_warmup.register_warmup_task("a", lambda: 1)
+        cache_warmup.register_warmup_task("a", lambda: 2)
+
+        assert [task.loader() for task in cache_warmup.get_warmup_tasks()] == [2]
+
+
+class TestWarmUp:
+    """Exécution des tâches"""
+
+    def test_failed_task_does_not_stop_warmup(self, service):
+        """Une tâche en erreur est signalée, les suivantes s'exécutent"""
+        calls = []
+
+        def failing():
+            raise RuntimeError("base indisponible")
+
+        cache_warmup.register_warmup_task("erreur", failing)
+        cache_warmup.register_warmup_task("stats", lambda: calls.append("stats"))
+
+        assert set(cache_warmup.warm_up(5)) == {"stats"}
+        assert calls == ["stats"]
+
+    def test_history_round_trip(self, service, tmp_path):
+        """Les statistiques enregistrées sont relues au démarrage suivant"""
+        _record_hits(service, "ns_a", hits=4, load_seconds=0.25)
+        cache_warmup.save_history()
+
+        assert cache_warmup.load_history() == {"ns_a": {"hits": 4, "time_saved_s": 1.0}}
+        assert cache_warmup.load_history(str(tmp_path / "absent.json")) == {}
+
+    def test_background_single_pass(self, service, monkeypatch):
+        """Passe unique dans un thread daemon, un seul thread à la fois"""
+        monkeypatch.setattr(cache_warmup.atexit, "register", lambda function: None)
+        monkeypatch.setattr(cache_warmup, "_warmup_started", False)
+        monkeypatch.setattr(cache_warmup, "_warmup_thread", None)
+        calls = []
+        cache_warmup.register_warmup_task("stats", lambda: calls.append("stats"))
+
+        assert cache_warmup.start_background_warmup(top_n=5, interval=0)
+        cache_warmup._warmup_thread.join(5)
+
+        assert calls == ["stats"]
+        assert not cache_warmup.start_configured_warmup("off")
+
+    def test_startup_once_per_process(self, service, monkeypatch):
+        """Chaque rerun rappelle main() : une seule passe, même une fois la première terminée"""
+        monkeypatch.setattr(cache_warmup.atexit, "register", lambda function: None)
+        monkeypatch.setattr(cache_warmup, "_warmup_started", False)
+        monkeypatch.setattr(cache_warmup, "_warmup_thread", None)
+        calls = []
+        cache_warmup.register_warmup_task("stats", lambda: calls.append("stats"))
+
+        assert cache_warmup.start_configured_warmup("startup")
+        cache_warmup._warmup_thread.join(5)
+        assert not cache_warmup.start_configured_warmup("startup")
+        assert not cache_warmup.start_configured_warmup("background")
+
+        assert calls == ["stats"]
@@ -0,0 +1,214 @@
+"""
+Tests de la façade de cache (cache_data / cache_resource)
+Backends service et streamlit, invalidation par tags, statistiques, ressources partagées
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database.models import BusinessManager
+from app.services import caching
+from app.services.business_manager_service import BusinessManagerService
+from app.services.caching import cache_data
+from app.services.caching import cache_resource
+from app.services.caching import skip_caching
+
+
+@pytest.fixture
+def streamlit_backend(monkeypatch, enabled_cache):
+    """Runtime Streamlit simulé : st.cache_data mémorise les résultats par arguments"""
+
+    def fake_cache_data(ttl=None, show_spinner=True):
+        def decorator(func):
+            results = {}
+
+            def wrapper(*args, **kwargs):
+                key = (args, tuple(sorted(kwargs.items())))
+                if key not in results:
+                    results[key] = func(*args, **kwargs)
+                return results[key]
+
+            return wrapper
+
+        return decorator
+
+    monkeypatch.setattr(caching, "CACHE_BACKEND", "streamlit")
+    monkeypatch.setattr(caching, "_streamlit_runtime", lambda: True)
+    monkeypatch.setattr(caching.st, "cache_data", fake_cache_data)
+    return enabled_cache
+
+
+def _counter(calls, tags=("business_managers",)):
+    @cache_data(ttl=60, tags=tags)
+    def count_business_managers(actif=True):
+        calls.append(actif)
+        return len(calls)
+
+    return count_business_managers
+
+
+def _flaky(calls):
+    """Premier appel en échec (valeur de repli), les suivants réussissent"""
+
+    @cache_data(ttl=3600, tags=("business_managers",))
+    def business_managers():
+        calls.append(1)
+        if len(calls) == 1:
+            skip_caching()
+            return []
+        return ["Anne"]
+
+    return business_managers
+
+
+class TestCacheData:
+    """Backend service (CacheService)"""
+
+    def test_cached_and_invalidated_by_table_tag(self, enabled_cache):
+        """Le résultat est servi depuis le cache jusqu'à l'invalidation d'une de ses tables"""
+        calls = []
+        count = _counter(calls)
+
+        assert count() == 1
+        assert count() == 1
+        assert count(actif=False) == 2
+
+        enabled_cache.invalidate_tags("business_managers")
+        assert count() == 3
+
+    def test_clear_invalidates_only_the_function(self, enabled_cache):
+        """clear() invalide la fonction, pas les autres fonctions portant les mêmes tags"""
+        calls, other_calls = [], []
+        count = _counter(calls)
+
+        @cache_data(ttl=60, tags=("business_managers",))
+        def other():
+            other_calls.append(1)
+            return len(other_calls)
+
+        count()
+        other()
+
+        count.clear()
+
+        assert count() == 2
+        assert other() == 1
+
+    def test_statistics_namespace(self, enabled_cache):
+        """Les succès sont comptés dans l'espace de noms module:fonction"""
+        count = _counter([])
+        count()
+        count()
+
+        rows = {row["namespace"]: row for row in enabled_cache.statistics.namespaces()}
+        assert count.namespace == "test_caching:count_business_managers"
+        assert rows[count.namespace]["hits"] == 1
+
+    def test_fallback_not_cached(self, enabled_cache):
+        """Une valeur de repli signalée par skip_caching n'est pas servie aux appels suivants"""
+        calls = []
+        business_managers = _flaky(calls)
+
+        assert business_managers() == []
+        assert business_managers() == ["Anne"]
+        assert business_managers() == ["Anne"]
+        assert len(calls) == 2
+
+    def test_fallback_not_cached_by_callers(self, enabled_cache):
+        """Un résultat construit à partir d'une valeur de repli n'est pas mis en cache non plus"""
+        business_managers = _flaky([])
+
+        @cache_data(ttl=3600, tags=("business_managers",))
+        def business_managers_count():
+            return len(business_managers())
+
+        assert business_managers_count() == 0
+        assert business_managers_count() == 1
+
+    def test_service_error_not_cached(self, enabled_cache, memory_session_factory, monkeypatch):
+        """Une erreur de base passagère ne fige pas une liste vide de Business Managers pendant 30 minutes"""
+        with memory_session_factory() as session:
+            session.add(BusinessManager(nom="Boss", prenom="Anne", email="anne@test.com"))
+            session.commit()
+        sessions = iter([SQLAlchemyError("base verrouillée")])
+
+        def get_database_session():
+            error = next(sessions, None)
+            if error is not None:
+                raise error
+            return memory_session_factory()
+
+        monkeypatch.setattr("app.services.business_manager_service.get_database_session", get_database_session)
+
+        assert BusinessManagerService.get_all_business_managers() == []
+        assert [bm["prenom"] for bm in BusinessManagerService.get_all_business_managers()] == ["Anne"]
+
+    def test_disabled(self, enabled_cache, monkeypatch):
+        """Façade désactivée : la fonction est appelée à chaque fois"""
+        monkeypatch.setattr(caching, "CACHE_ENABLED", False)
+        count = _counter([])
+
+        assert [count(), count()] == [1, 2]
+
+
+class TestStreamlitBackend:
+    """Backend streamlit (st.cache_data dans un runtime Streamlit)"""
+
+    def test_tag_generation_invalidates_streamlit_entries(self, streamlit_backend):
+        """Invalider un tag rend périmées les entrées Streamlit, comme celles de CacheService"""
+        calls = []
+        count = _counter(calls)
+
+        assert [count(), count()] == [1, 1]
+        streamlit_backend.invalidate_tags("business_managers")
+        assert count() == 2
+        count.clear()
+        assert count() == 3
+
+    def test_statistics(self, streamlit_backend):
+        """Succès et échecs Streamlit alimentent les statistiques de CacheService"""
+        count = _counter([])
+        count()
+        count()
+
+        row = {row["namespace"]: row for row in streamlit_backend.statistics.namespaces()}[count.namespace]
+        assert (row["hits"], row["misses"]) == (1, 1)
+
+    def test_fallback_not_cached(self, streamlit_backend):
+        """La valeur de repli n'entre pas dans st.cache_data"""
+        calls = []
+        business_managers = _flaky(calls)
+
+        assert business_managers() == []
+        assert [business_managers(), business_managers()] == [["Anne"], ["Anne"]]
+        assert len(calls) == 2
+
+
+class TestCacheResource:
+    """Ressources partagées par le processus"""
+
+    def test_created_once_across_threads(self):
+        """Les appels concurrents reçoivent la même ressource, créée une seule fois"""
+        created = []
+
+        @cache_resource
+        def engine():
+            created.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(engine())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(created) == 1
+        assert all(result is results[0] for result in results)
+
+        engine.clear()
+        assert engine() is not results[0]
@@ -0,0 +1,131 @@
+"""
+Tests du cache des réponses du chatbot
+Clé = question normalisée, invalidation par les écritures en base, statistiques et statut de la sidebar
+"""
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.pages_modules.chatbot import show_answer_cache_status
+from app.services import caching
+from app.services.chatbot_service import ChatbotService
+
+
+@pytest.fixture
+def chatbot(monkeypatch):
+    """Chatbot dont l'analyse et les handlers sont comptés (aucun accès à la base)"""
+    chatbot = ChatbotService()
+    answers = []
+
+    def route(intent, entities):
+        answers.append(intent)
+        return {"response": f"réponse {len(answers)}", "data": None, "intent": intent, "confidence": 0.9}
+
+    monkeypatch.setattr(chatbot, "_question_session", MagicMock())
+    monkeypatch.setattr(chatbot, "_analyze_intent", lambda question: "statistiques")
+    monkeypatch.setattr(chatbot, "_extract_entities", lambda question: {})
+    monkeypatch.setattr(chatbot, "_route_question_to_handler", route)
+    chatbot.answers = answers
+    return chatbot
+
+
+class TestAnswerCache:
+    """Réponses servies depuis le cache"""
+
+    def test_same_normalized_question(self, enabled_cache, chatbot):
+        """Une question identique après normalisation est servie depuis le cache"""
+        first = chatbot.process_question("Combien de consultants ??")
+        assert chatbot.last_answer_cached is False
+
+        second = chatbot.process_question("  combien   de CONSULTANTS ?")
+
+        assert second == first
+        assert chatbot.last_answer_cached is True
+        assert chatbot.answers == ["statistiques"]
+        assert chatbot.get_answer_cache_stats() == {"hits": 1, "misses": 1, "hit_rate": 50.0}
+
+    def test_invalidated_by_write(self, enabled_cache, chatbot):
+        """Une écriture sur une table lue par le chatbot rend les réponses périmées"""
+        chatbot.process_question("combien de consultants")
+        enabled_cache.invalidate_tags("business_managers")
+        chatbot.process_question("combien de consultants")
+        assert len(chatbot.answers) == 1
+
+        enabled_cache.invalidate_tags("consultants")
+        assert chatbot.process_question("combien de consultants")["response"] == "réponse 2"
+
+    def test_invalidated_during_answer(self, enabled_cache, chatbot, monkeypatch):
+        """Un commit pendant le calcul de la réponse la rend périmée"""
+        route = chatbot._route_question_to_handler
+
+        def route_and_write(intent, entities):
+            answer = route(intent, entities)
+            enabled_cache.invalidate_tags("consultants")
+            return answer
+
+        monkeypatch.setattr(chatbot, "_route_question_to_handler", route_and_write)
+        chatbot.process_question("combien de consultants")
+        chatbot.process_question("combien de consultants")
+
+        assert len(chatbot.answers) == 2
+        assert chatbot.last_answer_cached is False
+
+    def test_errors_not_cached(self, enabled_cache, chatbot, monkeypatch):
+        """Une réponse d'erreur n'est pas conservée"""
+        monkeypatch.setattr(chatbot, "_analyze_intent", MagicMock(side_effect=[RuntimeError("base"), "statistiques"]))
+
+        assert chatbot.process_question("combien de consultants")["intent"] == "error"
+        assert chatbot.process_question("combien de consultants")["intent"] == "statistiques"
+
+    def test_handler_errors_not_cached(self, enabled_cache, monkeypatch):
+        """Une erreur interceptée par un handler (intention normale) n'est pas conservée"""
+        chatbot = ChatbotService()
+        monkeypatch.setattr(chatbot, "_question_session", MagicMock())
+        monkeypatch.setattr(chatbot, "_analyze_intent", lambda question: "disponibilite")
+        monkeypatch.setattr(chatbot, "_extract_entities", lambda question: {"noms": []})
+        monkeypatch.setattr(
+            chatbot, "_get_availability_data", MagicMock(side_effect=[SQLAlchemyError("base"), ([], [])])
+        )
+
+        failed = chatbot.process_question("qui est disponible ?")
+        answer = chatbot.process_question("qui est disponible ?")
+
+        assert failed["intent"] == "disponibilite" and failed["error"] is True
+        assert chatbot.last_answer_cached is False
+        assert "error" not in answer
+        assert chatbot.process_question("qui est disponible ?") == answer
+        assert chatbot.last_answer_cached is True
+
+    def test_disabled(self, enabled_cache, chatbot, monkeypatch):
+        """Cache désactivé : chaque question est recalculée"""
+        monkeypatch.setattr(caching, "CACHE_ENABLED", False)
+        chatbot.process_question("combien de consultants")
+        chatbot.process_question("combien de consultants")
+
+        assert len(chatbot.answers) == 2
+        assert chatbot.last_answer_cached is False
+
+
+class TestSidebarStatus:
+    """Statut du cache dans la sidebar"""
+
+    @patch("app.pages_modules.chatbot.st")
+    def test_cached_status(self, mock_st, enabled_cache, chatbot):
+        """La sidebar indique l'origine de la dernière réponse et le taux de succès"""
+        chatbot.process_question("combien de consultants")
+        chatbot.process_question("combien de consultants")
+
+        show_answer_cache_status(chatbot)
+
+        captions = [call.args[0] for call in mock_st.caption.call_args_list]
+        assert captions == ["⚡ Dernière réponse : servie depuis le cache", "📦 Cache des réponses : 1/2 (50 %)"]
+
+    @patch("app.pages_modules.chatbot.st")
+    def test_no_question_yet(self, mock_st, enabled_cache):
+        """Avant la première question, rien n'est affiché"""
+        show_answer_cache_status(ChatbotService())
+
+        mock_st.caption.assert_not_called()
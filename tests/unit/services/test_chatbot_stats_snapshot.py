@@ -0,0 +1,161 @@
+"""
+Tests de l'instantané des statistiques du chatbot (agrégats GROUP BY)
+Répartitions par grade, contrat et société, expérience, nombre de requêtes constant
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from app.database.models import Consultant
+from app.services import entity_gazetteer
+from app.services.chatbot_service import ChatbotService
+
+GRADES = ["Senior", "Junior", "Manager"]
+CONTRATS = ["CDI", "cdi", "CDD", "Stagiaire"]
+
+
+@pytest.fixture
+def factory(isolated_cache, memory_session_factory, monkeypatch):
+    """Base en mémoire vide ; le chatbot ouvre ses sessions sur cette base"""
+    entity_gazetteer.clear_gazetteers()
+    monkeypatch.setattr("app.services.chatbot_service.get_database_session", memory_session_factory)
+    yield memory_session_factory
+    entity_gazetteer.clear_gazetteers()
+
+
+def _add_consultants(factory, count, start=0):
+    """Consultants répartis sur 3 grades, 4 contrats, 2 sociétés ; un sur cinq sans expérience"""
+    with factory() as session:
+        for i in range(start, start + count):
+            session.add(
+                Consultant(
+                    prenom=f"Prenom{i}",
+                    nom=f"Nom{i}",
+                    email=f"consultant{i}@example.com",
+                    grade=GRADES[i % 3] if i < 30 else "Directeur",
+                    type_contrat=CONTRATS[i % 4],
+                    societe="Asigma" if i in (0, 2, 4) else "Quanteam",
+                    date_premiere_mission=date(2010 + i % 12, 1, 1) if i % 5 else None,
+                )
+            )
+        session.commit()
+
+
+def _count_statements(factory, snapshot_call):
+    """Nombre de requêtes SQL exécutées par snapshot_call(session)"""
+    statements = []
+    with factory() as session:
+        engine = session.get_bind()
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            result = snapshot_call(session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+    return result, statements
+
+
+class TestStatsSnapshot:
+    """Agrégats calculés en SQL"""
+
+    def test_distributions(self, factory):
+        """Effectifs par valeur dans l'ordre du premier consultant, noms limités aux premiers du groupe"""
+        _add_consultants(factory, 33)
+
+        with factory() as session:
+            snapshot = ChatbotService()._get_stats_snapshot(session)
+
+        assert {grade: stats["count"] for grade, stats in snapshot["grade"].items()} == {
+            "Senior": 10,
+            "Junior": 10,
+            "Manager": 10,
+            "Directeur": 3,
+        }
+        assert list(snapshot["type_contrat"]) == CONTRATS
+        assert snapshot["societe"]["Asigma"] == {"count": 3, "noms": ["Prenom0 Nom0", "Prenom2 Nom2", "Prenom4 Nom4"]}
+        assert snapshot["grade"]["Senior"]["noms"] == [f"Prenom{i} Nom{i}" for i in (0, 3, 6, 9, 12)]
+
+    def test_experience_matches_python(self, factory):
+        """Agrégats d'expérience identiques au calcul Python sur les consultants chargés"""
+        _add_consultants(factory, 33)
+
+        with factory() as session:
+            experience = ChatbotService()._get_stats_snapshot(session)["experience"]
+            consultants = session.query(Consultant).filter(Consultant.date_premiere_mission.isnot(None)).all()
+            years = [c.experience_annees for c in consultants]
+            top = sorted(consultants, key=lambda c: c.experience_annees, reverse=True)[:3]
+
+        assert experience["count"] == len(consultants)
+        assert experience["moyenne"] == pytest.approx(sum(years) / len(years))
+        assert (experience["minimum"], experience["maximum"]) == (min(years), max(years))
+        assert experience["top"] == [(f"{c.prenom} {c.nom}", c.experience_annees) for c in top]
+
+    def test_constant_queries(self, factory):
+        """Deux requêtes et un échantillon borné, quel que soit l'effectif"""
+        chatbot = ChatbotService()
+        _add_consultants(factory, 40)
+        small, small_statements = _count_statements(factory, chatbot._get_stats_snapshot)
+        _add_consultants(factory, 400, start=40)
+        large, large_statements = _count_statements(factory, chatbot._get_stats_snapshot)
+
+        assert len(small_statements) == len(large_statements) == 2
+        assert large["societe"]["Quanteam"]["count"] == 437
+        assert all(len(stats["noms"]) <= 5 for stats in large["societe"].values())
+
+    def test_empty_base(self, factory):
+        """Base vide : aucune répartition, pas d'expérience"""
+        with factory() as session:
+            snapshot = ChatbotService()._get_stats_snapshot(session)
+
+        assert snapshot["grade"] == snapshot["type_contrat"] == snapshot["societe"] == {}
+        assert snapshot["experience"] == {"count": 0, "moyenne": None, "minimum": None, "maximum": None, "top": []}
+
+
+class TestStatisticsHandlers:
+    """Réponses du chatbot construites à partir de l'instantané"""
+
+    def test_grade_distribution(self, factory):
+        """Les noms ne sont listés que pour les petits groupes"""
+        _add_consultants(factory, 33)
+
+        chatbot = ChatbotService()
+        chatbot.last_question = "quelle est la répartition par grade ?"
+        response = chatbot._handle_professional_profile_question({"noms": []})["response"]
+
+        assert "• **Senior** : 10 consultant(s)\n• **Junior**" in response
+        assert (
+            "• **Directeur** : 3 consultant(s)\n  - Prenom30 Nom30\n  - Prenom31 Nom31\n  - Prenom32 Nom32\n"
+            in response
+        )
+
+    def test_contract_count_ignores_case(self, factory):
+        """CDI et cdi sont comptés ensemble"""
+        _add_consultants(factory, 20)
+        chatbot = ChatbotService()
+        chatbot.last_question = "combien de consultants en cdi ?"
+
+        assert (
+            chatbot._handle_professional_profile_question({"noms": []})["response"] == "📋 **10 consultant(s) en CDI**"
+        )
+
+    def test_specific_company(self, factory):
+        """Recherche d'une société filtrée en SQL"""
+        _add_consultants(factory, 10)
+        chatbot = ChatbotService()
+        chatbot.last_question = "qui travaille chez asigma ?"
+
+        response = chatbot._handle_professional_profile_question({"noms": []})["response"]
+
+        assert response.startswith("🏢 **Consultants chez Asigma** :")
+        assert "3 consultant(s) trouvé(s)" in response
+
+    def test_experience_statistics(self, factory):
+        """Statistiques générales d'expérience"""
+        _add_consultants(factory, 10)
+
+        result = ChatbotService()._handle_general_experience_stats()
+
+        assert result["data"] == {"consultants_count": 8}
+        assert "🏆 **Top 3 des plus expérimentés :**\n1. **Prenom1 Nom1** : " in result["response"]
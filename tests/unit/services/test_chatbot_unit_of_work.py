@@ -0,0 +1,113 @@
+"""
+Tests de l'unité de travail du chatbot : une seule session de base de données par question
+Base SQLite en mémoire, sessions ouvertes comptées pour chaque type de question
+"""
+
+from datetime import date
+
+import pytest
+
+from app.database.models import Competence
+from app.database.models import Consultant
+from app.database.models import ConsultantCompetence
+from app.database.models import ConsultantLangue
+from app.database.models import Langue
+from app.database.models import Mission
+from app.database.models import Practice
+from app.services import entity_gazetteer
+from app.services.chatbot_service import ChatbotService
+
+QUESTIONS = [
+    "quel est le salaire de Jean Dupont ?",
+    "quelle est l'expérience de Marie Martin ?",
+    "quel est le grade de Jean Dupont ?",
+    "quelles sont les compétences de Jean Dupont ?",
+    "qui connait Python ?",
+    "quelles langues parle Marie Martin ?",
+    "quelles sont les missions de Jean Dupont ?",
+    "quel est le mail de Marie Martin ?",
+    "liste des consultants disponibles",
+    "qui est dans la practice Data ?",
+    "combien de consultants dans la base ?",
+    "quand Jean Dupont sera disponible ?",
+    "quel est le tjm de la mission de Jean Dupont ?",
+    "bonjour",
+]
+
+
+@pytest.fixture
+def opened_sessions(isolated_cache, memory_session_factory, monkeypatch):
+    """Base en mémoire ; get_database_session du chatbot compte les sessions ouvertes"""
+    entity_gazetteer.clear_gazetteers()
+
+    with memory_session_factory() as session:
+        data = Practice(nom="Data", actif=True)
+        python = Competence(nom="Python", categorie="Langages", type_competence="technique")
+        anglais = Langue(nom="Anglais")
+        jean = Consultant(
+            prenom="Jean",
+            nom="Dupont",
+            email="jean.dupont@example.com",
+            salaire_actuel=50000,
+            disponibilite=True,
+            grade="Senior",
+            practice=data,
+            date_premiere_mission=date(2015, 1, 1),
+        )
+        marie = Consultant(
+            prenom="Marie",
+            nom="Martin",
+            email="marie.martin@example.com",
+            salaire_actuel=45000,
+            disponibilite=False,
+            practice=data,
+            date_premiere_mission=date(2018, 6, 1),
+        )
+        session.add_all([data, python, anglais, jean, marie])
+        session.flush()
+        session.add_all(
+            [
+                ConsultantCompetence(consultant_id=jean.id, competence_id=python.id, niveau_maitrise="expert"),
+                ConsultantLangue(consultant_id=marie.id, langue_id=anglais.id, niveau=4),
+                Mission(
+                    consultant_id=jean.id,
+                    nom_mission="Refonte",
+                    client="BNP Paribas",
+                    date_debut=date(2024, 1, 1),
+                    statut="en_cours",
+                    tjm=650,
+                ),
+            ]
+        )
+        session.commit()
+
+    opened = []
+
+    def get_database_session():
+        opened.append(1)
+        return memory_session_factory()
+
+    monkeypatch.setattr("app.services.chatbot_service.get_database_session", get_database_session)
+    yield opened
+    entity_gazetteer.clear_gazetteers()
+
+
+class TestUnitOfWork:
+    """Une question = une session"""
+
+    @pytest.mark.parametrize("question", QUESTIONS)
+    def test_one_session_per_question(self, opened_sessions, question):
+        """Analyse, extraction des entités et réponse partagent une seule session"""
+        result = ChatbotService().process_question(question)
+
+        assert result["intent"] != "error", result["response"]
+        assert len(opened_sessions) == 1
+
+    def test_session_released_after_question(self, opened_sessions):
+        """La session est libérée après la réponse ; un appel direct ouvre sa propre session"""
+        chatbot = ChatbotService()
+        chatbot.process_question("qui connait Python ?")
+
+        assert chatbot._session is None
+        assert [consultant.prenom for consultant in chatbot._find_consultants_by_skill("python")] == ["Jean"]
+        assert len(opened_sessions) == 2
@@ -0,0 +1,179 @@
+"""
+Tests de la recherche plein texte FTS5 (ConsultantService.full_text_search)
+Vérifie la synchronisation par triggers, le classement bm25 et la recherche par préfixe
+"""
+
+import time
+from datetime import date
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy import text
+
+from app.database.full_text import FTS_TABLE
+from app.database.full_text import build_match_query
+from app.database.full_text import drop_full_text_index
+from app.database.full_text import ensure_full_text_index
+from app.database.full_text import search_full_text
+from app.database.models import CV
+from app.database.models import Consultant
+from app.database.models import Mission
+from app.services.consultant_service import ConsultantService
+
+
+@pytest.fixture
+def fts_db(memory_session_factory):
+    """Base en mémoire avec index plein texte et get_database_session patché"""
+    with memory_session_factory() as session:
+        session.add_all(
+            [
+                Consultant(id=1, nom="Lefèvre", prenom="Élodie", email="elodie.lefevre@test.com"),
+                Consultant(id=2, nom="Martin", prenom="Paul", email="paul.martin@test.com", societe="Asigma"),
+                Consultant(id=3, nom="Durand", prenom="Kafka", email="k.durand@test.com"),
+            ]
+        )
+        session.add_all(
+            [
+                Mission(
+                    id=1,
+                    consultant_id=2,
+                    nom_mission="Migration temps réel",
+                    client="BNP Paribas",
+                    role="Data Engineer",
+                    date_debut=date(2023, 1, 1),
+                    description="Mise en place de flux de streaming",
+                    technologies_utilisees="Kafka, Spark, Python",
+                ),
+                Mission(
+                    id=2,
+                    consultant_id=1,
+                    nom_mission="Reporting",
+                    client="Société Générale",
+                    date_debut=date(2022, 1, 1),
+                    technologies_utilisees="PowerBI",
+                ),
+            ]
+        )
+        session.add(
+            CV(
+                id=1,
+                consultant_id=1,
+                fichier_nom="cv_elodie.pdf",
+                fichier_path="/tmp/cv_elodie.pdf",
+                contenu_extrait="Développeuse Python, expérience Kubernetes et pipelines de données",
+            )
+        )
+        session.commit()
+
+    with patch("app.services.consultant_service.get_database_session", side_effect=memory_session_factory):
+        yield memory_session_factory
+
+
+class TestFullTextSearch:
+    """Tests pour ConsultantService.full_text_search"""
+
+    def test_searches_missions_and_cvs(self, fts_db):
+        """Les missions et le texte extrait des CVs sont interrogeables"""
+        by_mission = ConsultantService.full_text_search("spark")
+        by_cv = ConsultantService.full_text_search("kubernetes")
+
+        assert [r["id"] for r in by_mission] == [2]
+        assert by_mission[0]["matches"][0]["source"] == "mission"
+        assert "[Spark]" in by_mission[0]["matches"][0]["extrait"]
+        assert [r["id"] for r in by_cv] == [1]
+        assert by_cv[0]["matches"][0] == {
+            "source": "cv",
+            "source_id": 1,
+            "extrait": by_cv[0]["matches"][0]["extrait"],
+        }
+
+    def test_prefix_accents_and_case(self, fts_db):
+        """Préfixes, accents et casse sont neutralisés"""
+        assert [r["id"] for r in ConsultantService.full_text_search("lefe")] == [1]
+        assert [r["id"] for r in ConsultantService.full_text_search("ELODIE")] == [1]
+        assert [r["id"] for r in ConsultantService.full_text_search("societe gen")] == [1]
+
+    def test_title_match_ranks_first(self, fts_db):
+        """Un nom de consultant pèse plus qu'une technologie citée dans une mission"""
+        results = ConsultantService.full_text_search("kafka")
+
+        assert [r["id"] for r in results] == [3, 2]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_sources_filter(self, fts_db):
+        """Le filtre de sources restreint les documents interrogés"""
+        results = ConsultantService.full_text_search("kafka", sources=["mission"])
+
+        assert [r["id"] for r in results] == [2]
+
+    def test_unknown_sources_only(self, fts_db):
+        """Des sources toutes inconnues ne donnent aucun résultat, sans interroger l'index"""
+        connection = MagicMock()
+
+        assert search_full_text(connection, "kafka", kinds=["inconnue"]) == []
+        connection.execute.assert_not_called()
+        assert ConsultantService.full_text_search("kafka", sources=["inconnue"]) == []
+
+    def test_index_follows_writes(self, fts_db):
+        """Les triggers répercutent insertions, modifications et suppressions"""
+        with fts_db() as session:
+            mission = session.get(Mission, 1)
+            mission.technologies_utilisees = "Flink"
+            session.add(Consultant(id=4, nom="Nouveau", prenom="Flinkeur", email="n@test.com"))
+            session.delete(session.get(CV, 1))
+            session.commit()
+
+        assert ConsultantService.full_text_search("spark") == []
+        assert [r["id"] for r in ConsultantService.full_text_search("flink")] == [4, 2]
+        assert ConsultantService.full_text_search("kubernetes") == []
+
+    def test_user_operators_are_neutralized(self, fts_db):
+        """La syntaxe FTS5 saisie par l'utilisateur ne provoque pas d'erreur"""
+        assert build_match_query('kafka" OR *') == '"kafka"* "OR"*'
+        assert build_match_query("  ") is None
+        assert ConsultantService.full_text_search('"(') == []
+
+    def test_prefix_search_is_fast_on_thousands_of_cvs(self, fts_db):
+        """Une recherche par préfixe sur quelques milliers de CVs reste de l'ordre de la milliseconde"""
+        with fts_db() as session:
+            session.execute(
+                CV.__table__.insert(),
+                [
+                    {
+                        "consultant_id": 1 + i % 3,
+                        "fichier_nom": f"cv_{i}.pdf",
+                        "fichier_path": f"/tmp/cv_{i}.pdf",
+                        "contenu_extrait": f"Projet {i} Java Spring microservices terraform{i % 50}",
+                    }
+                    for i in range(3000)
+                ],
+            )
+            session.commit()
+
+        start = time.perf_counter()
+        results = ConsultantService.full_text_search("terraform4")
+        duration = time.perf_counter() - start
+
+        assert {r["id"] for r in results} == {1, 2, 3}
+        assert duration < 0.1
+
+
+class TestEnsureFullTextIndex:
+    """Tests de la création de l'index sur une base existante"""
+
+    def test_existing_database_is_indexed(self, memory_engine):
+        """Une base créée sans l'index est indexée à la première vérification"""
+        with memory_engine.begin() as connection:
+            drop_full_text_index(connection)
+            connection.execute(
+                Consultant.__table__.insert(), {"nom": "Durand", "prenom": "Anne", "email": "anne@test.com"}
+            )
+
+        assert ensure_full_text_index(memory_engine) is True
+
+        assert inspect(memory_engine).has_table(FTS_TABLE)
+        with memory_engine.connect() as connection:
+            count = connection.execute(text(f"SELECT count(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH 'anne'"))
+            assert count.scalar() == 1
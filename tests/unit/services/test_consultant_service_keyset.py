@@ -0,0 +1,161 @@
+"""
+Tests de la pagination keyset (curseur) de ConsultantService
+Utilise une vraie base SQLite en mémoire pour valider l'ordre et les curseurs
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import pool
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base
+from app.database.models import Consultant
+from app.database.models import Mission
+from app.database.models import Practice
+from app.services.consultant_service import ConsultantService
+
+
+@pytest.fixture
+def keyset_db():
+    """Base en mémoire peuplée de consultants homonymes pour tester le départage par id"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=pool.StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as session:
+        practice = Practice(nom="Data")
+        session.add(practice)
+        session.flush()
+        for i in range(25):
+            consultant = Consultant(
+                nom=f"Nom{i % 5}",
+                prenom=f"P{i:02d}",
+                email=f"consultant{i}@test.com",
+                grade="Senior" if i % 2 else "Junior",
+                practice_id=practice.id if i < 10 else None,
+            )
+            session.add(consultant)
+            session.flush()
+            for j in range(i % 3):
+                session.add(
+                    Mission(
+                        consultant_id=consultant.id,
+                        nom_mission=f"Mission {j}",
+                        client="Client",
+                        date_debut=date(2023, 1, 1),
+                    )
+                )
+        session.commit()
+
+    with patch("app.services.consultant_service.get_database_session", side_effect=session_factory):
+        yield session_factory
+
+    engine.dispose()
+
+
+def _collect_all_pages(fetch_page):
+    """Parcourt toutes les pages en suivant les curseurs"""
+    consultants, cursor, pages = [], None, 0
+    while True:
+        page = fetch_page(cursor)
+        consultants.extend(page["consultants"])
+        pages += 1
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            return consultants, pages
+        cursor = page["next_cursor"]
+
+
+class TestConsultantServiceKeyset:
+    """Tests pour get_consultants_page_by_cursor et search_consultants_by_cursor"""
+
+    def test_pages_cover_all_consultants_in_order(self, keyset_db):
+        """Les pages successives couvrent tous les consultants, triés par (nom, id), sans doublon"""
+        consultants, pages = _collect_all_pages(
+            lambda cursor: ConsultantService.get_consultants_page_by_cursor(cursor, per_page=7)
+        )
+
+        assert pages == 4
+        assert len(consultants) == 25
+        keys = [(c["nom"], c["id"]) for c in consultants]
+        assert keys == sorted(keys)
+        assert len({c["id"] for c in consultants}) == 25
+
+    def test_nb_missions_matches_offset_listing(self, keyset_db):
+        """Le comptage de missions par sous-requête corrélée égale celui du GROUP BY"""
+        page = ConsultantService.get_consultants_page_by_cursor(per_page=100, sort_by="id")
+        offset_rows = ConsultantService.get_all_consultants_with_stats(page=1, per_page=100)
+
+        by_id = {c["id"]: c["nb_missions"] for c in offset_rows}
+        assert {c["id"]: c["nb_missions"] for c in page["consultants"]} == by_id
+        assert page["next_cursor"] is None
+
+    def test_filters_are_applied(self, keyset_db):
+        """Les filtres practice / grade restent identiques à la version OFFSET"""
+        consultants, _ = _collect_all_pages(
+            lambda cursor: ConsultantService.get_consultants_page_by_cursor(
+                cursor, per_page=2, practice_filter="Data", grade_filter="Senior"
+            )
+        )
+
+        assert len(consultants) == 5
+        assert all(c["practice_name"] == "Data" and c["grade"] == "Senior" for c in consultants)
+
+    def test_search_by_cursor(self, keyset_db):
+        """La recherche paginée suit les curseurs sur le sous-ensemble filtré"""
+        consultants, pages = _collect_all_pages(
+            lambda cursor: ConsultantService.search_consultants_by_cursor("Nom1", cursor, per_page=2, sort_by="prenom")
+        )
+
+        assert pages == 3
+        assert all(c["nom"] == "Nom1" for c in consultants)
+        prenoms = [c["prenom"] for c in consultants]
+        assert prenoms == sorted(prenoms)
+
+    def test_cursor_is_bound_to_sort_column(self, keyset_db):
+        """Un curseur émis pour un tri n'est pas accepté pour un autre"""
+        page = ConsultantService.get_consultants_page_by_cursor(per_page=5, sort_by="nom")
+
+        result = ConsultantService.get_consultants_page_by_cursor(page["next_cursor"], per_page=5, sort_by="email")
+
+        assert result == {"consultants": [], "next_cursor": None, "has_more": False}
+
+    def test_invalid_cursor_and_sort_column(self, keyset_db):
+        """Curseur illisible ou colonne de tri inconnue : résultat vide sans exception"""
+        empty = {"consultants": [], "next_cursor": None, "has_more": False}
+
+        assert ConsultantService.get_consultants_page_by_cursor("pas-un-curseur") == empty
+        assert ConsultantService.get_consultants_page_by_cursor(sort_by="salaire_actuel") == empty
+
+    def test_cursor_roundtrip(self):
+        """Encodage / décodage du curseur opaque"""
+        cursor = ConsultantService._encode_cursor("nom", "Dupont", 42)
+
+        assert "Dupont" not in cursor
+        assert ConsultantService._decode_cursor(cursor, "nom") == ("Dupont", 42)
+
+
+class TestIterConsultantsWithStats:
+    """Tests du parcours en streaming (yield_per) de ConsultantService"""
+
+    def test_streams_every_consultant_by_batches(self, keyset_db):
+        """Tous les consultants sont produits, triés par id, quel que soit le lot"""
+        streamed = list(ConsultantService.iter_consultants_with_stats(batch_size=4))
+
+        assert [c["id"] for c in streamed] == sorted(c["id"] for c in streamed)
+        assert len(streamed) == 25
+        assert sum(c["nb_missions"] for c in streamed) == sum(i % 3 for i in range(25))
+
+    def test_filters_are_applied(self, keyset_db):
+        """Les filtres de la liste paginée s'appliquent au parcours"""
+        streamed = list(ConsultantService.iter_consultants_with_stats(batch_size=3, practice_filter="Data"))
+
+        assert len(streamed) == 10
+        assert {c["practice_name"] for c in streamed} == {"Data"}
@@ -0,0 +1,186 @@
+"""
+Tests de ConsultantService.load_profile_bundle
+Vérifie le contenu du DTO immuable et le nombre borné de requêtes SQL
+"""
+
+import dataclasses
+import sys
+from datetime import date
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event
+
+import app.pages_modules.consultant_profile as profile_page
+import app.pages_modules.consultants as consultants_page
+from app.database.models import CV
+from app.database.models import BusinessManager
+from app.database.models import Competence
+from app.database.models import Consultant
+from app.database.models import ConsultantBusinessManager
+from app.database.models import ConsultantCompetence
+from app.database.models import ConsultantLangue
+from app.database.models import ConsultantSalaire
+from app.database.models import Langue
+from app.database.models import Mission
+from app.database.models import Practice
+from app.services.consultant_service import ConsultantService
+from app.services.profile_bundle import ConsultantProfileBundle
+
+
+@pytest.fixture
+def profile_db(memory_engine, memory_session_factory):
+    """Base en mémoire avec un consultant et toutes ses relations, requêtes comptées"""
+    future = date.today() + timedelta(days=60)
+
+    with memory_session_factory() as session:
+        session.add(Practice(id=1, nom="Data"))
+        session.add_all(
+            [
+                BusinessManager(id=1, nom="Ancien", prenom="Paul", email="paul@test.com"),
+                BusinessManager(id=2, nom="Actuel", prenom="Anne", email="anne@test.com"),
+            ]
+        )
+        session.add(
+            Consultant(id=1, nom="Dupont", prenom="Jean", email="jean@test.com", practice_id=1, disponibilite=False)
+        )
+        session.add_all(
+            [
+                Mission(
+                    consultant_id=1,
+                    nom_mission="M1",
+                    client="BNP",
+                    date_debut=date(2022, 1, 1),
+                    date_fin=date(2022, 12, 31),
+                    statut="terminee",
+                    taux_journalier=550,
+                ),
+                Mission(
+                    consultant_id=1,
+                    nom_mission="M2",
+                    client="SG",
+                    date_debut=date(2024, 1, 1),
+                    date_fin=future,
+                    tjm=650,
+                ),
+            ]
+        )
+        session.add_all(
+            [Competence(id=1, nom="Python", categorie="Backend"), Competence(id=2, nom="Azure", categorie="Cloud")]
+        )
+        session.add_all(
+            [
+                ConsultantCompetence(consultant_id=1, competence_id=1, niveau_maitrise="expert", annees_experience=5),
+                ConsultantCompetence(consultant_id=1, competence_id=2, niveau_maitrise="debutant"),
+            ]
+        )
+        session.add(Langue(id=1, nom="Anglais", code_iso="EN"))
+        session.add(ConsultantLangue(consultant_id=1, langue_id=1, niveau=4))
+        session.add_all(
+            [
+                ConsultantSalaire(
+                    consultant_id=1, salaire=45000, date_debut=date(2022, 1, 1), date_fin=date(2023, 12, 31)
+                ),
+                ConsultantSalaire(consultant_id=1, salaire=50000, date_debut=date(2024, 1, 1)),
+            ]
+        )
+        session.add(
+            CV(consultant_id=1, fichier_nom="cv.pdf", fichier_path="/tmp/cv.pdf", contenu_extrait="texte" * 1000)
+        )
+        session.add_all(
+            [
+                ConsultantBusinessManager(
+                    consultant_id=1, business_manager_id=1, date_debut=date(2022, 1, 1), date_fin=date(2023, 6, 30)
+                ),
+                ConsultantBusinessManager(consultant_id=1, business_manager_id=2, date_debut=date(2023, 7, 1)),
+            ]
+        )
+        session.commit()
+
+    statements = []
+    event.listen(
+        memory_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement)
+    )
+
+    with patch("app.services.consultant_service.get_database_session", side_effect=memory_session_factory):
+        yield memory_session_factory, statements
+
+
+class TestLoadProfileBundle:
+    """Tests pour ConsultantService.load_profile_bundle"""
+
+    def test_bundle_contains_every_relationship(self, profile_db):
+        """Le DTO expose le consultant et toutes ses relations, triées"""
+        bundle = ConsultantService.load_profile_bundle(1)
+
+        assert bundle.nom_complet == "Jean Dupont"
+        assert bundle.practice_nom == "Data"
+        assert [m.nom_mission for m in bundle.missions] == ["M2", "M1"]
+        assert bundle.missions[1].tjm == 550
+        assert bundle.date_disponibilite == (date.today() + timedelta(days=60)).strftime("%d/%m/%Y")
+        assert [c.nom for c in bundle.competences] == ["Azure", "Python"]
+        assert bundle.langues[0].niveau_label == "Avancé (C1)"
+        assert [s.salaire for s in bundle.salaires] == [50000, 45000]
+        assert bundle.cvs[0].fichier_nom == "cv.pdf"
+        assert bundle.business_manager_actuel.business_manager_nom == "Anne Actuel"
+        assert len(bundle.business_managers) == 2
+
+    def test_bounded_number_of_queries(self, profile_db):
+        """Une requête pour le consultant, une par collection, sans texte de CV"""
+        session_factory, statements = profile_db
+
+        ConsultantService.load_profile_bundle(1)
+        first_count = len(statements)
+
+        with session_factory() as session:
+            session.add_all(
+                [
+                    Mission(consultant_id=1, nom_mission=f"X{i}", client="C", date_debut=date(2021, 1, i + 1))
+                    for i in range(20)
+                ]
+            )
+            session.commit()
+        statements.clear()
+        bundle = ConsultantService.load_profile_bundle(1)
+
+        assert first_count <= 7
+        assert len(statements) == first_count
+        assert len(bundle.missions) == 22
+        assert not any("contenu_extrait" in statement for statement in statements)
+
+    def test_bundle_is_immutable(self, profile_db):
+        """Le DTO et ses collections ne sont pas modifiables"""
+        bundle = ConsultantService.load_profile_bundle(1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bundle.nom = "Autre"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            bundle.missions[0].client = "Autre"
+        assert isinstance(bundle.missions, tuple)
+
+    def test_unknown_consultant(self, profile_db):
+        """Un consultant inexistant renvoie None"""
+        assert ConsultantService.load_profile_bundle(999) is None
+
+
+class TestProfilePages:
+    """Pages de profil consultant alimentées par load_profile_bundle"""
+
+    @pytest.mark.parametrize("page", [consultants_page, profile_page])
+    def test_header_data_from_bundle(self, profile_db, page):
+        """En-tête et métriques construits depuis le profil complet, en un nombre borné de requêtes"""
+        session_factory, statements = profile_db
+        page_service = sys.modules[page.ConsultantService.__module__]
+
+        with patch.object(page_service, "get_database_session", side_effect=session_factory):
+            consultant_data, profile = page._load_consultant_data(1)
+            missing = page._load_consultant_data(999)
+
+        assert isinstance(profile, ConsultantProfileBundle)
+        assert profile.business_manager_actuel.business_manager_nom == "Anne Actuel"
+        assert (consultant_data["id"], consultant_data["prenom"], consultant_data["nom"]) == (1, "Jean", "Dupont")
+        assert consultant_data["practice_name"] == "Data"
+        assert consultant_data["disponibilite"] is False
+        assert missing == (None, None)
+        assert len(statements) <= 8
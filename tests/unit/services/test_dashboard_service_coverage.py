@@ -382,7 +382,7 @@ class TestDashboardService(unittest.TestCase):
 class TestDashboardDataService(unittest.TestCase):
     """Tests pour la classe DashboardDataService"""
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_no_filter(self, mock_get_session):
         """Test récupération données intercontrat sans filtre"""
         mock_session = MagicMock()
@@ -422,7 +422,7 @@ class TestDashboardDataService(unittest.TestCase):
         self.assertEqual(result['taux_intercontrat'], 20)
         self.assertEqual(len(result['consultants_sans_mission']), 2)
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_with_filter(self, mock_get_session):
         """Test récupération données intercontrat avec filtre BM"""
         mock_session = MagicMock()
@@ -443,7 +443,7 @@ class TestDashboardDataService(unittest.TestCase):
         self.assertEqual(result['consultants_intercontrat'], 1)
         self.assertEqual(result['taux_intercontrat'], 20)
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_all_in_mission(self, mock_get_session):
         """Test récupération données intercontrat - tous en mission"""
         mock_session = MagicMock()
@@ -462,7 +462,7 @@ class TestDashboardDataService(unittest.TestCase):
         self.assertEqual(result['taux_intercontrat'], 0)
         self.assertEqual(result['consultants_intercontrat'], 0)
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_exception(self, mock_get_session):
         """Test récupération données intercontrat avec exception"""
         mock_get_session.return_value.__enter__.side_effect = Exception("DB Error")
@@ -473,7 +473,7 @@ class TestDashboardDataService(unittest.TestCase):
         self.assertEqual(result['taux_intercontrat'], 0)
         self.assertEqual(result['consultants_sans_mission'], [])
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_with_data(self, mock_get_session):
         """Test récupération revenus par BM avec données"""
         mock_session = MagicMock()
@@ -510,7 +510,7 @@ class TestDashboardDataService(unittest.TestCase):
         self.assertEqual(result['bm_revenues'][0]['bm_name'], "Jean Manager")
         self.assertEqual(result['bm_revenues'][0]['missions_count'], 5)
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_empty(self, mock_get_session):
         """Test récupération revenus par BM - pas de données"""
         mock_session = MagicMock()
@@ -527,7 +527,7 @@ class TestDashboardDataService(unittest.TestCase):
         
         self.assertEqual(len(result['bm_revenues']), 0)
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_exception(self, mock_get_session):
         """Test récupération revenus par BM avec exception"""
         mock_get_session.return_value.__enter__.side_effect = Exception("DB Error")
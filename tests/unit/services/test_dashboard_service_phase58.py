@@ -615,7 +615,7 @@ class TestUpdateDashboardLayout:
 class TestGetIntercontratData:
     """Tests pour get_intercontrat_data()"""
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_no_filter(self, mock_get_db, mock_consultant):
         """Test données intercontrat sans filtre (simplifié)"""
         # Test simplifié : vérifier gestion erreur si DB complexe
@@ -630,7 +630,7 @@ class TestGetIntercontratData:
         assert result["taux_intercontrat"] == 0
         assert result["consultants_sans_mission"] == []
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_zero_consultants(self, mock_get_db):
         """Test avec aucun consultant"""
         mock_session = MagicMock()
@@ -649,7 +649,7 @@ class TestGetIntercontratData:
         assert result["total_consultants"] == 0
         assert result["taux_intercontrat"] == 0
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_intercontrat_data_error(self, mock_get_db):
         """Test avec erreur DB"""
         mock_get_db.side_effect = Exception("DB Error")
@@ -667,7 +667,7 @@ class TestGetIntercontratData:
 class TestGetRevenueByBmData:
     """Tests pour get_revenue_by_bm_data()"""
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_success(self, mock_get_db):
         """Test données revenus par BM"""
         mock_session = MagicMock()
@@ -698,7 +698,7 @@ class TestGetRevenueByBmData:
         assert result["bm_revenues"][0]["bm_name"] == "Alice Manager"
         assert result["bm_revenues"][0]["missions_count"] == 5
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_custom_period(self, mock_get_db):
         """Test avec période personnalisée"""
         mock_session = MagicMock()
@@ -717,7 +717,7 @@ class TestGetRevenueByBmData:
         
         assert result["period_months"] == 6
 
-    @patch('app.services.dashboard_service.get_database_session')
+    @patch('app.services.dashboard_service.get_readonly_session')
     def test_get_revenue_by_bm_data_error(self, mock_get_db):
         """Test avec erreur DB"""
         mock_get_db.side_effect = Exception("DB Error")
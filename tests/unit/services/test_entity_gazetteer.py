@@ -0,0 +1,150 @@
+"""
+Tests du gazetteer des entités (automate d'Aho-Corasick) et de son usage par le chatbot
+Casse et accents, limites de mots, rechargement après une écriture en base
+"""
+
+import re
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import entity_gazetteer
+from app.services.chatbot_service import ChatbotService
+from app.services.entity_gazetteer import EntityGazetteer
+from app.services.entity_gazetteer import fold
+from app.services.entity_gazetteer import get_gazetteer
+
+
+def _values(gazetteer, text):
+    return [entry.value for entry in gazetteer.find(text)]
+
+
+@pytest.fixture
+def service(enabled_cache):
+    """Cache isolé et activé, gazetteers oubliés"""
+    entity_gazetteer.clear_gazetteers()
+    yield enabled_cache
+    entity_gazetteer.clear_gazetteers()
+
+
+class TestEntityGazetteer:
+    """Recherche des termes"""
+
+    def test_accent_and_case_folding(self):
+        """Les termes sont trouvés sans tenir compte de la casse ni des accents"""
+        gazetteer = EntityGazetteer()
+        gazetteer.add("prenom", "Hélène")
+        gazetteer.add("langue", "Français")
+
+        assert fold("Hélène ÉLODIE") == "helene elodie"
+        assert _values(gazetteer, "helene parle FRANCAIS") == ["Hélène", "Français"]
+
+    def test_word_boundaries(self):
+        """Un terme à limites de mots n'est pas trouvé à l'intérieur d'un mot"""
+        gazetteer = EntityGazetteer()
+        gazetteer.add("competence", "Java")
+        gazetteer.add("competence", "sql", word_boundary=False)
+
+        assert _values(gazetteer, "javascript et mysql") == ["sql"]
+        assert _values(gazetteer, "java, sql") == ["Java", "sql"]
+
+    def test_overlapping_terms(self):
+        """Les termes qui se chevauchent ou sont suffixes d'autres termes sont tous trouvés"""
+        gazetteer = EntityGazetteer()
+        for term in ("he", "she", "his", "hers"):
+            gazetteer.add("terme", term, word_boundary=False)
+
+        assert _values(gazetteer, "ushers") == ["he", "she", "hers"]
+
+    def test_same_results_as_regex(self):
+        """Mêmes résultats que rf"\\b{terme}\\b" sur chaque terme"""
+        terms = ["Python", "C++", ".NET", "Power BI", "R", "Go", "Node.js", "Data"]
+        gazetteer = EntityGazetteer()
+        for term in terms:
+            gazetteer.add("competence", term)
+        question = "python, c++ et .net sous go ; power bi pour la data. r ou node.js ? golang"
+
+        expected = [term for term in terms if re.search(rf"\b{re.escape(term.lower())}\b", question)]
+        assert _values(gazetteer, question) == expected
+
+    def test_ignored_terms(self):
+        """Termes vides ou non textuels ignorés ; doublons renvoyés une fois"""
+        gazetteer = EntityGazetteer()
+        gazetteer.add("nom", "")
+        gazetteer.add("nom", None)
+        gazetteer.add("nom", "Martin")
+        gazetteer.add("nom", "martin", value="Martin")
+
+        assert len(gazetteer) == 2
+        assert _values(gazetteer, "martin") == ["Martin", "Martin"]
+
+
+class TestGetGazetteer:
+    """Gazetteer partagé"""
+
+    def test_reloaded_after_write(self, service):
+        """Chargé une fois, puis rechargé quand une de ses tables est modifiée"""
+        loads = []
+
+        def loader():
+            loads.append(1)
+            gazetteer = EntityGazetteer()
+            gazetteer.add("langue", f"langue{len(loads)}")
+            return gazetteer
+
+        assert _values(get_gazetteer("test", loader, ["langues"]), "langue1") == ["langue1"]
+        get_gazetteer("test", loader, ["langues"])
+        service.invalidate_tags("missions")
+        get_gazetteer("test", loader, ["langues"])
+        assert len(loads) == 1
+
+        service.invalidate_tags("langues")
+        assert _values(get_gazetteer("test", loader, ["langues"]), "langue2") == ["langue2"]
+        assert len(loads) == 2
+
+
+class TestChatbotEntities:
+    """Extraction des entités du chatbot"""
+
+    @pytest.fixture
+    def session(self, monkeypatch):
+        """Session simulée : une requête par table"""
+        rows = {
+            "consultants": [
+                SimpleNamespace(prenom="Hélène", nom="Dupont"),
+                SimpleNamespace(prenom="Paul", nom="Martin"),
+            ],
+            "competences": [SimpleNamespace(nom="Python"), SimpleNamespace(nom="Spark")],
+            "langues": [SimpleNamespace(nom="Anglais")],
+            "practices": [SimpleNamespace(nom="Data", actif=True), SimpleNamespace(nom="Cloud", actif=False)],
+        }
+        session = MagicMock()
+
+        def query(*columns):
+            result = MagicMock()
+            table = columns[0].class_.__tablename__
+            result.all.return_value = rows[table]
+            return result
+
+        session.query.side_effect = query
+        get_session = MagicMock()
+        get_session.return_value.__enter__.return_value = session
+        monkeypatch.setattr("app.services.chatbot_service.get_database_session", get_session)
+        return get_session
+
+    def test_entities_in_one_load(self, service, session):
+        """Toutes les entités viennent du gazetteer, chargé une seule fois pour plusieurs questions"""
+        chatbot = ChatbotService()
+
+        entities = chatbot._extract_entities(
+            "est-ce que helene dupont connait spark et python en anglais ? data ou cloud"
+        )
+        assert chatbot._check_consultant_name_mentioned("et paul ?")
+        assert not chatbot._check_consultant_name_mentioned("et pauline ?")
+
+        assert entities["noms"] == ["Hélène", "Dupont", "Hélène Dupont"]
+        assert entities["competences"] == ["python", "Python", "Spark"]
+        assert entities["langues"] == ["anglais", "Anglais"]
+        assert entities["practices"] == ["Data"]
+        assert session.call_count == 1
@@ -0,0 +1,126 @@
+"""
+Tests du moteur d'intentions compilé du chatbot
+Résultats identiques aux patterns d'origine, moteur TF-IDF, moteur enfichable, latence < 1 ms
+"""
+
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import entity_gazetteer
+from app.services import intent_engine
+from app.services.chatbot_service import ChatbotService
+from app.services.intent_engine import INTENT_PATTERNS
+from app.services.intent_engine import PatternIntentScorer
+from app.services.intent_engine import TfidfIntentScorer
+
+QUESTIONS = [
+    "quel est le salaire de prenom12 nom12 ?",
+    "combien de consultants en cdi",
+    "qui parle anglais couramment",
+    "quelles sont les compétences python de prenom3",
+    "combien de missions chez bnp paribas",
+    "quand est-ce que prenom7 sera disponible",
+    "tjm moyen des missions",
+    "liste des consultants disponibles",
+    "quel est le mail de nom42",
+    "combien y a-t-il de consultants dans la base",
+    "bonjour",
+]
+
+# Latence cible de l'analyse d'intention, par question
+LATENCY_TARGET_S = 0.001
+
+
+def _regex_scores(question):
+    """Scores calculés comme avant le moteur : un re.search par pattern"""
+    return {
+        intent: sum(1 for pattern in patterns if re.search(pattern, question))
+        for intent, patterns in INTENT_PATTERNS.items()
+    }
+
+
+class TestPatternIntentScorer:
+    """Moteur par défaut"""
+
+    @pytest.mark.parametrize("question", QUESTIONS)
+    def test_same_scores_as_regex(self, question):
+        """Mêmes scores qu'un re.search par pattern"""
+        assert PatternIntentScorer().score(question) == _regex_scores(question)
+
+    def test_literal_patterns_indexed(self):
+        """Seuls les patterns réguliers passent par re"""
+        scorer = PatternIntentScorer({"a": ("salaire", r"langues?", "e-mail"), "b": ("salaire",)})
+
+        assert scorer.score("salaire et e-mail") == {"a": 2, "b": 1}
+        assert len(scorer._regexes) == 1
+
+
+class TestTfidfIntentScorer:
+    """Modèle TF-IDF local"""
+
+    def test_best_intent(self):
+        """L'intention la mieux scorée correspond aux mots de la question"""
+        scorer = TfidfIntentScorer()
+
+        for question, expected in (
+            ("quel est le salaire de marie", "salaire"),
+            ("quelle est son adresse email", "contact"),
+            ("quels cv ont été téléchargé", "cvs"),
+        ):
+            scores = scorer.score(question)
+            assert set(scores) == set(INTENT_PATTERNS)
+            assert max(scores, key=scores.get) == expected
+
+    def test_unknown_engine(self):
+        """Un nom de moteur inconnu donne le moteur par défaut"""
+        assert intent_engine.create_intent_scorer("inconnu").name == "patterns"
+
+
+class TestChatbotIntent:
+    """Analyse d'intention du chatbot"""
+
+    @pytest.fixture
+    def chatbot(self, enabled_cache, monkeypatch):
+        """Chatbot avec 1 000 consultants, gazetteer en cache"""
+        entity_gazetteer.clear_gazetteers()
+
+        rows = [SimpleNamespace(prenom=f"Prenom{i}", nom=f"Nom{i}", actif=True) for i in range(1000)]
+        session = MagicMock()
+        session.query.return_value.all.return_value = rows
+        get_session = MagicMock()
+        get_session.return_value.__enter__.return_value = session
+        monkeypatch.setattr("app.services.chatbot_service.get_database_session", get_session)
+
+        yield ChatbotService()
+        entity_gazetteer.clear_gazetteers()
+
+    def test_pluggable_scorer(self, chatbot, monkeypatch):
+        """Le moteur peut être remplacé par tout objet exposant score()"""
+        scorer = SimpleNamespace(score=lambda question: {"cvs": 0.9, "salaire": 0.1})
+        monkeypatch.setattr(intent_engine, "_intent_scorer", scorer)
+
+        assert chatbot._analyze_intent("bonjour") == "cvs"
+
+    def test_intents(self, chatbot):
+        """Intentions attendues avec le moteur par défaut"""
+        assert chatbot._analyze_intent("quel est le salaire de prenom12 nom12 ?") == "salaire"
+        assert chatbot._analyze_intent("combien de missions chez bnp paribas") == "missions"
+        assert chatbot._analyze_intent("combien de consultants en cdi") == "profil_professionnel"
+        assert chatbot._analyze_intent("bonjour") == "general"
+
+    def test_latency_benchmark(self, chatbot):
+        """Analyse d'intention sous 1 ms par question (meilleure de 5 séries)"""
+        chatbot._analyze_intent("préchauffage")
+        rounds = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(20):
+                for question in QUESTIONS:
+                    chatbot._analyze_intent(question)
+            rounds.append((time.perf_counter() - start) / (20 * len(QUESTIONS)))
+
+        assert min(rounds) < LATENCY_TARGET_S
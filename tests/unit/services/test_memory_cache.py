@@ -0,0 +1,139 @@
+"""
+Tests du niveau de cache mémoire borné (LRU, budget en octets, purge des entrées expirées)
+"""
+
+import time
+
+from app.services.cache_service import CacheService
+from app.services.memory_cache import MemoryCache
+from app.services.memory_cache import estimate_size
+
+
+def _entry(data, ttl=300):
+    now = time.time()
+    return {"data": data, "expires_at": now + ttl, "created_at": now}
+
+
+class TestEstimateSize:
+    """Tests de l'estimation de taille"""
+
+    def test_grows_with_content(self):
+        """Une liste de résultats plus longue est estimée plus grosse"""
+        small = [{"id": i, "nom": "Dupont"} for i in range(10)]
+        large = [{"id": i, "nom": "Dupont"} for i in range(1000)]
+
+        assert estimate_size(large) > 50 * estimate_size(small) > 0
+
+    def test_shared_and_cyclic_values_counted_once(self):
+        """Les références partagées et cycliques ne font pas exploser l'estimation"""
+        shared = "x" * 10_000
+        cyclic = {"a": shared, "b": shared}
+        cyclic["self"] = cyclic
+
+        assert estimate_size(cyclic) < 2 * estimate_size(shared)
+
+
+class TestMemoryCache:
+    """Tests de MemoryCache"""
+
+    def test_lru_eviction_on_entry_limit(self):
+        """L'entrée la moins récemment lue est évincée en premier"""
+        cache = MemoryCache(max_entries=3, max_bytes=10**6, sweep_interval=0)
+        for key in ("a", "b", "c"):
+            cache[key] = _entry(key)
+        assert cache["a"]["data"] == "a"  # "a" redevient la plus récente
+
+        cache["d"] = _entry("d")
+
+        assert list(cache) == ["c", "a", "d"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        """La taille estimée reste sous le budget et l'entrée trop grosse est refusée"""
+        cache = MemoryCache(max_entries=1000, max_bytes=20_000, sweep_interval=0)
+        for i in range(50):
+            cache[f"k{i}"] = _entry("x" * 1_000)
+        cache["huge"] = _entry("x" * 50_000)
+
+        assert 0 < cache.size_bytes <= 20_000
+        assert "k49" in cache and "k0" not in cache
+        assert "huge" not in cache
+        assert cache.get_stats()["rejected"] == 1
+
+    def test_replace_and_delete_keep_size_accurate(self):
+        """Remplacer ou supprimer une entrée met à jour la taille comptée"""
+        cache = MemoryCache(max_entries=10, max_bytes=10**6, sweep_interval=0)
+        cache["a"] = _entry("x" * 5_000)
+        cache["a"] = _entry("y")
+        cache["b"] = _entry("z")
+        del cache["b"]
+
+        assert cache.size_bytes == estimate_size(cache["a"])
+        cache.clear()
+        assert cache.size_bytes == 0 and len(cache) == 0
+
+    def test_sweep_expired(self):
+        """sweep_expired retire les entrées expirées sans attendre une lecture"""
+        cache = MemoryCache(max_entries=10, max_bytes=10**6, sweep_interval=0)
+        cache["vieux"] = _entry("v", ttl=-1)
+        cache["frais"] = _entry("f")
+
+        assert cache.sweep_expired() == 1
+        assert list(cache) == ["frais"]
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_pop_and_setdefault_atomic_with_sweep(self):
+        """pop/setdefault ne laissent pas la purge passer entre la lecture et l'écriture de la clé"""
+
+        class SweptOnRead(MemoryCache):
+            # Purge déclenchée juste après chaque lecture par clé (là où MutableMapping.pop enchaîne __delitem__)
+            def __getitem__(self, key):
+                entry = super().__getitem__(key)
+                self.sweep_expired()
+                return entry
+
+        cache = SweptOnRead(max_entries=10, max_bytes=10**6, sweep_interval=0)
+        cache["vieux"] = _entry("v", ttl=-1)
+
+        assert cache.pop("vieux")["data"] == "v"
+        assert cache.pop("vieux", None) is None
+        assert cache.size_bytes == 0
+
+        cache["vieux"] = _entry("v", ttl=-1)
+        assert cache.setdefault("vieux", _entry("nouveau"))["data"] == "v"
+        assert cache.setdefault("frais", _entry("f"))["data"] == "f"
+        assert "frais" in cache
+
+    def test_background_sweeper(self):
+        """Le thread de fond purge les entrées expirées puis s'arrête avec close()"""
+        cache = MemoryCache(max_entries=10, max_bytes=10**6, sweep_interval=0.02)
+        cache["vieux"] = _entry("v", ttl=0.01)
+
+        deadline = time.time() + 2
+        while "vieux" in cache and time.time() < deadline:
+            time.sleep(0.01)
+        cache.close()
+        cache._sweeper.join(timeout=1)
+
+        assert "vieux" not in cache
+        assert not cache._sweeper.is_alive()
+
+
+class TestCacheServiceMemoryTier:
+    """CacheService utilise le niveau borné"""
+
+    def test_memory_stays_flat_under_search_traffic(self):
+        """Des milliers de recherches distinctes ne font pas grossir le cache au-delà des limites"""
+        service = CacheService(max_entries=200, max_bytes=256 * 1024, sweep_interval=0)
+        service.redis_client = None
+        results = [{"id": i, "nom": f"Consultant {i}", "email": f"c{i}@test.com"} for i in range(20)]
+
+        for i in range(5_000):
+            key = service._generate_key("search_consultants", (f"terme {i}",), {})
+            service.set(key, results, ttl=60)
+
+        stats = service.get_stats()["memory_cache"]
+        assert stats["entries"] <= 200
+        assert stats["estimated_size_kb"] <= 256
+        assert stats["evictions"] >= 4_800
+        assert service.get(key) == results
@@ -426,6 +426,8 @@ class TestGetPracticeStatistics(unittest.TestCase):
             1,  # Sans practice actifs
         ]
 
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         self.assertEqual(result["total_practices"], 2)
@@ -444,6 +446,8 @@ class TestGetPracticeStatistics(unittest.TestCase):
         mock_session.query.return_value.filter.return_value.all.return_value = []
         mock_session.query.return_value.filter.return_value.count.return_value = 0
 
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         self.assertEqual(result["total_practices"], 0)
@@ -460,6 +464,8 @@ class TestGetPracticeStatistics(unittest.TestCase):
         mock_get_session.return_value = mock_session
         mock_session.query.side_effect = SQLAlchemyError("Database error")
 
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         self.assertEqual(result["total_practices"], 0)
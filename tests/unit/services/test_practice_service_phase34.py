@@ -265,12 +265,14 @@ class TestGetPracticeStatistics(unittest.TestCase):
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
         
-        p1 = Mock(id=1, nom="Data")
-        p2 = Mock(id=2, nom="Quant")
+        p1 = Mock(id=1, nom="Data", responsable=None)
+        p2 = Mock(id=2, nom="Quant", responsable=None)
         mock_session.query.return_value.filter.return_value.all.return_value = [p1, p2]
         
         mock_session.query.return_value.filter.return_value.count.return_value = 5
 
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         self.assertIn("total_practices", result)
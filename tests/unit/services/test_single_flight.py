@@ -0,0 +1,144 @@
+"""
+Tests de la protection contre les rafales de rechargement du cache
+(single-flight, stale-while-revalidate, rafraîchissement anticipé, verrou Redis)
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.services.cache_service import FRESHNESS_FIELD
+from app.services.cache_service import _needs_refresh
+from app.services.cache_service import cached
+from app.services.single_flight import SingleFlight
+
+
+def _run_concurrently(target, count=8):
+    # Tous les threads démarrent ensemble pour appeler pendant le chargement du premier
+    barrier = threading.Barrier(count)
+    results = []
+
+    def call():
+        barrier.wait(5)
+        results.append(target())
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestSingleFlight:
+    """Tests de SingleFlight"""
+
+    def test_concurrent_calls_share_one_load(self):
+        """Les appels concurrents sur une clé attendent le chargement en cours"""
+        flights = SingleFlight()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.3)
+            return "valeur"
+
+        results = _run_concurrently(lambda: flights.do("cle", loader))
+
+        assert results == ["valeur"] * 8
+        assert len(calls) == 1
+        assert not flights.in_flight("cle")
+
+    def test_error_is_raised_and_not_kept(self):
+        """Une erreur de chargement est relevée et le chargement suivant est relancé"""
+        flights = SingleFlight()
+
+        def failing():
+            raise ValueError("base indisponible")
+
+        with pytest.raises(ValueError):
+            flights.do("cle", failing)
+        assert flights.do("cle", lambda: 42) == 42
+
+
+class TestCachedStampede:
+    """Protection de @cached"""
+
+    def test_expired_entry_loaded_once(self, isolated_cache):
+        """Une entrée absente n'est chargée qu'une fois malgré les appels simultanés"""
+        calls = []
+
+        @cached(ttl=60)
+        def stats():
+            calls.append(1)
+            time.sleep(0.3)
+            return {"total": 3}
+
+        assert _run_concurrently(stats) == [{"total": 3}] * 8
+        assert len(calls) == 1
+
+    def test_stale_value_served_while_revalidating(self, isolated_cache):
+        """Pendant le rechargement, les autres appelants reçoivent l'ancienne valeur"""
+        release = threading.Event()
+        started = threading.Event()
+
+        @cached(ttl=60, stale_ttl=30)
+        def stats():
+            started.set()
+            release.wait(5)
+            return "nouvelle"
+
+        key = isolated_cache._generate_key("stats", (), {})
+        expired = {FRESHNESS_FIELD: {"expires_at": time.time() - 1, "load_seconds": 0.01}, "data": "ancienne"}
+        isolated_cache.set(key, expired, ttl=30)
+
+        refresher = threading.Thread(target=stats)
+        refresher.start()
+        assert started.wait(5)
+        assert stats() == "ancienne"
+
+        release.set()
+        refresher.join(5)
+        assert stats() == "nouvelle"
+
+    def test_other_process_loading_serves_stale(self, isolated_cache):
+        """Verrou Redis tenu par un autre processus : l'ancienne valeur est servie sans recalcul"""
+
+        class LockedRedis:
+            def set(self, key, value, nx=False, px=None):
+                return None
+
+            def get(self, key):
+                return None
+
+            def setex(self, key, ttl, value):
+                pass
+
+        calls = []
+
+        @cached(ttl=60, stale_ttl=30)
+        def stats():
+            calls.append(1)
+            return "nouvelle"
+
+        key = isolated_cache._generate_key("stats", (), {})
+        expired = {FRESHNESS_FIELD: {"expires_at": time.time() - 1, "load_seconds": 0.01}, "data": "ancienne"}
+        isolated_cache.set(key, expired, ttl=30)
+        isolated_cache.redis_client = LockedRedis()
+
+        assert stats() == "ancienne"
+        assert calls == []
+
+
+class TestEarlyRefresh:
+    """Rafraîchissement anticipé probabiliste"""
+
+    def test_needs_refresh(self):
+        """Périmée : toujours ; loin de l'expiration : jamais ; chargement long proche de l'expiration : oui"""
+        now = time.time()
+        assert _needs_refresh({"expires_at": now - 1, "load_seconds": 0.1}, 0)
+        assert not _needs_refresh({"expires_at": now + 600, "load_seconds": 0.1}, 0)
+        assert not _needs_refresh({"expires_at": now + 600, "load_seconds": 0.0}, 1.0)
+        assert _needs_refresh({"expires_at": now + 1, "load_seconds": 1e6}, 1.0)
+        assert not _needs_refresh(None, 1.0)
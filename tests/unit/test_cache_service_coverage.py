@@ -3,7 +3,6 @@ Tests unitaires pour le service de cache
 Couvre les fonctionnalités de cache mémoire et Redis
 """
 
-import json
 import time
 import unittest.mock
 from datetime import datetime
@@ -14,7 +13,12 @@ from unittest.mock import patch
 import pytest
 
 from app.services.cache_service import CacheService
+from app.services.cache_service import TAG_CONSULTANTS
+from app.services.cache_service import TAG_MISSIONS
+from app.services.cache_service import TAG_PRACTICES
+from app.services.cache_service import TAG_SEARCH
 from app.services.cache_service import cached
+from app.services.cache_service import consultant_tags
 from app.services.cache_service import get_cache_service
 from app.services.cache_service import get_cached_consultant_stats
 from app.services.cache_service import get_cached_consultants_list
@@ -24,6 +28,7 @@ from app.services.cache_service import invalidate_consultant_cache
 from app.services.cache_service import invalidate_mission_cache
 from app.services.cache_service import invalidate_practice_cache
 from app.services.cache_service import invalidate_search_cache
+from app.services.memory_cache import MemoryCache
 
 
 class TestCacheService:
@@ -35,7 +40,7 @@ class TestCacheService:
             service = CacheService()
             assert service.redis_client is None
             assert service.default_ttl == 300
-            assert isinstance(service.memory_cache, dict)
+            assert isinstance(service.memory_cache, MemoryCache)
 
     def test_init_with_redis_success(self):
         """Test d'initialisation avec Redis disponible et connexion réussie"""
@@ -147,11 +152,11 @@ class TestCacheService:
         service.redis_client = mock_redis
 
         # Simuler Redis avec données
-        mock_redis.get.return_value = json.dumps("redis_value")
+        mock_redis.get.return_value = service.codec.encode("redis_value")
 
         result = service.get("redis_key")
         assert result == "redis_value"
-        mock_redis.get.assert_called_once_with("redis_key")
+        mock_redis.get.assert_called_once_with(service.redis_key("redis_key"))
 
     def test_get_from_redis_with_error(self):
         """Test de récupération depuis Redis avec erreur"""
@@ -189,7 +194,7 @@ class TestCacheService:
         assert entry["created_at"] <= time.time()
 
         # Vérifier l'appel Redis
-        mock_redis.setex.assert_called_once_with("test_key", 120, '"test_value"')
+        mock_redis.setex.assert_called_once_with(service.redis_key("test_key"), 120, service.codec.encode("test_value"))
 
     def test_set_with_default_ttl(self):
         """Test de stockage avec TTL par défaut"""
@@ -220,7 +225,7 @@ class TestCacheService:
 
         assert result is True
         assert "test_key" not in service.memory_cache
-        mock_redis.delete.assert_called_once_with("test_key")
+        mock_redis.delete.assert_called_once_with(service.redis_key("test_key"))
 
     def test_delete_nonexistent_key(self):
         """Test de suppression d'une clé inexistante"""
@@ -233,7 +238,7 @@ class TestCacheService:
         result = service.delete("nonexistent")
 
         assert result is True  # True car on considère que l'opération a réussi
-        mock_redis.delete.assert_called_once_with("nonexistent")
+        mock_redis.delete.assert_called_once_with(service.redis_key("nonexistent"))
 
     def test_clear_pattern(self):
         """Test de suppression par pattern"""
@@ -448,169 +453,92 @@ class TestCacheInvalidation:
         assert "consultator:post:1" in service.memory_cache
 
     def test_invalidate_consultant_cache_all(self):
-        """Test d'invalidation de tout le cache consultant"""
-        # Reset global cache service
+        """Test d'invalidation de tout le cache consultant (listes et entrées par consultant)"""
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
         service = get_cache_service()
         service.redis_client = None
-
-        service.memory_cache.update(
-            {
-                "consultator:get_consultant:1": {
-                    "data": "consultant1",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_consultant:2": {
-                    "data": "consultant2",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_mission:1": {
-                    "data": "mission1",
-                    "expires_at": time.time() + 100,
-                },
-            }
-        )
+        service.set("consultator:get_consultants:abc", "consultants", tags=[TAG_CONSULTANTS])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_mission:1", "mission1", tags=[TAG_MISSIONS])
 
         invalidate_consultant_cache()
 
-        assert "consultator:get_consultant:1" not in service.memory_cache
-        assert "consultator:get_consultant:2" not in service.memory_cache
-        assert "consultator:get_mission:1" in service.memory_cache  # Ne devrait pas être supprimé
+        assert service.get("consultator:get_consultants:abc") is None
+        assert service.get("consultator:get_consultant:1") is None
+        assert service.get("consultator:get_mission:1") == "mission1"  # Ne devrait pas être invalidé
 
     def test_invalidate_consultant_cache_specific(self):
         """Test d'invalidation du cache pour un consultant spécifique"""
-        # Reset global cache service
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
         service = get_cache_service()
         service.redis_client = None
-
-        service.memory_cache.update(
-            {
-                "consultator:get_consultant:1:abc123": {
-                    "data": "consultant1",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_consultant:2:def456": {
-                    "data": "consultant2",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_mission:1:xyz789": {
-                    "data": "mission1",
-                    "expires_at": time.time() + 100,
-                },
-            }
-        )
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_consultant:2", "consultant2", tags=consultant_tags(2))
+        service.set("consultator:get_consultants:abc", "consultants", tags=[TAG_CONSULTANTS])
+        service.set("consultator:get_mission:1", "mission1", tags=[TAG_MISSIONS])
 
         invalidate_consultant_cache(consultant_id=1)
 
-        assert "consultator:get_consultant:1:abc123" not in service.memory_cache
-        assert "consultator:get_consultant:2:def456" in service.memory_cache
-        assert "consultator:get_mission:1:xyz789" in service.memory_cache
+        assert service.get("consultator:get_consultant:1") is None
+        assert service.get("consultator:get_consultants:abc") is None  # La liste contient le consultant 1
+        assert service.get("consultator:get_consultant:2") == "consultant2"
+        assert service.get("consultator:get_mission:1") == "mission1"
 
     def test_invalidate_mission_cache(self):
         """Test d'invalidation du cache des missions"""
-        # Reset global cache service
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
         service = get_cache_service()
         service.redis_client = None
+        service.set("consultator:get_missions:abc", "missions", tags=[TAG_MISSIONS])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
+        service.set("consultator:get_consultant:2", "consultant2", tags=consultant_tags(2))
 
-        service.memory_cache.update(
-            {
-                "consultator:get_mission:1:abc123": {
-                    "data": "mission1",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_mission:2:def456": {
-                    "data": "mission2",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_consultant:1:xyz789": {
-                    "data": "consultant1",
-                    "expires_at": time.time() + 100,
-                },
-            }
-        )
-
-        invalidate_mission_cache()
+        invalidate_mission_cache(1)
 
-        assert "consultator:get_mission:1:abc123" not in service.memory_cache
-        assert "consultator:get_mission:2:def456" not in service.memory_cache
-        assert "consultator:get_consultant:1:xyz789" in service.memory_cache
+        assert service.get("consultator:get_missions:abc") is None
+        assert service.get("consultator:get_consultant:1") is None  # Le profil contient ses missions
+        assert service.get("consultator:get_consultant:2") == "consultant2"
 
     def test_invalidate_practice_cache(self):
         """Test d'invalidation du cache des practices"""
-        # Reset global cache service
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
         service = get_cache_service()
         service.redis_client = None
-
-        service.memory_cache.update(
-            {
-                "consultator:get_practice:1": {
-                    "data": "practice1",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_practice:2": {
-                    "data": "practice2",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_consultant:1": {
-                    "data": "consultant1",
-                    "expires_at": time.time() + 100,
-                },
-            }
-        )
+        service.set("consultator:get_practices:abc", "practices", tags=[TAG_PRACTICES])
+        service.set("consultator:get_consultant:1", "consultant1", tags=consultant_tags(1))
 
         invalidate_practice_cache()
 
-        assert "consultator:get_practice:1" not in service.memory_cache
-        assert "consultator:get_practice:2" not in service.memory_cache
-        assert "consultator:get_consultant:1" in service.memory_cache
+        assert service.get("consultator:get_practices:abc") is None
+        assert service.get("consultator:get_consultant:1") == "consultant1"
 
     def test_invalidate_search_cache(self):
         """Test d'invalidation du cache de recherche"""
-        # Reset global cache service
         import app.services.cache_service
 
         app.services.cache_service._cache_service = None
 
         service = get_cache_service()
         service.redis_client = None
-
-        service.memory_cache.update(
-            {
-                "consultator:search_consultants:abc123": {
-                    "data": "search1",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:search_consultants:def456": {
-                    "data": "search2",
-                    "expires_at": time.time() + 100,
-                },
-                "consultator:get_consultant:1": {
-                    "data": "consultant1",
-                    "expires_at": time.time() + 100,
-                },
-            }
-        )
+        service.set("consultator:search_consultants:abc", "search1", tags=[TAG_SEARCH])
+        service.set("consultator:get_other:def", "other")
 
         invalidate_search_cache()
 
-        assert "consultator:search_consultants:abc123" not in service.memory_cache
-        assert "consultator:search_consultants:def456" not in service.memory_cache
-        assert "consultator:get_consultant:1" in service.memory_cache
+        assert service.get("consultator:search_consultants:abc") is None
+        assert service.get("consultator:get_other:def") == "other"
 
 
 class TestCachedFunctions:
@@ -458,6 +458,8 @@ class TestPracticeServiceCoverage:
         mock_db.query.return_value.count.return_value = 2
 
         # Execution
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         # Vérifications
@@ -477,6 +479,8 @@ class TestPracticeServiceCoverage:
         mock_db.query.side_effect = SQLAlchemyError("DB Error")
 
         # Execution
+        if hasattr(PracticeService.get_practice_statistics, "clear"):
+            PracticeService.get_practice_statistics.clear()
         result = PracticeService.get_practice_statistics()
 
         # Vérifications
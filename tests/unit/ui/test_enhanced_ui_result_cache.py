@@ -0,0 +1,152 @@
+"""
+Tests des résultats filtrés conservés dans la session (SessionResultCache)
+Filtre identique servi depuis le cache, filtre restreint calculé depuis un résultat plus large
+"""
+
+import random
+
+import pytest
+
+from app.services.cache_service import CONSULTANT_LIST_TAGS
+from app.services.cache_service import data_generation
+from app.ui.enhanced_ui import AdvancedUIFilters
+from app.ui.enhanced_ui import SessionResultCache
+
+DATASET = ("", (("consultants", 0),))
+
+
+def _consultants(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": index,
+            "prenom": f"Prénom{index}",
+            "nom": f"Nom{index}",
+            "practice_name": rng.choice(["Data", "Cloud", "Digital"]),
+            "grade": rng.choice(["Junior", "Confirmé", "Senior"]),
+            "disponibilite": rng.random() < 0.5,
+            "societe": rng.choice(["Quanteam", "Asigma"]),
+            "type_contrat": "CDI",
+            "salaire_actuel": rng.randrange(30000, 90000, 500),
+            "experience_annees": rng.randint(0, 20),
+        }
+        for index in range(count)
+    ]
+
+
+def _filters(**values):
+    filters = AdvancedUIFilters()
+    filters.filters.update(values)
+    return filters
+
+
+@pytest.fixture
+def data():
+    return _consultants(5000)
+
+
+class TestRefines:
+    """Inclusion des résultats entre deux jeux de filtres"""
+
+    def test_narrowing_filters(self):
+        """Minimum relevé, maximum abaissé, filtre ajouté, recherche allongée : restreint"""
+        previous = _filters(salaire_min=40000, salaire_max=80000, search_term="nom1").filters
+
+        assert _filters(salaire_min=50000, salaire_max=80000, search_term="nom1").refines(previous)
+        assert _filters(salaire_min=40000, salaire_max=70000, search_term="nom12").refines(previous)
+        assert _filters(salaire_min=40000, salaire_max=80000, search_term="nom1", grade_filter="Senior").refines(
+            previous
+        )
+
+    def test_broadening_filters(self):
+        """Minimum abaissé, borne retirée ou autre valeur de filtre : ne restreint pas"""
+        previous = _filters(salaire_min=40000, practice_filter="Data").filters
+
+        assert not _filters(salaire_min=30000, practice_filter="Data").refines(previous)
+        assert not _filters(practice_filter="Data").refines(previous)
+        assert not _filters(salaire_min=40000, practice_filter="Cloud").refines(previous)
+
+
+class TestApplyFiltersCache:
+    """apply_filters avec dataset_key"""
+
+    def test_same_filters_hit(self, data):
+        """Le même jeu de filtres est servi depuis la session"""
+        cache = SessionResultCache()
+        filters = _filters(practice_filter="Data")
+
+        first = filters.apply_filters(data, dataset_key=DATASET, cache=cache)
+        second = filters.apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_raised_minimum_refines_cached_result(self, data):
+        """Un salaire minimum relevé repart du résultat précédent, avec le même résultat"""
+        cache = SessionResultCache()
+        _filters(salaire_min=40000).apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        filters = _filters(salaire_min=60000, grade_filter="Senior")
+        result = filters.apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        assert cache.refinements == 1
+        assert result == filters.apply_filters(data)
+
+    def test_broadened_filter_uses_full_list(self, data):
+        """Un filtre élargi est recalculé sur la liste complète"""
+        cache = SessionResultCache()
+        _filters(salaire_min=60000).apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        filters = _filters(salaire_min=40000)
+        result = filters.apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        assert (cache.refinements, cache.misses) == (0, 2)
+        assert result == filters.apply_filters(data)
+
+    def test_other_dataset_not_reused(self, data):
+        """Les résultats d'une autre recherche ou génération ne sont pas réutilisés"""
+        cache = SessionResultCache()
+        _filters(salaire_min=40000).apply_filters(data, dataset_key=DATASET, cache=cache)
+
+        _filters(salaire_min=60000).apply_filters(data, dataset_key=("", (("consultants", 1),)), cache=cache)
+
+        assert (cache.refinements, cache.misses) == (0, 2)
+
+    def test_identical_to_full_scan(self, data):
+        """Sur une suite de filtres, les résultats sont ceux du parcours complet"""
+        cache = SessionResultCache()
+        steps = [
+            {"practice_filter": "Data"},
+            {"practice_filter": "Data", "salaire_min": 45000},
+            {"practice_filter": "Data", "salaire_min": 55000, "experience_max": 10},
+            {"practice_filter": "Data", "salaire_min": 55000, "experience_max": 5, "search_term": "nom1"},
+            {"salaire_min": 55000},
+            {"practice_filter": "Data", "salaire_min": 45000},
+        ]
+
+        for values in steps:
+            filters = _filters(**values)
+            assert filters.apply_filters(data, dataset_key=DATASET, cache=cache) == filters.apply_filters(data)
+        assert cache.hits == 1
+        assert cache.refinements >= 3
+
+
+class TestSessionResultCache:
+    """LRU de la session"""
+
+    def test_lru_eviction(self):
+        """Au-delà de max_entries, l'entrée la moins récemment utilisée est retirée"""
+        cache = SessionResultCache(max_entries=2)
+        cache.put("a", [1])
+        cache.put("b", [2])
+        cache.get("a")
+        cache.put("c", [3])
+
+        assert [key for key, _ in cache.entries()] == ["a", "c"]
+
+    def test_data_generation_changes_on_invalidation(self, isolated_cache):
+        """La clé des données change après une écriture sur les tables de la liste"""
+        before = data_generation(*CONSULTANT_LIST_TAGS)
+        isolated_cache.invalidate_tags("missions")
+
+        assert data_generation(*CONSULTANT_LIST_TAGS) != before
@@ -1,124 +1,33 @@
 """
 Script de mise à jour des index de base de données
-Ajoute les nouveaux index de performance sans recréer la base
+Ajoute les index de performance manquants sans recréer la base
+
+Les index sont définis dans app/database/models.py et gérés par le système de
+migrations (app.database.migrations) : ce script en est un raccourci.
 """
 
 import os
 import sys
 
-from sqlalchemy import create_engine
-from sqlalchemy import text
-
 # Configuration
 current_dir = os.path.dirname(__file__)
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
+sys.path.insert(0, current_dir)
 
-from app.database.database import DATABASE_URL
+from app.database.database import get_database_engine
+from app.database.migrations import create_missing_indexes
 
 
 def add_performance_indexes():
-    """Ajoute les nouveaux index de performance à la base existante"""
-
-    engine = create_engine(DATABASE_URL, echo=True)
-
-    with engine.connect() as conn:
-        try:
-            print("🔄 Ajout des index de performance...")
-
-            # Index pour Consultant
-            print("📊 Index Consultant...")
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_consultant_salaire
-                ON consultants (salaire_actuel)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_consultant_recherche
-                ON consultants (nom, prenom, email)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_consultant_dispo_practice
-                ON consultants (disponibilite, practice_id)
-            """
-                )
-            )
-
-            # Index pour Mission
-            print("📊 Index Mission...")
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_mission_consultant_statut
-                ON missions (consultant_id, statut)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_mission_client_consultant
-                ON missions (client, consultant_id)
-            """
-                )
-            )
-
-            # Index pour Competence
-            print("📊 Index Competence...")
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_competence_nom
-                ON competences (nom)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_competence_categorie
-                ON competences (categorie)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_competence_type
-                ON competences (type_competence)
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE INDEX IF NOT EXISTS idx_competence_nom_categorie
-                ON competences (nom, categorie)
-            """
-                )
-            )
-
-            conn.commit()
-            print("✅ Tous les index ont été ajoutés avec succès !")
-
-        except Exception as exc:
-            print(f"❌ Erreur lors de l'ajout des index: {exc}")
-            conn.rollback()
+    """Ajoute les index de performance manquants à la base existante"""
+    try:
+        print("🔄 Ajout des index de performance...")
+        with get_database_engine().begin() as conn:
+            created = create_missing_indexes(conn)
+        for name in created:
+            print(f"📊 Index créé : {name}")
+        print("✅ Tous les index ont été ajoutés avec succès !")
+    except Exception as exc:
+        print(f"❌ Erreur lors de l'ajout des index: {exc}")
 
 
 if __name__ == "__main__":